@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add generated dispatch columns to tasks and dispatch index to subtasks
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-01-05 10:00:00.000000+08:00
+
+This migration adds virtual generated columns for the JSON paths used by
+executor task dispatch ($.status.status, $.metadata.labels.type and
+$.metadata.labels.source) together with a composite index, so that the
+dispatch query no longer needs to evaluate JSON_EXTRACT on every task row.
+It also adds a composite index on subtasks used to claim the first pending
+assistant subtask of each task.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated dispatch columns and indexes."""
+    # Virtual columns are computed on read and only materialized in the index,
+    # so adding them does not rebuild the tasks table
+    op.execute(
+        """
+        ALTER TABLE tasks
+        ADD COLUMN task_status VARCHAR(50)
+            GENERATED ALWAYS AS (json ->> '$.status.status') VIRTUAL
+            COMMENT 'Generated from $.status.status',
+        ADD COLUMN task_type VARCHAR(50)
+            GENERATED ALWAYS AS (coalesce(json ->> '$.metadata.labels.type', 'online')) VIRTUAL
+            COMMENT 'Generated from $.metadata.labels.type, defaults to online',
+        ADD COLUMN task_source VARCHAR(50)
+            GENERATED ALWAYS AS (coalesce(json ->> '$.metadata.labels.source', '')) VIRTUAL
+            COMMENT 'Generated from $.metadata.labels.source, defaults to empty string',
+        ADD INDEX idx_tasks_dispatch (kind, is_active, task_status, task_type, created_at)
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE subtasks
+        ADD INDEX idx_subtasks_task_role_status (task_id, role, status, message_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove generated dispatch columns and indexes."""
+    op.execute(
+        """
+        ALTER TABLE subtasks
+        DROP INDEX idx_subtasks_task_role_status
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE tasks
+        DROP INDEX idx_tasks_dispatch,
+        DROP COLUMN task_source,
+        DROP COLUMN task_type,
+        DROP COLUMN task_status
+        """
+    )
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add task_list_entries table for the keyset-paginated task list
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-01-06 10:00:00.000000+08:00
+
+This migration creates the denormalized task_list_entries table that backs
+the task list endpoints and backfills it from tasks and task_members. Each
+visible Task gets one row for its owner and one per active group chat member.
+After the migration the backend keeps the rows current on every flush.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _status_datetime(field: str) -> str:
+    """SQL converting an ISO timestamp in $.status to DATETIME, NULL if absent"""
+    value = f"json ->> '$.status.{field}'"
+    # Only the seconds part is kept so that timezone suffixes cannot make the
+    # cast fail under strict mode; invalid values become NULL
+    return (
+        f"CASE WHEN {value} REGEXP '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}[T ][0-9]{{2}}:[0-9]{{2}}:[0-9]{{2}}' "
+        f"THEN CAST(REPLACE(LEFT({value}, 19), 'T', ' ') AS DATETIME) END"
+    )
+
+
+def upgrade() -> None:
+    """Create and backfill task_list_entries."""
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS task_list_entries (
+            id INT NOT NULL AUTO_INCREMENT,
+            user_id INT NOT NULL COMMENT 'User the entry is listed for',
+            task_id INT NOT NULL COMMENT 'tasks.id',
+            is_owner TINYINT(1) NOT NULL DEFAULT 1 COMMENT 'Whether user owns the task',
+            title TEXT NOT NULL COMMENT 'From $.spec.title',
+            status VARCHAR(50) NOT NULL COMMENT 'From $.status.status',
+            task_type VARCHAR(50) NOT NULL COMMENT 'From $.metadata.labels.taskType',
+            type VARCHAR(50) NOT NULL COMMENT 'From $.metadata.labels.type',
+            team_name VARCHAR(100) NULL COMMENT 'From $.spec.teamRef',
+            team_namespace VARCHAR(100) NULL,
+            workspace_name VARCHAR(100) NULL COMMENT 'From $.spec.workspaceRef',
+            workspace_namespace VARCHAR(100) NULL,
+            member_count INT NOT NULL DEFAULT 0 COMMENT 'Active task_members rows',
+            is_group_chat TINYINT(1) NOT NULL DEFAULT 0,
+            created_at DATETIME NOT NULL COMMENT 'tasks.created_at',
+            updated_at DATETIME NOT NULL COMMENT 'tasks.updated_at (last activity)',
+            status_created_at DATETIME NULL,
+            status_updated_at DATETIME NULL,
+            completed_at DATETIME NULL,
+            PRIMARY KEY (id),
+            UNIQUE KEY uniq_task_list_user_task (user_id, task_id),
+            KEY ix_task_list_entries_id (id),
+            KEY ix_task_list_entries_task_id (task_id),
+            KEY idx_task_list_created (user_id, created_at, task_id),
+            KEY idx_task_list_group (user_id, is_group_chat, updated_at, task_id),
+            KEY idx_task_list_personal (user_id, is_owner, is_group_chat, created_at, task_id)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+
+    # One summary per visible task, with its active member count
+    op.execute(f"""
+        CREATE TEMPORARY TABLE tmp_task_list_summaries AS
+        SELECT
+            t.id AS task_id,
+            t.user_id AS owner_id,
+            coalesce(t.json ->> '$.spec.title', '') AS title,
+            coalesce(t.task_status, 'PENDING') AS status,
+            coalesce(t.json ->> '$.metadata.labels.taskType', 'chat') AS task_type,
+            t.task_type AS type,
+            t.json ->> '$.spec.teamRef.name' AS team_name,
+            coalesce(t.json ->> '$.spec.teamRef.namespace', 'default') AS team_namespace,
+            t.json ->> '$.spec.workspaceRef.name' AS workspace_name,
+            coalesce(t.json ->> '$.spec.workspaceRef.namespace', 'default') AS workspace_namespace,
+            coalesce(m.member_count, 0) AS member_count,
+            (coalesce(JSON_EXTRACT(t.json, '$.spec.is_group_chat') = true, false)
+                OR coalesce(m.member_count, 0) > 0) AS is_group_chat,
+            t.created_at,
+            t.updated_at,
+            {_status_datetime("createdAt")} AS status_created_at,
+            {_status_datetime("updatedAt")} AS status_updated_at,
+            {_status_datetime("completedAt")} AS completed_at
+        FROM tasks t
+        LEFT JOIN (
+            SELECT task_id, COUNT(*) AS member_count
+            FROM task_members
+            WHERE status = 'ACTIVE'
+            GROUP BY task_id
+        ) m ON m.task_id = t.id
+        WHERE t.kind = 'Task'
+        AND t.is_active = true
+        AND coalesce(t.task_status, 'PENDING') != 'DELETE'
+        """)
+
+    columns = """
+        task_id, title, status, task_type, type, team_name, team_namespace,
+        workspace_name, workspace_namespace, member_count, is_group_chat,
+        created_at, updated_at, status_created_at, status_updated_at, completed_at
+    """
+    source_columns = ", ".join(f"s.{c.strip()}" for c in columns.split(","))
+
+    op.execute(f"""
+        INSERT IGNORE INTO task_list_entries (user_id, is_owner, {columns})
+        SELECT s.owner_id, true, {source_columns}
+        FROM tmp_task_list_summaries s
+        """)
+
+    # Entries for group chat members other than the owner
+    op.execute(f"""
+        INSERT IGNORE INTO task_list_entries (user_id, is_owner, {columns})
+        SELECT tm.user_id, false, {source_columns}
+        FROM tmp_task_list_summaries s
+        INNER JOIN task_members tm ON tm.task_id = s.task_id
+        WHERE tm.status = 'ACTIVE'
+        AND tm.user_id != s.owner_id
+        """)
+
+    op.execute("DROP TEMPORARY TABLE tmp_task_list_summaries")
+
+
+def downgrade() -> None:
+    """Drop task_list_entries."""
+    op.execute("DROP TABLE IF EXISTS task_list_entries")
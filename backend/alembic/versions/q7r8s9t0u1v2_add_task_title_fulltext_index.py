@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add ngram FULLTEXT index for task title search
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-01-07 10:00:00.000000+08:00
+
+Task title search used to filter a window of recent tasks in the
+application. This migration adds an ngram FULLTEXT index on the
+denormalized task_list_entries.title column. The search can then match,
+rank and count titles in MySQL, including CJK titles that have no word
+boundaries.
+
+The index is built with stopwords disabled. The ngram parser drops every
+token that contains a stopword, and the default InnoDB list includes "a",
+"i", "at", "in", "is" and "to". A phrase query for an ordinary substring like
+"data" or "chat" would otherwise miss titles the substring filter found.
+InnoDB keeps the stopword setting that was active when the index was
+created, so it only has to be disabled for the session running the DDL.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add FULLTEXT index on task_list_entries.title."""
+    op.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+    op.execute("""
+        ALTER TABLE task_list_entries
+        ADD FULLTEXT INDEX ftx_task_list_title (title) WITH PARSER ngram
+        """)
+    op.execute("SET SESSION innodb_ft_enable_stopword = DEFAULT")
+
+
+def downgrade() -> None:
+    """Remove FULLTEXT index on task_list_entries.title."""
+    op.execute("""
+        ALTER TABLE task_list_entries
+        DROP INDEX ftx_task_list_title
+        """)
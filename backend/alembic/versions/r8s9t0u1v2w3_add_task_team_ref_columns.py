@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add generated team reference columns to tasks
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-01-08 10:00:00.000000+08:00
+
+This migration adds virtual generated columns for $.spec.teamRef.name and
+$.spec.teamRef.namespace with a composite index that also covers the
+generated task_status column. Checks for running tasks of a team or bot can
+then use an index lookup instead of evaluating JSON_EXTRACT on every task.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r8s9t0u1v2w3"
+down_revision: Union[str, None] = "q7r8s9t0u1v2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated team reference columns and index."""
+    op.execute("""
+        ALTER TABLE tasks
+        ADD COLUMN task_team_name VARCHAR(100)
+            GENERATED ALWAYS AS (json ->> '$.spec.teamRef.name') VIRTUAL
+            COMMENT 'Generated from $.spec.teamRef.name',
+        ADD COLUMN task_team_namespace VARCHAR(100)
+            GENERATED ALWAYS AS (json ->> '$.spec.teamRef.namespace') VIRTUAL
+            COMMENT 'Generated from $.spec.teamRef.namespace',
+        ADD INDEX idx_tasks_team_ref (kind, task_team_name, task_team_namespace, task_status)
+        """)
+
+
+def downgrade() -> None:
+    """Remove generated team reference columns and index."""
+    op.execute("""
+        ALTER TABLE tasks
+        DROP INDEX idx_tasks_team_ref,
+        DROP COLUMN task_team_namespace,
+        DROP COLUMN task_team_name
+        """)
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add result sequence number to subtasks
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-01-12 10:00:00.000000+08:00
+
+Executors send progress results as deltas of the previous update. This
+migration adds the sequence number of the last applied update so the
+backend can detect a missed delta and ask for a full result instead.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: Union[str, None] = "r8s9t0u1v2w3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add result_seq column."""
+    op.execute("""
+        ALTER TABLE subtasks
+        ADD COLUMN result_seq INT NOT NULL DEFAULT 0
+            COMMENT 'Sequence number of the last applied result update'
+        """)
+
+
+def downgrade() -> None:
+    """Remove result_seq column."""
+    op.execute("""
+        ALTER TABLE subtasks
+        DROP COLUMN result_seq
+        """)
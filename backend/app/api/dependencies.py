@@ -7,7 +7,7 @@ from typing import Generator, Optional
 from fastapi import Path
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.session import ReadSessionLocal, SessionLocal
 
 
 def _set_telemetry_task_context(task_id: int, subtask_id: int = None) -> None:
@@ -46,6 +46,18 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Read replica session dependency, for list and search reads that tolerate
+    replication lag. Falls back to the primary when no replica is configured
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def with_task_telemetry(task_id: int = Path(...)) -> int:
     """
     Dependency that sets task context for OpenTelemetry tracing.
@@ -4,10 +4,12 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_db
+from app.core.config import settings
+from app.core.security import verify_executor_status_token
 from app.schemas.subtask import SubtaskExecutorUpdate
 from app.services.adapters.executor_kinds import executor_kinds_service
 
@@ -26,6 +28,11 @@ async def dispatch_tasks(
         default=None, description="Optional task IDs to filter by, comma separated"
     ),
     type: str = Query(default="online", description="online or offline"),
+    wait: int = Query(
+        default=0,
+        ge=0,
+        description="Long-poll timeout in seconds when no task is dispatchable, 0 to return immediately",
+    ),
     db: Session = Depends(get_db),
 ):
     """Task dispatch interface with subtask support using kinds table
@@ -35,6 +42,7 @@ async def dispatch_tasks(
         limit: Maximum number of subtasks to return
         task_ids: Optional task IDs to filter by, comma separated. If not provided, will search across all tasks
         type: Task type to filter by (default: "online")
+        wait: Long-poll timeout in seconds, capped by EXECUTOR_DISPATCH_MAX_WAIT_SECONDS
 
     Returns:
         List of subtasks with aggregated context from previous subtasks
@@ -48,7 +56,12 @@ async def dispatch_tasks(
             task_id_list = None
 
     return await executor_kinds_service.dispatch_tasks(
-        db=db, status=task_status, limit=limit, task_ids=task_id_list, type=type
+        db=db,
+        status=task_status,
+        limit=limit,
+        task_ids=task_id_list,
+        type=type,
+        wait=min(wait, settings.EXECUTOR_DISPATCH_MAX_WAIT_SECONDS),
     )
 
 
@@ -67,3 +80,31 @@ async def update_subtask(
     return await executor_kinds_service.update_subtask(
         db=db, subtask_update=subtask_update
     )
+
+
+@router.put("/tasks/status")
+async def report_subtask_status(
+    subtask_update: SubtaskExecutorUpdate,
+    authorization: str = Header(default=""),
+    db: Session = Depends(get_db),
+):
+    """Progress updates sent by executors directly, bypassing executor_manager
+
+    Authenticated with the status_token dispatched with the subtask, which is
+    only valid for that subtask.
+
+    Args:
+        subtask_update: Subtask update information including status, progress, result, etc.
+
+    Returns:
+        Updated subtask information and task status
+    """
+    claims = None
+    if authorization.startswith("Bearer "):
+        claims = verify_executor_status_token(authorization[7:])
+    if not claims or claims.get("subtask_id") != subtask_update.subtask_id:
+        raise HTTPException(status_code=401, detail="Invalid status token")
+
+    return await executor_kinds_service.update_subtask(
+        db=db, subtask_update=subtask_update
+    )
@@ -12,7 +12,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, s
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_db, with_task_telemetry
+from app.api.dependencies import get_db, get_read_db, with_task_telemetry
 from app.core import security
 from app.core.config import settings
 from app.models.user import User
@@ -106,21 +106,27 @@ def get_tasks(
 def get_tasks_lite(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page, takes precedence over page"
+    ),
     current_user: User = Depends(security.get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get current user's lightweight task list (paginated) for fast loading, excluding DELETE status tasks"""
     skip = (page - 1) * limit
-    items, total = task_kinds_service.get_user_tasks_lite(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
+    items, total, next_cursor = task_kinds_service.get_user_tasks_lite(
+        db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=cursor
     )
-    return {"total": total, "items": items}
+    return {"total": total, "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/lite/group", response_model=TaskLiteListResponse)
 def get_group_tasks_lite(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page, takes precedence over page"
+    ),
     current_user: User = Depends(security.get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -128,16 +134,19 @@ def get_group_tasks_lite(
     Returns only group chat tasks sorted by updated_at descending (most recent activity first).
     """
     skip = (page - 1) * limit
-    items, total = task_kinds_service.get_user_group_tasks_lite(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
+    items, total, next_cursor = task_kinds_service.get_user_group_tasks_lite(
+        db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=cursor
     )
-    return {"total": total, "items": items}
+    return {"total": total, "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/lite/personal", response_model=TaskLiteListResponse)
 def get_personal_tasks_lite(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous page, takes precedence over page"
+    ),
     current_user: User = Depends(security.get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -145,10 +154,10 @@ def get_personal_tasks_lite(
     Returns only personal tasks sorted by created_at descending (newest first).
     """
     skip = (page - 1) * limit
-    items, total = task_kinds_service.get_user_personal_tasks_lite(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
+    items, total, next_cursor = task_kinds_service.get_user_personal_tasks_lite(
+        db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=cursor
     )
-    return {"total": total, "items": items}
+    return {"total": total, "items": items, "next_cursor": next_cursor}
 
 
 @router.get("/lite/new", response_model=TaskLiteListResponse)
@@ -173,7 +182,7 @@ def search_tasks_by_title(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(security.get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Fuzzy search tasks by title for current user (pagination), excluding DELETE status"""
     skip = (page - 1) * limit
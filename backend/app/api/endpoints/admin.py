@@ -753,10 +753,10 @@ async def admin_list_user_resources(
     validate_user_exists(db, user_id)
 
     # Get resource list
-    resources = kind_service.list_resources(user_id, kind, namespace)
+    resources = kind_service.list_resources(user_id, kind, namespace, db=db)
 
     # Format and return response
-    return format_resource_list(kind, resources)
+    return format_resource_list(kind, resources, db=db)
 
 
 @router.get("/users/username/{user_name}/kinds/{kinds}")
@@ -783,10 +783,10 @@ async def admin_list_user_resources_by_username(
     user_id = target_user.id
 
     # Get resource list
-    resources = kind_service.list_resources(user_id, kind, namespace)
+    resources = kind_service.list_resources(user_id, kind, namespace, db=db)
 
     # Format and return response
-    return format_resource_list(kind, resources)
+    return format_resource_list(kind, resources, db=db)
 
 
 @router.get("/users/{user_id}/kinds/{kinds}/{name}")
@@ -813,7 +813,7 @@ async def admin_get_user_resource(
     validate_user_exists(db, user_id)
 
     # Get resource
-    resource = kind_service.get_resource(user_id, kind, namespace, name)
+    resource = kind_service.get_resource(user_id, kind, namespace, name, db=db)
     if not resource:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -821,7 +821,7 @@ async def admin_get_user_resource(
         )
 
     # Format and return response
-    return format_single_resource(kind, resource)
+    return format_single_resource(kind, resource, db=db)
 
 
 @router.get("/users/username/{user_name}/kinds/{kinds}/{name}")
@@ -849,7 +849,7 @@ async def admin_get_user_resource_by_username(
     user_id = target_user.id
 
     # Get resource
-    resource = kind_service.get_resource(user_id, kind, namespace, name)
+    resource = kind_service.get_resource(user_id, kind, namespace, name, db=db)
     if not resource:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -857,7 +857,7 @@ async def admin_get_user_resource_by_username(
         )
 
     # Format and return response
-    return format_single_resource(kind, resource)
+    return format_single_resource(kind, resource, db=db)
 
 
 @router.post("/users/{user_id}/kinds/{kinds}", status_code=status.HTTP_201_CREATED)
@@ -887,10 +887,10 @@ async def admin_create_resource_for_user(
     validated_resource = validate_and_prepare_resource(kind, resource, namespace)
 
     # Create resource
-    resource_id = kind_service.create_resource(user_id, kind, validated_resource)
+    resource_id = kind_service.create_resource(user_id, kind, validated_resource, db=db)
 
     # Format and return response
-    formatted_resource = kind_service._format_resource_by_id(kind, resource_id)
+    formatted_resource = kind_service._format_resource_by_id(kind, resource_id, db=db)
     schema_class = KIND_SCHEMA_MAP[kind]
     return schema_class.parse_obj(formatted_resource)
 
@@ -924,11 +924,11 @@ async def admin_update_user_resource(
 
     # Update resource
     resource_id = kind_service.update_resource(
-        user_id, kind, namespace, name, validated_resource
+        user_id, kind, namespace, name, validated_resource, db=db
     )
 
     # Format and return response
-    formatted_resource = kind_service._format_resource_by_id(kind, resource_id)
+    formatted_resource = kind_service._format_resource_by_id(kind, resource_id, db=db)
     schema_class = KIND_SCHEMA_MAP[kind]
     return schema_class.parse_obj(formatted_resource)
 
@@ -7,7 +7,7 @@ Batch operation API endpoints
 """
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.core.security import get_current_user
 from app.models.user import User
@@ -21,6 +21,9 @@ router = APIRouter()
 async def apply_resources(
     namespace: str,
     resources: List[Dict[str, Any]],
+    atomic: bool = Query(
+        False, description="Apply nothing if any of the resources fails"
+    ),
     current_user: User = Depends(get_current_user),
 ):
     """Apply multiple resources (create or update)"""
@@ -28,7 +31,7 @@ async def apply_resources(
     for resource in resources:
         resource["metadata"]["namespace"] = namespace
 
-    results = batch_service.apply_resources(current_user.id, resources)
+    results = batch_service.apply_resources(current_user.id, resources, atomic=atomic)
 
     success_count = sum(1 for r in results if r["success"])
     total_count = len(results)
@@ -114,13 +114,16 @@ def validate_user_exists(db: Optional[Session], user_id: int) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-def format_resource_list(kind: str, resources: List[Any]) -> Any:
+def format_resource_list(
+    kind: str, resources: List[Any], db: Optional[Session] = None
+) -> Any:
     """
     Format resource list as response format
 
     Args:
         kind: Resource type
         resources: Resource list
+        db: Session of the request, if any
 
     Returns:
         Any: Formatted list response object
@@ -131,7 +134,7 @@ def format_resource_list(kind: str, resources: List[Any]) -> Any:
 
     # Format resources and create response
     items = [
-        schema_class.parse_obj(kind_service._format_resource(kind, resource))
+        schema_class.parse_obj(kind_service._format_resource(kind, resource, db=db))
         for resource in resources
     ]
 
@@ -140,19 +143,22 @@ def format_resource_list(kind: str, resources: List[Any]) -> Any:
     )
 
 
-def format_single_resource(kind: str, resource: Any) -> Any:
+def format_single_resource(
+    kind: str, resource: Any, db: Optional[Session] = None
+) -> Any:
     """
     Format single resource as response format
 
     Args:
         kind: Resource type
         resource: Resource object
+        db: Session of the request, if any
 
     Returns:
         Any: Formatted resource object
     """
     schema_class = KIND_SCHEMA_MAP[kind]
-    return schema_class.parse_obj(kind_service._format_resource(kind, resource))
+    return schema_class.parse_obj(kind_service._format_resource(kind, resource, db=db))
 
 
 def validate_and_prepare_resource(
@@ -5,10 +5,13 @@
 """
 Unified Kind API endpoints for all Kubernetes-style CRD operations
 """
+
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Path, status
+from sqlalchemy.orm import Session
 
+from app.api.dependencies import get_db
 from app.api.endpoints.kind.common import (
     KIND_SCHEMA_MAP,
     format_resource_list,
@@ -36,6 +39,7 @@ async def get_resource(
         description="Resource type. Valid options: ghosts, models, shells, bots, teams, workspaces, tasks",
     ),
     name: str = Path(..., description="Resource name"),
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -48,7 +52,7 @@ async def get_resource(
     kind = validate_resource_type(kinds)
 
     # Get resource
-    resource = kind_service.get_resource(current_user.id, kind, namespace, name)
+    resource = kind_service.get_resource(current_user.id, kind, namespace, name, db=db)
     if not resource:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -56,7 +60,7 @@ async def get_resource(
         )
 
     # Format and return response
-    return format_single_resource(kind, resource)
+    return format_single_resource(kind, resource, db=db)
 
 
 @router.get("/namespaces/{namespace:path}/{kinds}")
@@ -69,6 +73,7 @@ async def list_resources(
         ...,
         description="Resource type. Valid options: ghosts, models, shells, bots, teams, workspaces, tasks",
     ),
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -81,10 +86,10 @@ async def list_resources(
     kind = validate_resource_type(kinds)
 
     # Get resources list
-    resources = kind_service.list_resources(current_user.id, kind, namespace)
+    resources = kind_service.list_resources(current_user.id, kind, namespace, db=db)
 
     # Format and return response
-    return format_resource_list(kind, resources)
+    return format_resource_list(kind, resources, db=db)
 
 
 @router.put("/namespaces/{namespace:path}/{kinds}/{name}")
@@ -99,6 +104,7 @@ async def update_resource(
     ),
     name: str = Path(..., description="Resource name"),
     resource: Dict[str, Any] = None,
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -116,11 +122,11 @@ async def update_resource(
 
     # Update resource
     resource_id = kind_service.update_resource(
-        current_user.id, kind, namespace, name, validated_resource
+        current_user.id, kind, namespace, name, validated_resource, db=db
     )
 
     # Format and return response
-    formatted_resource = kind_service._format_resource_by_id(kind, resource_id)
+    formatted_resource = kind_service._format_resource_by_id(kind, resource_id, db=db)
     schema_class = KIND_SCHEMA_MAP[kind]
     return schema_class.parse_obj(formatted_resource)
 
@@ -136,6 +142,7 @@ async def delete_resource(
         description="Resource type. Valid options: ghosts, models, shells, bots, teams, workspaces, tasks",
     ),
     name: str = Path(..., description="Resource name"),
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -148,7 +155,7 @@ async def delete_resource(
     kind = validate_resource_type(kinds)
 
     # Delete resource
-    kind_service.delete_resource(current_user.id, kind, namespace, name)
+    kind_service.delete_resource(current_user.id, kind, namespace, name, db=db)
 
     return {"message": f"Successfully deleted resource '{name}'"}
 
@@ -166,6 +173,7 @@ async def create_resource(
         description="Resource type. Valid options: ghosts, models, shells, bots, teams, workspaces, tasks",
     ),
     resource: Dict[str, Any] = None,
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -183,10 +191,10 @@ async def create_resource(
 
     # Create resource
     resource_id = kind_service.create_resource(
-        current_user.id, kind, validated_resource
+        current_user.id, kind, validated_resource, db=db
     )
 
     # Format and return response
-    formatted_resource = kind_service._format_resource_by_id(kind, resource_id)
+    formatted_resource = kind_service._format_resource_by_id(kind, resource_id, db=db)
     schema_class = KIND_SCHEMA_MAP[kind]
     return schema_class.parse_obj(formatted_resource)
@@ -8,7 +8,11 @@ This module provides functions to load and process chat history from database.
 """
 
 import asyncio
+import copy
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 from app.core.config import settings
@@ -46,7 +50,20 @@ async def _load_history_from_db(
     is_group_chat: bool,
     exclude_after_message_id: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Load chat history from database."""
+    """Load chat history from database.
+
+    History is read right after the previous turn was committed, so it always
+    comes from the primary: a lagging replica would drop the last exchange.
+    """
+    from app.db.session import async_sessions_enabled, run_in_async_session
+
+    if async_sessions_enabled():
+        return await run_in_async_session(
+            _load_history_from_db_sync,
+            task_id,
+            is_group_chat,
+            exclude_after_message_id,
+        )
     return await asyncio.to_thread(
         _load_history_from_db_sync,
         task_id,
@@ -55,26 +72,108 @@ async def _load_history_from_db(
     )
 
 
+@dataclass
+class _CachedHistory:
+    """Built history of a task up to a message_id watermark."""
+
+    watermark: int
+    # (count, max updated_at) of COMPLETED subtasks up to the watermark, used
+    # to detect completed, edited or deleted messages behind the watermark
+    fingerprint: tuple[int, Any]
+    messages: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    # Approximate size of the messages in bytes
+    size: int = 0
+
+
+# Built history per (task_id, is_group_chat), least recently used first
+_history_cache: "OrderedDict[tuple[int, bool], _CachedHistory]" = OrderedDict()
+_history_cache_bytes = 0
+_history_cache_lock = threading.Lock()
+
+
+def clear_history_cache() -> None:
+    """Drop all cached histories."""
+    global _history_cache_bytes
+    with _history_cache_lock:
+        _history_cache.clear()
+        _history_cache_bytes = 0
+
+
+def _message_size(value: Any) -> int:
+    """Approximate size of a message, dominated by text and base64 images."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_message_size(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_message_size(v) for v in value)
+    return 0
+
+
+def _store_history(cache_key: tuple[int, bool], entry: _CachedHistory) -> None:
+    """Cache a history, evicting the least recently used ones over the limits."""
+    global _history_cache_bytes
+    with _history_cache_lock:
+        previous = _history_cache.pop(cache_key, None)
+        if previous is not None:
+            _history_cache_bytes -= previous.size
+        # A history larger than the whole cache is rebuilt every time instead
+        if entry.size > settings.CHAT_HISTORY_CACHE_MAX_BYTES:
+            return
+        _history_cache[cache_key] = entry
+        _history_cache_bytes += entry.size
+        while (
+            len(_history_cache) > settings.CHAT_HISTORY_CACHE_MAX_TASKS
+            or _history_cache_bytes > settings.CHAT_HISTORY_CACHE_MAX_BYTES
+        ):
+            _, evicted = _history_cache.popitem(last=False)
+            _history_cache_bytes -= evicted.size
+
+
 def _load_history_from_db_sync(
     task_id: int,
     is_group_chat: bool,
     exclude_after_message_id: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Synchronous implementation of chat history retrieval."""
-    from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
-    from app.models.subtask_attachment import AttachmentStatus, SubtaskAttachment
+    """Synchronous implementation of chat history retrieval.
+
+    Messages built on previous turns are cached, so only subtasks after the
+    cached watermark are loaded and built. A cheap aggregate query checks that
+    nothing behind the watermark changed; otherwise the history is rebuilt.
+    """
+    from sqlalchemy import func
+
+    from app.models.subtask import Subtask, SubtaskStatus
     from app.models.user import User
     from app.services.attachment import attachment_service
     from app.services.chat.storage.db import _db_session
 
-    history: list[dict[str, Any]] = []
+    cache_key = (task_id, is_group_chat)
+    with _history_cache_lock:
+        cached = _history_cache.get(cache_key)
+
     with _db_session() as db:
+        if cached is not None:
+            fingerprint = tuple(
+                db.query(func.count(Subtask.id), func.max(Subtask.updated_at))
+                .filter(
+                    Subtask.task_id == task_id,
+                    Subtask.status == SubtaskStatus.COMPLETED,
+                    Subtask.message_id <= cached.watermark,
+                )
+                .one()
+            )
+            if fingerprint != cached.fingerprint:
+                cached = None
+
+        watermark = cached.watermark if cached else 0
         query = (
             db.query(Subtask, User.user_name)
             .outerjoin(User, Subtask.sender_user_id == User.id)
             .filter(
                 Subtask.task_id == task_id,
                 Subtask.status == SubtaskStatus.COMPLETED,
+                Subtask.message_id > watermark,
             )
         )
 
@@ -82,27 +181,90 @@ def _load_history_from_db_sync(
             query = query.filter(Subtask.message_id < exclude_after_message_id)
 
         subtasks = query.order_by(Subtask.message_id.asc()).all()
+        attachments = _load_attachments(db, [subtask for subtask, _ in subtasks])
 
+        messages = list(cached.messages) if cached else []
+        size = cached.size if cached else 0
         for subtask, sender_username in subtasks:
             msg = _build_history_message(
-                db, subtask, sender_username, attachment_service, is_group_chat
+                subtask,
+                sender_username,
+                attachments.get(subtask.id, []),
+                attachment_service,
+                is_group_chat,
             )
             if msg:
-                history.append(msg)
+                messages.append((subtask.message_id, msg))
+                size += _message_size(msg)
 
-    return history
+    if subtasks:
+        count, last_updated_at = cached.fingerprint if cached else (0, None)
+        updated_at = [s.updated_at for s, _ in subtasks if s.updated_at is not None]
+        if last_updated_at is not None:
+            updated_at.append(last_updated_at)
+        _store_history(
+            cache_key,
+            _CachedHistory(
+                watermark=subtasks[-1][0].message_id,
+                fingerprint=(count + len(subtasks), max(updated_at, default=None)),
+                messages=messages,
+                size=size,
+            ),
+        )
+    elif cached is not None:
+        with _history_cache_lock:
+            if cache_key in _history_cache:
+                _history_cache.move_to_end(cache_key)
+
+    # Copy the messages so callers cannot modify the cached content lists
+    return [
+        copy.deepcopy(msg)
+        for message_id, msg in messages
+        if exclude_after_message_id is None or message_id < exclude_after_message_id
+    ]
+
+
+def _load_attachments(db, subtasks: list) -> dict[int, list]:
+    """Load READY attachments of the user subtasks in one query.
+
+    binary_data holds the original file and is never needed to build the
+    prompt, so it is deferred and stays in the database.
+    """
+    from sqlalchemy.orm import defer
+
+    from app.models.subtask import SubtaskRole
+    from app.models.subtask_attachment import AttachmentStatus, SubtaskAttachment
+
+    subtask_ids = [s.id for s in subtasks if s.role == SubtaskRole.USER]
+    if not subtask_ids:
+        return {}
+
+    attachments = (
+        db.query(SubtaskAttachment)
+        .options(defer(SubtaskAttachment.binary_data))
+        .filter(
+            SubtaskAttachment.subtask_id.in_(subtask_ids),
+            SubtaskAttachment.status == AttachmentStatus.READY,
+        )
+        .order_by(SubtaskAttachment.id.asc())
+        .all()
+    )
+
+    by_subtask: dict[int, list] = {}
+    for attachment in attachments:
+        by_subtask.setdefault(attachment.subtask_id, []).append(attachment)
+    return by_subtask
 
 
 def _build_history_message(
-    db,
     subtask,
     sender_username: str | None,
+    attachments: list,
     attachment_service,
     is_group_chat: bool = False,
 ) -> dict[str, Any] | None:
-    """Build a single history message from a subtask."""
+    """Build a single history message from a subtask and its attachments."""
     from app.models.subtask import SubtaskRole
-    from app.models.subtask_attachment import AttachmentStatus, SubtaskAttachment
 
     if subtask.role == SubtaskRole.USER:
         # Build text content
@@ -110,16 +272,6 @@ def _build_history_message(
         if is_group_chat and sender_username:
             text_content = f"User[{sender_username}]: {text_content}"
 
-        # Get attachments
-        attachments = (
-            db.query(SubtaskAttachment)
-            .filter(
-                SubtaskAttachment.subtask_id == subtask.id,
-                SubtaskAttachment.status == AttachmentStatus.READY,
-            )
-            .all()
-        )
-
         if not attachments:
             return {"role": "user", "content": text_content}
 
@@ -244,8 +244,8 @@ class SSEStreamingHandler:
                     on_tool_event=handle_tool_event,
                 ):
                     if not await core.process_token(token):
-                        # Cancelled
-                        if emitter.has_events():
+                        # Cancelled: buffered chunk and cancellation
+                        while emitter.has_events():
                             yield emitter.get_event()
                         return
 
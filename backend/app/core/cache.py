@@ -4,7 +4,10 @@
 
 import asyncio
 import logging
-from typing import Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 import orjson
 from redis import Redis as SyncRedis
@@ -24,19 +27,126 @@ class RedisCache:
         self._connection_params = {
             "encoding": "utf-8",
             "decode_responses": False,
-            "max_connections": 10,
+            "max_connections": settings.REDIS_MAX_CONNECTIONS,
             "socket_timeout": 5.0,
             "socket_connect_timeout": 2.0,
             "retry_on_timeout": True,
         }
+        self._lock = threading.Lock()
+        # One pooled async client per event loop, keyed by id(loop)
+        self._clients: Dict[int, tuple[asyncio.AbstractEventLoop, Redis]] = {}
+        self._sync_client: Optional[SyncRedis] = None
+        # Per-operation latency: operation -> [count, errors, total_ms, max_ms]
+        self._stats: Dict[str, List[float]] = {}
 
     async def _get_client(self) -> Redis:
         """
-        Get Redis client, simply and directly create new connection
+        Get the pooled Redis client bound to the running event loop.
+
+        redis.asyncio connections belong to the loop that opened them, and a
+        client shared across loops (the server loop, asyncio.run() in worker
+        threads) fails with "Event loop is closed". Each loop therefore gets
+        its own client and connection pool, and clients of closed loops are
+        dropped. The client is shared: callers must not close it.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(id(loop))
+            if entry is not None and entry[0] is loop:
+                return entry[1]
+            # Connections of closed loops are already dead, just forget them
+            for key, (other_loop, _) in list(self._clients.items()):
+                if other_loop.is_closed():
+                    del self._clients[key]
+            client = Redis.from_url(self._url, **self._connection_params)
+            self._clients[id(loop)] = (loop, client)
+            return client
+
+    def _create_client(self) -> Redis:
+        """
+        Create a dedicated client outside the pool.
+
+        Used for long-lived connections such as Pub/Sub subscriptions that
+        would otherwise hold a pooled connection. The caller must close it.
         """
-        # Create new client every time to avoid event loop closure issues
         return Redis.from_url(self._url, **self._connection_params)
 
+    def _get_sync_client(self) -> SyncRedis:
+        # The sync client's connection pool is thread-safe (and resets itself
+        # after fork), so one instance is shared by all threads
+        if self._sync_client is None:
+            with self._lock:
+                if self._sync_client is None:
+                    self._sync_client = SyncRedis.from_url(
+                        self._url,
+                        encoding="utf-8",
+                        decode_responses=False,
+                        max_connections=settings.REDIS_MAX_CONNECTIONS,
+                        socket_timeout=5.0,
+                        socket_connect_timeout=2.0,
+                    )
+        return self._sync_client
+
+    async def close(self) -> None:
+        """Close pooled connections. Called on application shutdown."""
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+            sync_client, self._sync_client = self._sync_client, None
+
+        for loop, client in clients:
+            try:
+                if loop is current_loop:
+                    await client.aclose()
+                elif loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            except Exception as e:
+                logger.warning(f"Error closing Redis client: {e}")
+        if sync_client is not None:
+            sync_client.close()
+
+    @contextmanager
+    def track(self, operation: str) -> Iterator[None]:
+        """Record the latency of a Redis operation (usable from sync and async code)"""
+        from shared.telemetry.metrics import record_redis_operation
+
+        start = time.perf_counter()
+        success = True
+        try:
+            yield
+        except Exception:
+            success = False
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                stats = self._stats.setdefault(operation, [0, 0, 0.0, 0.0])
+                stats[0] += 1
+                stats[1] += 0 if success else 1
+                stats[2] += duration_ms
+                stats[3] = max(stats[3], duration_ms)
+            record_redis_operation(operation, duration_ms, success)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool usage and per-operation latency"""
+        with self._lock:
+            operations = {
+                operation: {
+                    "count": int(count),
+                    "errors": int(errors),
+                    "avg_ms": round(total_ms / count, 3) if count else 0.0,
+                    "max_ms": round(max_ms, 3),
+                }
+                for operation, (count, errors, total_ms, max_ms) in self._stats.items()
+            }
+            pools = len(self._clients)
+        return {"event_loop_pools": pools, "operations": operations}
+
     def generate_full_cache_key(self, user_id: int, git_domain: str) -> str:
         """Generate cache key for full user repositories list"""
         # Keep the raw key without hashing, as requested
@@ -46,42 +156,30 @@ class RedisCache:
         """Get value from cache"""
         try:
             client = await self._get_client()
-            try:
+            with self.track("get"):
                 data = await client.get(key)
-                if data is None:
-                    return None
-                try:
-                    return orjson.loads(data)
-                except Exception:
-                    # If value was stored as plain bytes/string
-                    return data
-            finally:
-                await client.aclose()
+            return self._loads(data)
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {str(e)}")
             return None
 
+    @staticmethod
+    def _loads(data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return orjson.loads(data)
+        except Exception:
+            # If value was stored as plain bytes/string
+            return data
+
     def get_sync(self, key: str) -> Optional[Any]:
         """Get value from cache synchronously"""
         try:
-            client = SyncRedis.from_url(
-                self._url,
-                encoding="utf-8",
-                decode_responses=False,
-                socket_timeout=5.0,
-                socket_connect_timeout=2.0,
-            )
-            try:
+            client = self._get_sync_client()
+            with self.track("get_sync"):
                 data = client.get(key)
-                if data is None:
-                    return None
-                try:
-                    return orjson.loads(data)
-                except Exception:
-                    # If value was stored as plain bytes/string
-                    return data
-            finally:
-                client.close()
+            return self._loads(data)
         except Exception as e:
             logger.error(f"Error getting cache key {key} (sync): {str(e)}")
             return None
@@ -108,12 +206,10 @@ class RedisCache:
         """Set value to cache with expiration (seconds)"""
         try:
             client = await self._get_client()
-            try:
-                payload = orjson.dumps(value)
+            payload = orjson.dumps(value)
+            with self.track("set"):
                 ok = await client.set(key, payload, ex=expire)
-                return bool(ok)
-            finally:
-                await client.aclose()
+            return bool(ok)
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {str(e)}")
             return False
@@ -124,12 +220,10 @@ class RedisCache:
         """Set value to cache only if key doesn't exist (SETNX operation)"""
         try:
             client = await self._get_client()
-            try:
-                payload = orjson.dumps(value)
+            payload = orjson.dumps(value)
+            with self.track("setnx"):
                 ok = await client.set(key, payload, ex=expire, nx=True)
-                return bool(ok)
-            finally:
-                await client.aclose()
+            return bool(ok)
         except Exception as e:
             logger.error(f"Error setting cache key {key} with SETNX: {str(e)}")
             return False
@@ -138,15 +232,58 @@ class RedisCache:
         """Delete key from cache"""
         try:
             client = await self._get_client()
-            try:
+            with self.track("delete"):
                 deleted = await client.delete(key)
-                return deleted > 0
-            finally:
-                await client.aclose()
+            return deleted > 0
         except Exception as e:
             logger.error(f"Error deleting cache key {key}: {str(e)}")
             return False
 
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round trip (MGET)"""
+        if not keys:
+            return []
+        try:
+            client = await self._get_client()
+            with self.track("get_many"):
+                values = await client.mget(keys)
+            return [self._loads(data) for data in values]
+        except Exception as e:
+            logger.error(f"Error getting cache keys {keys}: {str(e)}")
+            return [None] * len(keys)
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = settings.REPO_CACHE_EXPIRED_TIME,
+    ) -> bool:
+        """Set several values with expiration in one pipelined round trip"""
+        if not mapping:
+            return True
+        try:
+            client = await self._get_client()
+            with self.track("set_many"):
+                async with client.pipeline(transaction=False) as pipe:
+                    for key, value in mapping.items():
+                        pipe.set(key, orjson.dumps(value), ex=expire)
+                    results = await pipe.execute()
+            return all(results)
+        except Exception as e:
+            logger.error(f"Error setting cache keys {list(mapping)}: {str(e)}")
+            return False
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys in one round trip, returns the number deleted"""
+        if not keys:
+            return 0
+        try:
+            client = await self._get_client()
+            with self.track("delete_many"):
+                return await client.delete(*keys)
+        except Exception as e:
+            logger.error(f"Error deleting cache keys {keys}: {str(e)}")
+            return 0
+
     async def cleanup_expired(self):
         """No-op: Redis handles expiration via TTL."""
         return None
@@ -155,10 +292,8 @@ class RedisCache:
         """Get approximate number of keys in current DB"""
         try:
             client = await self._get_client()
-            try:
+            with self.track("dbsize"):
                 return await client.dbsize()
-            finally:
-                await client.aclose()
         except Exception as e:
             logger.error(f"Error getting cache size: {str(e)}")
             return 0
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cross-worker invalidation of in-process caches.
+
+A cache publishes a small JSON message on its Redis pub/sub channel when
+committed data it mirrors changes, and every worker runs a listener that
+passes received messages to the cache's handler.
+
+Messages are published from after_commit hooks, which also run on the event
+loop, so they are handed to a BackgroundPublisher instead of waiting for Redis.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+import orjson
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundPublisher:
+    """Publishes pub/sub messages from a daemon thread, never blocking the caller"""
+
+    def __init__(
+        self,
+        url: str,
+        max_pending: int = 1000,
+        retry_after: float = 5.0,
+    ):
+        """
+        Args:
+            url: Redis URL
+            max_pending: Messages queued before new ones are dropped
+            retry_after: Seconds messages are dropped after a failed publish,
+                so an unreachable Redis does not hold every message for the
+                socket timeout
+        """
+        self._url = url
+        self._retry_after = retry_after
+        self._queue: "queue.Queue[tuple[str, Union[str, bytes], str]]" = queue.Queue(
+            max_pending
+        )
+        self._client: Optional[SyncRedis] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._failed_until = 0.0
+
+    def publish(self, channel: str, data: Union[str, bytes], name: str) -> None:
+        """Queue a message for publishing. Never blocks or raises."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((channel, data, name))
+        except queue.Full:
+            logger.warning(f"Dropping {name} message, publish queue is full")
+
+    def flush(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the queued messages to be published"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="redis-publisher", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def _get_client(self) -> SyncRedis:
+        if self._client is None:
+            self._client = SyncRedis.from_url(
+                self._url,
+                socket_timeout=2.0,
+                socket_connect_timeout=2.0,
+            )
+        return self._client
+
+    def _run(self) -> None:
+        while True:
+            channel, data, name = self._queue.get()
+            try:
+                if time.monotonic() < self._failed_until:
+                    logger.debug(f"Dropping {name} message, Redis unavailable")
+                    continue
+                self._get_client().publish(channel, data)
+            except Exception as e:
+                self._failed_until = time.monotonic() + self._retry_after
+                logger.warning(f"Failed to publish {name} message: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class InvalidationChannel:
+    """Redis pub/sub channel carrying invalidation messages for one cache"""
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        channel: str,
+        handler: Callable[[Dict[str, Any]], None],
+        on_subscribe: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            name: Cache name used in log messages
+            url: Redis URL
+            channel: Pub/sub channel name
+            handler: Called with every received message
+            on_subscribe: Called after each (re)subscription, since messages
+                published while no subscription existed were missed
+        """
+        self._name = name
+        self._url = url
+        self._channel = channel
+        self._handler = handler
+        self._on_subscribe = on_subscribe
+        self.publisher = BackgroundPublisher(url)
+        self._listener_task: Optional[asyncio.Task] = None
+        self._shutdown = False
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        """Publish an invalidation message in the background. Never raises."""
+        try:
+            data = orjson.dumps(message)
+        except Exception as e:
+            logger.warning(f"Failed to encode {self._name} invalidation: {e}")
+            return
+        self.publisher.publish(self._channel, data, f"{self._name} invalidation")
+
+    def handle(self, data: bytes) -> None:
+        """Pass a raw message received on the channel to the handler"""
+        self._handler(orjson.loads(data))
+
+    async def start_listener(self) -> None:
+        """Start listening for invalidations published by other workers"""
+        if self._listener_task is not None:
+            return
+        self._shutdown = False
+        self._listener_task = asyncio.create_task(self._listener())
+        logger.info(f"[{self._name}] Started invalidation listener")
+
+    async def stop_listener(self) -> None:
+        """Stop the invalidation listener"""
+        self._shutdown = True
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+            logger.info(f"[{self._name}] Stopped invalidation listener")
+
+    async def _listener(self) -> None:
+        while not self._shutdown:
+            try:
+                client = Redis.from_url(
+                    self._url, socket_timeout=None, socket_connect_timeout=5.0
+                )
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self._channel)
+                if self._on_subscribe is not None:
+                    self._on_subscribe()
+
+                async for message in pubsub.listen():
+                    if self._shutdown:
+                        break
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        self.handle(message["data"])
+                    except Exception as e:
+                        logger.error(
+                            f"[{self._name}] Invalid invalidation message: {e}"
+                        )
+
+                await pubsub.unsubscribe(self._channel)
+                await client.aclose()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                if not self._shutdown:
+                    logger.error(
+                        f"[{self._name}] Invalidation listener error: {e}, "
+                        f"reconnecting in 1s..."
+                    )
+                    await asyncio.sleep(1)
@@ -3,7 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Logger of the per-request access log lines
+ACCESS_LOGGER_NAME = "app.access"
+# Access log records waiting for the background writer; more are dropped
+ACCESS_LOG_QUEUE_SIZE = 10000
 
 
 class RequestIdFilter(logging.Filter):
@@ -24,6 +32,11 @@ class RequestIdFilter(logging.Filter):
         Returns:
             True (always allow the record to be logged)
         """
+        # Records handed over by the access log queue were already tagged
+        # in the request's context
+        if hasattr(record, "request_id"):
+            return True
+
         try:
             from shared.telemetry.context import get_request_id
 
@@ -66,3 +79,67 @@ def setup_logging() -> None:
 
     logging.getLogger("uvicorn.access").handlers.clear()
     logging.getLogger("uvicorn.access").propagate = False
+
+
+class _AccessLogQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the background writer.
+
+    The stock QueueHandler formats each record in the calling thread. Access
+    log records only carry immutable arguments, so they are enqueued as they
+    are and the request only pays for creating the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Logging must never block or fail a request
+            pass
+
+
+_access_log_listener: Optional[QueueListener] = None
+
+
+def start_access_log_queue() -> None:
+    """
+    Write access log records from a background thread.
+
+    Records of the access logger are tagged with the request ID and put on a
+    bounded queue, and a listener thread passes them to the root handlers.
+    """
+    global _access_log_listener
+    if _access_log_listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(maxsize=ACCESS_LOG_QUEUE_SIZE)
+    handler = _AccessLogQueueHandler(log_queue)
+    handler.addFilter(RequestIdFilter())
+
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    access_logger.addHandler(handler)
+    access_logger.propagate = False
+
+    _access_log_listener = QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    _access_log_listener.start()
+
+
+def stop_access_log_queue() -> None:
+    """Flush queued access log records and log them synchronously again"""
+    global _access_log_listener
+    if _access_log_listener is None:
+        return
+
+    access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+    for handler in list(access_logger.handlers):
+        if isinstance(handler, _AccessLogQueueHandler):
+            access_logger.removeHandler(handler)
+    access_logger.propagate = True
+
+    _access_log_listener.stop()
+    _access_log_listener = None
@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cache of authenticated principals.
+
+Resolving a bearer token or API key to a user costs one to three queries per
+request. Resolved principals are therefore cached in process, keyed by the
+SHA-256 of the credential. An entry holds an immutable snapshot of the
+user's columns and is attached to the request's session on a hit without a
+query (Session.merge(load=False)), so endpoints still receive a regular
+persistent User they can modify.
+
+Entries live for AUTH_PRINCIPAL_CACHE_TTL_SECONDS at most, and never past
+the expiry of the token or key. Committed changes to a User or APIKey row
+(deactivation, revocation, profile updates) drop the affected entries in
+every worker through a Redis pub/sub channel.
+
+Decoded JWT claims are cached the same way, so the logging middleware and
+the authentication dependency share one decode per token.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.cache_invalidation import InvalidationChannel
+from app.core.config import settings
+from app.models.api_key import APIKey
+from app.models.user import User
+
+# Session.info key collecting principal changes until commit
+_PENDING_CHANGES_KEY = "principal_changes"
+
+
+def credential_hash(credential: str) -> str:
+    """SHA-256 hex digest of a token or API key"""
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """Snapshot of an authenticated user and the API key used, if any"""
+
+    user: Mapping[str, Any]
+    api_key_name: Optional[str] = None
+
+
+def snapshot_user(user: User) -> Mapping[str, Any]:
+    """Immutable copy of a user's column values"""
+    return MappingProxyType(
+        {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in inspect(User).column_attrs
+        }
+    )
+
+
+def attach_user(db: Session, snapshot: Mapping[str, Any]) -> User:
+    """Return a persistent User for a snapshot without querying the database"""
+    user = User(**copy.deepcopy(dict(snapshot)))
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+class PrincipalCache:
+    """In-process TTL cache of decoded tokens and resolved principals"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int, url: str, channel: str):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # token hash -> (expires_at, claims), oldest first
+        self._claims: "OrderedDict[str, Tuple[float, Mapping[str, Any]]]" = (
+            OrderedDict()
+        )
+        # cache key -> (expires_at, principal, user_id, api_key_id), oldest first
+        self._principals: (
+            "OrderedDict[str, Tuple[float, CachedPrincipal, int, Optional[int]]]"
+        ) = OrderedDict()
+        # Bumped by every invalidation so loads racing with it are not stored
+        self._generation = 0
+        self.channel = InvalidationChannel(
+            "PrincipalCache",
+            url,
+            channel,
+            handler=self._handle_message,
+            # Revocations published while no subscription existed were missed
+            on_subscribe=self.clear,
+        )
+
+    def _lifetime(self, expires_in: Optional[float]) -> float:
+        if expires_in is None:
+            return self._ttl
+        return min(self._ttl, expires_in)
+
+    def _store(self, entries: OrderedDict, key: str, value: tuple) -> None:
+        entries.pop(key, None)
+        entries[key] = value
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+    def get_claims(self, token_hash: str) -> Optional[Mapping[str, Any]]:
+        """Return the cached claims of a token if not expired"""
+        with self._lock:
+            cached = self._claims.get(token_hash)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def put_claims(
+        self, token_hash: str, claims: Mapping[str, Any], expires_in: Optional[float]
+    ) -> None:
+        """Cache decoded claims for at most expires_in seconds"""
+        lifetime = self._lifetime(expires_in)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._store(
+                self._claims,
+                token_hash,
+                (time.monotonic() + lifetime, MappingProxyType(dict(claims))),
+            )
+
+    def generation(self) -> int:
+        """Current invalidation generation, to be passed to put_principal"""
+        with self._lock:
+            return self._generation
+
+    def get_principal(self, key: str) -> Optional[CachedPrincipal]:
+        """Return the cached principal for a credential key if not expired"""
+        with self._lock:
+            cached = self._principals.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def put_principal(
+        self,
+        key: str,
+        principal: CachedPrincipal,
+        *,
+        generation: int,
+        api_key_id: Optional[int] = None,
+        expires_in: Optional[float] = None,
+    ) -> None:
+        """
+        Cache a resolved principal.
+
+        Args:
+            key: Credential key, see get_principal
+            principal: Resolved principal
+            generation: Value of generation() taken before the principal was
+                loaded; the entry is dropped if an invalidation happened since
+            api_key_id: ID of the API key used, for revocation
+            expires_in: Seconds until the credential expires
+        """
+        lifetime = self._lifetime(expires_in)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._store(
+                self._principals,
+                key,
+                (
+                    time.monotonic() + lifetime,
+                    principal,
+                    principal.user["id"],
+                    api_key_id,
+                ),
+            )
+
+    def invalidate(
+        self, user_ids: Iterable[int] = (), api_key_ids: Iterable[int] = ()
+    ) -> None:
+        """Drop the principals of the given users and API keys"""
+        user_ids = set(user_ids)
+        api_key_ids = set(api_key_ids)
+        with self._lock:
+            self._generation += 1
+            for key, (_, _, user_id, api_key_id) in list(self._principals.items()):
+                if user_id in user_ids or api_key_id in api_key_ids:
+                    del self._principals[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._generation += 1
+            self._claims.clear()
+            self._principals.clear()
+
+    def publish_invalidation(
+        self, user_ids: Iterable[int], api_key_ids: Iterable[int]
+    ) -> None:
+        """Ask every worker to drop the given principals. Never raises."""
+        self.channel.publish(
+            {"user_ids": sorted(user_ids), "api_key_ids": sorted(api_key_ids)}
+        )
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        self.invalidate(message.get("user_ids") or [], message.get("api_key_ids") or [])
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    url=settings.REDIS_URL,
+    channel=settings.AUTH_PRINCIPAL_INVALIDATE_CHANNEL,
+)
+
+
+def _changed_principals(session: Session) -> Tuple[Set[int], Set[int]]:
+    """Collect IDs of users and API keys changed by the flush"""
+    user_ids, api_key_ids = set(), set()
+    for obj in chain(session.dirty, session.deleted):
+        # Loading a user assigns decrypted git_info, which is not a change
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, User) and obj.id is not None:
+            user_ids.add(obj.id)
+        elif isinstance(obj, APIKey) and obj.id is not None:
+            api_key_ids.add(obj.id)
+    return user_ids, api_key_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session: Session, flush_context) -> None:
+    user_ids, api_key_ids = _changed_principals(session)
+    if not user_ids and not api_key_ids:
+        return
+    principal_cache.invalidate(user_ids, api_key_ids)
+    pending_user_ids, pending_api_key_ids = session.info.get(
+        _PENDING_CHANGES_KEY, (set(), set())
+    )
+    session.info[_PENDING_CHANGES_KEY] = (
+        pending_user_ids | user_ids,
+        pending_api_key_ids | api_key_ids,
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changes is None:
+        return
+    principal_cache.invalidate(*changes)
+    principal_cache.publish_invalidation(*changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
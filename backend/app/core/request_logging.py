@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Request logging middleware.
+
+Logs one access line when a request arrives and one when its response
+starts, sets the request context used by log records and traces, and adds
+an X-Request-ID response header.
+
+When OpenTelemetry body capture is enabled, request and response bodies are
+teed into span attributes as they stream through: only the first
+max_body_size bytes are kept and the messages themselves are passed on
+untouched, so responses are never buffered or rebuilt. Body capture can be
+restricted to some routes and sampled (OTEL_BODY_CAPTURE_URLS,
+OTEL_BODY_CAPTURE_SAMPLE_RATE).
+"""
+
+import json
+import logging
+import time
+import uuid
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import ACCESS_LOGGER_NAME
+from shared.telemetry.config import OtelConfig
+
+logger = logging.getLogger(__name__)
+access_logger = logging.getLogger(ACCESS_LOGGER_NAME)
+
+_SENSITIVE_HEADERS = ("authorization", "cookie", "set-cookie")
+
+
+class _BodyTee:
+    """Keeps the first max_size bytes of a body passing through"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.head = bytearray()
+        self.total = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self.total += len(chunk)
+        room = self.max_size - len(self.head)
+        if room > 0 and chunk:
+            self.head += chunk[:room]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.max_size
+
+    def text(self) -> Optional[str]:
+        if not self.total:
+            return None
+        text = self.head.decode("utf-8", errors="replace")
+        if self.truncated:
+            text += f"... [truncated, total size: {self.total} bytes]"
+        return text
+
+
+def _current_span():
+    from opentelemetry import trace
+
+    span = trace.get_current_span()
+    if span and span.is_recording():
+        return span
+    return None
+
+
+def _record_request_body(tee: _BodyTee) -> None:
+    """Add the captured request body and the task it refers to to the trace"""
+    from shared.telemetry.context import set_task_context, set_user_context
+
+    request_body = tee.text()
+    if not request_body:
+        return
+
+    # Extract task_id and subtask_id from request body for tracing
+    if not tee.truncated:
+        try:
+            body_json = json.loads(tee.head)
+            task_id = body_json.get("task_id")
+            subtask_id = body_json.get("subtask_id")
+            if task_id is not None or subtask_id is not None:
+                set_task_context(task_id=task_id, subtask_id=subtask_id)
+            # Extract user_id from request body if available
+            user_id = body_json.get("user_id")
+            if user_id is not None:
+                set_user_context(user_id=str(user_id))
+        except (ValueError, TypeError, AttributeError):
+            pass  # Not a JSON object, skip task context extraction
+
+    span = _current_span()
+    if span is not None:
+        span.set_attribute("http.request.body", request_body)
+
+
+class RequestLoggingMiddleware:
+    """Pure ASGI access logging and OpenTelemetry body capture middleware"""
+
+    def __init__(self, app: ASGIApp, otel_config: OtelConfig):
+        self.app = app
+        self.otel_config = otel_config
+
+    def _tracing_enabled(self) -> bool:
+        if not self.otel_config.enabled:
+            return False
+        from shared.telemetry.core import is_telemetry_enabled
+
+        return is_telemetry_enabled()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip logging for health check/probe requests (root path)
+        if scope["type"] != "http" or scope["path"] == "/":
+            await self.app(scope, receive, send)
+            return
+
+        from app.core.security import get_username_from_request
+        from shared.telemetry.config import should_capture_body
+        from shared.telemetry.context import set_request_context, set_user_context
+
+        # Use first 8 characters of UUID as request ID
+        request_id = str(uuid.uuid4())[:8]
+        scope.setdefault("state", {})["request_id"] = request_id
+        start_time = time.time()
+
+        method = scope["method"]
+        path = scope["path"]
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        client = scope.get("client")
+        client_ip = client[0] if client else "Unknown"
+        username = get_username_from_request(Request(scope))
+
+        # Always set request context for logging (works even without OTEL)
+        set_request_context(request_id)
+        if username:
+            set_user_context(user_name=username)
+
+        config = self.otel_config
+        tracing = self._tracing_enabled()
+        capture_body = (
+            tracing
+            and (config.capture_request_body or config.capture_response_body)
+            and should_capture_body(path, config)
+        )
+
+        if (
+            capture_body
+            and config.capture_request_body
+            and method in ("POST", "PUT", "PATCH")
+        ):
+            receive = self._tee_request(receive, _BodyTee(config.max_body_size))
+
+        access_logger.info(
+            "request : %s %s %s %s %s [%s]",
+            method,
+            path,
+            query_string,
+            request_id,
+            client_ip,
+            username,
+        )
+
+        response_tee: Optional[_BodyTee] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_tee
+            if message["type"] == "http.response.start":
+                process_time = (time.time() - start_time) * 1000
+                headers = MutableHeaders(scope=message)
+
+                span = _current_span() if tracing else None
+                if span is not None and config.capture_response_headers:
+                    for header_name, header_value in headers.items():
+                        # Skip sensitive headers
+                        if header_name.lower() in _SENSITIVE_HEADERS:
+                            header_value = "[REDACTED]"
+                        span.set_attribute(
+                            f"http.response.header.{header_name}", header_value
+                        )
+
+                # Streamed event responses never end while the client listens
+                if (
+                    capture_body
+                    and config.capture_response_body
+                    and not headers.get("content-type", "").startswith(
+                        "text/event-stream"
+                    )
+                ):
+                    response_tee = _BodyTee(config.max_body_size)
+
+                # Add request ID to response headers for client-side tracking
+                headers["X-Request-ID"] = request_id
+
+                access_logger.info(
+                    "response: %s %s %s %s %s [%s] %s %.2fms",
+                    method,
+                    path,
+                    query_string,
+                    request_id,
+                    client_ip,
+                    username,
+                    message["status"],
+                    process_time,
+                )
+
+            elif message["type"] == "http.response.body" and response_tee is not None:
+                response_tee.feed(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body_str = response_tee.text()
+                    response_tee = None
+                    span = _current_span()
+                    if body_str and span is not None:
+                        span.set_attribute("http.response.body", body_str)
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _tee_request(receive: Receive, tee: _BodyTee) -> Receive:
+        done = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal done
+            message = await receive()
+            if message["type"] == "http.request" and not done:
+                tee.feed(message.get("body", b""))
+                if not message.get("more_body", False):
+                    done = True
+                    try:
+                        _record_request_body(tee)
+                    except Exception as e:
+                        logger.debug(f"Failed to capture request body: {e}")
+            return message
+
+        return receive_wrapper
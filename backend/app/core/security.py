@@ -6,6 +6,7 @@ import hashlib
 import json
 import logging
 import re
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -20,6 +21,13 @@ from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_db
 from app.core.config import settings
+from app.core.principal_cache import (
+    CachedPrincipal,
+    attach_user,
+    credential_hash,
+    principal_cache,
+    snapshot_user,
+)
 from app.models.api_key import KEY_TYPE_PERSONAL, KEY_TYPE_SERVICE, APIKey
 from app.models.user import User
 from app.schemas.user import TokenData
@@ -47,7 +55,13 @@ def get_current_user(
     token_data = verify_token(token)
     username = token_data.get("username")
 
+    cache_key = f"jwt:{credential_hash(token)}"
+    cached = principal_cache.get_principal(cache_key)
+    if cached is not None:
+        return attach_user(db, cached.user)
+
     # Query user
+    generation = principal_cache.generation()
     user = user_service.get_user_by_name(db=db, user_name=username)
     if user is None:
         raise HTTPException(
@@ -61,6 +75,9 @@ def get_current_user(
             detail="User not activated",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    principal_cache.put_principal(
+        cache_key, CachedPrincipal(user=snapshot_user(user)), generation=generation
+    )
     return user
 
 
@@ -120,6 +137,52 @@ def create_access_token(
     return encoded_jwt
 
 
+# Scope of tokens that only allow reporting the status of one subtask
+EXECUTOR_STATUS_SCOPE = "executor_status"
+
+
+def create_executor_status_token(task_id: int, subtask_id: int) -> str:
+    """
+    Create a token that allows an executor to report the status of a subtask
+
+    Args:
+        task_id: Task ID
+        subtask_id: Subtask ID
+
+    Returns:
+        Status token, not accepted as a user access token
+    """
+    return create_access_token(
+        data={
+            "scope": EXECUTOR_STATUS_SCOPE,
+            "task_id": task_id,
+            "subtask_id": subtask_id,
+        },
+        expires_delta=settings.EXECUTOR_STATUS_TOKEN_EXPIRE_MINUTES,
+    )
+
+
+def verify_executor_status_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify an executor status token
+
+    Args:
+        token: Status token
+
+    Returns:
+        Token claims with task_id and subtask_id, or None if the token is invalid
+    """
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    except JWTError:
+        return None
+    if payload.get("scope") != EXECUTOR_STATUS_SCOPE:
+        return None
+    return payload
+
+
 def authenticate_user(
     db: Session, username: str, password: Optional[str] = None, **kwargs
 ) -> Union[User, None]:
@@ -170,6 +233,13 @@ def verify_token(token: str) -> Dict[str, Any]:
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    # Decoded claims are shared by the request logging middleware and the
+    # authentication dependency
+    token_hash = credential_hash(token)
+    claims = principal_cache.get_claims(token_hash)
+    if claims is not None:
+        return dict(claims)
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -178,10 +248,16 @@ def verify_token(token: str) -> Dict[str, Any]:
         if username is None:
             raise credentials_exception
         token_data = TokenData(username=username)
-        return {"username": token_data.username}
     except JWTError:
         raise credentials_exception
 
+    claims = {"username": token_data.username}
+    exp = payload.get("exp")
+    principal_cache.put_claims(
+        token_hash, claims, exp - time.time() if exp is not None else None
+    )
+    return claims
+
 
 def get_username_from_request(request) -> str:
     """
@@ -322,6 +398,14 @@ def get_auth_context(
         )
 
     key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    cache_key = f"api_key:{key_hash}:{wegent_username or ''}"
+    cached = principal_cache.get_principal(cache_key)
+    if cached is not None:
+        return AuthContext(
+            user=attach_user(db, cached.user), api_key_name=cached.api_key_name
+        )
+
+    generation = principal_cache.generation()
     api_key_record = (
         db.query(APIKey)
         .filter(
@@ -338,21 +422,36 @@ def get_auth_context(
         )
 
     # Check expiration
-    if api_key_record.expires_at < datetime.utcnow():
+    now = datetime.utcnow()
+    if api_key_record.expires_at < now:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="API key has expired",
         )
 
-    # Update last_used_at
-    api_key_record.last_used_at = datetime.utcnow()
+    # Update last_used_at, only when the key is not cached. A bulk update
+    # leaves the record unmodified in the session, so it does not revoke
+    # cached principals of the key.
+    db.query(APIKey).filter(APIKey.id == api_key_record.id).update(
+        {"last_used_at": now}, synchronize_session=False
+    )
     db.commit()
 
+    def cached_context(user: User) -> AuthContext:
+        principal_cache.put_principal(
+            cache_key,
+            CachedPrincipal(user=snapshot_user(user), api_key_name=api_key_record.name),
+            generation=generation,
+            api_key_id=api_key_record.id,
+            expires_in=(api_key_record.expires_at - now).total_seconds(),
+        )
+        return AuthContext(user=user, api_key_name=api_key_record.name)
+
     # Personal key: return the key owner directly
     if api_key_record.key_type == KEY_TYPE_PERSONAL:
         user = db.query(User).filter(User.id == api_key_record.user_id).first()
         if user and user.is_active:
-            return AuthContext(user=user, api_key_name=api_key_record.name)
+            return cached_context(user)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -382,7 +481,7 @@ def get_auth_context(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail=f"User '{wegent_username}' is inactive",
                 )
-            return AuthContext(user=user, api_key_name=api_key_record.name)
+            return cached_context(user)
 
         # User not found, auto-create for service key authentication
         logger.info(
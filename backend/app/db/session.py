@@ -2,24 +2,237 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from sqlalchemy import create_engine
+"""
+Database engines and session factories.
+
+- engine/SessionLocal: the primary database.
+- read_engine/ReadSessionLocal: the read replica (DATABASE_READ_URL) for
+  list and search reads that tolerate replication lag, the primary
+  otherwise. Reads of data the caller may just have written, such as chat
+  history, must use the primary.
+- AsyncSessionLocal/AsyncReadSessionLocal: async (asyncmy) session
+  factories of the same databases, only created when DB_ASYNC_ENABLED.
+
+Pools are sized by the DB_POOL_* settings and record how long every checkout
+waits for a connection as the wegent.db.pool.wait_time metric.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 # Database connection URL (using sync driver)
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+
+class _WaitTimingPool:
+    """Pool mixin recording the time each checkout waits for a connection"""
+
+    def connect(self):
+        from shared.telemetry.metrics import record_db_pool_wait
+
+        start = time.perf_counter()
+        success = False
+        try:
+            connection = super().connect()
+            success = True
+            return connection
+        finally:
+            record_db_pool_wait(
+                self.logging_name or "default",
+                (time.perf_counter() - start) * 1000,
+                success,
+            )
+
+
+class TimedQueuePool(_WaitTimingPool, QueuePool):
+    """QueuePool recording checkout wait times"""
+
+
+class TimedAsyncAdaptedQueuePool(_WaitTimingPool, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait times"""
+
+
+def _engine_options(url: URL, name: str) -> Dict[str, Any]:
+    """Pool and connection options of an engine, named after its role"""
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    if url.get_backend_name() != "mysql":
+        return options
+    options.update(
+        poolclass=(
+            TimedAsyncAdaptedQueuePool if url.get_dialect().is_async else TimedQueuePool
+        ),
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={"charset": "utf8mb4", "init_command": "SET time_zone = '+08:00'"},
+    )
+    return options
+
+
+def _async_url(url: URL) -> URL:
+    """Use the async MySQL driver for a database URL"""
+    if url.get_backend_name() == "mysql":
+        return url.set(drivername="mysql+asyncmy")
+    return url
+
+
+_database_url = make_url(SQLALCHEMY_DATABASE_URL)
+_read_url = make_url(settings.DATABASE_READ_URL or SQLALCHEMY_DATABASE_URL)
+
 # Create sync database engine with timezone configuration
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    connect_args={"charset": "utf8mb4", "init_command": "SET time_zone = '+08:00'"},
+engine = create_engine(_database_url, **_engine_options(_database_url, "primary"))
+read_engine = (
+    create_engine(_read_url, **_engine_options(_read_url, "replica"))
+    if settings.DATABASE_READ_URL
+    else engine
 )
 
-# Sync session factory
+# Sync session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+
+def _create_async_engine(url: URL, name: str):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = _async_url(url)
+    return create_async_engine(url, **_engine_options(url, name))
+
+
+# Async session factories, None unless DB_ASYNC_ENABLED
+AsyncSessionLocal = None
+AsyncReadSessionLocal = None
+if settings.DB_ASYNC_ENABLED:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = _create_async_engine(_database_url, "async")
+    async_read_engine = (
+        _create_async_engine(_read_url, "async-replica")
+        if settings.DATABASE_READ_URL
+        else async_engine
+    )
+    # Objects stay loaded after commit, expired attributes cannot be lazy
+    # loaded once the session's greenlet has finished
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        bind=async_read_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+async def dispose_async_engines() -> None:
+    """Close the pooled connections of the async engines"""
+    if AsyncSessionLocal is None:
+        return
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+    logger.info("Async database engines disposed")
+
+
+# Session bound by run_in_async_session() for the function it runs
+_bound_session: ContextVar[Optional[Session]] = ContextVar(
+    "bound_session", default=None
+)
+
+
+def async_sessions_enabled() -> bool:
+    """Whether the async session factories are available"""
+    return AsyncSessionLocal is not None
+
+
+def get_bound_session() -> Optional[Session]:
+    """Session of the enclosing run_in_async_session() call, if any"""
+    return _bound_session.get()
+
+
+def _call_bound(session: Session, func: Callable[..., T], args: tuple) -> T:
+    token = _bound_session.set(session)
+    try:
+        return func(*args)
+    finally:
+        _bound_session.reset(token)
+
+
+async def run_in_async_session(
+    func: Callable[..., T], *args: Any, read_only: bool = False
+) -> T:
+    """
+    Run a synchronous ORM function on the async engine.
+
+    The function runs on the event loop through AsyncSession.run_sync, so
+    database I/O never waits for a worker thread. Sessions it opens through
+    get_bound_session() are the sync facade of one AsyncSession, committed
+    by the function and closed on return.
+
+    Args:
+        func: Function to run, must not block on anything but the database
+        args: Positional arguments of the function
+        read_only: Use the read replica
+
+    Returns:
+        The function's result
+    """
+    factory = AsyncReadSessionLocal if read_only else AsyncSessionLocal
+    async with factory() as session:
+        return await session.run_sync(_call_bound, func, args)
+
+
+# Checkout counter of the operation running in the current context
+_pool_checkouts: ContextVar[Optional[List[int]]] = ContextVar(
+    "pool_checkouts", default=None
+)
+
+
+@event.listens_for(Pool, "checkout")
+def _count_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+    counter = _pool_checkouts.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@contextmanager
+def count_pool_checkouts(operation: str) -> Iterator[List[int]]:
+    """
+    Count the connections checked out from the pool during an operation and
+    record them as a metric. Nested operations count towards the outermost one.
+
+    Yields:
+        A one-element list holding the number of checkouts so far
+    """
+    counter = _pool_checkouts.get()
+    if counter is not None:
+        yield counter
+        return
+
+    from shared.telemetry.metrics import record_db_pool_checkouts
+
+    counter = [0]
+    token = _pool_checkouts.set(counter)
+    try:
+        yield counter
+    finally:
+        _pool_checkouts.reset(token)
+        record_db_pool_checkouts(operation, counter[0])
+
 
 # Declare base class
 Base = declarative_base()
@@ -7,12 +7,11 @@ import logging
 import signal
 import sys
 import time
-import uuid
 from contextlib import asynccontextmanager
 
 import redis
 import socketio
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.api import api_router
@@ -24,7 +23,12 @@ from app.core.exceptions import (
     python_exception_handler,
     validation_exception_handler,
 )
-from app.core.logging import setup_logging
+from app.core.logging import (
+    setup_logging,
+    start_access_log_queue,
+    stop_access_log_queue,
+)
+from app.core.request_logging import RequestLoggingMiddleware
 from app.core.shutdown import shutdown_manager
 from app.core.yaml_init import run_yaml_initialization
 from app.db.base import Base
@@ -53,6 +57,9 @@ async def lifespan(app: FastAPI):
 
     # ==================== STARTUP ====================
 
+    # Write access log lines from a background thread
+    start_access_log_queue()
+
     # Try to get Redis client for distributed locking
     redis_client = None
     try:
@@ -241,6 +248,24 @@ async def lifespan(app: FastAPI):
     await get_pending_request_registry()
     logger.info("✓ PendingRequestRegistry initialized")
 
+    # Listen for group permission cache invalidations from other workers
+    from app.services.group_permission import group_permission_cache
+
+    await group_permission_cache.channel.start_listener()
+    logger.info("✓ Group permission cache invalidation listener started")
+
+    # Listen for revocations of cached authenticated principals
+    from app.core.principal_cache import principal_cache
+
+    await principal_cache.channel.start_listener()
+    logger.info("✓ Principal cache invalidation listener started")
+
+    # Listen for resolved CRD cache invalidations from other workers
+    from app.services.crd_cache import crd_cache
+
+    await crd_cache.channel.start_listener()
+    logger.info("✓ CRD cache invalidation listener started")
+
     logger.info("=" * 60)
     logger.info("Application startup completed successfully!")
     logger.info("=" * 60)
@@ -298,7 +323,26 @@ async def lifespan(app: FastAPI):
     await shutdown_pending_request_registry()
     logger.info("✓ PendingRequestRegistry shutdown completed")
 
-    # Step 5: Shutdown OpenTelemetry
+    await group_permission_cache.channel.stop_listener()
+    logger.info("✓ Group permission cache invalidation listener stopped")
+
+    await principal_cache.channel.stop_listener()
+    logger.info("✓ Principal cache invalidation listener stopped")
+
+    await crd_cache.channel.stop_listener()
+    logger.info("✓ CRD cache invalidation listener stopped")
+
+    # Step 5: Close pooled Redis connections
+    from app.core.cache import cache_manager
+
+    await cache_manager.close()
+    logger.info("✓ Redis connection pools closed")
+
+    from app.db.session import dispose_async_engines
+
+    await dispose_async_engines()
+
+    # Step 6: Shutdown OpenTelemetry
     from shared.telemetry.config import get_otel_config
     from shared.telemetry.core import is_telemetry_enabled, shutdown_telemetry
 
@@ -313,6 +357,9 @@ async def lifespan(app: FastAPI):
     )
     logger.info("=" * 60)
 
+    # Flush remaining access log lines
+    stop_access_log_queue()
+
 
 def create_app():
     # Toggle API docs/OpenAPI via environment (settings.ENABLE_API_DOCS, default True)
@@ -373,173 +420,8 @@ def create_app():
     else:
         logger.debug("OpenTelemetry is disabled")
 
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        from starlette.responses import StreamingResponse
-
-        # Skip logging for health check/probe requests (root path)
-        if request.url.path == "/":
-            return await call_next(request)
-
-        # Generate a unique request ID
-        request_id = str(uuid.uuid4())[
-            :8
-        ]  # Use first 8 characters of UUID as request ID
-        request.state.request_id = request_id
-
-        start_time = time.time()
-
-        # Extract username from Authorization header
-        from app.core.security import get_username_from_request
-
-        username = get_username_from_request(request)
-
-        client_ip = request.client.host if request.client else "Unknown"
-
-        # Always set request context for logging (works even without OTEL)
-        from shared.telemetry.context import (
-            set_request_context,
-            set_task_context,
-            set_user_context,
-        )
-
-        set_request_context(request_id)
-        if username:
-            set_user_context(user_name=username)
-
-        # Capture request body if OTEL is enabled and body capture is configured
-        request_body = None
-        if (
-            otel_config.enabled
-            and otel_config.capture_request_body
-            and request.method in ("POST", "PUT", "PATCH")
-        ):
-            try:
-                # Read the body
-                body_bytes = await request.body()
-                if body_bytes:
-                    # Limit body size to avoid huge spans
-                    max_body_size = otel_config.max_body_size
-                    if len(body_bytes) <= max_body_size:
-                        request_body = body_bytes.decode("utf-8", errors="replace")
-                    else:
-                        request_body = (
-                            body_bytes[:max_body_size].decode("utf-8", errors="replace")
-                            + f"... [truncated, total size: {len(body_bytes)} bytes]"
-                        )
-            except Exception as e:
-                logger.debug(f"Failed to capture request body: {e}")
-
-        # Add OpenTelemetry span attributes if enabled
-        if otel_config.enabled:
-            from opentelemetry import trace
-            from shared.telemetry.core import is_telemetry_enabled
-
-            if is_telemetry_enabled():
-                # Extract task_id and subtask_id from request body for tracing
-                if request_body:
-                    try:
-                        import json
-
-                        body_json = json.loads(request_body)
-                        task_id = body_json.get("task_id")
-                        subtask_id = body_json.get("subtask_id")
-                        if task_id is not None or subtask_id is not None:
-                            set_task_context(task_id=task_id, subtask_id=subtask_id)
-                        # Extract user_id from request body if available
-                        user_id = body_json.get("user_id")
-                        if user_id is not None:
-                            set_user_context(user_id=str(user_id))
-                    except (json.JSONDecodeError, TypeError):
-                        pass  # Not JSON or invalid format, skip task context extraction
-
-                # Add request body to current span
-                if request_body:
-                    current_span = trace.get_current_span()
-                    if current_span and current_span.is_recording():
-                        current_span.set_attribute("http.request.body", request_body)
-
-        # Pre-request logging with request ID
-        logger.info(
-            f"request : {request.method} {request.url.path} {request.query_params} {request_id} {client_ip} [{username}]"
-        )
-
-        # Process request
-        response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-
-        # Capture response headers and body if OTEL is enabled
-        if otel_config.enabled:
-            from opentelemetry import trace
-            from shared.telemetry.core import is_telemetry_enabled
-
-            if is_telemetry_enabled():
-                current_span = trace.get_current_span()
-                if current_span and current_span.is_recording():
-                    # Capture response headers
-                    if otel_config.capture_response_headers:
-                        for header_name, header_value in response.headers.items():
-                            # Skip sensitive headers
-                            if header_name.lower() in (
-                                "authorization",
-                                "cookie",
-                                "set-cookie",
-                            ):
-                                header_value = "[REDACTED]"
-                            current_span.set_attribute(
-                                f"http.response.header.{header_name}", header_value
-                            )
-
-                    # Capture response body (only for non-streaming responses)
-                    if otel_config.capture_response_body:
-                        if not isinstance(response, StreamingResponse):
-                            try:
-                                # For regular responses, we need to read and reconstruct the body
-                                response_body_chunks = []
-                                async for chunk in response.body_iterator:
-                                    response_body_chunks.append(chunk)
-
-                                response_body = b"".join(response_body_chunks)
-
-                                # Limit body size
-                                max_body_size = otel_config.max_body_size
-                                if response_body:
-                                    if len(response_body) <= max_body_size:
-                                        body_str = response_body.decode(
-                                            "utf-8", errors="replace"
-                                        )
-                                    else:
-                                        body_str = (
-                                            response_body[:max_body_size].decode(
-                                                "utf-8", errors="replace"
-                                            )
-                                            + f"... [truncated, total size: {len(response_body)} bytes]"
-                                        )
-                                    current_span.set_attribute(
-                                        "http.response.body", body_str
-                                    )
-
-                                # Reconstruct the response with the body
-                                from starlette.responses import Response
-
-                                response = Response(
-                                    content=response_body,
-                                    status_code=response.status_code,
-                                    headers=dict(response.headers),
-                                    media_type=response.media_type,
-                                )
-                            except Exception as e:
-                                logger.debug(f"Failed to capture response body: {e}")
-
-        # Post-request logging with request ID
-        logger.info(
-            f"response: {request.method} {request.url.path} {request.query_params} {request_id} {client_ip} [{username}] {response.status_code} {process_time:.2f}ms"
-        )
-
-        # Add request ID to response headers for client-side tracking
-        response.headers["X-Request-ID"] = request_id
-
-        return response
+    # Access logging and OpenTelemetry body capture
+    app.add_middleware(RequestLoggingMiddleware, otel_config=otel_config)
 
     # Setup CORS
     app.add_middleware(
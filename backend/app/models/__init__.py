@@ -15,6 +15,7 @@ from app.models.skill_binary import SkillBinary
 from app.models.subtask import Subtask
 from app.models.system_config import SystemConfig
 from app.models.task import TaskResource
+from app.models.task_list_entry import TaskListEntry
 from app.models.task_member import TaskMember
 
 # Do NOT import Base here to avoid conflicts with app.db.base.Base
@@ -33,5 +34,6 @@ __all__ = [
     "NamespaceMember",
     "APIKey",
     "TaskMember",
+    "TaskListEntry",
     "KnowledgeDocument",
 ]
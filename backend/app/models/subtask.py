@@ -7,7 +7,7 @@ from enum import Enum as PyEnum
 
 from sqlalchemy import JSON, Boolean, Column, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -56,6 +56,8 @@ class Subtask(Base):
     )
     progress = Column(Integer, nullable=False, default=0)
     result = Column(JSON)
+    # Sequence number of the last result update applied from the executor
+    result_seq = Column(Integer, nullable=False, default=0)
     error_message = Column(Text)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
@@ -79,6 +81,13 @@ class Subtask(Base):
     )
 
     __table_args__ = (
+        Index(
+            "idx_subtasks_task_role_status",
+            "task_id",
+            "role",
+            "status",
+            "message_id",
+        ),
         {
             "sqlite_autoincrement": True,
             "mysql_engine": "InnoDB",
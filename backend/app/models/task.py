@@ -8,13 +8,16 @@ Task model for storing Task and Workspace CRD resources.
 This table is separated from the kinds table for better query performance
 and data management efficiency.
 """
+
 from datetime import datetime
 
 from sqlalchemy import (
     JSON,
     Boolean,
     Column,
+    Computed,
     DateTime,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -69,9 +72,56 @@ class TaskResource(Base):
         comment="Update time",
     )
 
+    # Virtual generated columns over hot JSON paths so that dispatch queries can
+    # be served by an index instead of scanning JSON_EXTRACT on every row.
+    # They are maintained by the database and must never be assigned directly.
+    task_status = Column(
+        String(50),
+        Computed("json ->> '$.status.status'", persisted=False),
+        comment="Generated from $.status.status",
+    )
+    task_type = Column(
+        String(50),
+        Computed(
+            "coalesce(json ->> '$.metadata.labels.type', 'online')", persisted=False
+        ),
+        comment="Generated from $.metadata.labels.type, defaults to online",
+    )
+    task_source = Column(
+        String(50),
+        Computed("coalesce(json ->> '$.metadata.labels.source', '')", persisted=False),
+        comment="Generated from $.metadata.labels.source, defaults to empty string",
+    )
+    task_team_name = Column(
+        String(100),
+        Computed("json ->> '$.spec.teamRef.name'", persisted=False),
+        comment="Generated from $.spec.teamRef.name",
+    )
+    task_team_namespace = Column(
+        String(100),
+        Computed("json ->> '$.spec.teamRef.namespace'", persisted=False),
+        comment="Generated from $.spec.teamRef.namespace",
+    )
+
     __table_args__ = (
         UniqueConstraint(
             "user_id", "kind", "name", "namespace", name="uniq_user_kind_name_namespace"
         ),
+        Index(
+            "idx_tasks_dispatch",
+            "kind",
+            "is_active",
+            "task_status",
+            "task_type",
+            "created_at",
+        ),
+        # Running-task checks for teams and bots
+        Index(
+            "idx_tasks_team_ref",
+            "kind",
+            "task_team_name",
+            "task_team_namespace",
+            "task_status",
+        ),
         {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
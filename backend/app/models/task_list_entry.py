@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Task list entry model.
+
+Denormalized summary rows backing the task list endpoints. Every visible Task
+has one row for its owner and one for each active group chat member, so a
+user's task list is a single index range scan that never reads task JSON.
+Rows are rebuilt by app.services.task_list_index and must not be written
+directly.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+
+from app.db.base import Base
+
+
+class TaskListEntry(Base):
+    """Per-user summary of a Task for list display"""
+
+    __tablename__ = "task_list_entries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, nullable=False, comment="User the entry is listed for")
+    task_id = Column(Integer, nullable=False, index=True, comment="tasks.id")
+    is_owner = Column(
+        Boolean, nullable=False, default=True, comment="Whether user owns the task"
+    )
+    title = Column(Text, nullable=False, comment="From $.spec.title")
+    status = Column(String(50), nullable=False, comment="From $.status.status")
+    task_type = Column(
+        String(50), nullable=False, comment="From $.metadata.labels.taskType"
+    )
+    type = Column(String(50), nullable=False, comment="From $.metadata.labels.type")
+    team_name = Column(String(100), nullable=True, comment="From $.spec.teamRef")
+    team_namespace = Column(String(100), nullable=True)
+    workspace_name = Column(
+        String(100), nullable=True, comment="From $.spec.workspaceRef"
+    )
+    workspace_namespace = Column(String(100), nullable=True)
+    member_count = Column(
+        Integer, nullable=False, default=0, comment="Active task_members rows"
+    )
+    is_group_chat = Column(Boolean, nullable=False, default=False)
+    # Row timestamps of the task, used as sort keys
+    created_at = Column(DateTime, nullable=False, comment="tasks.created_at")
+    updated_at = Column(
+        DateTime, nullable=False, comment="tasks.updated_at (last activity)"
+    )
+    # Timestamps reported in the task status, preferred for display
+    status_created_at = Column(DateTime, nullable=True)
+    status_updated_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "task_id", name="uniq_task_list_user_task"),
+        Index("idx_task_list_created", "user_id", "created_at", "task_id"),
+        Index(
+            "idx_task_list_group",
+            "user_id",
+            "is_group_chat",
+            "updated_at",
+            "task_id",
+        ),
+        Index(
+            "idx_task_list_personal",
+            "user_id",
+            "is_owner",
+            "is_group_chat",
+            "created_at",
+            "task_id",
+        ),
+        # Title search, see app.services.task_list_index.search_entries. Built
+        # with stopwords disabled by migration q7r8s9t0u1v2
+        Index(
+            "ftx_task_list_title",
+            "title",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        {"mysql_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
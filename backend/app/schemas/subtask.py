@@ -190,4 +190,8 @@ class SubtaskExecutorUpdate(BaseModel):
     executor_namespace: Optional[str] = None
     executor_name: Optional[str] = None
     result: Optional[dict[str, Any]] = None
+    # Sequence number of a full result
+    result_seq: Optional[int] = None
+    # Result as a delta of the previous update, see shared.utils.result_delta
+    result_delta: Optional[dict[str, Any]] = None
     error_message: Optional[str] = None
@@ -170,3 +170,5 @@ class TaskLiteListResponse(BaseModel):
 
     total: int
     items: list[TaskLite]
+    # Opaque keyset cursor for the next page, None on the last page
+    next_cursor: Optional[str] = None
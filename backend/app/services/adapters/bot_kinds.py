@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 from shared.utils.crypto import encrypt_sensitive_data, is_data_encrypted
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -24,6 +24,7 @@ from app.services.adapters.shell_utils import (
     get_shells_by_names_batch,
 )
 from app.services.base import BaseService
+from app.services.crd_cache import crd_cache
 
 
 class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
@@ -1023,37 +1024,36 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
         if not teams:
             return []
 
-        # Get all active tasks
-        all_tasks = (
+        team_refs = {(team.name, team.namespace) for team in teams}
+
+        # Only running tasks of these teams are loaded, using the generated
+        # team reference and status columns covered by idx_tasks_team_ref
+        tasks = (
             db.query(TaskResource)
-            .filter(TaskResource.kind == "Task", TaskResource.is_active == True)
+            .filter(
+                TaskResource.kind == "Task",
+                tuple_(
+                    TaskResource.task_team_name, TaskResource.task_team_namespace
+                ).in_(team_refs),
+                TaskResource.task_status.in_(["PENDING", "RUNNING"]),
+                TaskResource.is_active == True,
+            )
+            .order_by(TaskResource.id)
             .all()
         )
 
         running_tasks = []
-        for team in teams:
-            team_name = team.name
-            team_namespace = team.namespace
-
-            for task in all_tasks:
-                task_crd = Task.model_validate(task.json)
-                if (
-                    task_crd.spec.teamRef.name == team_name
-                    and task_crd.spec.teamRef.namespace == team_namespace
-                ):
-                    if task_crd.status and task_crd.status.status in [
-                        "PENDING",
-                        "RUNNING",
-                    ]:
-                        running_tasks.append(
-                            {
-                                "task_id": task.id,
-                                "task_name": task.name,
-                                "task_title": task_crd.spec.title,
-                                "status": task_crd.status.status,
-                                "team_name": team_name,
-                            }
-                        )
+        for task in tasks:
+            task_crd = Task.model_validate(task.json)
+            running_tasks.append(
+                {
+                    "task_id": task.id,
+                    "task_name": task.name,
+                    "task_title": task_crd.spec.title,
+                    "status": task_crd.status.status,
+                    "team_name": task.task_team_name,
+                }
+            )
 
         return running_tasks
 
@@ -1229,7 +1229,7 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
 
         logger = logging.getLogger(__name__)
 
-        bot_crd = Bot.model_validate(bot.json)
+        bot_crd = crd_cache.validate(bot)
         model_ref_name = bot_crd.spec.modelRef.name if bot_crd.spec.modelRef else None
         model_ref_namespace = (
             bot_crd.spec.modelRef.namespace if bot_crd.spec.modelRef else None
@@ -1304,7 +1304,7 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
 
         for bot in bots:
             # Parse bot.json once and reuse later
-            bot_crd = Bot.model_validate(bot.json)
+            bot_crd = crd_cache.validate(bot)
             bot_crds[bot.id] = bot_crd
 
             is_group_resource = bot.namespace and bot.namespace != "default"
@@ -1469,16 +1469,16 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
         agent_config = {}
 
         # Get shell_name from bot's shellRef - this is the name user selected
-        bot_crd = Bot.model_validate(bot.json)
+        bot_crd = crd_cache.validate(bot)
         shell_name = bot_crd.spec.shellRef.name if bot_crd.spec.shellRef else ""
 
         if ghost and ghost.json:
-            ghost_crd = Ghost.model_validate(ghost.json)
+            ghost_crd = crd_cache.validate(ghost)
             system_prompt = ghost_crd.spec.systemPrompt
             mcp_servers = ghost_crd.spec.mcpServers or {}
 
         if shell and shell.json:
-            shell_crd = Shell.model_validate(shell.json)
+            shell_crd = crd_cache.validate(shell)
             shell_type = shell_crd.spec.shellType or ""
 
         # Determine agent_config
@@ -1506,7 +1506,7 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
             protocol = model_crd.spec.protocol
 
             # Get the modelRef name and namespace from bot to determine if it's a dedicated private model
-            bot_crd = Bot.model_validate(bot.json)
+            bot_crd = crd_cache.validate(bot)
             model_ref_name = (
                 bot_crd.spec.modelRef.name if bot_crd.spec.modelRef else None
             )
@@ -1588,7 +1588,7 @@ class BotKindsService(BaseService[Kind, BotCreate, BotUpdate]):
         # Extract skills from ghost
         skills = []
         if ghost:
-            ghost_crd = Ghost.model_validate(ghost.json)
+            ghost_crd = crd_cache.validate(ghost)
             skills = ghost_crd.spec.skills or []
 
         return {
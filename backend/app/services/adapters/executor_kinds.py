@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
+import copy
 import logging
 import threading
 from datetime import datetime
@@ -11,8 +12,9 @@ from typing import Any, Dict, List, Optional
 import httpx
 from fastapi import HTTPException
 from shared.utils.crypto import decrypt_api_key
-from sqlalchemy import and_, func, text
-from sqlalchemy.orm import Session, selectinload
+from shared.utils.result_delta import RESULT_DELTA_VERSION, apply_result_delta
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session, aliased, selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.core.config import settings
@@ -20,14 +22,54 @@ from app.models.kind import Kind
 from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
 from app.models.task import TaskResource
 from app.models.user import User
-from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Team, Workspace
+from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Workspace
 from app.schemas.subtask import SubtaskExecutorUpdate
 from app.services.base import BaseService
+from app.services.crd_cache import crd_cache
+from app.services.dispatch_notifier import dispatch_notifier
 from app.services.webhook_notification import Notification, webhook_notification_service
 
 logger = logging.getLogger(__name__)
 
 
+class _PreloadedKinds:
+    """
+    In-memory index of Ghost/Shell/Model rows preloaded for a dispatch batch.
+
+    Lookups mirror the per-bot database queries they replace; when several rows
+    match, the one with the lowest id wins.
+    """
+
+    def __init__(self, rows: List[Kind]):
+        self._rows: Dict[tuple[str, str], List[Kind]] = {}
+        self.add(rows)
+
+    def add(self, rows: List[Kind]) -> None:
+        for row in rows:
+            self._rows.setdefault((row.kind, row.name), []).append(row)
+        for candidates in self._rows.values():
+            candidates.sort(key=lambda row: row.id)
+
+    def has(self, kind: str, name: str) -> bool:
+        return (kind, name) in self._rows
+
+    def find(
+        self,
+        kind: str,
+        name: str,
+        *,
+        namespace: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> Optional[Kind]:
+        for row in self._rows.get((kind, name), []):
+            if namespace is not None and row.namespace != namespace:
+                continue
+            if user_id is not None and row.user_id != user_id:
+                continue
+            return row
+        return None
+
+
 class ExecutorKindsService(
     BaseService[Kind, SubtaskExecutorUpdate, SubtaskExecutorUpdate]
 ):
@@ -43,65 +85,58 @@ class ExecutorKindsService(
         limit: int = 1,
         task_ids: Optional[List[int]] = None,
         type: str = "online",
+        wait: float = 0,
     ) -> Dict[str, List[Dict]]:
         """
         Task dispatch logic with subtask support using tasks table
 
+        Eligible subtasks are claimed with a single set-based query backed by the
+        generated dispatch columns on the tasks table. Rows are locked with
+        ``FOR UPDATE SKIP LOCKED`` so concurrent pollers never claim the same
+        subtask and never wait on each other.
+
         Args:
             status: Subtask status to filter by
             limit: Maximum number of subtasks to return (only used when task_ids is None)
             task_ids: Optional list of task IDs to filter by
             type: Task type to filter by (default: "online")
+            wait: Long-poll timeout in seconds. When nothing is dispatchable, hold
+                the request until new PENDING tasks of this type are announced or
+                the timeout elapses, then claim again (only used when task_ids is
+                None)
         """
+        if wait <= 0 or task_ids:
+            return self._dispatch_once(db, status, limit, task_ids, type)
+
+        async with dispatch_notifier.listen(type) as listener:
+            result = self._dispatch_once(db, status, limit, task_ids, type)
+            if result["tasks"]:
+                return result
+            # Claim again however the wait ended: a notification may have been
+            # lost, or Redis may be down and the listener only slept
+            await listener.wait(wait)
+            return self._dispatch_once(db, status, limit, task_ids, type)
+
+    def _dispatch_once(
+        self,
+        db: Session,
+        status: str,
+        limit: int,
+        task_ids: Optional[List[int]],
+        type: str,
+    ) -> Dict[str, List[Dict]]:
+        """Claim and format one batch of dispatchable subtasks"""
         if task_ids:
-            # Scenario 1: Specify task ID list, query subtasks for these tasks
+            # Scenario 1: Specify task ID list, claim subtasks for these tasks
             # When multiple task_ids are provided, ignore limit parameter, each task will only take 1 subtask
-            subtasks = []
-
-            for task_id in task_ids:
-                # First query tasks table to check task status
-                task = (
-                    db.query(TaskResource)
-                    .filter(
-                        TaskResource.id == task_id,
-                        TaskResource.kind == "Task",
-                        TaskResource.is_active == True,
-                    )
-                    .params(type=type)
-                    .first()
-                )
-                if not task:
-                    # Task doesn't exist, skip
-                    continue
-                # Check task status from JSON, skip if not PENDING or RUNNING
-                task_crd = Task.model_validate(task.json)
-                task_status = task_crd.status.status if task_crd.status else "PENDING"
-                if task_status not in ["PENDING", "RUNNING"]:
-                    continue
-
-                # Check if the specified task has RUNNING status subtasks
-                running_subtasks = (
-                    db.query(Subtask)
-                    .filter(
-                        Subtask.task_id == task_id,
-                        Subtask.status == SubtaskStatus.RUNNING,
-                    )
-                    .count()
-                )
-
-                if running_subtasks > 0:
-                    # If there are running subtasks, skip this task
-                    continue
-
-                # Get subtasks for this task, only take 1 per task
-                task_subtasks = self._get_subtasks_for_task(db, task_id, status, 1)
-                if task_subtasks:
-                    subtasks.extend(task_subtasks)
+            subtasks = self._claim_subtasks_for_task_ids(db, task_ids, status)
         else:
-            # Scenario 2: No task_ids, first query tasks, then query first subtask for each task
+            # Scenario 2: No task_ids, claim the first subtask of the newest eligible tasks
             subtasks = self._get_first_subtasks_for_tasks(db, status, limit, type)
 
         if not subtasks:
+            # Release the row locks taken by the claim query
+            db.commit()
             return {"tasks": []}
 
         # Update subtask status to RUNNING (concurrent safe)
@@ -112,161 +147,167 @@ class ExecutorKindsService(
         result = self._format_subtasks_response(db, updated_subtasks)
         return result
 
-    def _get_subtasks_for_task(
-        self, db: Session, task_id: int, status: str, limit: int
-    ) -> List[Subtask]:
-        """Get subtasks for specified task, return first one sorted by message_id"""
+    def _first_pending_subtask_query(self, db: Session, status: str):
+        """
+        Build a query selecting the first assistant subtask with the given status
+        of each task (ordered by message_id, then id).
+
+        A subtask qualifies when no earlier assistant subtask of the same task has
+        the same status, which lets the database pick one subtask per task
+        without a per-task round trip.
+        """
+        earlier = aliased(Subtask)
+        has_earlier = (
+            db.query(earlier.id)
+            .filter(
+                earlier.task_id == Subtask.task_id,
+                earlier.role == SubtaskRole.ASSISTANT,
+                earlier.status == status,
+                or_(
+                    earlier.message_id < Subtask.message_id,
+                    and_(
+                        earlier.message_id == Subtask.message_id,
+                        earlier.id < Subtask.id,
+                    ),
+                ),
+            )
+            .exists()
+        )
         return (
             db.query(Subtask)
+            .join(TaskResource, TaskResource.id == Subtask.task_id)
             .filter(
-                Subtask.task_id == task_id,
+                TaskResource.kind == "Task",
+                TaskResource.is_active == True,
                 Subtask.role == SubtaskRole.ASSISTANT,
                 Subtask.status == status,
+                ~has_earlier,
             )
-            .order_by(Subtask.message_id.asc(), Subtask.created_at.asc())
-            .limit(limit)
-            .all()
         )
 
-    def _get_first_subtasks_for_tasks(
-        self, db: Session, status: str, limit: int, type: str
+    def _claim_subtasks_for_task_ids(
+        self, db: Session, task_ids: List[int], status: str
     ) -> List[Subtask]:
-        """Get first subtask for multiple tasks using tasks table"""
-        # Step 1: First query tasks table to get limit tasks
-        tasks = None
-        if type == "offline":
-            tasks = (
-                db.query(TaskResource)
-                .filter(
-                    TaskResource.kind == "Task",
-                    TaskResource.is_active == True,
-                    text(
-                        "JSON_EXTRACT(json, '$.metadata.labels.type') = 'offline' "
-                        "and JSON_EXTRACT(json, '$.status.status') = :status "
-                        "and (JSON_EXTRACT(json, '$.metadata.labels.source') IS NULL OR JSON_EXTRACT(json, '$.metadata.labels.source') != 'chat_shell')"
-                    ),
-                )
-                .params(status=status)
-                .order_by(TaskResource.created_at.desc())
-                .limit(limit)
-                .all()
+        """Claim the first subtask of each specified task in task_ids order"""
+        # Tasks that already have a RUNNING subtask are skipped
+        running_subtask = aliased(Subtask)
+        running = (
+            db.query(running_subtask.id)
+            .filter(
+                running_subtask.task_id == TaskResource.id,
+                running_subtask.status == SubtaskStatus.RUNNING,
             )
-        else:
-            tasks = (
-                db.query(TaskResource)
-                .filter(
-                    TaskResource.kind == "Task",
-                    TaskResource.is_active == True,
-                    text(
-                        "(JSON_EXTRACT(json, '$.metadata.labels.type') IS NULL OR JSON_EXTRACT(json, '$.metadata.labels.type') = 'online') "
-                        "and JSON_EXTRACT(json, '$.status.status') = :status "
-                        "and (JSON_EXTRACT(json, '$.metadata.labels.source') IS NULL OR JSON_EXTRACT(json, '$.metadata.labels.source') != 'chat_shell')"
-                    ),
-                )
-                .params(status=status)
-                .order_by(TaskResource.created_at.desc())
-                .limit(limit)
-                .all()
+            .exists()
+        )
+        subtasks = (
+            self._first_pending_subtask_query(db, status)
+            .filter(
+                TaskResource.id.in_(task_ids),
+                # Tasks without a status are still pending
+                or_(
+                    TaskResource.task_status.in_(["PENDING", "RUNNING"]),
+                    TaskResource.task_status.is_(None),
+                ),
+                ~running,
             )
+            .with_for_update(of=Subtask, skip_locked=True)
+            .all()
+        )
 
-        if not tasks:
-            return []
+        order = {task_id: index for index, task_id in enumerate(task_ids)}
+        return sorted(subtasks, key=lambda s: order.get(s.task_id, len(order)))
 
-        task_ids = [task.id for task in tasks]
-        # Step 2: Query first subtask with matching status for each task
-        subtasks = []
-        for tid in task_ids:
-            first_subtask = (
-                db.query(Subtask)
-                .filter(
-                    Subtask.task_id == tid,
-                    Subtask.role == SubtaskRole.ASSISTANT,
-                    Subtask.status == status,
-                )
-                .order_by(Subtask.message_id.asc(), Subtask.created_at.asc())
-                .first()
+    def _get_first_subtasks_for_tasks(
+        self, db: Session, status: str, limit: int, type: str
+    ) -> List[Subtask]:
+        """Claim the first subtask of the newest tasks using tasks table"""
+        return (
+            self._first_pending_subtask_query(db, status)
+            .filter(
+                TaskResource.task_status == status,
+                TaskResource.task_type == type,
+                TaskResource.task_source != "chat_shell",
             )
-
-            if first_subtask:
-                subtasks.append(first_subtask)
-
-        return subtasks
+            .order_by(TaskResource.created_at.desc())
+            .limit(limit)
+            .with_for_update(of=Subtask, skip_locked=True)
+            .all()
+        )
 
     def _update_subtasks_to_running(
         self, db: Session, subtasks: List[Subtask]
     ) -> List[Subtask]:
         """Concurrently and safely update subtask status to RUNNING"""
-        updated_subtasks = []
+        now = datetime.now()
+        # Claimed rows are locked by this transaction. The PENDING filter guards
+        # databases without row locking: "fetch" synchronizes only the rows the
+        # database actually updated, so subtasks another worker already started
+        # keep their loaded status and are not dispatched twice
+        db.query(Subtask).filter(
+            Subtask.id.in_([subtask.id for subtask in subtasks]),
+            Subtask.status == SubtaskStatus.PENDING,
+        ).update(
+            {
+                Subtask.status: SubtaskStatus.RUNNING,
+                Subtask.updated_at: now,
+            },
+            synchronize_session="fetch",
+        )
 
-        for subtask in subtasks:
-            # Use optimistic locking mechanism to ensure concurrent safety
-            result = (
-                db.query(Subtask)
-                .filter(
-                    Subtask.id == subtask.id,
-                    Subtask.status
-                    == SubtaskStatus.PENDING,  # Ensure only PENDING status can be updated
-                )
-                .update(
-                    {
-                        Subtask.status: SubtaskStatus.RUNNING,
-                        Subtask.updated_at: datetime.now(),
-                    }
-                )
-            )
+        updated_subtasks = [
+            subtask for subtask in subtasks if subtask.status == SubtaskStatus.RUNNING
+        ]
+        if not updated_subtasks:
+            return []
 
-            if result > 0:  # If update is successful
-                # Reload the updated subtask
-                updated_subtask = db.query(Subtask).get(subtask.id)
-                updated_subtasks.append(updated_subtask)
-                # update task status to RUNNING
-                self._update_task_to_running(db, updated_subtask.task_id)
-
-                # Send chat:start WebSocket event for executor tasks
-                # This allows frontend to establish subtask-to-task mapping
-                # and prepare for receiving chat:done event later
-                self._emit_chat_start_ws_event(
-                    task_id=updated_subtask.task_id,
-                    subtask_id=updated_subtask.id,
-                )
+        # update task status to RUNNING
+        self._update_tasks_to_running(
+            db, list({subtask.task_id for subtask in updated_subtasks})
+        )
+
+        for subtask in updated_subtasks:
+            # Send chat:start WebSocket event for executor tasks
+            # This allows frontend to establish subtask-to-task mapping
+            # and prepare for receiving chat:done event later
+            self._emit_chat_start_ws_event(
+                task_id=subtask.task_id,
+                subtask_id=subtask.id,
+            )
 
         return updated_subtasks
 
-    def _update_task_to_running(self, db: Session, task_id: int) -> None:
+    def _update_tasks_to_running(self, db: Session, task_ids: List[int]) -> None:
         """Update task status to RUNNING (only when task is PENDING) using tasks table"""
-        task = (
+        tasks = (
             db.query(TaskResource)
             .filter(
-                TaskResource.id == task_id,
+                TaskResource.id.in_(task_ids),
                 TaskResource.kind == "Task",
                 TaskResource.is_active == True,
+                or_(
+                    TaskResource.task_status == "PENDING",
+                    TaskResource.task_status.is_(None),
+                ),
             )
-            .first()
+            .all()
         )
 
-        if task:
-            if task:
-                task_crd = Task.model_validate(task.json)
-                current_status = (
-                    task_crd.status.status if task_crd.status else "PENDING"
-                )
+        for task in tasks:
+            task_crd = Task.model_validate(task.json)
+            if task_crd.status:
+                task_crd.status.status = "RUNNING"
+                task_crd.status.updatedAt = datetime.now()
+            task.json = task_crd.model_dump(mode="json")
+            task.updated_at = datetime.now()
+            flag_modified(task, "json")
 
-                # Ensure only PENDING status can be updated
-                if current_status == "PENDING":
-                    if task_crd.status:
-                        task_crd.status.status = "RUNNING"
-                        task_crd.status.updatedAt = datetime.now()
-                    task.json = task_crd.model_dump(mode="json")
-                    task.updated_at = datetime.now()
-                    flag_modified(task, "json")
-
-                    # Send WebSocket event for task status update (PENDING -> RUNNING)
-                    self._emit_task_status_ws_event(
-                        user_id=task.user_id,
-                        task_id=task_id,
-                        status="RUNNING",
-                        progress=task_crd.status.progress if task_crd.status else 0,
-                    )
+            # Send WebSocket event for task status update (PENDING -> RUNNING)
+            self._emit_task_status_ws_event(
+                user_id=task.user_id,
+                task_id=task.id,
+                status="RUNNING",
+                progress=task_crd.status.progress if task_crd.status else 0,
+            )
 
     def _get_model_config_from_public_model(
         self, db: Session, agent_config: Any
@@ -302,7 +343,7 @@ class ExecutorKindsService(
 
     def _query_ghost(
         self,
-        db: Session,
+        kinds: "_PreloadedKinds",
         ghost_ref_name: str,
         ghost_ref_namespace: str,
         bot_user_id: int,
@@ -311,7 +352,7 @@ class ExecutorKindsService(
         Query Ghost resource based on namespace.
 
         Args:
-            db: Database session
+            kinds: Ghost/Shell/Model rows preloaded for the dispatch batch
             ghost_ref_name: Ghost reference name
             ghost_ref_namespace: Ghost reference namespace
             bot_user_id: Bot's user_id for personal resource lookup
@@ -323,46 +364,18 @@ class ExecutorKindsService(
 
         if is_group:
             # Group resource - don't filter by user_id
-            return (
-                db.query(Kind)
-                .filter(
-                    Kind.kind == "Ghost",
-                    Kind.name == ghost_ref_name,
-                    Kind.namespace == ghost_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
-        else:
-            # Default namespace - first try user's ghost, then public ghost
-            ghost = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == bot_user_id,
-                    Kind.kind == "Ghost",
-                    Kind.name == ghost_ref_name,
-                    Kind.namespace == ghost_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
-            if not ghost:
-                ghost = (
-                    db.query(Kind)
-                    .filter(
-                        Kind.user_id == 0,
-                        Kind.kind == "Ghost",
-                        Kind.name == ghost_ref_name,
-                        Kind.namespace == ghost_ref_namespace,
-                        Kind.is_active == True,
-                    )
-                    .first()
-                )
-            return ghost
+            return kinds.find("Ghost", ghost_ref_name, namespace=ghost_ref_namespace)
+
+        # Default namespace - first try user's ghost, then public ghost
+        return kinds.find(
+            "Ghost", ghost_ref_name, namespace=ghost_ref_namespace, user_id=bot_user_id
+        ) or kinds.find(
+            "Ghost", ghost_ref_name, namespace=ghost_ref_namespace, user_id=0
+        )
 
     def _query_shell(
         self,
-        db: Session,
+        kinds: "_PreloadedKinds",
         shell_ref_name: str,
         shell_ref_namespace: str,
         bot_user_id: int,
@@ -371,7 +384,7 @@ class ExecutorKindsService(
         Query Shell resource based on namespace.
 
         Args:
-            db: Database session
+            kinds: Ghost/Shell/Model rows preloaded for the dispatch batch
             shell_ref_name: Shell reference name
             shell_ref_namespace: Shell reference namespace
             bot_user_id: Bot's user_id for personal resource lookup
@@ -384,61 +397,28 @@ class ExecutorKindsService(
 
         if is_group:
             # Group resource - don't filter by user_id
-            shell = (
-                db.query(Kind)
-                .filter(
-                    Kind.kind == "Shell",
-                    Kind.name == shell_ref_name,
-                    Kind.namespace == shell_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
+            shell = kinds.find("Shell", shell_ref_name, namespace=shell_ref_namespace)
             return shell, shell_base_image
-        else:
-            # Default namespace - first try user's shell
-            shell = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == bot_user_id,
-                    Kind.kind == "Shell",
-                    Kind.name == shell_ref_name,
-                    Kind.namespace == shell_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
-
-            if shell:
-                return shell, shell_base_image
-
-            # If user shell not found, try public shells (user_id = 0)
-            public_shell = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == 0,
-                    Kind.kind == "Shell",
-                    Kind.name == shell_ref_name,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
-            if public_shell and public_shell.json:
-                shell_crd_temp = Shell.model_validate(public_shell.json)
-                shell_base_image = shell_crd_temp.spec.baseImage
 
-                # Create a mock shell object for compatibility
-                class MockShell:
-                    def __init__(self, json_data):
-                        self.json = json_data
+        # Default namespace - first try user's shell
+        shell = kinds.find(
+            "Shell", shell_ref_name, namespace=shell_ref_namespace, user_id=bot_user_id
+        )
+        if shell:
+            return shell, shell_base_image
 
-                return MockShell(public_shell.json), shell_base_image
+        # If user shell not found, try public shells (user_id = 0)
+        public_shell = kinds.find("Shell", shell_ref_name, user_id=0)
+        if public_shell and public_shell.json:
+            shell_crd_temp = crd_cache.validate(public_shell)
+            shell_base_image = shell_crd_temp.spec.baseImage
+            return public_shell, shell_base_image
 
-            return None, shell_base_image
+        return None, shell_base_image
 
     def _query_model(
         self,
-        db: Session,
+        kinds: "_PreloadedKinds",
         model_ref_name: str,
         model_ref_namespace: str,
         bot_user_id: int,
@@ -448,7 +428,7 @@ class ExecutorKindsService(
         Query Model resource based on namespace.
 
         Args:
-            db: Database session
+            kinds: Ghost/Shell/Model rows preloaded for the dispatch batch
             model_ref_name: Model reference name
             model_ref_namespace: Model reference namespace
             bot_user_id: Bot's user_id for personal resource lookup
@@ -461,54 +441,28 @@ class ExecutorKindsService(
 
         if is_group:
             # Group resource - don't filter by user_id
-            return (
-                db.query(Kind)
-                .filter(
-                    Kind.kind == "Model",
-                    Kind.name == model_ref_name,
-                    Kind.namespace == model_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
-        else:
-            # Default namespace - first try user's private models
-            model = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == bot_user_id,
-                    Kind.kind == "Model",
-                    Kind.name == model_ref_name,
-                    Kind.namespace == model_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
+            return kinds.find("Model", model_ref_name, namespace=model_ref_namespace)
 
-            if model:
-                return model
+        # Default namespace - first try user's private models
+        model = kinds.find(
+            "Model", model_ref_name, namespace=model_ref_namespace, user_id=bot_user_id
+        )
+        if model:
+            return model
 
-            # If not found, try public models (user_id = 0)
-            public_model = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == 0,
-                    Kind.kind == "Model",
-                    Kind.name == model_ref_name,
-                    Kind.namespace == model_ref_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
+        # If not found, try public models (user_id = 0)
+        public_model = kinds.find(
+            "Model", model_ref_name, namespace=model_ref_namespace, user_id=0
+        )
+        if public_model:
+            logger.info(
+                f"Found model '{model_ref_name}' in public models for bot {bot_name}"
             )
-            if public_model:
-                logger.info(
-                    f"Found model '{model_ref_name}' in public models for bot {bot_name}"
-                )
-            return public_model
+        return public_model
 
     def _resolve_model_by_type(
         self,
-        db: Session,
+        kinds: "_PreloadedKinds",
         model_name: str,
         bind_model_type: Optional[str],
         bind_model_namespace: str,
@@ -518,7 +472,7 @@ class ExecutorKindsService(
         Resolve model by bind_model_type.
 
         Args:
-            db: Database session
+            kinds: Ghost/Shell/Model rows preloaded for the dispatch batch
             model_name: Model name to resolve
             bind_model_type: Model type ('public', 'user', 'group', or None)
             bind_model_namespace: Model namespace
@@ -529,74 +483,59 @@ class ExecutorKindsService(
         """
         if bind_model_type == "public":
             # Explicitly public model - query with user_id = 0
-            return (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == 0,
-                    Kind.kind == "Model",
-                    Kind.name == model_name,
-                    Kind.namespace == "default",
-                    Kind.is_active == True,
-                )
-                .first()
-            )
+            return kinds.find("Model", model_name, namespace="default", user_id=0)
         elif bind_model_type == "group":
             # Group model - query without user_id filter
-            return (
-                db.query(Kind)
-                .filter(
-                    Kind.kind == "Model",
-                    Kind.name == model_name,
-                    Kind.namespace == bind_model_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
-            )
+            return kinds.find("Model", model_name, namespace=bind_model_namespace)
         elif bind_model_type == "user":
             # User's private model - query with bot's user_id
-            return (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == bot_user_id,
-                    Kind.kind == "Model",
-                    Kind.name == model_name,
-                    Kind.namespace == bind_model_namespace,
-                    Kind.is_active == True,
-                )
-                .first()
+            return kinds.find(
+                "Model", model_name, namespace=bind_model_namespace, user_id=bot_user_id
             )
         else:
             # No explicit type - use fallback logic
-            # First try user's private models
-            model_kind = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == bot_user_id,
-                    Kind.kind == "Model",
-                    Kind.name == model_name,
-                    Kind.namespace == "default",
-                    Kind.is_active == True,
-                )
-                .first()
+            # First try user's private models, then public models
+            return kinds.find(
+                "Model", model_name, namespace="default", user_id=bot_user_id
+            ) or kinds.find("Model", model_name, namespace="default", user_id=0)
+
+    def _get_model_name_to_use(
+        self, agent_config: Dict[str, Any], task_crd: Task
+    ) -> Optional[str]:
+        """
+        Determine which model name a bot should run with.
+
+        Task-level model wins when forceOverrideBotModel is set, otherwise the
+        bot bound model is used, falling back to the task-level model.
+        """
+        task_model_name = None
+        force_override = False
+
+        if task_crd.metadata.labels:
+            task_model_name = task_crd.metadata.labels.get("modelId")
+            force_override = (
+                task_crd.metadata.labels.get("forceOverrideBotModel") == "true"
             )
-            # If not found, try public models
-            if not model_kind:
-                model_kind = (
-                    db.query(Kind)
-                    .filter(
-                        Kind.user_id == 0,
-                        Kind.kind == "Model",
-                        Kind.name == model_name,
-                        Kind.namespace == "default",
-                        Kind.is_active == True,
-                    )
-                    .first()
-                )
-            return model_kind
+
+        if force_override and task_model_name:
+            # Force override: use Task-specified model
+            logger.info(f"Using task model (force override): {task_model_name}")
+            return task_model_name
+
+        # Check for bind_model in agent_config
+        bind_model_name = agent_config.get("bind_model")
+        if isinstance(bind_model_name, str) and bind_model_name.strip():
+            logger.info(f"Using bot bound model: {bind_model_name.strip()}")
+            return bind_model_name.strip()
+
+        # Fallback to task-specified model
+        if task_model_name:
+            logger.info(f"Using task model (no bot binding): {task_model_name}")
+        return task_model_name
 
     def _resolve_model_config(
         self,
-        db: Session,
+        kinds: "_PreloadedKinds",
         agent_config: Dict[str, Any],
         task_crd: Task,
         bot_user_id: int,
@@ -605,7 +544,7 @@ class ExecutorKindsService(
         Resolve model configuration with support for bind_model and task-level override.
 
         Args:
-            db: Database session
+            kinds: Ghost/Shell/Model rows preloaded for the dispatch batch
             agent_config: Current agent configuration
             task_crd: Task CRD for task-level model info
             bot_user_id: Bot's user_id for model lookup
@@ -619,37 +558,9 @@ class ExecutorKindsService(
         agent_config_data = agent_config
 
         try:
-            # 1. Get Task-level model information
-            task_model_name = None
-            force_override = False
-
-            if task_crd.metadata.labels:
-                task_model_name = task_crd.metadata.labels.get("modelId")
-                force_override = (
-                    task_crd.metadata.labels.get("forceOverrideBotModel") == "true"
-                )
-
-            # 2. Determine which model name to use
-            model_name_to_use = None
+            model_name_to_use = self._get_model_name_to_use(agent_config, task_crd)
 
-            if force_override and task_model_name:
-                # Force override: use Task-specified model
-                model_name_to_use = task_model_name
-                logger.info(f"Using task model (force override): {model_name_to_use}")
-            else:
-                # Check for bind_model in agent_config
-                bind_model_name = agent_config.get("bind_model")
-                if isinstance(bind_model_name, str) and bind_model_name.strip():
-                    model_name_to_use = bind_model_name.strip()
-                    logger.info(f"Using bot bound model: {model_name_to_use}")
-                # Fallback to task-specified model
-                if not model_name_to_use and task_model_name:
-                    model_name_to_use = task_model_name
-                    logger.info(
-                        f"Using task model (no bot binding): {model_name_to_use}"
-                    )
-
-            # 3. Query kinds table for Model CRD and replace config
+            # Look up the Model CRD and replace config
             if model_name_to_use:
                 bind_model_type = agent_config.get("bind_model_type")
                 bind_model_namespace = agent_config.get(
@@ -657,7 +568,7 @@ class ExecutorKindsService(
                 )
 
                 model_kind = self._resolve_model_by_type(
-                    db,
+                    kinds,
                     model_name_to_use,
                     bind_model_type,
                     bind_model_namespace,
@@ -666,8 +577,9 @@ class ExecutorKindsService(
 
                 if model_kind and model_kind.json:
                     try:
-                        model_crd = Model.model_validate(model_kind.json)
-                        model_config = model_crd.spec.modelConfig
+                        model_crd = crd_cache.validate(model_kind)
+                        # The cached spec is shared, the API key is decrypted below
+                        model_config = copy.deepcopy(model_crd.spec.modelConfig)
                         if isinstance(model_config, dict):
                             # Decrypt API key for executor
                             if (
@@ -697,41 +609,287 @@ class ExecutorKindsService(
 
         return agent_config_data
 
+    def _load_kinds(
+        self,
+        db: Session,
+        refs: set[tuple[str, str]],
+        user_ids: set[int],
+        namespaces: set[str],
+    ) -> List[Kind]:
+        """
+        Load every active Kind row that any of the given (kind, name) references
+        could resolve to, in a single query.
+
+        Rows are restricted to the owners' personal resources, public resources
+        (user_id = 0) and the referenced group namespaces.
+        """
+        if not refs:
+            return []
+
+        scope = Kind.user_id.in_(user_ids | {0})
+        group_namespaces = {ns for ns in namespaces if ns and ns != "default"}
+        if group_namespaces:
+            scope = or_(scope, Kind.namespace.in_(group_namespaces))
+
+        return (
+            db.query(Kind)
+            .filter(
+                Kind.kind.in_({kind for kind, _ in refs}),
+                Kind.name.in_({name for _, name in refs}),
+                Kind.is_active == True,
+                scope,
+            )
+            .all()
+        )
+
+    def _preload_bot_components(
+        self,
+        db: Session,
+        bots: Dict[int, Kind],
+        bot_crds: Dict[int, Bot],
+        task_crds: Dict[int, Task],
+    ) -> "_PreloadedKinds":
+        """
+        Preload the Ghost, Shell and Model rows referenced by a dispatch batch.
+
+        The first query covers the bots' ghost/shell/model refs and task-level
+        models. Models bound through a bot model's config are only known after
+        that, so they are fetched with one more query when missing.
+        """
+        refs: set[tuple[str, str]] = set()
+        namespaces: set[str] = set()
+        user_ids = {bot.user_id for bot in bots.values()}
+
+        for bot_crd in bot_crds.values():
+            refs.add(("Ghost", bot_crd.spec.ghostRef.name))
+            refs.add(("Shell", bot_crd.spec.shellRef.name))
+            namespaces.add(bot_crd.spec.ghostRef.namespace)
+            namespaces.add(bot_crd.spec.shellRef.namespace)
+            if bot_crd.spec.modelRef:
+                refs.add(("Model", bot_crd.spec.modelRef.name))
+                namespaces.add(bot_crd.spec.modelRef.namespace)
+
+        for task_crd in task_crds.values():
+            if task_crd.metadata.labels and task_crd.metadata.labels.get("modelId"):
+                refs.add(("Model", task_crd.metadata.labels["modelId"]))
+
+        kinds = _PreloadedKinds(self._load_kinds(db, refs, user_ids, namespaces))
+
+        # Second round: models bound inside the resolved bot model configs
+        bound_refs: set[tuple[str, str]] = set()
+        bound_namespaces: set[str] = set()
+        for bot_id, bot_crd in bot_crds.items():
+            if not bot_crd.spec.modelRef:
+                continue
+            model = self._query_model(
+                kinds,
+                bot_crd.spec.modelRef.name,
+                bot_crd.spec.modelRef.namespace,
+                bots[bot_id].user_id,
+                bots[bot_id].name,
+            )
+            if not model or not model.json:
+                continue
+            model_config = model.json.get("spec", {}).get("modelConfig")
+            if isinstance(model_config, dict):
+                bind_model = model_config.get("bind_model")
+                if isinstance(bind_model, str) and bind_model.strip():
+                    ref = ("Model", bind_model.strip())
+                    if not kinds.has(*ref):
+                        bound_refs.add(ref)
+                        bound_namespaces.add(
+                            model_config.get("bind_model_namespace", "default")
+                        )
+
+        if bound_refs:
+            kinds.add(self._load_kinds(db, bound_refs, user_ids, bound_namespaces))
+
+        return kinds
+
+    def _find_subtask_context(
+        self, related_subtasks: List[Subtask], subtask: Subtask
+    ) -> tuple[Optional[Subtask], str, Any, Optional[Subtask]]:
+        """
+        Locate the conversation context of a subtask among its task's subtasks.
+
+        Returns:
+            Tuple of (user subtask, user prompt, previous subtask result, next subtask)
+        """
+        next_subtask = None
+        previous_subtask_results = ""
+        user_prompt = ""
+        user_subtask = None
+        for i, related in enumerate(related_subtasks):
+            if related.role == SubtaskRole.USER:
+                user_prompt = related.prompt
+                previous_subtask_results = ""
+                user_subtask = related
+                continue
+            if related.message_id < subtask.message_id:
+                previous_subtask_results = related.result
+            if related.message_id == subtask.message_id:
+                if i < len(related_subtasks) - 1:
+                    next_subtask = related_subtasks[i + 1]
+                break
+        return user_subtask, user_prompt, previous_subtask_results, next_subtask
+
     def _format_subtasks_response(
         self, db: Session, subtasks: List[Subtask]
     ) -> Dict[str, List[Dict]]:
-        """Format subtask response data using kinds table for task information"""
-        formatted_subtasks = []
+        """
+        Format subtask response data using kinds table for task information.
 
-        # Pre-fetch adjacent subtask information for each subtask
-        for subtask in subtasks:
-            # Query all related subtasks under the same task in one go
-            related_subtasks = (
-                db.query(Subtask)
+        All related rows for the whole batch (subtasks, tasks, workspaces, users,
+        teams, bots, ghosts, shells, models and attachments) are preloaded in a
+        constant number of queries and payloads are built from in-memory maps.
+        """
+        from app.core.security import (
+            create_access_token,
+            create_executor_status_token,
+        )
+        from app.models.subtask_attachment import AttachmentStatus, SubtaskAttachment
+
+        if not subtasks:
+            logger.info("dispatch subtasks response count=0 ids=[]")
+            return {"tasks": []}
+
+        task_ids = {subtask.task_id for subtask in subtasks}
+
+        # Query all related subtasks under the dispatched tasks in one go
+        related_by_task: Dict[int, List[Subtask]] = {}
+        for related in (
+            db.query(Subtask)
+            .filter(Subtask.task_id.in_(task_ids))
+            .order_by(Subtask.message_id.asc(), Subtask.created_at.asc())
+            .all()
+        ):
+            related_by_task.setdefault(related.task_id, []).append(related)
+
+        # Get task information from tasks table
+        tasks = {
+            task.id: task
+            for task in db.query(TaskResource)
+            .filter(
+                TaskResource.id.in_(task_ids),
+                TaskResource.kind == "Task",
+                TaskResource.is_active == True,
+            )
+            .all()
+        }
+        task_crds = {
+            task_id: Task.model_validate(task.json) for task_id, task in tasks.items()
+        }
+
+        # Get workspace information
+        workspaces: Dict[tuple[int, str, str], TaskResource] = {}
+        workspace_refs = {
+            (
+                tasks[task_id].user_id,
+                task_crd.spec.workspaceRef.name,
+                task_crd.spec.workspaceRef.namespace,
+            )
+            for task_id, task_crd in task_crds.items()
+        }
+        if workspace_refs:
+            for workspace in (
+                db.query(TaskResource)
                 .filter(
-                    Subtask.task_id == subtask.task_id,
+                    TaskResource.user_id.in_({ref[0] for ref in workspace_refs}),
+                    TaskResource.kind == "Workspace",
+                    TaskResource.name.in_({ref[1] for ref in workspace_refs}),
+                    TaskResource.is_active == True,
+                )
+                .order_by(TaskResource.id.asc())
+                .all()
+            ):
+                workspaces.setdefault(
+                    (workspace.user_id, workspace.name, workspace.namespace),
+                    workspace,
                 )
-                .order_by(Subtask.message_id.asc(), Subtask.created_at.asc())
+
+        users = {
+            user.id: user
+            for user in db.query(User)
+            .filter(User.id.in_({subtask.user_id for subtask in subtasks}))
+            .all()
+        }
+
+        # Get team and bot information from kinds table
+        teams = {
+            team.id: team
+            for team in db.query(Kind)
+            .filter(
+                Kind.id.in_({subtask.team_id for subtask in subtasks}),
+                Kind.is_active == True,
+            )
+            .all()
+        }
+        bot_ids = {bot_id for subtask in subtasks for bot_id in subtask.bot_ids or []}
+        bots = {
+            bot.id: bot
+            for bot in (
+                db.query(Kind)
+                .filter(Kind.id.in_(bot_ids), Kind.is_active == True)
                 .all()
+                if bot_ids
+                else []
             )
+        }
+        bot_crds = {bot_id: crd_cache.validate(bot) for bot_id, bot in bots.items()}
+        kinds = self._preload_bot_components(db, bots, bot_crds, task_crds)
 
-            next_subtask = None
-            previous_subtask_results = ""
+        contexts = {
+            subtask.id: self._find_subtask_context(
+                related_by_task.get(subtask.task_id, []), subtask
+            )
+            for subtask in subtasks
+        }
 
-            user_prompt = ""
-            user_subtask = None
-            for i, related in enumerate(related_subtasks):
-                if related.role == SubtaskRole.USER:
-                    user_prompt = related.prompt
-                    previous_subtask_results = ""
-                    user_subtask = related
-                    continue
-                if related.message_id < subtask.message_id:
-                    previous_subtask_results = related.result
-                if related.message_id == subtask.message_id:
-                    if i < len(related_subtasks) - 1:
-                        next_subtask = related_subtasks[i + 1]
-                    break
+        # Query attachments for all user subtasks, without the binary columns
+        user_subtask_ids = {
+            context[0].id for context in contexts.values() if context[0] is not None
+        }
+        attachments_by_subtask: Dict[int, List[Dict[str, Any]]] = {}
+        if user_subtask_ids:
+            for att in (
+                db.query(
+                    SubtaskAttachment.id,
+                    SubtaskAttachment.subtask_id,
+                    SubtaskAttachment.original_filename,
+                    SubtaskAttachment.file_extension,
+                    SubtaskAttachment.file_size,
+                    SubtaskAttachment.mime_type,
+                )
+                .filter(
+                    SubtaskAttachment.subtask_id.in_(user_subtask_ids),
+                    SubtaskAttachment.status == AttachmentStatus.READY,
+                )
+                .all()
+            ):
+                # Note: We don't include download_url here.
+                # The executor will construct the download URL using TASK_API_DOMAIN env var,
+                # similar to how skill downloads work. This decouples backend from knowing its own URL.
+                # We intentionally don't include image_base64 here to avoid
+                # large task JSON payloads. The executor will download attachments
+                # via AttachmentDownloader using the attachment id.
+                attachments_by_subtask.setdefault(att.subtask_id, []).append(
+                    {
+                        "id": att.id,
+                        "original_filename": att.original_filename,
+                        "file_extension": att.file_extension,
+                        "file_size": att.file_size,
+                        "mime_type": att.mime_type,
+                    }
+                )
+
+        formatted_subtasks = []
+        auth_tokens: Dict[int, Optional[str]] = {}
+
+        for subtask in subtasks:
+            related_subtasks = related_by_task.get(subtask.task_id, [])
+            user_subtask, user_prompt, previous_subtask_results, next_subtask = (
+                contexts[subtask.id]
+            )
 
             # Build aggregated prompt
             aggregated_prompt = ""
@@ -743,33 +901,18 @@ class ExecutorKindsService(
                 aggregated_prompt += (
                     f"\nPrevious execution result: {previous_subtask_results}"
                 )
-            # Get task information from tasks table
-            task = (
-                db.query(TaskResource)
-                .filter(
-                    TaskResource.id == subtask.task_id,
-                    TaskResource.kind == "Task",
-                    TaskResource.is_active == True,
-                )
-                .first()
-            )
 
+            task = tasks.get(subtask.task_id)
             if not task:
                 continue
 
-            task_crd = Task.model_validate(task.json)
-
-            # Get workspace information
-            workspace = (
-                db.query(TaskResource)
-                .filter(
-                    TaskResource.user_id == task.user_id,
-                    TaskResource.kind == "Workspace",
-                    TaskResource.name == task_crd.spec.workspaceRef.name,
-                    TaskResource.namespace == task_crd.spec.workspaceRef.namespace,
-                    TaskResource.is_active == True,
+            task_crd = task_crds[task.id]
+            workspace = workspaces.get(
+                (
+                    task.user_id,
+                    task_crd.spec.workspaceRef.name,
+                    task_crd.spec.workspaceRef.namespace,
                 )
-                .first()
             )
 
             git_url = ""
@@ -790,8 +933,8 @@ class ExecutorKindsService(
                     # Handle workspaces with incomplete repository data
                     pass
 
-            # Build user git information - query user by user_id
-            user = db.query(User).filter(User.id == subtask.user_id).first()
+            # Build user git information
+            user = users.get(subtask.user_id)
             git_info = (
                 next(
                     (
@@ -805,26 +948,20 @@ class ExecutorKindsService(
                 else None
             )
 
-            # Get team information from kinds table
-            team = (
-                db.query(Kind)
-                .filter(Kind.id == subtask.team_id, Kind.is_active == True)
-                .first()
-            )
-
+            team = teams.get(subtask.team_id)
             if not team:
                 continue
 
-            team_crd = Team.model_validate(team.json)
+            team_crd = crd_cache.validate(team)
             team_members = team_crd.spec.members
             collaboration_model = team_crd.spec.collaborationModel
 
             # Build bot information
-            bots = []
+            bots_data = []
 
             pipeline_index = 0
             if collaboration_model == "pipeline":
-                for i, related in enumerate(related_subtasks):
+                for related in related_subtasks:
                     if related.role == SubtaskRole.USER:
                         continue
                     if related.id == subtask.id:
@@ -832,28 +969,22 @@ class ExecutorKindsService(
                     pipeline_index = pipeline_index + 1
 
             for index, bot_id in enumerate(subtask.bot_ids):
-                # Get bot from kinds table
-                bot = (
-                    db.query(Kind)
-                    .filter(Kind.id == bot_id, Kind.is_active == True)
-                    .first()
-                )
-
+                bot = bots.get(bot_id)
                 if not bot:
                     continue
 
-                bot_crd = Bot.model_validate(bot.json)
+                bot_crd = bot_crds[bot_id]
 
                 # Query ghost, shell, model using helper methods
                 ghost = self._query_ghost(
-                    db,
+                    kinds,
                     bot_crd.spec.ghostRef.name,
                     bot_crd.spec.ghostRef.namespace,
                     bot.user_id,
                 )
 
                 shell, shell_base_image = self._query_shell(
-                    db,
+                    kinds,
                     bot_crd.spec.shellRef.name,
                     bot_crd.spec.shellRef.namespace,
                     bot.user_id,
@@ -863,7 +994,7 @@ class ExecutorKindsService(
                 model = None
                 if bot_crd.spec.modelRef:
                     model = self._query_model(
-                        db,
+                        kinds,
                         bot_crd.spec.modelRef.name,
                         bot_crd.spec.modelRef.namespace,
                         bot.user_id,
@@ -878,7 +1009,7 @@ class ExecutorKindsService(
                 agent_config = {}
 
                 if ghost and ghost.json:
-                    ghost_crd = Ghost.model_validate(ghost.json)
+                    ghost_crd = crd_cache.validate(ghost)
                     system_prompt = ghost_crd.spec.systemPrompt
                     mcp_servers = ghost_crd.spec.mcpServers or {}
                     skills = ghost_crd.spec.skills or []
@@ -887,15 +1018,16 @@ class ExecutorKindsService(
                     )
 
                 if shell and shell.json:
-                    shell_crd = Shell.model_validate(shell.json)
+                    shell_crd = crd_cache.validate(shell)
                     shell_type = shell_crd.spec.shellType
                     # Extract baseImage from shell (user-defined shell overrides public shell)
                     if shell_crd.spec.baseImage:
                         shell_base_image = shell_crd.spec.baseImage
 
                 if model and model.json:
-                    model_crd = Model.model_validate(model.json)
-                    agent_config = model_crd.spec.modelConfig
+                    model_crd = crd_cache.validate(model)
+                    # The cached spec is shared, the API key is decrypted below
+                    agent_config = copy.deepcopy(model_crd.spec.modelConfig)
 
                     # Check for private_model in agent_config (legacy compatibility)
                     agent_config = self._get_model_config_from_public_model(
@@ -924,10 +1056,10 @@ class ExecutorKindsService(
 
                 # Resolve model config using helper method
                 agent_config_data = self._resolve_model_config(
-                    db, agent_config, task_crd, bot.user_id
+                    kinds, agent_config, task_crd, bot.user_id
                 )
 
-                bots.append(
+                bots_data.append(
                     {
                         "id": bot.id,
                         "name": bot.name,
@@ -950,11 +1082,10 @@ class ExecutorKindsService(
             # Generate auth token for skills download
             # Use user's JWT token or generate a temporary one
             auth_token = None
-            if user:
+            if user and user.id in auth_tokens:
+                auth_token = auth_tokens[user.id]
+            elif user:
                 # Generate a JWT token for the user to access backend API
-                from app.core.config import settings
-                from app.core.security import create_access_token
-
                 try:
                     # Create a token valid for 24 hours (1440 minutes) for skills download
                     auth_token = create_access_token(
@@ -968,39 +1099,11 @@ class ExecutorKindsService(
                     logger.warning(
                         f"Failed to generate auth token for user {user.id}: {e}"
                     )
+                auth_tokens[user.id] = auth_token
 
-            # Query attachments for this subtask
-            from app.models.subtask_attachment import (
-                AttachmentStatus,
-                SubtaskAttachment,
+            attachments_data = (
+                attachments_by_subtask.get(user_subtask.id, []) if user_subtask else []
             )
-
-            attachments_data = []
-            subtask_attachments = (
-                db.query(SubtaskAttachment)
-                .filter(
-                    SubtaskAttachment.subtask_id == user_subtask.id,
-                    SubtaskAttachment.status == AttachmentStatus.READY,
-                )
-                .all()
-            )
-
-            # Note: We don't include download_url here.
-            # The executor will construct the download URL using TASK_API_DOMAIN env var,
-            # similar to how skill downloads work. This decouples backend from knowing its own URL.
-            for att in subtask_attachments:
-                att_data = {
-                    "id": att.id,
-                    "original_filename": att.original_filename,
-                    "file_extension": att.file_extension,
-                    "file_size": att.file_size,
-                    "mime_type": att.mime_type,
-                }
-                # Note: We intentionally don't include image_base64 here to avoid
-                # large task JSON payloads. The executor will download attachments
-                # via AttachmentDownloader using the attachment id.
-                attachments_data.append(att_data)
-
             if attachments_data:
                 logger.info(
                     f"Found {len(attachments_data)} attachments for subtask {subtask.id}"
@@ -1026,7 +1129,7 @@ class ExecutorKindsService(
                         "git_email": git_info.get("git_email") if git_info else None,
                         "user_name": git_info.get("user_name") if git_info else None,
                     },
-                    "bot": bots,
+                    "bot": bots_data,
                     "team_id": team.id,
                     "mode": collaboration_model,
                     "git_domain": git_domain,
@@ -1036,6 +1139,11 @@ class ExecutorKindsService(
                     "git_url": git_url,
                     "prompt": aggregated_prompt,
                     "auth_token": auth_token,
+                    "status_token": (
+                        create_executor_status_token(subtask.task_id, subtask.id)
+                        if settings.EXECUTOR_DIRECT_STATUS_ENABLED
+                        else None
+                    ),
                     "attachments": attachments_data,
                     "status": subtask.status,
                     "progress": subtask.progress,
@@ -1060,13 +1168,25 @@ class ExecutorKindsService(
         For streaming support:
         - When status is RUNNING and result contains content, emit chat:chunk events
         - Track previous content length to send only incremental updates
+
+        Results sent as a delta of the previous update are applied to the
+        stored result. If the delta does not follow the last applied update,
+        it is dropped and "resync" asks the executor for the full result.
+        Updates arrive over the direct channel and through executor_manager,
+        so a full result older than the stored one is ignored.
         """
         logger.info(
             f"update subtask subtask_id={subtask_update.subtask_id}, subtask_status={subtask_update.status}, subtask_progress={subtask_update.progress}"
         )
 
-        # Get subtask
-        subtask = db.query(Subtask).get(subtask_update.subtask_id)
+        # Get subtask, locked while a sequenced result is applied to it
+        query = db.query(Subtask).filter(Subtask.id == subtask_update.subtask_id)
+        if (
+            subtask_update.result_delta is not None
+            or subtask_update.result_seq is not None
+        ):
+            query = query.with_for_update()
+        subtask = query.first()
         if not subtask:
             raise HTTPException(status_code=404, detail="Subtask not found")
 
@@ -1102,8 +1222,29 @@ class ExecutorKindsService(
 
         # Update other subtask fields
         update_data = subtask_update.model_dump(
-            exclude={"subtask_title", "task_title"}, exclude_unset=True
+            exclude={"subtask_title", "task_title", "result_seq", "result_delta"},
+            exclude_unset=True,
         )
+        resync = False
+        result = subtask_update.result
+        if subtask_update.result_delta is not None:
+            result = self._apply_result_delta(subtask, subtask_update.result_delta)
+            resync = result is None
+        elif result is not None:
+            if subtask_update.result_seq is None:
+                # Unsequenced results cannot be ordered, the next delta does not
+                # apply to them and asks for a full result
+                subtask.result_seq = 0
+            elif subtask_update.result_seq < subtask.result_seq:
+                logger.info(
+                    f"Ignoring out of order result of subtask {subtask.id}: "
+                    f"result_seq={subtask_update.result_seq}, stored={subtask.result_seq}"
+                )
+                update_data.pop("result", None)
+                result = None
+            else:
+                subtask.result_seq = subtask_update.result_seq
+
         for field, value in update_data.items():
             setattr(subtask, field, value)
 
@@ -1117,12 +1258,12 @@ class ExecutorKindsService(
         # Emit chat:chunk event for streaming content updates
         # This allows frontend to display content in real-time during executor task execution
         # For executor tasks, result contains thinking and workbench data, not just value
-        if subtask_update.status == SubtaskStatus.RUNNING and subtask_update.result:
-            if isinstance(subtask_update.result, dict):
+        if subtask_update.status == SubtaskStatus.RUNNING and result:
+            if isinstance(result, dict):
                 # For executor tasks, send the full result (thinking, workbench)
                 # Calculate offset from value if present
                 new_content = ""
-                new_value = subtask_update.result.get("value", "")
+                new_value = result.get("value", "")
                 if isinstance(new_value, str):
                     new_content = new_value
 
@@ -1130,8 +1271,8 @@ class ExecutorKindsService(
                 offset = len(new_content) if new_content else 0
 
                 # Check if there's any meaningful data to send (thinking or workbench)
-                has_thinking = bool(subtask_update.result.get("thinking"))
-                has_workbench = bool(subtask_update.result.get("workbench"))
+                has_thinking = bool(result.get("thinking"))
+                has_workbench = bool(result.get("workbench"))
                 has_new_content = new_content and len(new_content) > len(
                     previous_content
                 )
@@ -1153,7 +1294,7 @@ class ExecutorKindsService(
                         subtask_id=subtask.id,
                         content=chunk_content,
                         offset=offset,
-                        result=subtask_update.result,  # Send full result with thinking and workbench
+                        result=result,  # Send full result with thinking and workbench
                     )
 
         # Update associated task status
@@ -1161,13 +1302,41 @@ class ExecutorKindsService(
 
         db.commit()
 
-        return {
+        response = {
             "subtask_id": subtask.id,
             "task_id": subtask.task_id,
             "status": subtask.status,
             "progress": subtask.progress,
             "message": "Subtask updated successfully",
         }
+        if resync:
+            response["resync"] = True
+        return response
+
+    def _apply_result_delta(
+        self, subtask: Subtask, delta: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply a result delta to a subtask.
+
+        Returns:
+            The updated result, or None if the delta does not follow the last
+            applied update and the full result is needed
+        """
+        if (
+            delta.get("version") != RESULT_DELTA_VERSION
+            or delta.get("base_seq") != subtask.result_seq
+            or not isinstance(subtask.result, dict)
+        ):
+            logger.info(
+                f"Result delta of subtask {subtask.id} does not apply: "
+                f"base_seq={delta.get('base_seq')}, result_seq={subtask.result_seq}"
+            )
+            return None
+
+        subtask.result = apply_result_delta(subtask.result, delta)
+        subtask.result_seq = delta["seq"]
+        return subtask.result
 
     def _update_task_status_based_on_subtasks(self, db: Session, task_id: int) -> None:
         """Update task status based on subtask status using tasks table"""
@@ -10,7 +10,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import func, text
+from sqlalchemy import func, text, tuple_
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -19,12 +19,14 @@ from app.models.kind import Kind
 from app.models.shared_team import SharedTeam
 from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
 from app.models.task import TaskResource
+from app.models.task_list_entry import TaskListEntry
 from app.models.user import User
 from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Team, Workspace
 from app.schemas.task import TaskCreate, TaskDetail, TaskInDB, TaskStatus, TaskUpdate
 from app.services.adapters.executor_kinds import executor_kinds_service
 from app.services.adapters.team_kinds import team_kinds_service
 from app.services.base import BaseService
+from app.services.task_list_index import paginate_entries, search_entries
 
 logger = logging.getLogger(__name__)
 
@@ -281,6 +283,8 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         # Create subtasks for the task
         self._create_subtasks(db, task, team, user.id, obj_in.prompt)
 
+        # Committing the PENDING subtasks wakes executor managers waiting on
+        # the dispatch long-poll (see dispatch_notifier)
         db.commit()
         db.refresh(task)
         db.flush()
@@ -293,7 +297,8 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         """
         Get user's Task list with pagination (only active tasks, excluding DELETE status)
         Optimized version using raw SQL to avoid MySQL "Out of sort memory" errors.
-        DELETE status tasks are filtered in application layer.
+        DELETE status tasks are filtered on the generated task_status column, so
+        neither the JSON nor the sort rows carry the task document.
         Includes tasks owned by user AND tasks user is a member of (group chats).
         """
         # Use raw SQL to get task IDs where user is owner OR member
@@ -304,10 +309,11 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
             LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
             WHERE k.kind = 'Task'
             AND k.is_active = true
+            AND (k.task_status IS NULL OR k.task_status != 'DELETE')
             AND (k.user_id = :user_id OR tm.id IS NOT NULL)
         """
         )
-        total_result = db.execute(count_sql, {"user_id": user_id}).scalar()
+        total = db.execute(count_sql, {"user_id": user_id}).scalar() or 0
 
         # Get task IDs sorted by created_at
         ids_sql = text(
@@ -317,39 +323,25 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
             LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
             WHERE k.kind = 'Task'
             AND k.is_active = true
+            AND (k.task_status IS NULL OR k.task_status != 'DELETE')
             AND (k.user_id = :user_id OR tm.id IS NOT NULL)
             ORDER BY k.created_at DESC
             LIMIT :limit OFFSET :skip
         """
         )
         task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "limit": limit + 50, "skip": skip}
+            ids_sql, {"user_id": user_id, "limit": limit, "skip": skip}
         ).fetchall()
         task_ids = [row[0] for row in task_id_rows]
 
-        if not task_ids:
-            return [], 0
-
-        # Load full task data for the selected IDs
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter out DELETE status tasks in application layer and restore order
-        id_to_task = {}
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE":
-                id_to_task[t.id] = t
-
-        # Restore the original order and apply limit
-        filtered_tasks = []
-        for tid in task_ids:
-            if tid in id_to_task:
-                filtered_tasks.append(id_to_task[tid])
-                if len(filtered_tasks) >= limit:
-                    break
-
-        total = total_result if total_result else 0
+        # Load full task data for the selected IDs and restore the order
+        tasks = (
+            db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
+            if task_ids
+            else []
+        )
+        id_to_task = {t.id: t for t in tasks}
+        filtered_tasks = [id_to_task[tid] for tid in task_ids if tid in id_to_task]
 
         if not filtered_tasks:
             return [], total
@@ -370,227 +362,41 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         return result, total
 
     def get_user_tasks_lite(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
         """
         Get user's Task list with pagination (lightweight version for list display)
-        Only returns essential fields without JOIN queries for better performance.
-        Includes tasks owned by user AND tasks user is a member of (group chats).
+        Includes tasks owned by user AND tasks user is a member of (group chats),
+        sorted by created_at descending.
 
-        Uses raw SQL to avoid MySQL "Out of sort memory" errors caused by
-        JSON_EXTRACT in WHERE clause combined with ORDER BY.
-        """
-        # Get task IDs where user is owner OR member
-        # Use raw SQL with UNION for efficiency
-        count_sql = text(
-            """
-            SELECT COUNT(DISTINCT k.id)
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-        """
-        )
-        total_result = db.execute(count_sql, {"user_id": user_id}).scalar()
+        Served from the denormalized task_list_entries index, see
+        app.services.task_list_index. Pass the returned cursor to fetch the
+        next page in constant time; skip is only used without a cursor.
 
-        # Get task IDs sorted by created_at, including both owned and member tasks
-        ids_sql = text(
-            """
-            SELECT DISTINCT k.id, k.created_at
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-            ORDER BY k.created_at DESC
-            LIMIT :limit OFFSET :skip
+        Returns:
+            Tuple of (items, exact total, cursor for the next page or None)
         """
+        query = db.query(TaskListEntry).filter(TaskListEntry.user_id == user_id)
+        entries, total, next_cursor = paginate_entries(
+            query, TaskListEntry.created_at, skip=skip, limit=limit, cursor=cursor
         )
-        task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "limit": limit + 50, "skip": skip}
-        ).fetchall()
-        task_ids = [row[0] for row in task_id_rows]
-
-        if not task_ids:
-            return [], 0
-
-        # Load full task data for the selected IDs
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter out DELETE status tasks in application layer and restore order
-        id_to_task = {}
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE":
-                id_to_task[t.id] = t
-
-        # Restore the original order and apply limit
-        tasks = []
-        for tid in task_ids:
-            if tid in id_to_task:
-                tasks.append(id_to_task[tid])
-                if len(tasks) >= limit:
-                    break
-
-        # Recalculate total excluding DELETE status (approximate)
-        total = total_result if total_result else 0
-
-        # Get task member counts in batch for is_group_chat detection
-        from app.models.task_member import MemberStatus, TaskMember
-
-        task_ids_for_members = [t.id for t in tasks]
-        member_counts = {}
-        if task_ids_for_members:
-            member_count_results = (
-                db.query(TaskMember.task_id, func.count(TaskMember.id).label("count"))
-                .filter(
-                    TaskMember.task_id.in_(task_ids_for_members),
-                    TaskMember.status == MemberStatus.ACTIVE,
-                )
-                .group_by(TaskMember.task_id)
-                .all()
-            )
-            member_counts = {row[0]: row[1] for row in member_count_results}
-
-        # Build lightweight result without expensive JOIN operations
-        result = []
-        for task in tasks:
-            task_crd = Task.model_validate(task.json)
-
-            # Extract basic fields from task JSON
-            task_type = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("taskType")
-                or "chat"
-            )
-            type_value = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("type")
-                or "online"
-            )
-            status = task_crd.status.status if task_crd.status else "PENDING"
-
-            # Parse timestamps
-            created_at = task.created_at
-            updated_at = task.updated_at
-            completed_at = None
-            if task_crd.status:
-                try:
-                    if task_crd.status.createdAt:
-                        created_at = task_crd.status.createdAt
-                    if task_crd.status.updatedAt:
-                        updated_at = task_crd.status.updatedAt
-                    if task_crd.status.completedAt:
-                        completed_at = task_crd.status.completedAt
-                except:
-                    pass
-
-            # Get team_id using direct SQL query (more efficient than ORM)
-            team_name = task_crd.spec.teamRef.name
-            team_namespace = task_crd.spec.teamRef.namespace
-            team_result = db.execute(
-                text(
-                    """
-                    SELECT id FROM kinds
-                    WHERE user_id = :user_id
-                    AND kind = 'Team'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {"user_id": user_id, "name": team_name, "namespace": team_namespace},
-            ).fetchone()
-
-            # If not found in user's teams, check shared teams
-            team_id = team_result[0] if team_result else None
-            if not team_id:
-                shared_team_result = db.execute(
-                    text(
-                        """
-                        SELECT k.id FROM kinds k
-                        INNER JOIN shared_teams st ON k.user_id = st.original_user_id
-                        WHERE st.user_id = :user_id
-                        AND st.is_active = true
-                        AND k.kind = 'Team'
-                        AND k.name = :name
-                        AND k.namespace = :namespace
-                        AND k.is_active = true
-                        LIMIT 1
-                    """
-                    ),
-                    {
-                        "user_id": user_id,
-                        "name": team_name,
-                        "namespace": team_namespace,
-                    },
-                ).fetchone()
-                team_id = shared_team_result[0] if shared_team_result else None
-
-            # Get git_repo from workspace using direct SQL query
-            workspace_name = task_crd.spec.workspaceRef.name
-            workspace_namespace = task_crd.spec.workspaceRef.namespace
-            workspace_result = db.execute(
-                text(
-                    """
-                    SELECT JSON_EXTRACT(json, '$.spec.repository.gitRepo') as git_repo
-                    FROM tasks
-                    WHERE user_id = :user_id
-                    AND kind = 'Workspace'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {
-                    "user_id": user_id,
-                    "name": workspace_name,
-                    "namespace": workspace_namespace,
-                },
-            ).fetchone()
-
-            git_repo = None
-            if workspace_result and workspace_result[0]:
-                # Remove JSON quotes from extracted value
-                git_repo = (
-                    workspace_result[0].strip('"')
-                    if isinstance(workspace_result[0], str)
-                    else workspace_result[0]
-                )
-
-            # Check if this is a group chat
-            # First check task.json.spec.is_group_chat, fallback to member count
-            task_json = task.json or {}
-            is_group_chat = task_json.get("spec", {}).get("is_group_chat", False)
-            # Fallback: if not explicitly set, check member count
-            if not is_group_chat:
-                is_group_chat = member_counts.get(task.id, 0) > 0
-
-            result.append(
-                {
-                    "id": task.id,
-                    "title": task_crd.spec.title,
-                    "status": status,
-                    "task_type": task_type,
-                    "type": type_value,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "completed_at": completed_at,
-                    "team_id": team_id,
-                    "git_repo": git_repo,
-                    "is_group_chat": is_group_chat,
-                }
-            )
-
-        return result, total
+        return self._build_lite_task_list(db, entries, user_id), total, next_cursor
 
     def get_user_group_tasks_lite(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 50
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
         """
         Get user's group chat task list with pagination (lightweight version for list display).
         Returns only group chat tasks sorted by updated_at descending (most recent activity first).
@@ -598,80 +404,24 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         - task.json.spec.is_group_chat = true, OR
         - task has records in task_members table
         """
-        from app.models.task_member import MemberStatus, TaskMember
-
-        # Get all task IDs where user is owner or member
-        # First get task IDs that are group chats (have members)
-        member_task_ids_sql = text(
-            """
-            SELECT DISTINCT tm.task_id
-            FROM task_members tm
-            INNER JOIN tasks k ON k.id = tm.task_id
-            WHERE tm.status = 'ACTIVE'
-            AND k.kind = 'Task'
-            AND k.is_active = true
-            AND (k.user_id = :user_id OR tm.user_id = :user_id)
-        """
-        )
-        member_task_ids_result = db.execute(
-            member_task_ids_sql, {"user_id": user_id}
-        ).fetchall()
-        member_task_ids = {row[0] for row in member_task_ids_result}
-
-        # Also get tasks where is_group_chat is explicitly set to true in JSON
-        explicit_group_sql = text(
-            """
-            SELECT DISTINCT k.id
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-            AND JSON_EXTRACT(k.json, '$.spec.is_group_chat') = true
-        """
+        query = db.query(TaskListEntry).filter(
+            TaskListEntry.user_id == user_id,
+            TaskListEntry.is_group_chat == True,
         )
-        explicit_group_result = db.execute(
-            explicit_group_sql, {"user_id": user_id}
-        ).fetchall()
-        explicit_group_ids = {row[0] for row in explicit_group_result}
-
-        # Combine both sets
-        all_group_task_ids = member_task_ids | explicit_group_ids
-
-        if not all_group_task_ids:
-            return [], 0
-
-        total = len(all_group_task_ids)
-
-        # Load full task data for all group chat IDs
-        tasks = (
-            db.query(TaskResource).filter(TaskResource.id.in_(all_group_task_ids)).all()
-        )
-
-        # Filter out DELETE status tasks
-        valid_tasks = []
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE":
-                valid_tasks.append(t)
-
-        # Sort by updated_at descending (most recent activity first)
-        valid_tasks.sort(key=lambda t: t.updated_at, reverse=True)
-
-        # Apply pagination
-        paginated_tasks = valid_tasks[skip : skip + limit]
-
-        # Build lightweight result
-        result = self._build_lite_task_list(
-            db, paginated_tasks, user_id, member_task_ids
+        entries, total, next_cursor = paginate_entries(
+            query, TaskListEntry.updated_at, skip=skip, limit=limit, cursor=cursor
         )
-
-        return result, len(valid_tasks)
+        return self._build_lite_task_list(db, entries, user_id), total, next_cursor
 
     def get_user_personal_tasks_lite(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 50
-    ) -> Tuple[List[Dict[str, Any]], int]:
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
         """
         Get user's personal (non-group-chat) task list with pagination (lightweight version for list display).
         Returns only personal tasks sorted by created_at descending (newest first).
@@ -679,267 +429,105 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         - task.json.spec.is_group_chat is NOT true, AND
         - task has NO records in task_members table
         """
-        from app.models.task_member import MemberStatus, TaskMember
-
-        # Get all task IDs that are group chats (have members)
-        member_task_ids_sql = text(
-            """
-            SELECT DISTINCT tm.task_id
-            FROM task_members tm
-            INNER JOIN tasks k ON k.id = tm.task_id
-            WHERE tm.status = 'ACTIVE'
-            AND k.kind = 'Task'
-            AND k.is_active = true
-        """
-        )
-        member_task_ids_result = db.execute(member_task_ids_sql).fetchall()
-        member_task_ids = {row[0] for row in member_task_ids_result}
-
-        # Also get task IDs where is_group_chat is explicitly set to true
-        explicit_group_sql = text(
-            """
-            SELECT DISTINCT k.id
-            FROM tasks k
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.user_id = :user_id
-            AND JSON_EXTRACT(k.json, '$.spec.is_group_chat') = true
-        """
-        )
-        explicit_group_result = db.execute(
-            explicit_group_sql, {"user_id": user_id}
-        ).fetchall()
-        explicit_group_ids = {row[0] for row in explicit_group_result}
-
-        # Combine all group task IDs to exclude
-        all_group_task_ids = member_task_ids | explicit_group_ids
-
-        # Get user's owned tasks (not group chats)
-        count_sql = text(
-            """
-            SELECT COUNT(*)
-            FROM tasks k
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.user_id = :user_id
-        """
+        query = db.query(TaskListEntry).filter(
+            TaskListEntry.user_id == user_id,
+            TaskListEntry.is_owner == True,
+            TaskListEntry.is_group_chat == False,
         )
-        total_result = db.execute(count_sql, {"user_id": user_id}).scalar()
-
-        # Get task IDs sorted by created_at, excluding group chats
-        ids_sql = text(
-            """
-            SELECT k.id, k.created_at
-            FROM tasks k
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.user_id = :user_id
-            ORDER BY k.created_at DESC
-            LIMIT :limit OFFSET :skip
-        """
+        entries, total, next_cursor = paginate_entries(
+            query, TaskListEntry.created_at, skip=skip, limit=limit, cursor=cursor
         )
-        task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "limit": limit + 100, "skip": skip}
-        ).fetchall()
-        task_ids = [row[0] for row in task_id_rows]
-
-        if not task_ids:
-            return [], 0
-
-        # Load full task data
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter out DELETE status and group chat tasks
-        valid_tasks = []
-        for t in tasks:
-            # Skip group chat tasks
-            if t.id in all_group_task_ids:
-                continue
-
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE":
-                valid_tasks.append(t)
-
-        # Restore original order (by created_at descending) and apply limit
-        id_to_task = {t.id: t for t in valid_tasks}
-        ordered_tasks = []
-        for tid in task_ids:
-            if tid in id_to_task:
-                ordered_tasks.append(id_to_task[tid])
-                if len(ordered_tasks) >= limit:
-                    break
-
-        # Build lightweight result
-        result = self._build_lite_task_list(db, ordered_tasks, user_id, set())
-
-        # Recalculate total excluding group chats and DELETE status (approximate)
-        total = total_result - len(all_group_task_ids) if total_result else 0
-        if total < 0:
-            total = len(ordered_tasks)
-
-        return result, max(total, len(ordered_tasks))
+        return self._build_lite_task_list(db, entries, user_id), total, next_cursor
 
     def _build_lite_task_list(
-        self,
-        db: Session,
-        tasks: List[TaskResource],
-        user_id: int,
-        member_task_ids: set,
+        self, db: Session, entries: List[TaskListEntry], user_id: int
     ) -> List[Dict[str, Any]]:
         """
-        Build lightweight task list result from task resources.
-        Shared helper method for get_user_group_tasks_lite and get_user_personal_tasks_lite.
+        Build lightweight task list result from task list entries.
+        Team IDs and workspace repositories are resolved for the whole page in
+        batch, from the viewing user's own teams/workspaces first and then from
+        teams shared with them.
         """
-        if not tasks:
+        if not entries:
             return []
 
-        # Get task member counts in batch for is_group_chat detection
-        from app.models.task_member import MemberStatus, TaskMember
-
-        task_ids_for_members = [t.id for t in tasks]
-        member_counts = {}
-        if task_ids_for_members:
-            member_count_results = (
-                db.query(TaskMember.task_id, func.count(TaskMember.id).label("count"))
+        team_keys = {(e.team_name, e.team_namespace) for e in entries if e.team_name}
+        team_ids: Dict[Tuple[str, str], int] = {}
+        if team_keys:
+            own_teams = (
+                db.query(Kind.name, Kind.namespace, Kind.id)
                 .filter(
-                    TaskMember.task_id.in_(task_ids_for_members),
-                    TaskMember.status == MemberStatus.ACTIVE,
+                    Kind.user_id == user_id,
+                    Kind.kind == "Team",
+                    Kind.is_active == True,
+                    tuple_(Kind.name, Kind.namespace).in_(team_keys),
                 )
-                .group_by(TaskMember.task_id)
+                .order_by(Kind.id)
                 .all()
             )
-            member_counts = {row[0]: row[1] for row in member_count_results}
+            for name, namespace, team_id in own_teams:
+                team_ids.setdefault((name, namespace), team_id)
 
-        result = []
-        for task in tasks:
-            task_crd = Task.model_validate(task.json)
-
-            # Extract basic fields from task JSON
-            task_type = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("taskType")
-                or "chat"
-            )
-            type_value = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("type")
-                or "online"
-            )
-            status = task_crd.status.status if task_crd.status else "PENDING"
-
-            # Parse timestamps
-            created_at = task.created_at
-            updated_at = task.updated_at
-            completed_at = None
-            if task_crd.status:
-                try:
-                    if task_crd.status.createdAt:
-                        created_at = task_crd.status.createdAt
-                    if task_crd.status.updatedAt:
-                        updated_at = task_crd.status.updatedAt
-                    if task_crd.status.completedAt:
-                        completed_at = task_crd.status.completedAt
-                except:
-                    pass
-
-            # Get team_id using direct SQL query
-            team_name = task_crd.spec.teamRef.name
-            team_namespace = task_crd.spec.teamRef.namespace
-            team_result = db.execute(
-                text(
-                    """
-                    SELECT id FROM kinds
-                    WHERE user_id = :user_id
-                    AND kind = 'Team'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {"user_id": user_id, "name": team_name, "namespace": team_namespace},
-            ).fetchone()
+            missing_keys = team_keys - team_ids.keys()
+            if missing_keys:
+                shared_teams = (
+                    db.query(Kind.name, Kind.namespace, Kind.id)
+                    .join(SharedTeam, Kind.user_id == SharedTeam.original_user_id)
+                    .filter(
+                        SharedTeam.user_id == user_id,
+                        SharedTeam.is_active == True,
+                        Kind.kind == "Team",
+                        Kind.is_active == True,
+                        tuple_(Kind.name, Kind.namespace).in_(missing_keys),
+                    )
+                    .order_by(Kind.id)
+                    .all()
+                )
+                for name, namespace, team_id in shared_teams:
+                    team_ids.setdefault((name, namespace), team_id)
 
-            # If not found in user's teams, check shared teams
-            team_id = team_result[0] if team_result else None
-            if not team_id:
-                shared_team_result = db.execute(
-                    text(
-                        """
-                        SELECT k.id FROM kinds k
-                        INNER JOIN shared_teams st ON k.user_id = st.original_user_id
-                        WHERE st.user_id = :user_id
-                        AND st.is_active = true
-                        AND k.kind = 'Team'
-                        AND k.name = :name
-                        AND k.namespace = :namespace
-                        AND k.is_active = true
-                        LIMIT 1
-                    """
+        workspace_keys = {
+            (e.workspace_name, e.workspace_namespace)
+            for e in entries
+            if e.workspace_name
+        }
+        git_repos: Dict[Tuple[str, str], Optional[str]] = {}
+        if workspace_keys:
+            workspaces = (
+                db.query(TaskResource.name, TaskResource.namespace, TaskResource.json)
+                .filter(
+                    TaskResource.user_id == user_id,
+                    TaskResource.kind == "Workspace",
+                    TaskResource.is_active == True,
+                    tuple_(TaskResource.name, TaskResource.namespace).in_(
+                        workspace_keys
                     ),
-                    {
-                        "user_id": user_id,
-                        "name": team_name,
-                        "namespace": team_namespace,
-                    },
-                ).fetchone()
-                team_id = shared_team_result[0] if shared_team_result else None
-
-            # Get git_repo from workspace using direct SQL query
-            workspace_name = task_crd.spec.workspaceRef.name
-            workspace_namespace = task_crd.spec.workspaceRef.namespace
-            workspace_result = db.execute(
-                text(
-                    """
-                    SELECT JSON_EXTRACT(json, '$.spec.repository.gitRepo') as git_repo
-                    FROM tasks
-                    WHERE user_id = :user_id
-                    AND kind = 'Workspace'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {
-                    "user_id": user_id,
-                    "name": workspace_name,
-                    "namespace": workspace_namespace,
-                },
-            ).fetchone()
-
-            git_repo = None
-            if workspace_result and workspace_result[0]:
-                git_repo = (
-                    workspace_result[0].strip('"')
-                    if isinstance(workspace_result[0], str)
-                    else workspace_result[0]
                 )
-
-            # Check if this is a group chat
-            task_json = task.json or {}
-            is_group_chat = task_json.get("spec", {}).get("is_group_chat", False)
-            if not is_group_chat:
-                is_group_chat = member_counts.get(task.id, 0) > 0
-
-            result.append(
-                {
-                    "id": task.id,
-                    "title": task_crd.spec.title,
-                    "status": status,
-                    "task_type": task_type,
-                    "type": type_value,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "completed_at": completed_at,
-                    "team_id": team_id,
-                    "git_repo": git_repo,
-                    "is_group_chat": is_group_chat,
-                }
+                .order_by(TaskResource.id)
+                .all()
             )
+            for name, namespace, workspace_json in workspaces:
+                repository = (workspace_json or {}).get("spec", {}).get("repository")
+                git_repos.setdefault(
+                    (name, namespace), (repository or {}).get("gitRepo") or None
+                )
 
-        return result
+        return [
+            {
+                "id": e.task_id,
+                "title": e.title,
+                "status": e.status,
+                "task_type": e.task_type,
+                "type": e.type,
+                "created_at": e.status_created_at or e.created_at,
+                "updated_at": e.status_updated_at or e.updated_at,
+                "completed_at": e.completed_at,
+                "team_id": team_ids.get((e.team_name, e.team_namespace)),
+                "git_repo": git_repos.get((e.workspace_name, e.workspace_namespace)),
+                "is_group_chat": e.is_group_chat,
+            }
+            for e in entries
+        ]
 
     def get_new_tasks_since_id(
         self, db: Session, *, user_id: int, since_id: int, limit: int = 50
@@ -949,259 +537,37 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
         Returns tasks with ID greater than since_id, ordered by ID descending.
         Includes tasks owned by user AND tasks user is a member of (group chats).
         """
-        # Get task IDs where user is owner OR member, with ID > since_id
-        ids_sql = text(
-            """
-            SELECT DISTINCT k.id, k.created_at
-            FROM tasks k
-            LEFT JOIN task_members tm ON k.id = tm.task_id AND tm.user_id = :user_id AND tm.status = 'ACTIVE'
-            WHERE k.kind = 'Task'
-            AND k.is_active = true
-            AND k.id > :since_id
-            AND (k.user_id = :user_id OR tm.id IS NOT NULL)
-            ORDER BY k.id DESC
-            LIMIT :limit
-        """
+        entries = (
+            db.query(TaskListEntry)
+            .filter(TaskListEntry.user_id == user_id, TaskListEntry.task_id > since_id)
+            .order_by(TaskListEntry.task_id.desc())
+            .limit(limit)
+            .all()
         )
-        task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "since_id": since_id, "limit": limit}
-        ).fetchall()
-        task_ids = [row[0] for row in task_id_rows]
-
-        if not task_ids:
-            return []
-
-        # Load full task data for the selected IDs
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter out DELETE status tasks and restore order
-        id_to_task = {}
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            if status != "DELETE":
-                id_to_task[t.id] = t
-
-        # Restore the original order (by ID descending)
-        tasks = [id_to_task[tid] for tid in task_ids if tid in id_to_task]
-
-        # Get task member counts in batch for is_group_chat detection
-        from app.models.task_member import MemberStatus, TaskMember
-
-        task_ids_for_members = [t.id for t in tasks]
-        member_counts = {}
-        if task_ids_for_members:
-            member_count_results = (
-                db.query(TaskMember.task_id, func.count(TaskMember.id).label("count"))
-                .filter(
-                    TaskMember.task_id.in_(task_ids_for_members),
-                    TaskMember.status == MemberStatus.ACTIVE,
-                )
-                .group_by(TaskMember.task_id)
-                .all()
-            )
-            member_counts = {row[0]: row[1] for row in member_count_results}
-
-        # Build lightweight result (same structure as get_user_tasks_lite)
-        result = []
-        for task in tasks:
-            task_crd = Task.model_validate(task.json)
-
-            # Extract basic fields from task JSON
-            task_type = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("taskType")
-                or "chat"
-            )
-            type_value = (
-                task_crd.metadata.labels
-                and task_crd.metadata.labels.get("type")
-                or "online"
-            )
-            status = task_crd.status.status if task_crd.status else "PENDING"
-
-            # Parse timestamps
-            created_at = task.created_at
-            updated_at = task.updated_at
-            completed_at = None
-            if task_crd.status:
-                try:
-                    if task_crd.status.createdAt:
-                        created_at = task_crd.status.createdAt
-                    if task_crd.status.updatedAt:
-                        updated_at = task_crd.status.updatedAt
-                    if task_crd.status.completedAt:
-                        completed_at = task_crd.status.completedAt
-                except:
-                    pass
-
-            # Get team_id using direct SQL query
-            team_name = task_crd.spec.teamRef.name
-            team_namespace = task_crd.spec.teamRef.namespace
-            team_result = db.execute(
-                text(
-                    """
-                    SELECT id FROM kinds
-                    WHERE user_id = :user_id
-                    AND kind = 'Team'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {"user_id": user_id, "name": team_name, "namespace": team_namespace},
-            ).fetchone()
-
-            # If not found in user's teams, check shared teams
-            team_id = team_result[0] if team_result else None
-            if not team_id:
-                shared_team_result = db.execute(
-                    text(
-                        """
-                        SELECT k.id FROM kinds k
-                        INNER JOIN shared_teams st ON k.user_id = st.original_user_id
-                        WHERE st.user_id = :user_id
-                        AND st.is_active = true
-                        AND k.kind = 'Team'
-                        AND k.name = :name
-                        AND k.namespace = :namespace
-                        AND k.is_active = true
-                        LIMIT 1
-                    """
-                    ),
-                    {
-                        "user_id": user_id,
-                        "name": team_name,
-                        "namespace": team_namespace,
-                    },
-                ).fetchone()
-                team_id = shared_team_result[0] if shared_team_result else None
-
-            # Get git_repo from workspace using direct SQL query
-            workspace_name = task_crd.spec.workspaceRef.name
-            workspace_namespace = task_crd.spec.workspaceRef.namespace
-            workspace_result = db.execute(
-                text(
-                    """
-                    SELECT JSON_EXTRACT(json, '$.spec.repository.gitRepo') as git_repo
-                    FROM tasks
-                    WHERE user_id = :user_id
-                    AND kind = 'Workspace'
-                    AND name = :name
-                    AND namespace = :namespace
-                    AND is_active = true
-                    LIMIT 1
-                """
-                ),
-                {
-                    "user_id": user_id,
-                    "name": workspace_name,
-                    "namespace": workspace_namespace,
-                },
-            ).fetchone()
-
-            git_repo = None
-            if workspace_result and workspace_result[0]:
-                # Remove JSON quotes from extracted value
-                git_repo = (
-                    workspace_result[0].strip('"')
-                    if isinstance(workspace_result[0], str)
-                    else workspace_result[0]
-                )
-
-            # Check if this is a group chat
-            # First check task.json.spec.is_group_chat, fallback to member count
-            task_json = task.json or {}
-            is_group_chat = task_json.get("spec", {}).get("is_group_chat", False)
-            # Fallback: if not explicitly set, check member count
-            if not is_group_chat:
-                is_group_chat = member_counts.get(task.id, 0) > 0
-
-            result.append(
-                {
-                    "id": task.id,
-                    "title": task_crd.spec.title,
-                    "status": status,
-                    "task_type": task_type,
-                    "type": type_value,
-                    "created_at": created_at,
-                    "updated_at": updated_at,
-                    "completed_at": completed_at,
-                    "team_id": team_id,
-                    "git_repo": git_repo,
-                    "is_group_chat": is_group_chat,
-                }
-            )
-
-        return result
+        return self._build_lite_task_list(db, entries, user_id)
 
     def get_user_tasks_by_title_with_pagination(
         self, db: Session, *, user_id: int, title: str, skip: int = 0, limit: int = 100
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
-        Fuzzy search tasks by title for current user (pagination), excluding DELETE status
-        Optimized version using raw SQL to avoid MySQL "Out of sort memory" errors.
-        Title matching and DELETE status filtering are done in application layer.
-        """
-        # Use raw SQL to get task IDs without JSON_EXTRACT in WHERE clause
-        count_sql = text(
-            """
-            SELECT COUNT(*) FROM tasks
-            WHERE user_id = :user_id
-            AND kind = 'Task'
-            AND is_active = true
-        """
-        )
-        total_result = db.execute(count_sql, {"user_id": user_id}).scalar()
-
-        # Get task IDs sorted by created_at (fetch more to account for filtering)
-        ids_sql = text(
-            """
-            SELECT id FROM tasks
-            WHERE user_id = :user_id
-            AND kind = 'Task'
-            AND is_active = true
-            ORDER BY created_at DESC
-            LIMIT :limit OFFSET :skip
+        Fuzzy search tasks by title for current user (pagination), excluding DELETE status.
+        Matching, ranking and counting run in the database against the task list
+        index, see app.services.task_list_index.search_entries.
         """
+        entries, total = search_entries(
+            db, user_id=user_id, title=title, skip=skip, limit=limit
         )
-        task_id_rows = db.execute(
-            ids_sql, {"user_id": user_id, "limit": limit + 100, "skip": skip}
-        ).fetchall()
-        task_ids = [row[0] for row in task_id_rows]
-
-        if not task_ids:
-            return [], 0
-
-        # Load full task data for the selected IDs
-        tasks = db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
-
-        # Filter by title and DELETE status in application layer, restore order
-        title_lower = title.lower()
-        id_to_task = {}
-        for t in tasks:
-            task_crd = Task.model_validate(t.json)
-            status = task_crd.status.status if task_crd.status else "PENDING"
-            task_title = task_crd.spec.title or ""
-            # Filter: not DELETE and title matches
-            if status != "DELETE" and title_lower in task_title.lower():
-                id_to_task[t.id] = t
-
-        # Restore the original order and apply limit
-        filtered_tasks = []
-        for tid in task_ids:
-            if tid in id_to_task:
-                filtered_tasks.append(id_to_task[tid])
-                if len(filtered_tasks) >= limit:
-                    break
-
-        # Approximate total (actual count would require full scan)
-        total = len(id_to_task)
-
-        if not filtered_tasks:
+        if not entries:
             return [], total
 
+        # Load full task data for the page only, keeping the ranked order
+        task_ids = [e.task_id for e in entries]
+        id_to_task = {
+            t.id: t
+            for t in db.query(TaskResource).filter(TaskResource.id.in_(task_ids)).all()
+        }
+        filtered_tasks = [id_to_task[tid] for tid in task_ids if tid in id_to_task]
+
         # Get all related data in batch to avoid N+1 queries
         related_data_batch = self._get_tasks_related_data_batch(
             db, filtered_tasks, user_id
@@ -1233,7 +599,7 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
                 TaskResource.id == task_id,
                 TaskResource.kind == "Task",
                 TaskResource.is_active == True,
-                text("JSON_EXTRACT(json, '$.status.status') != 'DELETE'"),
+                TaskResource.task_status != "DELETE",
             )
             .first()
         )
@@ -1245,7 +611,7 @@ class TaskKindsService(BaseService[Kind, TaskCreate, TaskUpdate]):
                 TaskResource.id == task_id,
                 TaskResource.kind == "Task",
                 TaskResource.is_active == True,
-                text("JSON_EXTRACT(json, '$.status.status') != 'DELETE'"),
+                TaskResource.task_status != "DELETE",
             )
             .first()
         )
@@ -24,6 +24,7 @@ from app.schemas.kind import Bot, Ghost, Model, Shell, Task, Team
 from app.schemas.team import BotInfo, TeamCreate, TeamDetail, TeamInDB, TeamUpdate
 from app.services.adapters.shell_utils import get_shell_type
 from app.services.base import BaseService
+from app.services.crd_cache import crd_cache
 
 
 class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
@@ -938,37 +939,18 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         Returns:
             List of running task info dictionaries
         """
-        from sqlalchemy import func, or_
-
         from app.models.task import TaskResource
 
-        # Use JSON queries to filter at database level instead of loading all tasks into memory
-        # This is much faster when there are many tasks
+        # Filter on the generated team reference and status columns, which are
+        # covered by idx_tasks_team_ref, instead of JSON paths
         tasks = (
             db.query(TaskResource)
             .filter(
                 TaskResource.kind == "Task",
+                TaskResource.task_team_name == team_name,
+                TaskResource.task_team_namespace == team_namespace,
+                TaskResource.task_status.in_(["PENDING", "RUNNING"]),
                 TaskResource.is_active == True,
-                # Filter by team reference using JSON path
-                func.json_unquote(
-                    func.json_extract(TaskResource.json, "$.spec.teamRef.name")
-                )
-                == team_name,
-                func.json_unquote(
-                    func.json_extract(TaskResource.json, "$.spec.teamRef.namespace")
-                )
-                == team_namespace,
-                # Filter by status using JSON path - only get PENDING or RUNNING tasks
-                or_(
-                    func.json_unquote(
-                        func.json_extract(TaskResource.json, "$.status.status")
-                    )
-                    == "PENDING",
-                    func.json_unquote(
-                        func.json_extract(TaskResource.json, "$.status.status")
-                    )
-                    == "RUNNING",
-                ),
             )
             .all()
         )
@@ -1471,7 +1453,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         """
         convert_start = time.time()
 
-        team_crd = Team.model_validate(team.json)
+        team_crd = crd_cache.validate(team)
 
         # Convert members to bots format and collect shell_types for is_mix_team calculation
         bots = []
@@ -1543,40 +1525,28 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
             first_bot = first_bot_query.first()
 
             if first_bot:
-                bot_crd = Bot.model_validate(first_bot.json)
+                bot_crd = crd_cache.validate(first_bot)
                 shell_type = None
 
                 # First check user's custom shells (for group resources, use bot's user_id)
                 shell_user_id = first_bot.user_id if is_group_resource else user_id
-                shell = (
-                    db.query(Kind)
-                    .filter(
-                        Kind.user_id == shell_user_id,
-                        Kind.kind == "Shell",
-                        Kind.name == bot_crd.spec.shellRef.name,
-                        Kind.namespace == bot_crd.spec.shellRef.namespace,
-                        Kind.is_active.is_(True),
-                    )
-                    .first()
+                shell = crd_cache.find(
+                    db,
+                    "Shell",
+                    bot_crd.spec.shellRef.name,
+                    namespace=bot_crd.spec.shellRef.namespace,
+                    user_id=shell_user_id,
                 )
 
                 if shell:
-                    shell_crd = Shell.model_validate(shell.json)
-                    shell_type = shell_crd.spec.shellType
+                    shell_type = shell.crd.spec.shellType
                 else:
                     # If not found, check public shells
-
-                    public_shell = (
-                        db.query(Kind)
-                        .filter(
-                            Kind.name == bot_crd.spec.shellRef.name,
-                            Kind.is_active == True,
-                        )
-                        .first()
+                    public_shell = crd_cache.find(
+                        db, "Shell", bot_crd.spec.shellRef.name
                     )
-                    if public_shell and public_shell.json:
-                        shell_crd = Shell.model_validate(public_shell.json)
-                        shell_type = shell_crd.spec.shellType
+                    if public_shell:
+                        shell_type = public_shell.crd.spec.shellType
 
                 if shell_type:
                     # Map shellType to agent type
@@ -1649,7 +1619,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
                 - models: Dict[(user_id, name, namespace), Kind]
                 - public_models: Dict[name, Kind]
         """
-        team_crd = Team.model_validate(team.json)
+        team_crd = crd_cache.validate(team)
 
         # Determine if this is a group resource
         is_group_resource = team.namespace and team.namespace != "default"
@@ -1725,7 +1695,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
                         break
 
             if first_bot:
-                bot_crd = Bot.model_validate(first_bot.json)
+                bot_crd = crd_cache.validate(first_bot)
                 shell_type = None
                 shell_ref_name = bot_crd.spec.shellRef.name
                 shell_ref_namespace = bot_crd.spec.shellRef.namespace
@@ -1740,7 +1710,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
                 )
 
                 if shell:
-                    shell_crd = Shell.model_validate(shell.json)
+                    shell_crd = crd_cache.validate(shell)
                     shell_type = shell_crd.spec.shellType
                     logger.debug(
                         f"[_convert_to_team_dict_with_cache] Found user shell: {shell_ref_name}, shell_type={shell_type}"
@@ -1749,7 +1719,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
                     # If not found, check public shells in cache (by name only)
                     public_shell = public_shells_cache.get(shell_ref_name)
                     if public_shell and public_shell.json:
-                        shell_crd = Shell.model_validate(public_shell.json)
+                        shell_crd = crd_cache.validate(public_shell)
                         shell_type = shell_crd.spec.shellType
                         logger.debug(
                             f"[_convert_to_team_dict_with_cache] Found public shell: {shell_ref_name}, shell_type={shell_type}"
@@ -1818,7 +1788,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         Get a summary of bot information using preloaded cache.
         This is an optimized version that avoids database queries.
         """
-        bot_crd = Bot.model_validate(bot.json)
+        bot_crd = crd_cache.validate(bot)
 
         # modelRef is optional, handle None case
         model_ref_name = bot_crd.spec.modelRef.name if bot_crd.spec.modelRef else None
@@ -1836,7 +1806,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
 
         shell_type = ""
         if shell and shell.json:
-            shell_crd = Shell.model_validate(shell.json)
+            shell_crd = crd_cache.validate(shell)
             shell_type = shell_crd.spec.shellType
 
         agent_config = {}
@@ -1848,7 +1818,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
 
             if model:
                 # Private model - check if it's a custom config or predefined model
-                model_crd = Model.model_validate(model.json)
+                model_crd = crd_cache.validate(model)
                 is_custom_config = model_crd.spec.isCustomConfig
 
                 if is_custom_config:
@@ -1884,7 +1854,7 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         """
         summary_start = time.time()
 
-        bot_crd = Bot.model_validate(bot.json)
+        bot_crd = crd_cache.validate(bot)
 
         # modelRef is optional, handle None case
         model_ref_name = bot_crd.spec.modelRef.name if bot_crd.spec.modelRef else None
@@ -1898,16 +1868,12 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
 
         # Get shell to extract shell_type
         t_shell = time.time()
-        shell = (
-            db.query(Kind)
-            .filter(
-                Kind.user_id == user_id,
-                Kind.kind == "Shell",
-                Kind.name == bot_crd.spec.shellRef.name,
-                Kind.namespace == bot_crd.spec.shellRef.namespace,
-                Kind.is_active.is_(True),
-            )
-            .first()
+        shell = crd_cache.find(
+            db,
+            "Shell",
+            bot_crd.spec.shellRef.name,
+            namespace=bot_crd.spec.shellRef.namespace,
+            user_id=user_id,
         )
 
         logger.info(
@@ -1916,16 +1882,12 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
 
         # If not found in user's shells, check public shells (user_id = 0)
         if not shell:
-            shell = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == 0,
-                    Kind.kind == "Shell",
-                    Kind.name == bot_crd.spec.shellRef.name,
-                    Kind.namespace == bot_crd.spec.shellRef.namespace,
-                    Kind.is_active.is_(True),
-                )
-                .first()
+            shell = crd_cache.find(
+                db,
+                "Shell",
+                bot_crd.spec.shellRef.name,
+                namespace=bot_crd.spec.shellRef.namespace,
+                user_id=0,
             )
             logger.info(
                 f"[_get_bot_summary] Checking public shell for bot={bot.name}, shellRef.name={bot_crd.spec.shellRef.name}, found_in_public_shells={shell is not None}"
@@ -1934,9 +1896,8 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         shell_query_time = time.time() - t_shell
 
         shell_type = ""
-        if shell and shell.json:
-            shell_crd = Shell.model_validate(shell.json)
-            shell_type = shell_crd.spec.shellType
+        if shell:
+            shell_type = shell.crd.spec.shellType
             logger.info(
                 f"[_get_bot_summary] Got shell_type={shell_type} for bot={bot.name}"
             )
@@ -1951,23 +1912,19 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
         t_model = time.time()
         if model_ref_name and model_ref_namespace:
             # Try to find model in user's private models first
-            model = (
-                db.query(Kind)
-                .filter(
-                    Kind.user_id == user_id,
-                    Kind.kind == "Model",
-                    Kind.name == model_ref_name,
-                    Kind.namespace == model_ref_namespace,
-                    Kind.is_active.is_(True),
-                )
-                .first()
+            model = crd_cache.find(
+                db,
+                "Model",
+                model_ref_name,
+                namespace=model_ref_namespace,
+                user_id=user_id,
             )
 
             logger.debug(f"[_get_bot_summary] Private model found: {model is not None}")
 
             if model:
                 # Private model - check if it's a custom config or predefined model
-                model_crd = Model.model_validate(model.json)
+                model_crd = model.crd
                 is_custom_config = model_crd.spec.isCustomConfig
 
                 logger.info(
@@ -1995,14 +1952,8 @@ class TeamKindsService(BaseService[Kind, TeamCreate, TeamUpdate]):
                     )
             else:
                 # Try to find in public_models table
-                public_model = (
-                    db.query(Kind)
-                    .filter(
-                        Kind.name == model_ref_name,
-                        Kind.namespace == model_ref_namespace,
-                        Kind.is_active.is_(True),
-                    )
-                    .first()
+                public_model = crd_cache.find(
+                    db, "Model", model_ref_name, namespace=model_ref_namespace
                 )
 
                 logger.debug(
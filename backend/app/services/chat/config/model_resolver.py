@@ -8,6 +8,7 @@ Model resolver for Chat Shell.
 Resolves model configuration from Bot's bound model or task-level override.
 """
 
+import copy
 import json
 import logging
 import os
@@ -19,7 +20,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.models.kind import Kind
-from app.schemas.kind import Bot, Model
+from app.services.crd_cache import crd_cache
 
 logger = logging.getLogger(__name__)
 
@@ -371,7 +372,7 @@ def get_model_config_for_bot(
     Raises:
         ValueError: If no model is configured or model not found
     """
-    bot_crd = Bot.model_validate(bot.json)
+    bot_crd = crd_cache.validate(bot)
     model_name = None
 
     # Priority 1: Force override from task
@@ -429,37 +430,20 @@ def _find_model(db: Session, model_name: str, user_id: int) -> Optional[Dict[str
         Model spec dictionary or None if not found
     """
     # Search user's private models first
-    user_model = (
-        db.query(Kind)
-        .filter(
-            Kind.kind == "Model",
-            Kind.user_id == user_id,
-            Kind.name == model_name,
-            Kind.is_active == True,
-        )
-        .first()
-    )
+    user_model = crd_cache.find(db, "Model", model_name, user_id=user_id)
 
-    if user_model and user_model.json:
+    if user_model:
         logger.info(f"Found model '{model_name}' in user's private models")
-        return user_model.json.get("spec", {})
+        return copy.deepcopy(user_model.json.get("spec", {}))
 
     # Search public models
-    public_model = (
-        db.query(Kind)
-        .filter(
-            Kind.user_id == 0,
-            Kind.kind == "Model",
-            Kind.name == model_name,
-            Kind.namespace == "default",
-            Kind.is_active == True,
-        )
-        .first()
+    public_model = crd_cache.find(
+        db, "Model", model_name, namespace="default", user_id=0
     )
 
-    if public_model and public_model.json:
+    if public_model:
         logger.info(f"Found model '{model_name}' in public models")
-        return public_model.json.get("spec", {})
+        return copy.deepcopy(public_model.json.get("spec", {}))
 
     logger.warning(f"Model '{model_name}' not found in any source")
     return None
@@ -608,27 +592,20 @@ def get_bot_system_prompt(
     Returns:
         Combined system prompt string
     """
-    from app.schemas.kind import Ghost
-
-    bot_crd = Bot.model_validate(bot.json)
+    bot_crd = crd_cache.validate(bot)
     system_prompt = ""
 
     # Get Ghost for system prompt
-    ghost = (
-        db.query(Kind)
-        .filter(
-            Kind.user_id == user_id,
-            Kind.kind == "Ghost",
-            Kind.name == bot_crd.spec.ghostRef.name,
-            Kind.namespace == bot_crd.spec.ghostRef.namespace,
-            Kind.is_active == True,
-        )
-        .first()
+    ghost = crd_cache.find(
+        db,
+        "Ghost",
+        bot_crd.spec.ghostRef.name,
+        namespace=bot_crd.spec.ghostRef.namespace,
+        user_id=user_id,
     )
 
-    if ghost and ghost.json:
-        ghost_crd = Ghost.model_validate(ghost.json)
-        system_prompt = ghost_crd.spec.systemPrompt or ""
+    if ghost:
+        system_prompt = ghost.crd.spec.systemPrompt or ""
 
     # Append team member prompt if provided
     if team_member_prompt:
@@ -14,10 +14,12 @@ from typing import Any, Callable, Generator, Optional, TypeVar
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
-# Thread pool for database operations
-_db_executor = ThreadPoolExecutor(max_workers=10)
+# Thread pool for database operations when the async engine is disabled
+_db_executor = ThreadPoolExecutor(max_workers=settings.CHAT_DB_EXECUTOR_WORKERS)
 
 # Terminal statuses that mark completion
 _TERMINAL_STATUSES = frozenset(["COMPLETED", "FAILED", "CANCELLED"])
@@ -57,10 +59,17 @@ async def emit_task_status_update(
 
 @contextmanager
 def _db_session() -> Generator[Session, None, None]:
-    """Context manager for database session with auto-rollback on error."""
-    from app.db.session import SessionLocal
+    """Context manager for database session with auto-rollback on error.
+
+    Inside run_in_async_session() the session bound to the async engine is
+    used, otherwise a new session of the primary.
+    """
+    from app.db.session import SessionLocal, get_bound_session
 
-    db = SessionLocal()
+    db = get_bound_session()
+    owned = db is None
+    if owned:
+        db = SessionLocal()
     try:
         yield db
         db.commit()
@@ -68,14 +77,23 @@ def _db_session() -> Generator[Session, None, None]:
         db.rollback()
         raise
     finally:
-        db.close()
+        if owned:
+            db.close()
 
 
 class DatabaseHandler:
     """Handles database operations for chat service."""
 
     async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
-        """Run a synchronous function in the thread pool executor."""
+        """Run a synchronous database function.
+
+        With DB_ASYNC_ENABLED it runs on the async engine in the event loop,
+        otherwise in the thread pool executor.
+        """
+        from app.db.session import async_sessions_enabled, run_in_async_session
+
+        if async_sessions_enabled():
+            return await run_in_async_session(func, *args)
         return await asyncio.get_event_loop().run_in_executor(_db_executor, func, *args)
 
     async def update_subtask_status(
@@ -16,11 +16,19 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from app.core.cache import cache_manager
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Redis key prefix for chat history (Redis list, one JSON message per item)
+HISTORY_KEY_PREFIX = "chat:history_list:"
+# Redis key prefix for chat history stored as a single JSON blob (before
+# the list format); migrated to the list on first access
+LEGACY_HISTORY_KEY_PREFIX = "chat:history:"
+
 # Redis key prefix for cancellation flags
 CANCEL_KEY_PREFIX = "chat:cancel:"
 # Cancellation flag TTL in seconds (5 minutes should be enough for any chat)
@@ -55,44 +63,89 @@ class SessionManager:
         self._local_events: Dict[int, asyncio.Event] = {}
 
     def _get_history_key(self, task_id: int) -> str:
-        """Generate Redis key for chat history."""
-        return f"chat:history:{task_id}"
+        """Generate Redis key for chat history (Redis list, one message per item)."""
+        return f"{HISTORY_KEY_PREFIX}{task_id}"
+
+    def _get_legacy_history_key(self, task_id: int) -> str:
+        """Generate Redis key of the legacy chat history (whole list as one JSON blob)."""
+        return f"{LEGACY_HISTORY_KEY_PREFIX}{task_id}"
 
-    async def get_chat_history(self, task_id: int) -> List[Dict[str, str]]:
+    async def get_chat_history(
+        self, task_id: int, limit: Optional[int] = None
+    ) -> List[Dict[str, str]]:
         """
         Get chat history for a task.
 
         Args:
             task_id: The task ID to get history for
+            limit: Only return the last N messages (ranged read)
 
         Returns:
             List of message dictionaries with 'role' and 'content' keys
         """
+        if limit is not None and limit <= 0:
+            return []
         try:
             key = self._get_history_key(task_id)
-            history = await self._cache.get(key)
-
-            if history is None:
-                return []
+            redis_client = await self._cache._get_client()
+            with self._cache.track("history_get"):
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.lrange(key, -limit if limit else 0, -1)
+                    pipe.exists(self._get_legacy_history_key(task_id))
+                    items, legacy_exists = await pipe.execute()
 
-            # Ensure we return a list
-            if isinstance(history, list):
-                return history
+            if not items and legacy_exists:
+                history = await self._migrate_legacy_history(task_id)
+                return history[-limit:] if limit else history
 
-            logger.warning(
-                f"Invalid history format for task {task_id}, returning empty list"
-            )
-            return []
+            return [orjson.loads(item) for item in items]
 
         except Exception as e:
             logger.error(f"Error getting chat history for task {task_id}: {e}")
             return []
 
+    async def _migrate_legacy_history(self, task_id: int) -> List[Dict[str, str]]:
+        """
+        Move a legacy JSON blob history into the Redis list.
+
+        GETDEL makes sure only one concurrent caller migrates the blob. Its
+        messages are pushed in front of anything appended to the list since.
+
+        Returns:
+            The migrated messages (empty if there was nothing to migrate)
+        """
+        redis_client = await self._cache._get_client()
+        with self._cache.track("history_migrate"):
+            data = await redis_client.getdel(self._get_legacy_history_key(task_id))
+            if data is None:
+                return []
+            try:
+                history = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                history = None
+            if not isinstance(history, list):
+                logger.warning(
+                    f"Invalid history format for task {task_id}, dropping it"
+                )
+                return []
+
+            history = history[-settings.CHAT_HISTORY_MAX_MESSAGES :]
+            if history:
+                key = self._get_history_key(task_id)
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    pipe.lpush(key, *[orjson.dumps(m) for m in reversed(history)])
+                    pipe.ltrim(key, -settings.CHAT_HISTORY_MAX_MESSAGES, -1)
+                    pipe.expire(key, settings.CHAT_HISTORY_EXPIRE_SECONDS)
+                    await pipe.execute()
+
+        logger.info(f"Migrated {len(history)} chat history messages for task {task_id}")
+        return history
+
     async def save_chat_history(
         self, task_id: int, messages: List[Dict[str, str]], expire: Optional[int] = None
     ) -> bool:
         """
-        Save chat history for a task.
+        Save chat history for a task, replacing any existing history.
 
         Args:
             task_id: The task ID to save history for
@@ -114,12 +167,43 @@ class SessionManager:
                 )
 
             expire_time = expire or settings.CHAT_HISTORY_EXPIRE_SECONDS
-            return await self._cache.set(key, messages, expire=expire_time)
+            redis_client = await self._cache._get_client()
+            with self._cache.track("history_save"):
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    pipe.delete(key, self._get_legacy_history_key(task_id))
+                    if messages:
+                        pipe.rpush(key, *[orjson.dumps(m) for m in messages])
+                        pipe.expire(key, expire_time)
+                    await pipe.execute()
+            return True
 
         except Exception as e:
             logger.error(f"Error saving chat history for task {task_id}: {e}")
             return False
 
+    async def _append_history(
+        self, task_id: int, messages: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Atomically append messages and trim the history.
+
+        RPUSH, LTRIM and EXPIRE run in one MULTI/EXEC, so the cost does not
+        depend on the history length and concurrent appends are not lost.
+        """
+        key = self._get_history_key(task_id)
+        redis_client = await self._cache._get_client()
+        with self._cache.track("history_append"):
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.rpush(key, *[orjson.dumps(m) for m in messages])
+                pipe.ltrim(key, -settings.CHAT_HISTORY_MAX_MESSAGES, -1)
+                pipe.expire(key, settings.CHAT_HISTORY_EXPIRE_SECONDS)
+                length, _, _ = await pipe.execute()
+
+        if length == len(messages):
+            # The list was just created: adopt a legacy blob history if one exists
+            await self._migrate_legacy_history(task_id)
+        return True
+
     async def append_message(self, task_id: int, role: str, content: str) -> bool:
         """
         Append a single message to chat history.
@@ -133,9 +217,9 @@ class SessionManager:
             bool: True if append was successful
         """
         try:
-            history = await self.get_chat_history(task_id)
-            history.append({"role": role, "content": content})
-            return await self.save_chat_history(task_id, history)
+            return await self._append_history(
+                task_id, [{"role": role, "content": content}]
+            )
 
         except Exception as e:
             logger.error(f"Error appending message for task {task_id}: {e}")
@@ -158,8 +242,6 @@ class SessionManager:
             bool: True if append was successful
         """
         try:
-            history = await self.get_chat_history(task_id)
-
             # Normalize user message content for storage
             # If it's a vision message dict, convert to standard OpenAI format
             if isinstance(user_message, dict) and user_message.get("type") == "vision":
@@ -180,9 +262,13 @@ class SessionManager:
                 # Fallback: convert to string
                 user_content = str(user_message)
 
-            history.append({"role": "user", "content": user_content})
-            history.append({"role": "assistant", "content": assistant_message})
-            return await self.save_chat_history(task_id, history)
+            return await self._append_history(
+                task_id,
+                [
+                    {"role": "user", "content": user_content},
+                    {"role": "assistant", "content": assistant_message},
+                ],
+            )
 
         except Exception as e:
             logger.error(f"Error appending messages for task {task_id}: {e}")
@@ -199,8 +285,13 @@ class SessionManager:
             bool: True if clear was successful
         """
         try:
-            key = self._get_history_key(task_id)
-            return await self._cache.delete(key)
+            deleted = await self._cache.delete_many(
+                [
+                    self._get_history_key(task_id),
+                    self._get_legacy_history_key(task_id),
+                ]
+            )
+            return deleted > 0
 
         except Exception as e:
             logger.error(f"Error clearing chat history for task {task_id}: {e}")
@@ -216,8 +307,17 @@ class SessionManager:
         Returns:
             int: Number of messages in history
         """
-        history = await self.get_chat_history(task_id)
-        return len(history)
+        try:
+            redis_client = await self._cache._get_client()
+            with self._cache.track("history_length"):
+                length = await redis_client.llen(self._get_history_key(task_id))
+        except Exception as e:
+            logger.error(f"Error getting chat history length for task {task_id}: {e}")
+            return 0
+        if length:
+            return length
+        # Nothing in the list yet, the history may still be a legacy blob
+        return len(await self.get_chat_history(task_id))
 
     # ==================== Cancellation Management ====================
 
@@ -304,6 +404,22 @@ class SessionManager:
                 f"Failed to delete cancel flag for subtask {subtask_id}: {e}"
             )
 
+    async def release_stream(self, subtask_id: int) -> None:
+        """
+        Release a finished stream in one round trip.
+
+        Equivalent to unregister_stream followed by delete_streaming_content:
+        removes the local event and deletes the cancellation flag and the
+        streaming content cache with a single multi-key DEL.
+
+        Args:
+            subtask_id: The subtask ID to release
+        """
+        self._local_events.pop(subtask_id, None)
+        await self._cache.delete_many(
+            [self._get_cancel_key(subtask_id), self._get_streaming_key(subtask_id)]
+        )
+
     async def is_cancelled(self, subtask_id: int) -> bool:
         """
         Check if a streaming request has been cancelled.
@@ -351,7 +467,8 @@ class SessionManager:
         Save streaming content to Redis (temporary cache).
 
         This is used for fast recovery when user refreshes during streaming.
-        Content is saved frequently (every 1 second) to minimize data loss.
+        Content is stored as a raw UTF-8 string (not JSON) so that
+        append_streaming_content can extend it with Redis APPEND.
 
         Args:
             subtask_id: Subtask ID
@@ -364,13 +481,49 @@ class SessionManager:
         try:
             key = self._get_streaming_key(subtask_id)
             expire_time = expire or settings.STREAMING_REDIS_TTL
-            return await self._cache.set(key, content, expire=expire_time)
+            redis_client = await self._cache._get_client()
+            with self._cache.track("streaming_save"):
+                return bool(await redis_client.set(key, content, ex=expire_time))
         except Exception as e:
             logger.error(
                 f"Error saving streaming content for subtask {subtask_id}: {e}"
             )
             return False
 
+    async def append_streaming_content(
+        self, subtask_id: int, delta: str, expire: int = None
+    ) -> Optional[int]:
+        """
+        Append new streaming content to the Redis cache.
+
+        Only the content produced since the last save is sent, so the cost of
+        a save does not grow with the length of the response.
+
+        Args:
+            subtask_id: Subtask ID
+            delta: Content produced since the last save
+            expire: Expiration time in seconds (default from settings)
+
+        Returns:
+            int or None: Length of the cached content in bytes after the
+            append, or None if the append failed
+        """
+        try:
+            key = self._get_streaming_key(subtask_id)
+            expire_time = expire or settings.STREAMING_REDIS_TTL
+            redis_client = await self._cache._get_client()
+            with self._cache.track("streaming_append"):
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.append(key, delta)
+                    pipe.expire(key, expire_time)
+                    length, _ = await pipe.execute()
+            return length
+        except Exception as e:
+            logger.error(
+                f"Error appending streaming content for subtask {subtask_id}: {e}"
+            )
+            return None
+
     async def get_streaming_content(self, subtask_id: int) -> Optional[str]:
         """
         Get streaming content from Redis cache.
@@ -385,10 +538,12 @@ class SessionManager:
         """
         try:
             key = self._get_streaming_key(subtask_id)
-            content = await self._cache.get(key)
-            if content is not None and isinstance(content, str):
-                return content
-            return None
+            redis_client = await self._cache._get_client()
+            with self._cache.track("streaming_get"):
+                content = await redis_client.get(key)
+            if content is None:
+                return None
+            return content.decode("utf-8", errors="replace")
         except Exception as e:
             logger.error(
                 f"Error getting streaming content for subtask {subtask_id}: {e}"
@@ -438,11 +593,9 @@ class SessionManager:
             channel = self._get_channel_key(subtask_id)
             # Get a Redis client for pub/sub
             redis_client = await self._cache._get_client()
-            try:
+            with self._cache.track("publish"):
                 await redis_client.publish(channel, chunk)
-                return True
-            finally:
-                await redis_client.aclose()
+            return True
         except Exception as e:
             logger.error(
                 f"Error publishing streaming chunk for subtask {subtask_id}: {e}"
@@ -469,13 +622,11 @@ class SessionManager:
         try:
             channel = self._get_channel_key(subtask_id)
             redis_client = await self._cache._get_client()
-            try:
-                # Encode done signal with result data
-                done_message = json.dumps({"__type__": "STREAM_DONE", "result": result})
+            # Encode done signal with result data
+            done_message = json.dumps({"__type__": "STREAM_DONE", "result": result})
+            with self._cache.track("publish"):
                 await redis_client.publish(channel, done_message)
-                return True
-            finally:
-                await redis_client.aclose()
+            return True
         except Exception as e:
             logger.error(f"Error publishing stream done for subtask {subtask_id}: {e}")
             return False
@@ -493,7 +644,9 @@ class SessionManager:
         """
         try:
             channel = self._get_channel_key(subtask_id)
-            redis_client = await self._cache._get_client()
+            # Dedicated client: the subscription holds its connection for the
+            # whole stream and must not take one from the shared pool
+            redis_client = self._cache._create_client()
             pubsub = redis_client.pubsub()
             await pubsub.subscribe(channel)
             # Return both client and pubsub so caller can close client when done
@@ -488,10 +488,10 @@ async def initialize_redis_chat_history(
     from app.services.chat.storage import session_manager
 
     # Check if history exists in Redis
-    redis_history = await session_manager.get_chat_history(task_id)
+    history_length = await session_manager.get_history_length(task_id)
 
     # If Redis history is empty but we have subtasks, rebuild history from DB
-    if not redis_history:
+    if not history_length:
         logger.info(
             f"Initializing chat history from DB for task {task_id} with {len(existing_subtasks)} existing subtasks"
         )
@@ -0,0 +1,274 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Cache of resolved CRD references.
+
+Listing teams, converting bots, dispatching subtasks and building chat
+configs all follow the same Team -> Bot -> Ghost/Shell/Model references,
+querying the referenced Kind rows and validating their JSON with the
+Pydantic schemas again on every request.
+
+This module caches both steps in process:
+
+- validate() returns the validated schema object of a Kind row. Entries are
+  keyed by (kind, namespace, name, owner) and versioned by the row's ID and
+  updated_at, so a row that changed since it was validated is validated
+  again.
+- find() resolves a reference to an immutable ResolvedCrd snapshot holding
+  the row's identity, JSON and validated schema object. Missing references
+  are cached too.
+
+Cached objects are shared between requests and must be treated as
+read-only; callers that modify a spec (e.g. to decrypt a key) copy it first.
+
+Entries live for CRD_CACHE_TTL_SECONDS at most. Flushed changes to a Kind
+row (create_resource/update_resource, the adapters, ...) drop every entry of
+the same kind and name, and committed changes are published to the other
+workers through a Redis pub/sub channel.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache_invalidation import InvalidationChannel
+from app.core.config import settings
+from app.models.kind import Kind
+from app.schemas.kind import Bot, Ghost, Model, Shell, Team
+
+# Session.info key collecting changed (kind, name) pairs until commit
+_PENDING_CHANGES_KEY = "crd_changes"
+
+# Kinds whose validated schema objects are cached
+CRD_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "Ghost": Ghost,
+    "Shell": Shell,
+    "Model": Model,
+    "Bot": Bot,
+    "Team": Team,
+}
+
+
+@dataclass(frozen=True)
+class ResolvedCrd:
+    """Snapshot of an active Kind row and its validated schema object"""
+
+    id: int
+    user_id: int
+    kind: str
+    name: str
+    namespace: str
+    updated_at: Optional[datetime]
+    json: Mapping[str, Any]
+    crd: BaseModel
+
+
+class CrdCache:
+    """In-process TTL cache of validated and resolved CRDs"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int, url: str, channel: str):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # (kind, namespace, name, user_id) -> (expires_at, version, crd)
+        self._validated: "OrderedDict[Tuple, Tuple[float, Hashable, BaseModel]]" = (
+            OrderedDict()
+        )
+        # (kind, namespace, name, user_id or None) -> (expires_at, resolved or None)
+        self._resolved: "OrderedDict[Tuple, Tuple[float, Optional[ResolvedCrd]]]" = (
+            OrderedDict()
+        )
+        # Bumped by every invalidation so loads racing with it are not stored
+        self._generation = 0
+        self.channel = InvalidationChannel(
+            "CrdCache",
+            url,
+            channel,
+            handler=self._handle_message,
+            # Changes published while no subscription existed were missed
+            on_subscribe=self.clear,
+        )
+
+    def _store(
+        self, entries: OrderedDict, key: Tuple, value: tuple, generation: int
+    ) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            entries.pop(key, None)
+            entries[key] = (time.monotonic() + self._ttl, *value)
+            while len(entries) > self._max_entries:
+                entries.popitem(last=False)
+
+    def validate(self, row: Kind) -> BaseModel:
+        """
+        Return the validated schema object of a Ghost, Shell, Model, Bot or
+        Team row.
+
+        The object is reused as long as the row's updated_at is unchanged.
+        Rows that are not persistent yet or have unflushed changes are
+        validated without the cache.
+        """
+        schema = CRD_SCHEMAS[row.kind]
+        if row.id is None or row.updated_at is None or inspect(row).modified:
+            return schema.model_validate(row.json)
+
+        key = (row.kind, row.namespace, row.name, row.user_id)
+        version = (row.id, row.updated_at)
+        with self._lock:
+            cached = self._validated.get(key)
+            generation = self._generation
+        if cached is not None and cached[1] == version and time.monotonic() < cached[0]:
+            return cached[2]
+
+        crd = schema.model_validate(row.json)
+        self._store(self._validated, key, (version, crd), generation)
+        return crd
+
+    def find(
+        self,
+        db: Session,
+        kind: str,
+        name: str,
+        namespace: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> Optional[ResolvedCrd]:
+        """
+        Resolve an active Ghost, Shell, Model, Bot or Team by reference.
+
+        Args:
+            db: Database session, only queried on a cache miss
+            kind: Kind of the resource
+            name: Name of the resource
+            namespace: Namespace of the resource, None for any namespace
+            user_id: Owner of the resource, None for any owner
+
+        Returns:
+            The resolved resource, or None if no active row with JSON matches
+        """
+        key = (kind, namespace, name, user_id)
+        with self._lock:
+            cached = self._resolved.get(key)
+            generation = self._generation
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        query = db.query(Kind).filter(
+            Kind.kind == kind, Kind.name == name, Kind.is_active == True
+        )
+        if namespace is not None:
+            query = query.filter(Kind.namespace == namespace)
+        if user_id is not None:
+            query = query.filter(Kind.user_id == user_id)
+        row = query.first()
+
+        resolved = None
+        if row is not None and row.json:
+            resolved = ResolvedCrd(
+                id=row.id,
+                user_id=row.user_id,
+                kind=row.kind,
+                name=row.name,
+                namespace=row.namespace,
+                updated_at=row.updated_at,
+                json=MappingProxyType(copy.deepcopy(row.json)),
+                crd=self.validate(row),
+            )
+
+        # Changes of the current transaction must not be seen by other sessions
+        if _PENDING_CHANGES_KEY not in db.info:
+            self._store(self._resolved, key, (resolved,), generation)
+        return resolved
+
+    def invalidate(self, refs: Iterable[Tuple[str, str]]) -> None:
+        """Drop all entries of the given (kind, name) pairs"""
+        refs = set(refs)
+        with self._lock:
+            self._generation += 1
+            for entries in (self._validated, self._resolved):
+                for key in list(entries):
+                    if (key[0], key[2]) in refs:
+                        del entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._generation += 1
+            self._validated.clear()
+            self._resolved.clear()
+
+    def publish_invalidation(self, refs: Iterable[Tuple[str, str]]) -> None:
+        """Ask every worker to drop the given (kind, name) pairs. Never raises."""
+        self.channel.publish({"refs": sorted(refs)})
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        self.invalidate((kind, name) for kind, name in message.get("refs") or [])
+
+
+crd_cache = CrdCache(
+    ttl_seconds=settings.CRD_CACHE_TTL_SECONDS,
+    max_entries=settings.CRD_CACHE_MAX_ENTRIES,
+    url=settings.REDIS_URL,
+    channel=settings.CRD_CACHE_INVALIDATE_CHANNEL,
+)
+
+
+def _changed_refs(session: Session) -> Set[Tuple[str, str]]:
+    """Collect (kind, name) pairs of Kind rows changed by the flush"""
+    refs = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, Kind):
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        # A renamed row is evicted under its old name as well
+        for name in chain([obj.name], inspect(obj).attrs.name.history.deleted):
+            refs.add((obj.kind, name))
+    return refs
+
+
+def track_changes(session: Session, refs: Set[Tuple[str, str]]) -> None:
+    """
+    Evict (kind, name) pairs changed in a session and publish them when it
+    commits. Called for flushed objects and by bulk statements, which do not
+    go through the flush.
+    """
+    crd_cache.invalidate(refs)
+    session.info[_PENDING_CHANGES_KEY] = (
+        session.info.get(_PENDING_CHANGES_KEY, set()) | refs
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session: Session, flush_context) -> None:
+    refs = _changed_refs(session)
+    if refs:
+        track_changes(session, refs)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    refs = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if refs is None:
+        return
+    crd_cache.invalidate(refs)
+    crd_cache.publish_invalidation(refs)
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_after_rollback(session: Session) -> None:
+    refs = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if refs is not None:
+        crd_cache.invalidate(refs)
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Wake-up notifications for executor task dispatch.
+
+When PENDING assistant subtasks are committed (new tasks, appended messages,
+retries, group chat and pipeline follow-ups), the backend publishes the task
+type ("online"/"offline") on a Redis pub/sub channel from an after_commit
+hook, in the background so the committing thread or event loop never waits
+for Redis. The dispatch endpoint can then
+hold an executor_manager long-poll request open until a matching notification
+arrives instead of letting the executor_manager poll on a fixed interval.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from itertools import chain
+from typing import AsyncIterator, Set
+
+from redis.asyncio import Redis
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from app.core.cache_invalidation import BackgroundPublisher
+from app.core.config import settings
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+
+logger = logging.getLogger(__name__)
+
+# Session.info key of the task types with newly dispatchable subtasks
+_PENDING_TYPES_KEY = "dispatch_notifier_pending_types"
+
+TASK_TYPES = ("online", "offline")
+
+
+class DispatchListener:
+    """Subscription to dispatch notifications for a single task type"""
+
+    def __init__(self, pubsub, task_type: str):
+        self._pubsub = pubsub
+        self._task_type = task_type
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait until a notification for this task type arrives.
+
+        Returns:
+            True if notified, False if the timeout elapsed
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._pubsub is None:
+                # Redis unavailable: degrade to a plain wait so callers still
+                # behave like an interval poll instead of spinning
+                await asyncio.sleep(remaining)
+                return False
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+            except Exception as e:
+                logger.warning(f"Dispatch subscription failed, falling back: {e}")
+                self._pubsub = None
+                continue
+            if not message:
+                continue
+            data = message.get("data")
+            if isinstance(data, bytes):
+                data = data.decode("utf-8", errors="replace")
+            if data == self._task_type:
+                return True
+
+
+class DispatchNotifier:
+    """Publishes and listens for new dispatchable task notifications"""
+
+    def __init__(self, url: str, channel: str):
+        self._url = url
+        self._channel = channel
+        self.publisher = BackgroundPublisher(url)
+
+    def notify(self, task_type: str = "online") -> None:
+        """Publish a wake-up for the given task type. Never blocks or raises."""
+        self.publisher.publish(self._channel, task_type, "dispatch notification")
+
+    @asynccontextmanager
+    async def listen(
+        self, task_type: str = "online"
+    ) -> AsyncIterator[DispatchListener]:
+        """
+        Subscribe to notifications for a task type.
+
+        Subscribe before checking for work so that notifications published
+        between the check and the wait are not lost.
+        """
+        client = None
+        pubsub = None
+        try:
+            client = Redis.from_url(
+                self._url, socket_timeout=None, socket_connect_timeout=2.0
+            )
+            pubsub = client.pubsub()
+            await pubsub.subscribe(self._channel)
+        except Exception as e:
+            logger.warning(f"Failed to subscribe to dispatch notifications: {e}")
+            pubsub = None
+
+        try:
+            yield DispatchListener(pubsub, task_type)
+        finally:
+            try:
+                if pubsub is not None:
+                    await pubsub.unsubscribe(self._channel)
+                    await pubsub.aclose()
+                if client is not None:
+                    await client.aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close dispatch subscription: {e}")
+
+
+dispatch_notifier = DispatchNotifier(
+    settings.REDIS_URL, settings.EXECUTOR_DISPATCH_NOTIFY_CHANNEL
+)
+
+
+def _became_pending(session: Session, obj: Subtask) -> bool:
+    if obj.role != SubtaskRole.ASSISTANT or obj.status != SubtaskStatus.PENDING:
+        return False
+    if obj in session.new:
+        return True
+    # Retried or resumed subtasks are set back to PENDING
+    return bool(inspect(obj).attrs.status.history.deleted)
+
+
+def _dispatchable_types(session: Session) -> Set[str]:
+    """Task types of the subtasks flushed as PENDING in this session"""
+    types: Set[str] = set()
+    for obj in chain(session.new, session.dirty):
+        if not isinstance(obj, Subtask) or not _became_pending(session, obj):
+            continue
+        task = session.identity_map.get(identity_key(TaskResource, obj.task_id))
+        if task is None:
+            # Unknown task type, waking both kinds of pollers is harmless
+            types.update(TASK_TYPES)
+            continue
+        labels = ((task.json or {}).get("metadata") or {}).get("labels") or {}
+        if labels.get("source") == "chat_shell":
+            # Handled by the backend itself, never dispatched to executors
+            continue
+        types.add(labels.get("type") or "online")
+    return types
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_after_flush(session: Session, flush_context) -> None:
+    types = _dispatchable_types(session)
+    if types:
+        session.info[_PENDING_TYPES_KEY] = (
+            session.info.get(_PENDING_TYPES_KEY, set()) | types
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session) -> None:
+    # Executors claim subtasks in their own transactions, so they are only
+    # woken once the subtasks are visible to them
+    for task_type in sorted(session.info.pop(_PENDING_TYPES_KEY, ())):
+        dispatch_notifier.notify(task_type)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_TYPES_KEY, None)
@@ -2,14 +2,230 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Optional
-
+"""
+Group permission resolution.
+
+Groups form a hierarchy through their names ('aaa/bbb' is a subgroup of
+'aaa') and membership of a group grants the same role in all of its
+subgroups. The active group names are compiled into a trie and each user's
+direct memberships into a role map. Both are cached in process, so access
+checks are dictionary lookups along the group path. Entries expire after
+GROUP_PERMISSION_CACHE_TTL_SECONDS. Committed Namespace and NamespaceMember
+changes also invalidate them immediately, both locally and through a Redis
+pub/sub channel that every worker listens on.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.cache_invalidation import InvalidationChannel
+from app.core.config import settings
 from app.models.namespace import Namespace
 from app.models.namespace_member import NamespaceMember
 from app.schemas.namespace import GroupRole
 
+logger = logging.getLogger(__name__)
+
+# Trie key marking that the path up to a node is an active group
+_GROUP_END = None
+
+# Session.info key collecting permission changes until commit
+_PENDING_CHANGES_KEY = "group_permission_changes"
+
+# Role hierarchy (lower number = higher permission)
+_ROLE_LEVELS = {
+    GroupRole.Owner: 0,
+    GroupRole.Maintainer: 1,
+    GroupRole.Developer: 2,
+    GroupRole.Reporter: 3,
+}
+
+
+class GroupPermissionCache:
+    """In-process group hierarchy trie and per-user membership roles"""
+
+    def __init__(self, ttl_seconds: float, max_users: int, url: str, channel: str):
+        self._ttl = ttl_seconds
+        self._max_users = max_users
+        self._lock = threading.Lock()
+        self._group_trie: Optional[dict] = None
+        self._group_trie_expires_at = 0.0
+        # user_id -> (expires_at, {group_name: role}), oldest first
+        self._user_roles: "OrderedDict[int, Tuple[float, Dict[str, GroupRole]]]" = (
+            OrderedDict()
+        )
+        # Bumped by every invalidation so loads racing with it are not stored
+        self._generation = 0
+        self.channel = InvalidationChannel(
+            "GroupPermissionCache",
+            url,
+            channel,
+            handler=self._handle_message,
+            # Changes published while no subscription existed were missed
+            on_subscribe=self.clear,
+        )
+
+    def get_group_trie(self, db: Session) -> dict:
+        """Return the trie of active group names, loading it if expired"""
+        now = time.monotonic()
+        with self._lock:
+            if self._group_trie is not None and now < self._group_trie_expires_at:
+                return self._group_trie
+            generation = self._generation
+
+        trie: dict = {}
+        for (name,) in db.query(Namespace.name).filter(Namespace.is_active == True):
+            node = trie
+            for part in name.split("/"):
+                node = node.setdefault(part, {})
+            node[_GROUP_END] = True
+
+        with self._lock:
+            if generation == self._generation:
+                self._group_trie = trie
+                self._group_trie_expires_at = now + self._ttl
+        return trie
+
+    def get_cached_user_roles(self, user_id: int) -> Optional[Dict[str, GroupRole]]:
+        """Return the user's direct group roles if cached and not expired"""
+        with self._lock:
+            cached = self._user_roles.get(user_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def get_user_roles(self, db: Session, user_id: int) -> Dict[str, GroupRole]:
+        """Return the user's direct group roles, loading them if expired"""
+        roles = self.get_cached_user_roles(user_id)
+        if roles is not None:
+            return roles
+
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generation
+        roles = {}
+        memberships = db.query(NamespaceMember.group_name, NamespaceMember.role).filter(
+            NamespaceMember.user_id == user_id,
+            NamespaceMember.is_active == True,
+        )
+        for group_name, role in memberships:
+            try:
+                roles[group_name] = GroupRole(role)
+            except ValueError:
+                logger.warning(
+                    f"Ignoring unknown role {role!r} of user {user_id} in {group_name}"
+                )
+
+        with self._lock:
+            if generation != self._generation:
+                return roles
+            self._user_roles.pop(user_id, None)
+            self._user_roles[user_id] = (now + self._ttl, roles)
+            while len(self._user_roles) > self._max_users:
+                self._user_roles.popitem(last=False)
+        return roles
+
+    def invalidate(
+        self, user_ids: Optional[Iterable[int]] = None, groups: bool = False
+    ) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            user_ids: Users whose memberships changed, None for all users
+            groups: Whether groups were created, changed or deleted, which
+                also drops every user's memberships
+        """
+        with self._lock:
+            self._generation += 1
+            if groups:
+                self._group_trie = None
+            if groups or user_ids is None:
+                self._user_roles.clear()
+                return
+            for user_id in user_ids:
+                self._user_roles.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self.invalidate(groups=True)
+
+    def publish_invalidation(self, user_ids: Iterable[int], groups: bool) -> None:
+        """Ask every worker to invalidate the given entries. Never raises."""
+        self.channel.publish({"user_ids": sorted(user_ids), "groups": groups})
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        self.invalidate(message.get("user_ids") or [], bool(message.get("groups")))
+
+
+group_permission_cache = GroupPermissionCache(
+    ttl_seconds=settings.GROUP_PERMISSION_CACHE_TTL_SECONDS,
+    max_users=settings.GROUP_PERMISSION_CACHE_MAX_USERS,
+    url=settings.REDIS_URL,
+    channel=settings.GROUP_PERMISSION_INVALIDATE_CHANNEL,
+)
+
+
+def _changed_permissions(session: Session) -> Tuple[Set[int], bool]:
+    """Collect users whose memberships and whether groups are part of the flush"""
+    user_ids = set()
+    groups = False
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, NamespaceMember):
+            if obj.user_id is not None:
+                user_ids.add(obj.user_id)
+        elif isinstance(obj, Namespace):
+            groups = True
+    return user_ids, groups
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session: Session, flush_context) -> None:
+    user_ids, groups = _changed_permissions(session)
+    if not user_ids and not groups:
+        return
+    # Reads later in this transaction must see its own changes
+    group_permission_cache.invalidate(user_ids, groups)
+    pending_user_ids, pending_groups = session.info.get(
+        _PENDING_CHANGES_KEY, (set(), False)
+    )
+    session.info[_PENDING_CHANGES_KEY] = (
+        pending_user_ids | user_ids,
+        pending_groups or groups,
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changes is None:
+        return
+    # Entries loaded from the uncommitted state are dropped again and other
+    # workers are told about the change
+    group_permission_cache.invalidate(*changes)
+    group_permission_cache.publish_invalidation(*changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _invalidate_after_rollback(session: Session) -> None:
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if changes is not None:
+        group_permission_cache.invalidate(*changes)
+
+
+def _role_satisfies(user_role: Optional[GroupRole], required_role: GroupRole) -> bool:
+    """Check if user_role is equal or higher than required_role"""
+    if user_role is None:
+        return False
+    return _ROLE_LEVELS[user_role] <= _ROLE_LEVELS[required_role]
+
 
 def get_user_role_in_group(
     db: Session, user_id: int, group_name: str
@@ -25,20 +241,7 @@ def get_user_role_in_group(
     Returns:
         GroupRole if user is a member, None otherwise
     """
-    member = (
-        db.query(NamespaceMember)
-        .filter(
-            NamespaceMember.group_name == group_name,
-            NamespaceMember.user_id == user_id,
-            NamespaceMember.is_active == True,
-        )
-        .first()
-    )
-
-    if member:
-        return GroupRole(member.role)
-
-    return None
+    return group_permission_cache.get_user_roles(db, user_id).get(group_name)
 
 
 def check_group_permission(
@@ -59,21 +262,22 @@ def check_group_permission(
     Returns:
         True if user has permission, False otherwise
     """
-    # Define role hierarchy (lower number = higher permission)
-    role_hierarchy = {
-        GroupRole.Owner: 0,
-        GroupRole.Maintainer: 1,
-        GroupRole.Developer: 2,
-        GroupRole.Reporter: 3,
-    }
-
     user_role = get_user_role_in_group(db, user_id, group_name)
+    return _role_satisfies(user_role, required_role)
 
-    if user_role is None:
-        return False
 
-    # Check if user's role level is equal or higher than required
-    return role_hierarchy[user_role] <= role_hierarchy[required_role]
+def _collect_subgroups(node: dict, prefix: str, result: Set[str]) -> None:
+    """Add the names of all active groups below a trie node to result"""
+    stack = [(node, prefix)]
+    while stack:
+        node, prefix = stack.pop()
+        for part, child in node.items():
+            if part is _GROUP_END:
+                continue
+            name = f"{prefix}/{part}"
+            if _GROUP_END in child:
+                result.add(name)
+            stack.append((child, name))
 
 
 def get_user_groups(db: Session, user_id: int) -> list[str]:
@@ -92,38 +296,20 @@ def get_user_groups(db: Session, user_id: int) -> list[str]:
     Returns:
         List of group names (without duplicates)
     """
-    # Get all active groups
-    all_groups = db.query(Namespace).filter(Namespace.is_active == True).all()
-
-    # Get user's direct memberships
-    direct_memberships = (
-        db.query(NamespaceMember)
-        .filter(
-            NamespaceMember.user_id == user_id,
-            NamespaceMember.is_active == True,
-        )
-        .all()
-    )
-
-    direct_group_names = {m.group_name for m in direct_memberships}
+    direct_group_names = set(group_permission_cache.get_user_roles(db, user_id))
     accessible_groups = set(direct_group_names)
 
-    # Check permission inheritance for all groups
-    for group in all_groups:
-        # Skip if already in accessible set
-        if group.name in accessible_groups:
-            continue
-
-        # Check if user has access via parent group membership
-        # Example: if user is member of 'aaa', they have access to 'aaa/bbb', 'aaa/bbb/ccc'
-        if "/" in group.name:
-            # Check each parent in the hierarchy
-            parts = group.name.split("/")
-            for i in range(1, len(parts)):
-                parent_name = "/".join(parts[:i])
-                if parent_name in direct_group_names:
-                    accessible_groups.add(group.name)
-                    break
+    # Every active group in the subtree of a direct membership is accessible
+    # Example: if user is member of 'aaa', they have access to 'aaa/bbb', 'aaa/bbb/ccc'
+    trie = group_permission_cache.get_group_trie(db)
+    for group_name in direct_group_names:
+        node = trie
+        for part in group_name.split("/"):
+            node = node.get(part)
+            if node is None:
+                break
+        else:
+            _collect_subgroups(node, group_name, accessible_groups)
 
     return sorted(accessible_groups)
 
@@ -147,31 +333,29 @@ def get_effective_role_in_group(
     Returns:
         GroupRole if user has access (direct or inherited), None otherwise
     """
-    # First check direct membership
-    direct_role = get_user_role_in_group(db, user_id, group_name)
-    if direct_role is not None:
-        return direct_role
+    roles = group_permission_cache.get_user_roles(db, user_id)
 
-    # Check parent groups (from nearest to farthest)
-    if "/" in group_name:
-        parts = group_name.split("/")
-        # Check from nearest parent upward
-        for i in range(len(parts) - 1, 0, -1):
-            parent_name = "/".join(parts[:i])
-            parent_role = get_user_role_in_group(db, user_id, parent_name)
-            if parent_role is not None:
-                # Return the same role level from parent
-                return parent_role
-
-    return None
+    # Check the group itself, then its parents from nearest to farthest
+    name = group_name
+    while True:
+        role = roles.get(name)
+        if role is not None:
+            return role
+        if "/" not in name:
+            return None
+        name = name.rsplit("/", 1)[0]
 
 
 def check_user_group_permission(
-    user_id: int, group_name: str, min_role: str = "Reporter"
+    user_id: int,
+    group_name: str,
+    min_role: str = "Reporter",
+    db: Optional[Session] = None,
 ) -> bool:
     """
     Check if user has required permission level in a group.
-    This is a standalone function that manages its own DB session.
+    This is a standalone function that manages its own DB session unless
+    one is given.
 
     Permission hierarchy: Owner > Maintainer > Developer > Reporter
     A user with a higher role can perform actions of lower roles.
@@ -180,6 +364,7 @@ def check_user_group_permission(
         user_id: User ID
         group_name: Group name (namespace)
         min_role: Minimum required role as string ("Reporter", "Developer", "Maintainer", "Owner")
+        db: Optional session used to load the memberships if not cached
 
     Returns:
         True if user has permission, False otherwise
@@ -192,5 +377,12 @@ def check_user_group_permission(
     except ValueError:
         return False
 
-    with SessionLocal() as db:
-        return check_group_permission(db, user_id, group_name, required_role)
+    # Only open a session when the user's memberships are not cached
+    roles = group_permission_cache.get_cached_user_roles(user_id)
+    if roles is None and db is not None:
+        roles = group_permission_cache.get_user_roles(db, user_id)
+    elif roles is None:
+        with SessionLocal() as db:
+            roles = group_permission_cache.get_user_roles(db, user_id)
+
+    return _role_satisfies(roles.get(group_name), required_role)
@@ -9,13 +9,28 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List
-
-from app.core.exceptions import ValidationException
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import NotFoundException, ValidationException
+from app.db.session import SessionLocal
+from app.models.kind import Kind
+from app.schemas.kind import Bot, Ghost, Team
+from app.services.crd_cache import track_changes
 from app.services.kind import kind_service
+from app.services.kind_factory import KindServiceFactory
 
 logger = logging.getLogger(__name__)
 
+# Kinds applied in one transaction, by the order their references resolve in
+KIND_APPLY_ORDER = {"Ghost": 0, "Model": 0, "Shell": 0, "Bot": 1, "Team": 2}
+
+_NOT_APPLIED = "Not applied because another resource in the batch failed"
+
 
 class BatchService:
     """Service for batch operations"""
@@ -32,68 +47,367 @@ class BatchService:
             "Task",
         ]
 
+    def get_db(self) -> Session:
+        """Get database session"""
+        return SessionLocal()
+
     def apply_resources(
-        self, user_id: int, resources: List[Dict[str, Any]]
+        self, user_id: int, resources: List[Dict[str, Any]], atomic: bool = False
     ) -> List[Dict[str, Any]]:
-        """Apply multiple resources (create or update)"""
-        results = []
-
-        for resource in resources:
+        """
+        Apply multiple resources (create or update).
+
+        Ghost, Model, Shell, Bot and Team resources are validated in dependency
+        order (Ghost/Model/Shell -> Bot -> Team) against the existing rows and
+        the other resources of the batch, then written in a single
+        transaction. Task and Workspace resources are applied one by one
+        afterwards, as they create subtasks.
+
+        Args:
+            user_id: ID of the user applying the resources
+            resources: Resources to apply
+            atomic: If True, nothing is applied when any resource fails. Task
+                and Workspace resources are applied after the other resources
+                were committed and cannot be rolled back.
+
+        Returns:
+            One result per resource, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(resources)
+        kind_items = []
+        task_items = []
+
+        for index, resource in enumerate(resources):
             try:
-                kind = resource.get("kind")
-                if not kind:
-                    raise ValidationException("Resource must have 'kind' field")
+                kind = self._validate_kind(resource)
+                metadata = resource.get("metadata") or {}
+                if "namespace" not in metadata or "name" not in metadata:
+                    raise ValidationException(
+                        "Resource must have 'metadata.name' and 'metadata.namespace'"
+                    )
+            except Exception as e:
+                results[index] = self._failed_result(resource, e)
+                continue
+            if kind in KIND_APPLY_ORDER:
+                kind_items.append((index, resource))
+            else:
+                task_items.append((index, resource))
+
+        # Resources that failed the checks above have a result already
+        applied = not (atomic and any(result is not None for result in results))
+        if applied and kind_items:
+            applied = self._apply_kind_resources(user_id, kind_items, results, atomic)
+
+        if task_items and (applied or not atomic):
+            with self.get_db() as db:
+                for index, resource in task_items:
+                    results[index] = self._apply_resource(user_id, resource, db)
+        else:
+            for index, resource in task_items:
+                results[index] = self._failed_result(
+                    resource, ValidationException(_NOT_APPLIED)
+                )
 
-                if kind not in self.supported_kinds:
-                    raise ValidationException(f"Unsupported resource kind: {kind}")
+        if atomic and not applied:
+            for index, resource in kind_items:
+                if results[index] is None or results[index]["success"]:
+                    results[index] = self._failed_result(
+                        resource, ValidationException(_NOT_APPLIED)
+                    )
+
+        return results
 
-                # Check if resource exists
+    def _validate_kind(self, resource: Dict[str, Any]) -> str:
+        kind = resource.get("kind")
+        if not kind:
+            raise ValidationException("Resource must have 'kind' field")
+
+        if kind not in self.supported_kinds:
+            raise ValidationException(f"Unsupported resource kind: {kind}")
+
+        return kind
+
+    def _failed_result(self, resource: Dict[str, Any], error: Exception):
+        return {
+            "kind": resource.get("kind") or "unknown",
+            "name": resource.get("metadata", {}).get("name", "unknown"),
+            "namespace": resource.get("metadata", {}).get("namespace", "default"),
+            "operation": "failed",
+            "success": False,
+            "error": str(error),
+        }
+
+    def _apply_resource(self, user_id: int, resource: Dict[str, Any], db: Session):
+        """Apply a single resource in its own transaction of the given session"""
+        try:
+            kind = self._validate_kind(resource)
+
+            # Check if resource exists
+            namespace = resource["metadata"]["namespace"]
+            name = resource["metadata"]["name"]
+            existing = kind_service.get_resource(user_id, kind, namespace, name, db=db)
+
+            if existing:
+                # Update existing resource
+                kind_service.update_resource(
+                    user_id, kind, namespace, name, resource, db=db
+                )
+                operation = "updated"
+            else:
+                # Create new resource
+                kind_service.create_resource(user_id, kind, resource, db=db)
+                operation = "created"
+
+            return {
+                "kind": kind,
+                "name": name,
+                "namespace": namespace,
+                "operation": operation,
+                "success": True,
+            }
+        except Exception as e:
+            # Leave the shared session usable for the next resource
+            db.rollback()
+            return self._failed_result(resource, e)
+
+    def _apply_kind_resources(
+        self,
+        user_id: int,
+        items: List[Tuple[int, Dict[str, Any]]],
+        results: List[Optional[Dict[str, Any]]],
+        atomic: bool,
+    ) -> bool:
+        """
+        Validate and upsert resources stored in the kinds table.
+
+        Fills in the result of each item and returns False if the batch was
+        not written.
+        """
+        items = sorted(items, key=lambda item: KIND_APPLY_ORDER[item[1]["kind"]])
+
+        with self.get_db() as db:
+            existing, available, skills = self._prefetch(db, user_id, items)
+            # (kind, namespace, name) -> extracted resource data
+            planned: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+            permissions: Dict[Tuple[str, str], bool] = {}
+
+            for index, resource in items:
+                kind = resource["kind"]
                 namespace = resource["metadata"]["namespace"]
                 name = resource["metadata"]["name"]
-                existing = kind_service.get_resource(user_id, kind, namespace, name)
-
-                if existing:
-                    # Update existing resource
-                    resource_id = kind_service.update_resource(
-                        user_id, kind, namespace, name, resource
-                    )
-                    results.append(
-                        {
-                            "kind": kind,
-                            "name": name,
-                            "namespace": namespace,
-                            "operation": "updated",
-                            "success": True,
-                        }
-                    )
-                else:
-                    # Create new resource
-                    resource_id = kind_service.create_resource(user_id, kind, resource)
-                    results.append(
-                        {
-                            "kind": kind,
-                            "name": name,
-                            "namespace": namespace,
-                            "operation": "created",
-                            "success": True,
-                        }
-                    )
+                key = (kind, namespace, name)
+                exists = key in existing or key in planned
+                service = KindServiceFactory.get_service(kind)
+                try:
+                    # Creating needs Maintainer or Owner, updating Developer or above
+                    role = "Developer" if exists else "Maintainer"
+                    if (namespace, role) not in permissions:
+                        permissions[(namespace, role)] = (
+                            service._check_group_permission(user_id, namespace, role)
+                        )
+                    if not permissions[(namespace, role)]:
+                        raise NotFoundException(
+                            f"Namespace '{namespace}' not found or permission denied"
+                        )
+
+                    resource_data = service._extract_resource_data(resource)
+                    self._validate_references(kind, resource, available, skills)
+                except Exception as e:
+                    results[index] = self._failed_result(resource, e)
+                    continue
+
+                planned[key] = resource_data
+                available.add(key)
+                results[index] = {
+                    "kind": kind,
+                    "name": name,
+                    "namespace": namespace,
+                    "operation": "updated" if exists else "created",
+                    "success": True,
+                }
+
+            if atomic and len(planned) < len(items):
+                return False
+            if not planned:
+                return True
 
+            try:
+                self._upsert(db, user_id, planned, existing)
+                db.commit()
             except Exception as e:
-                results.append(
+                db.rollback()
+                logger.error(
+                    f"Failed to apply {len(planned)} resources for user {user_id}: {e}",
+                    exc_info=True,
+                )
+                for index, resource in items:
+                    if results[index]["success"]:
+                        results[index] = self._failed_result(resource, e)
+                return False
+
+        logger.info(
+            f"Applied {len(planned)} resources for user {user_id} in one transaction"
+        )
+        return True
+
+    def _prefetch(
+        self, db: Session, user_id: int, items: List[Tuple[int, Dict[str, Any]]]
+    ):
+        """
+        Load the rows the batch writes to or refers to, one query per kind.
+
+        Returns:
+            - existing: {(kind, namespace, name): Kind} rows to update, matched
+              like KindBaseService._build_filters
+            - available: {(kind, namespace, name)} resources that references
+              may point to
+            - skills: names of the skills Ghosts may use
+        """
+        names: Dict[str, Set[str]] = defaultdict(set)
+        skill_names: Set[str] = set()
+        for _, resource in items:
+            kind = resource["kind"]
+            names[kind].add(resource["metadata"]["name"])
+            try:
+                if kind == "Ghost":
+                    skill_names.update(Ghost.model_validate(resource).spec.skills or [])
+                for ref_kind, _, ref_name in self._references(kind, resource):
+                    names[ref_kind].add(ref_name)
+            except ValueError:
+                # Invalid resources fail validation later
+                continue
+
+        existing: Dict[Tuple[str, str, str], Kind] = {}
+        available: Set[Tuple[str, str, str]] = set()
+        for kind, kind_names in names.items():
+            rows = (
+                db.query(Kind)
+                .filter(
+                    Kind.kind == kind,
+                    Kind.name.in_(kind_names),
+                    Kind.is_active == True,
+                )
+                .order_by(Kind.id)
+                .all()
+            )
+            for row in rows:
+                key = (row.kind, row.namespace, row.name)
+                # Personal resources are matched by owner, group resources by namespace
+                if row.namespace != "default" or row.user_id == user_id:
+                    existing.setdefault(key, row)
+                # References resolve to the user's resources and public shells
+                if row.user_id == user_id or (row.kind == "Shell" and row.user_id == 0):
+                    available.add(key)
+
+        skills: Set[str] = set()
+        if skill_names:
+            skills = {
+                name
+                for (name,) in db.query(Kind.name).filter(
+                    or_(Kind.user_id == user_id, Kind.user_id == 0),
+                    Kind.kind == "Skill",
+                    Kind.name.in_(skill_names),
+                    Kind.namespace == "default",
+                    Kind.is_active == True,
+                )
+            }
+
+        return existing, available, skills
+
+    def _references(
+        self, kind: str, resource: Dict[str, Any]
+    ) -> List[Tuple[str, str, str]]:
+        """(kind, namespace, name) of the resources a Bot or Team refers to"""
+        if kind == "Bot":
+            bot_crd = Bot.model_validate(resource)
+            return [
+                (
+                    "Ghost",
+                    bot_crd.spec.ghostRef.namespace or "default",
+                    bot_crd.spec.ghostRef.name,
+                ),
+                (
+                    "Shell",
+                    bot_crd.spec.shellRef.namespace or "default",
+                    bot_crd.spec.shellRef.name,
+                ),
+            ]
+        if kind == "Team":
+            team_crd = Team.model_validate(resource)
+            return [
+                ("Bot", member.botRef.namespace or "default", member.botRef.name)
+                for member in team_crd.spec.members
+            ]
+        return []
+
+    def _validate_references(
+        self,
+        kind: str,
+        resource: Dict[str, Any],
+        available: Set[Tuple[str, str, str]],
+        skills: Set[str],
+    ) -> None:
+        """Same checks as the Kind services' _validate_references, on prefetched rows"""
+        if kind == "Ghost":
+            ghost_crd = Ghost.model_validate(resource)
+            missing_skills = [
+                name for name in ghost_crd.spec.skills or [] if name not in skills
+            ]
+            if missing_skills:
+                raise NotFoundException(
+                    f"The following Skills do not exist: {', '.join(missing_skills)}"
+                )
+            return
+
+        for ref_kind, namespace, name in self._references(kind, resource):
+            if (ref_kind, namespace, name) in available:
+                continue
+            if ref_kind == "Shell":
+                raise NotFoundException(
+                    f"Shell '{name}' not found in namespace '{namespace}' or in public shells"
+                )
+            raise NotFoundException(
+                f"{ref_kind} '{name}' not found in namespace '{namespace}'"
+            )
+
+    def _upsert(
+        self,
+        db: Session,
+        user_id: int,
+        planned: Dict[Tuple[str, str, str], Dict[str, Any]],
+        existing: Dict[Tuple[str, str, str], Kind],
+    ) -> None:
+        """Insert new rows and update existing ones with one statement each"""
+        now = datetime.now()
+        new_rows = []
+        changed_rows = []
+        for key, resource_data in planned.items():
+            kind, namespace, name = key
+            if key in existing:
+                changed_rows.append(
+                    {"id": existing[key].id, "json": resource_data, "updated_at": now}
+                )
+            else:
+                new_rows.append(
                     {
-                        "kind": kind if "kind" in locals() else "unknown",
-                        "name": resource.get("metadata", {}).get("name", "unknown"),
-                        "namespace": resource.get("metadata", {}).get(
-                            "namespace", "default"
-                        ),
-                        "operation": "failed",
-                        "success": False,
-                        "error": str(e),
+                        "user_id": user_id,
+                        "kind": kind,
+                        "name": name,
+                        "namespace": namespace,
+                        "json": resource_data,
+                        "is_active": True,
+                        "created_at": now,
+                        "updated_at": now,
                     }
                 )
 
-        return results
+        if new_rows:
+            db.execute(insert(Kind), new_rows)
+        if changed_rows:
+            db.execute(update(Kind), changed_rows)
+
+        # Bulk statements bypass the flush, evict cached references explicitly
+        track_changes(db, {(kind, name) for kind, _, name in planned})
 
     def delete_resources(
         self, user_id: int, resources: List[Dict[str, Any]]
@@ -101,42 +415,43 @@ class BatchService:
         """Delete multiple resources"""
         results = []
 
-        for resource in resources:
-            try:
-                kind = resource.get("kind")
-                if not kind:
-                    raise ValidationException("Resource must have 'kind' field")
+        with self.get_db() as db:
+            for resource in resources:
+                try:
+                    kind = resource.get("kind")
+                    if not kind:
+                        raise ValidationException("Resource must have 'kind' field")
 
-                if kind not in self.supported_kinds:
-                    raise ValidationException(f"Unsupported resource kind: {kind}")
+                    if kind not in self.supported_kinds:
+                        raise ValidationException(f"Unsupported resource kind: {kind}")
 
-                namespace = resource["metadata"]["namespace"]
-                name = resource["metadata"]["name"]
+                    namespace = resource["metadata"]["namespace"]
+                    name = resource["metadata"]["name"]
 
-                kind_service.delete_resource(user_id, kind, namespace, name)
-                results.append(
-                    {
-                        "kind": kind,
-                        "name": name,
-                        "namespace": namespace,
-                        "operation": "deleted",
-                        "success": True,
-                    }
-                )
+                    kind_service.delete_resource(user_id, kind, namespace, name, db=db)
+                    results.append(
+                        {
+                            "kind": kind,
+                            "name": name,
+                            "namespace": namespace,
+                            "operation": "deleted",
+                            "success": True,
+                        }
+                    )
 
-            except Exception as e:
-                results.append(
-                    {
-                        "kind": kind if "kind" in locals() else "unknown",
-                        "name": resource.get("metadata", {}).get("name", "unknown"),
-                        "namespace": resource.get("metadata", {}).get(
-                            "namespace", "default"
-                        ),
-                        "operation": "failed",
-                        "success": False,
-                        "error": str(e),
-                    }
-                )
+                except Exception as e:
+                    results.append(
+                        {
+                            "kind": kind if "kind" in locals() else "unknown",
+                            "name": resource.get("metadata", {}).get("name", "unknown"),
+                            "namespace": resource.get("metadata", {}).get(
+                                "namespace", "default"
+                            ),
+                            "operation": "failed",
+                            "success": False,
+                            "error": str(e),
+                        }
+                    )
 
         return results
 
@@ -7,6 +7,8 @@ Unified Kind service for all Kubernetes-style CRD operations
 """
 from typing import Any, Dict, List, Optional, Union
 
+from sqlalchemy.orm import Session
+
 from app.core.exceptions import NotFoundException
 from app.models.kind import Kind
 from app.models.task import TaskResource
@@ -19,22 +21,35 @@ TASK_RESOURCE_KINDS = {"Task", "Workspace"}
 class KindService:
     """Unified service for all Kubernetes-style CRD operations"""
 
-    def list_resources(self, user_id: int, kind: str, namespace: str) -> List[Kind]:
+    def list_resources(
+        self, user_id: int, kind: str, namespace: str, db: Optional[Session] = None
+    ) -> List[Kind]:
         """List all resources of a specific kind in a namespace"""
         service = KindServiceFactory.get_service(kind)
-        return service.list_resources(user_id, namespace)
+        return service.list_resources(user_id, namespace, db=db)
 
     def get_resource(
-        self, user_id: int, kind: str, namespace: str, name: str
+        self,
+        user_id: int,
+        kind: str,
+        namespace: str,
+        name: str,
+        db: Optional[Session] = None,
     ) -> Optional[Kind]:
         """Get a specific resource"""
         service = KindServiceFactory.get_service(kind)
-        return service.get_resource(user_id, namespace, name)
+        return service.get_resource(user_id, namespace, name, db=db)
 
-    def create_resource(self, user_id: int, kind: str, resource: Dict[str, Any]) -> int:
+    def create_resource(
+        self,
+        user_id: int,
+        kind: str,
+        resource: Dict[str, Any],
+        db: Optional[Session] = None,
+    ) -> int:
         """Create a new resource and return its ID"""
         service = KindServiceFactory.get_service(kind)
-        return service.create_resource(user_id, resource)
+        return service.create_resource(user_id, resource, db=db)
 
     def update_resource(
         self,
@@ -43,17 +58,23 @@ class KindService:
         namespace: str,
         name: str,
         resource: Dict[str, Any],
+        db: Optional[Session] = None,
     ) -> int:
         """Update an existing resource and return its ID"""
         service = KindServiceFactory.get_service(kind)
-        return service.update_resource(user_id, namespace, name, resource)
+        return service.update_resource(user_id, namespace, name, resource, db=db)
 
     def delete_resource(
-        self, user_id: int, kind: str, namespace: str, name: str
+        self,
+        user_id: int,
+        kind: str,
+        namespace: str,
+        name: str,
+        db: Optional[Session] = None,
     ) -> bool:
         """Delete a resource (soft delete)"""
         service = KindServiceFactory.get_service(kind)
-        return service.delete_resource(user_id, namespace, name)
+        return service.delete_resource(user_id, namespace, name, db=db)
 
     def _extract_resource_data(
         self, kind: str, resource: Dict[str, Any]
@@ -62,16 +83,19 @@ class KindService:
         service = KindServiceFactory.get_service(kind)
         return service._extract_resource_data(resource)
 
-    def _format_resource(self, kind: str, resource: Kind) -> Dict[str, Any]:
+    def _format_resource(
+        self, kind: str, resource: Kind, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """Format resource for API response directly from stored JSON"""
         service = KindServiceFactory.get_service(kind)
-        return service._format_resource(resource)
+        return service._format_resource(resource, db=db)
 
-    def _format_resource_by_id(self, kind: str, resource_id: int) -> Dict[str, Any]:
-        """Format resource for API response by ID using a new session"""
-        from app.db.session import SessionLocal
-
-        with SessionLocal() as db:
+    def _format_resource_by_id(
+        self, kind: str, resource_id: int, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """Format resource for API response by ID, using a new session if none is given"""
+        service = KindServiceFactory.get_service(kind)
+        with service.session_scope(db) as db:
             # Use TaskResource model for Task and Workspace kinds
             if kind in TASK_RESOURCE_KINDS:
                 resource = (
@@ -97,8 +121,7 @@ class KindService:
             if not resource:
                 raise NotFoundException(f"{kind} with ID {resource_id} not found")
 
-            service = KindServiceFactory.get_service(kind)
-            return service._format_resource(resource)
+            return service._format_resource(resource, db=db)
 
     def get_resource_by_id(
         self, kind: str, resource_id: int
@@ -144,7 +167,7 @@ class KindService:
                 return None
 
             service = KindServiceFactory.get_service("Team")
-            formatted = service._format_resource(resource)
+            formatted = service._format_resource(resource, db=db)
             # Add the database ID
             formatted["id"] = resource.id
             # Add agent_type from the resource's json
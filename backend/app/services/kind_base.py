@@ -5,17 +5,19 @@
 """
 Base service for all Kubernetes-style CRD operations
 """
+import functools
 import json
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterator, List, Optional, Type, TypeVar
 
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import ConflictException, NotFoundException
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, count_pool_checkouts
 from app.models.kind import Kind
 from app.models.task import TaskResource
 from app.services.group_permission import check_user_group_permission
@@ -23,6 +25,17 @@ from app.services.group_permission import check_user_group_permission
 logger = logging.getLogger(__name__)
 
 
+def track_pool_checkouts(method):
+    """Record the pool checkouts of a Kind service operation as a metric"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with count_pool_checkouts(f"{self.kind}.{method.__name__}"):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class KindBaseService(ABC):
     """Base service for all Kubernetes-style CRD operations"""
 
@@ -33,6 +46,20 @@ class KindBaseService(ABC):
         """Get database session"""
         return SessionLocal()
 
+    @contextmanager
+    def session_scope(self, db: Optional[Session] = None) -> Iterator[Session]:
+        """
+        Yield the caller's session, or a new one closed on exit.
+
+        Operations pass their session on to the operations they call, so a
+        request checks out a single pool connection at a time.
+        """
+        if db is not None:
+            yield db
+            return
+        with self.get_db() as db:
+            yield db
+
     def _build_filters(
         self, user_id: int, namespace: str, name: Optional[str] = None
     ) -> List:
@@ -58,7 +85,11 @@ class KindBaseService(ABC):
         return filters
 
     def _check_group_permission(
-        self, user_id: int, namespace: str, min_role: str = "Reporter"
+        self,
+        user_id: int,
+        namespace: str,
+        min_role: str = "Reporter",
+        db: Optional[Session] = None,
     ) -> bool:
         """Check if user has permission to access resources in the given namespace
 
@@ -66,6 +97,7 @@ class KindBaseService(ABC):
             user_id: User ID
             namespace: Resource namespace
             min_role: Minimum required role (Reporter, Developer, Maintainer, Owner)
+            db: Session to load the user's memberships with, if not cached
 
         Returns:
             bool: True if user has permission, False otherwise
@@ -74,41 +106,53 @@ class KindBaseService(ABC):
             return True
 
         # Check group permission
-        return check_user_group_permission(user_id, namespace, min_role)
+        return check_user_group_permission(user_id, namespace, min_role, db=db)
 
-    def list_resources(self, user_id: int, namespace: str) -> List[Kind]:
+    @track_pool_checkouts
+    def list_resources(
+        self, user_id: int, namespace: str, db: Optional[Session] = None
+    ) -> List[Kind]:
         """List all resources in a namespace"""
         # Check group permission for non-default namespaces
-        if not self._check_group_permission(user_id, namespace, "Reporter"):
+        if not self._check_group_permission(user_id, namespace, "Reporter", db=db):
             return []
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace)
             return db.query(Kind).filter(and_(*filters)).all()
 
-    def get_resource(self, user_id: int, namespace: str, name: str) -> Optional[Kind]:
+    @track_pool_checkouts
+    def get_resource(
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
+    ) -> Optional[Kind]:
         """Get a specific resource"""
         # Check group permission for non-default namespaces
-        if not self._check_group_permission(user_id, namespace, "Reporter"):
+        if not self._check_group_permission(user_id, namespace, "Reporter", db=db):
             return None
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             return db.query(Kind).filter(and_(*filters)).first()
 
-    def create_resource(self, user_id: int, resource: Dict[str, Any]) -> int:
+    @track_pool_checkouts
+    def create_resource(
+        self, user_id: int, resource: Dict[str, Any], db: Optional[Session] = None
+    ) -> int:
         """Create a new resource and return its ID"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
         namespace = resource.get("metadata", {}).get("namespace", "default")
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"Namespace '{namespace}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             # Check if resource already exists
             existing = self.get_resource(
-                user_id, resource["metadata"]["namespace"], resource["metadata"]["name"]
+                user_id,
+                resource["metadata"]["namespace"],
+                resource["metadata"]["name"],
+                db=db,
             )
 
             if existing:
@@ -150,17 +194,23 @@ class KindBaseService(ABC):
 
             return resource_id
 
+    @track_pool_checkouts
     def update_resource(
-        self, user_id: int, namespace: str, name: str, resource: Dict[str, Any]
+        self,
+        user_id: int,
+        namespace: str,
+        name: str,
+        resource: Dict[str, Any],
+        db: Optional[Session] = None,
     ) -> int:
         """Update an existing resource and return its ID"""
         # Check group permission for non-default namespaces (need Developer or above)
-        if not self._check_group_permission(user_id, namespace, "Developer"):
+        if not self._check_group_permission(user_id, namespace, "Developer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(Kind).filter(and_(*filters)).first()
             if not db_resource:
@@ -194,15 +244,18 @@ class KindBaseService(ABC):
 
             return resource_id
 
-    def soft_delete_resource(self, user_id: int, namespace: str, name: str) -> bool:
+    @track_pool_checkouts
+    def soft_delete_resource(
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
+    ) -> bool:
         """Soft delete a resource (mark as inactive)"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(Kind).filter(and_(*filters)).first()
             if not db_resource:
@@ -227,15 +280,18 @@ class KindBaseService(ABC):
 
             return True
 
-    def delete_resource(self, user_id: int, namespace: str, name: str) -> bool:
+    @track_pool_checkouts
+    def delete_resource(
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
+    ) -> bool:
         """Hard delete a resource (permanently remove from database)"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(Kind).filter(and_(*filters)).first()
             if not db_resource:
@@ -315,7 +371,9 @@ class KindBaseService(ABC):
         """Perform side effects after resource update"""
         pass
 
-    def _format_resource(self, resource: Kind) -> Dict[str, Any]:
+    def _format_resource(
+        self, resource: Kind, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """Format resource for API response directly from stored JSON"""
         # Get the stored resource data
         stored_resource = resource.json
@@ -365,41 +423,51 @@ class TaskResourceBaseService(KindBaseService):
 
         return filters
 
-    def list_resources(self, user_id: int, namespace: str) -> List[TaskResource]:
+    @track_pool_checkouts
+    def list_resources(
+        self, user_id: int, namespace: str, db: Optional[Session] = None
+    ) -> List[TaskResource]:
         """List all resources in a namespace using tasks table"""
         # Check group permission for non-default namespaces
-        if not self._check_group_permission(user_id, namespace, "Reporter"):
+        if not self._check_group_permission(user_id, namespace, "Reporter", db=db):
             return []
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace)
             return db.query(TaskResource).filter(and_(*filters)).all()
 
+    @track_pool_checkouts
     def get_resource(
-        self, user_id: int, namespace: str, name: str
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
     ) -> Optional[TaskResource]:
         """Get a specific resource using tasks table"""
         # Check group permission for non-default namespaces
-        if not self._check_group_permission(user_id, namespace, "Reporter"):
+        if not self._check_group_permission(user_id, namespace, "Reporter", db=db):
             return None
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             return db.query(TaskResource).filter(and_(*filters)).first()
 
-    def create_resource(self, user_id: int, resource: Dict[str, Any]) -> int:
+    @track_pool_checkouts
+    def create_resource(
+        self, user_id: int, resource: Dict[str, Any], db: Optional[Session] = None
+    ) -> int:
         """Create a new resource in tasks table and return its ID"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
         namespace = resource.get("metadata", {}).get("namespace", "default")
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"Namespace '{namespace}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             # Check if resource already exists
             existing = self.get_resource(
-                user_id, resource["metadata"]["namespace"], resource["metadata"]["name"]
+                user_id,
+                resource["metadata"]["namespace"],
+                resource["metadata"]["name"],
+                db=db,
             )
 
             if existing:
@@ -441,17 +509,23 @@ class TaskResourceBaseService(KindBaseService):
 
             return resource_id
 
+    @track_pool_checkouts
     def update_resource(
-        self, user_id: int, namespace: str, name: str, resource: Dict[str, Any]
+        self,
+        user_id: int,
+        namespace: str,
+        name: str,
+        resource: Dict[str, Any],
+        db: Optional[Session] = None,
     ) -> int:
         """Update an existing resource in tasks table and return its ID"""
         # Check group permission for non-default namespaces (need Developer or above)
-        if not self._check_group_permission(user_id, namespace, "Developer"):
+        if not self._check_group_permission(user_id, namespace, "Developer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(TaskResource).filter(and_(*filters)).first()
             if not db_resource:
@@ -485,15 +559,18 @@ class TaskResourceBaseService(KindBaseService):
 
             return resource_id
 
-    def soft_delete_resource(self, user_id: int, namespace: str, name: str) -> bool:
+    @track_pool_checkouts
+    def soft_delete_resource(
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
+    ) -> bool:
         """Soft delete a resource in tasks table (mark as inactive)"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(TaskResource).filter(and_(*filters)).first()
             if not db_resource:
@@ -518,15 +595,18 @@ class TaskResourceBaseService(KindBaseService):
 
             return True
 
-    def delete_resource(self, user_id: int, namespace: str, name: str) -> bool:
+    @track_pool_checkouts
+    def delete_resource(
+        self, user_id: int, namespace: str, name: str, db: Optional[Session] = None
+    ) -> bool:
         """Hard delete a resource from tasks table (permanently remove from database)"""
         # Check group permission for non-default namespaces (need Maintainer or Owner)
-        if not self._check_group_permission(user_id, namespace, "Maintainer"):
+        if not self._check_group_permission(user_id, namespace, "Maintainer", db=db):
             raise NotFoundException(
                 f"{self.kind} '{name}' not found or permission denied"
             )
 
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             filters = self._build_filters(user_id, namespace, name)
             db_resource = db.query(TaskResource).filter(and_(*filters)).first()
             if not db_resource:
@@ -551,7 +631,9 @@ class TaskResourceBaseService(KindBaseService):
 
             return True
 
-    def _format_resource(self, resource: TaskResource) -> Dict[str, Any]:
+    def _format_resource(
+        self, resource: TaskResource, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """Format resource for API response directly from stored JSON"""
         # Get the stored resource data
         stored_resource = resource.json
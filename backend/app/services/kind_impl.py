@@ -6,7 +6,7 @@
 Implementation of specific Kind services
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from shared.utils.crypto import decrypt_api_key, encrypt_api_key, is_api_key_encrypted
 from sqlalchemy.orm import Session
@@ -118,10 +118,12 @@ class ModelKindService(KindBaseService):
 
         return resource_data
 
-    def _format_resource(self, resource: Kind) -> Dict[str, Any]:
+    def _format_resource(
+        self, resource: Kind, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """Format Model resource for API response with decrypted API key"""
         # Get the stored resource data
-        result = super()._format_resource(resource)
+        result = super()._format_resource(resource, db=db)
 
         # Decrypt API key for display
         try:
@@ -519,8 +521,14 @@ class TaskKindService(TaskResourceBaseService):
             # Log error but don't interrupt the process
             logger.error(f"Error updating subtasks: {str(e)}")
 
-    def _format_resource(self, resource: TaskResource) -> Dict[str, Any]:
-        """Format Task resource for API response with enhanced status information"""
+    def _format_resource(
+        self, resource: TaskResource, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """
+        Format Task resource for API response with enhanced status information.
+
+        The subtasks are loaded with the caller's session if one is given.
+        """
         # Get the stored resource data
         stored_resource = resource.json
 
@@ -538,8 +546,7 @@ class TaskKindService(TaskResourceBaseService):
         result["apiVersion"] = "agent.wecode.io/v1"
         result["kind"] = self.kind
 
-        # Get database connection
-        with self.get_db() as db:
+        with self.session_scope(db) as db:
             # Query all Subtasks for this Task
             subtasks = (
                 db.query(Subtask)
@@ -658,10 +665,12 @@ class RetrieverKindService(KindBaseService):
 
         return resource_data
 
-    def _format_resource(self, resource: Kind) -> Dict[str, Any]:
+    def _format_resource(
+        self, resource: Kind, db: Optional[Session] = None
+    ) -> Dict[str, Any]:
         """Format Retriever resource for API response with decrypted sensitive data"""
         # Get the stored resource data
-        result = super()._format_resource(resource)
+        result = super()._format_resource(resource, db=db)
 
         # Decrypt sensitive data for display
         try:
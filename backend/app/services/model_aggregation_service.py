@@ -338,7 +338,7 @@ class ModelAggregationService:
             if namespace == "default":
                 # Query personal models
                 user_model_resources = kind_service.list_resources(
-                    user_id=current_user.id, kind="Model", namespace="default"
+                    user_id=current_user.id, kind="Model", namespace="default", db=db
                 )
                 resource_type = ModelType.USER  # Personal models
             else:
@@ -483,7 +483,11 @@ class ModelAggregationService:
         """
         if model_type == ModelType.USER:
             resource = kind_service.get_resource(
-                user_id=current_user.id, kind="Model", namespace="default", name=name
+                user_id=current_user.id,
+                kind="Model",
+                namespace="default",
+                name=name,
+                db=db,
             )
 
             if resource:
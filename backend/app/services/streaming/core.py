@@ -7,7 +7,8 @@
 This module provides the unified streaming infrastructure that handles:
 - Semaphore-based concurrency control
 - Cancellation event management
-- Periodic content saving (Redis and DB)
+- Coalescing tokens into chunk events
+- Periodic content saving (Redis deltas and throttled DB checkpoints)
 - Final result persistence
 - Shutdown manager integration
 
@@ -63,10 +64,26 @@ class StorageHandlerProtocol(Protocol):
         """Save streaming content to cache."""
         ...
 
+    async def append_streaming_content(self, subtask_id: int, delta: str) -> int | None:
+        """Append new streaming content to cache.
+
+        Optional: handlers without it get full saves. Returns the cached length
+        in bytes after the append, or None on failure.
+        """
+        ...
+
     async def delete_streaming_content(self, subtask_id: int) -> None:
         """Delete streaming content from cache."""
         ...
 
+    async def release_stream(self, subtask_id: int) -> None:
+        """Unregister a stream and delete its streaming content.
+
+        Optional: handlers without it get unregister_stream and
+        delete_streaming_content calls.
+        """
+        ...
+
     async def publish_streaming_done(
         self, subtask_id: int, result: dict[str, Any]
     ) -> None:
@@ -109,7 +126,6 @@ class StreamingState:
     )
 
     # Runtime state
-    full_response: str = ""
     offset: int = 0
     last_redis_save: float = 0.0
     last_db_save: float = 0.0
@@ -118,11 +134,32 @@ class StreamingState:
         default_factory=list
     )  # Knowledge base sources for citation
 
+    # Content buffer: tokens are kept as chunks and only joined when the full
+    # response is needed (DB checkpoints and finalize), never per token
+    _response: str = field(default="", init=False, repr=False)
+    _chunks: list[str] = field(default_factory=list, init=False, repr=False)
+    _unsaved_chunks: list[str] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def full_response(self) -> str:
+        """Accumulated response, materialized from the buffered chunks."""
+        if self._chunks:
+            self._response = "".join([self._response, *self._chunks])
+            self._chunks.clear()
+        return self._response
+
     def append_content(self, token: str) -> None:
         """Append token to accumulated response."""
-        self.full_response += token
+        self._chunks.append(token)
+        self._unsaved_chunks.append(token)
         self.offset += len(token)
 
+    def take_unsaved_content(self) -> str:
+        """Return the content appended since the last call and reset it."""
+        delta = "".join(self._unsaved_chunks)
+        self._unsaved_chunks.clear()
+        return delta
+
     def add_thinking_step(self, step: dict[str, Any]) -> None:
         """Add a thinking step (tool call)."""
         self.thinking.append(step)
@@ -260,6 +297,18 @@ class StreamingConfig:
     db_save_interval: float = field(
         default_factory=lambda: settings.STREAMING_DB_SAVE_INTERVAL
     )
+    db_checkpoint_scale_chars: int = field(
+        default_factory=lambda: settings.STREAMING_DB_CHECKPOINT_SCALE_CHARS
+    )
+    db_save_max_interval: float = field(
+        default_factory=lambda: settings.STREAMING_DB_SAVE_MAX_INTERVAL
+    )
+    chunk_flush_interval: float = field(
+        default_factory=lambda: settings.STREAMING_CHUNK_FLUSH_INTERVAL
+    )
+    chunk_flush_chars: int = field(
+        default_factory=lambda: settings.STREAMING_CHUNK_FLUSH_CHARS
+    )
     semaphore_timeout: float = 5.0
 
 
@@ -317,6 +366,24 @@ class StreamingCore:
         self._cancel_event: asyncio.Event | None = None
         self._mcp_client: Any = None
 
+        # Redis cache bookkeeping: bytes written so far, and whether the cached
+        # content must be rewritten in full (first save or a failed append)
+        self._redis_bytes = 0
+        self._redis_resync = True
+        # Progress covered by the last DB checkpoint
+        self._db_checkpoint: tuple[int, int, int] | None = None
+
+        # Tokens not emitted yet, the offset of the first one and their length
+        self._chunk_tokens: list[str] = []
+        self._chunk_offset = 0
+        self._chunk_chars = 0
+        self._last_chunk_flush = 0.0
+        self._chunk_flush_task: asyncio.Task | None = None
+        # Serializes chunk emission so chunks reach the emitter in order
+        self._chunk_lock = asyncio.Lock()
+        self._token_count = 0
+        self._chunk_count = 0
+
     @property
     def cancel_event(self) -> asyncio.Event | None:
         """Get the cancellation event."""
@@ -359,12 +426,27 @@ class StreamingCore:
 
     async def release_resources(self) -> None:
         """Release all acquired resources."""
+        if self._chunk_flush_task is not None:
+            self._chunk_flush_task.cancel()
+            self._chunk_flush_task = None
+        if self._token_count:
+            from shared.telemetry.metrics import record_stream_chunks
+
+            record_stream_chunks(
+                self.state.shell_type, self._token_count, self._chunk_count
+            )
+
         try:
-            # Unregister stream
-            await self._storage.unregister_stream(self.state.subtask_id)
+            release_stream = getattr(self._storage, "release_stream", None)
+            if release_stream is not None:
+                # Unregister stream and delete streaming content in one round trip
+                await release_stream(self.state.subtask_id)
+            else:
+                # Unregister stream
+                await self._storage.unregister_stream(self.state.subtask_id)
 
-            # Delete streaming content cache
-            await self._storage.delete_streaming_content(self.state.subtask_id)
+                # Delete streaming content cache
+                await self._storage.delete_streaming_content(self.state.subtask_id)
 
             # Disconnect MCP client if present
             if self._mcp_client:
@@ -391,7 +473,8 @@ class StreamingCore:
 
         Handles:
         - Content accumulation
-        - Emitting chunk to client
+        - Emitting chunks to client, coalescing tokens that arrive within
+          chunk_flush_interval of the last chunk
         - Periodic saves to Redis and DB
 
         Args:
@@ -412,6 +495,7 @@ class StreamingCore:
                 "[STREAMING] Cancelled or shutting down: subtask_id=%d",
                 self.state.subtask_id,
             )
+            await self.flush_chunks()
             await self.emitter.emit_cancelled(self.state.subtask_id)
             await self._storage.update_subtask_status(
                 self.state.subtask_id,
@@ -422,41 +506,98 @@ class StreamingCore:
         # Accumulate content
         self.state.append_content(token)
 
-        # Emit chunk to client with result data
-        # - include_value=False: avoid sending full response in every chunk (reduces data size)
-        # - include_thinking: only for Code mode (ClaudeCode, Agno), Chat mode only needs token
-        # Frontend accumulates content from individual chunks, doesn't need full value
-        is_chat_mode = self.state.shell_type == "Chat"
-        result = self.state.get_current_result(
-            include_value=False,
-            include_thinking=not is_chat_mode,  # Chat mode doesn't need thinking in chunks
-        )
-        await self.emitter.emit_chunk(
-            token,
-            self.state.offset - len(token),  # offset before this token
-            self.state.subtask_id,
-            result=result,  # Include result with shell_type for frontend display
-        )
+        # Buffer the token for the next chunk
+        if not self._chunk_tokens:
+            self._chunk_offset = self.state.offset - len(token)  # offset before it
+        self._chunk_tokens.append(token)
+        self._chunk_chars += len(token)
+        self._token_count += 1
+
+        # Emit right away when the stream is slow or the buffer is full, so
+        # the first token and slow streams are not delayed; otherwise flush
+        # at the end of the window
+        interval = self.config.chunk_flush_interval
+        elapsed = asyncio.get_event_loop().time() - self._last_chunk_flush
+        if (
+            interval <= 0
+            or elapsed >= interval
+            or self._chunk_chars >= self.config.chunk_flush_chars
+        ):
+            await self.flush_chunks()
+        elif self._chunk_flush_task is None:
+            self._chunk_flush_task = asyncio.create_task(
+                self._flush_chunks_later(interval - elapsed)
+            )
 
         # Periodic saves
         await self._periodic_save()
 
         return True
 
+    async def flush_chunks(self) -> None:
+        """Emit the buffered tokens as one chunk.
+
+        The chunk carries the offset of its first token, so clients see the
+        same offsets as with one chunk per token.
+        """
+        task = self._chunk_flush_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._chunk_flush_task = None
+
+        async with self._chunk_lock:
+            if not self._chunk_tokens:
+                return
+            content = "".join(self._chunk_tokens)
+            offset = self._chunk_offset
+            self._chunk_tokens.clear()
+            self._chunk_chars = 0
+            self._last_chunk_flush = asyncio.get_event_loop().time()
+            self._chunk_count += 1
+
+            # Emit chunk to client with result data
+            # - include_value=False: avoid sending full response in every chunk (reduces data size)
+            # - include_thinking: only for Code mode (ClaudeCode, Agno), Chat mode only needs token
+            # Frontend accumulates content from individual chunks, doesn't need full value
+            is_chat_mode = self.state.shell_type == "Chat"
+            result = self.state.get_current_result(
+                include_value=False,
+                include_thinking=not is_chat_mode,  # Chat mode doesn't need thinking in chunks
+            )
+            await self.emitter.emit_chunk(
+                content,
+                offset,
+                self.state.subtask_id,
+                result=result,  # Include result with shell_type for frontend display
+            )
+
+    async def _flush_chunks_later(self, delay: float) -> None:
+        """Flush the buffered tokens once the window has passed."""
+        await asyncio.sleep(delay)
+        # Flushing from here on must not be cancelled by process_token
+        self._chunk_flush_task = None
+        try:
+            await self.flush_chunks()
+        except Exception:
+            logger.exception(
+                "[STREAMING] Failed to emit chunk: subtask_id=%d",
+                self.state.subtask_id,
+            )
+
     async def _periodic_save(self) -> None:
         """Perform periodic saves to Redis and DB."""
         current_time = asyncio.get_event_loop().time()
 
-        # Save to Redis
+        # Save new content to Redis
         if current_time - self.state.last_redis_save >= self.config.redis_save_interval:
-            await self._storage.save_streaming_content(
-                self.state.subtask_id,
-                self.state.full_response,
-            )
+            await self._save_to_redis()
             self.state.last_redis_save = current_time
 
-        # Save to DB with thinking data
-        if current_time - self.state.last_db_save >= self.config.db_save_interval:
+        # Save a checkpoint to DB with thinking data
+        if (
+            current_time - self.state.last_db_save >= self._db_save_interval()
+            and self._db_checkpoint != self._progress()
+        ):
             # For Chat mode with tools, use slim_thinking to reduce payload size
             is_chat_mode = self.state.shell_type == "Chat"
             result = self.state.get_current_result(
@@ -471,8 +612,61 @@ class StreamingCore:
                 "RUNNING",
                 result=result,
             )
+            self._db_checkpoint = self._progress()
             self.state.last_db_save = current_time
 
+    def _progress(self) -> tuple[int, int, int]:
+        """Content length and number of thinking steps and sources."""
+        return (self.state.offset, len(self.state.thinking), len(self.state.sources))
+
+    def _db_save_interval(self) -> float:
+        """DB checkpoint interval, growing with the response size.
+
+        Each checkpoint rewrites the whole result, so spacing them out in
+        proportion to the response keeps the total volume written linear.
+        """
+        scale = max(1, self.config.db_checkpoint_scale_chars)
+        interval = self.config.db_save_interval * (1 + self.state.offset // scale)
+        return min(
+            interval,
+            max(self.config.db_save_interval, self.config.db_save_max_interval),
+        )
+
+    async def _save_to_redis(self) -> None:
+        """Write the content produced since the last save to Redis.
+
+        Uses append_streaming_content when the storage handler provides it and
+        falls back to rewriting the full content when the cached length does
+        not match what was written (e.g. the key expired or an append failed).
+        """
+        delta = self.state.take_unsaved_content()
+        if not delta and not self._redis_resync:
+            return
+
+        append = getattr(self._storage, "append_streaming_content", None)
+        if not self._redis_resync and append is not None:
+            expected = self._redis_bytes + len(delta.encode("utf-8"))
+            length = await append(self.state.subtask_id, delta)
+            if length == expected:
+                self._redis_bytes = length
+                return
+            logger.warning(
+                "[STREAMING] Streaming cache out of sync, rewriting: subtask_id=%d, "
+                "cached=%s, expected=%d",
+                self.state.subtask_id,
+                length,
+                expected,
+            )
+
+        content = self.state.full_response
+        saved = await self._storage.save_streaming_content(
+            self.state.subtask_id,
+            content,
+        )
+        # Handlers may return None; only an explicit False means the save failed
+        self._redis_resync = saved is False
+        self._redis_bytes = len(content.encode("utf-8"))
+
     async def finalize(self) -> dict[str, Any]:
         """Finalize streaming and save results.
 
@@ -488,11 +682,11 @@ class StreamingCore:
             slim_thinking=is_chat_mode,  # Slim down for Chat mode
         )
 
-        # Save final content to Redis for streaming recovery
-        await self._storage.save_streaming_content(
-            self.state.subtask_id,
-            self.state.full_response,
-        )
+        # Emit buffered tokens before the done event
+        await self.flush_chunks()
+
+        # Flush remaining content to Redis for streaming recovery
+        await self._save_to_redis()
 
         # Publish done signal
         await self._storage.publish_streaming_done(
@@ -541,6 +735,15 @@ class StreamingCore:
 
         error_msg = str(error)
 
+        # Emit buffered tokens of the partial response
+        try:
+            await self.flush_chunks()
+        except Exception:
+            logger.warning(
+                "[STREAMING] Failed to emit buffered chunk: subtask_id=%s",
+                self.state.subtask_id,
+            )
+
         # Record error in OpenTelemetry trace using unified function
         record_stream_error(
             error=error,
@@ -0,0 +1,361 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Denormalized, keyset-paginated task list index.
+
+The task list used to be served from the tasks table directly. That meant
+OFFSET scans over a tasks/task_members join and deserializing every task's
+JSON just to drop DELETE rows, and the totals were only approximate. Instead,
+each visible Task has one task_list_entries row for every user who can see
+it: the owner, plus every active group chat member. A row holds everything
+the list needs. Pages are index range scans on (user_id, sort key, task_id),
+continued with an opaque cursor, and totals are exact index counts. Titles
+are searched through an ngram FULLTEXT index on the same table.
+
+Entries are rebuilt from tasks and task_members in the same transaction.
+This happens whenever a session flushes changes to either table that affect
+the list, so every ORM write path keeps the index current without calling
+this module. Progress-only writes to a task, which make up most task updates,
+leave its entries untouched. Their updated_at and status timestamps are only
+refreshed with the next list-relevant change, such as a status transition.
+"""
+
+import base64
+import binascii
+import logging
+from collections import defaultdict
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import and_, delete, event, func, insert, inspect, or_, select, update
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Query, Session
+
+from app.models.task import TaskResource
+from app.models.task_list_entry import TaskListEntry
+from app.models.task_member import MemberStatus, TaskMember
+from app.schemas.kind import Task
+
+logger = logging.getLogger(__name__)
+
+# Token size of the MySQL ngram parser (server default ngram_token_size)
+NGRAM_TOKEN_SIZE = 2
+
+
+def build_task_list_entries(
+    task_row: Any, member_user_ids: Iterable[int]
+) -> List[Dict[str, Any]]:
+    """
+    Build the entry rows for one task.
+
+    Args:
+        task_row: Row with id, user_id, kind, json, is_active, created_at
+            and updated_at of a tasks record
+        member_user_ids: User IDs of the task's active members
+
+    Returns:
+        Entry values for the owner and every member, empty if the task is
+        not listed (not a Task, inactive or in DELETE status)
+    """
+    if task_row.kind != "Task" or not task_row.is_active:
+        return []
+
+    try:
+        task_crd = Task.model_validate(task_row.json)
+    except ValidationError as e:
+        logger.warning(f"Task {task_row.id} has invalid JSON, not listed: {e}")
+        return []
+
+    status = task_crd.status.status if task_crd.status else "PENDING"
+    if status == "DELETE":
+        return []
+
+    member_user_ids = list(member_user_ids)
+    labels = task_crd.metadata.labels or {}
+    summary = {
+        "task_id": task_row.id,
+        "title": task_crd.spec.title,
+        "status": status,
+        "task_type": labels.get("taskType") or "chat",
+        "type": labels.get("type") or "online",
+        "team_name": task_crd.spec.teamRef.name,
+        "team_namespace": task_crd.spec.teamRef.namespace,
+        "workspace_name": task_crd.spec.workspaceRef.name,
+        "workspace_namespace": task_crd.spec.workspaceRef.namespace,
+        "member_count": len(member_user_ids),
+        "is_group_chat": task_crd.spec.is_group_chat or len(member_user_ids) > 0,
+        "created_at": task_row.created_at,
+        "updated_at": task_row.updated_at,
+        "status_created_at": task_crd.status and task_crd.status.createdAt,
+        "status_updated_at": task_crd.status and task_crd.status.updatedAt,
+        "completed_at": task_crd.status and task_crd.status.completedAt,
+    }
+
+    entries = [{**summary, "user_id": task_row.user_id, "is_owner": True}]
+    for member_id in sorted(set(member_user_ids) - {task_row.user_id}):
+        entries.append({**summary, "user_id": member_id, "is_owner": False})
+    return entries
+
+
+def sync_task_list_entries(connection: Connection, task_ids: Iterable[int]) -> None:
+    """
+    Rebuild the list entries of the given tasks from tasks and task_members.
+
+    Existing rows are updated in place by primary key and only when their
+    values changed. Rows are only inserted or deleted for users who gained or
+    lost the task. Range deletes on the non-unique task_id index would take
+    gap locks that deadlock concurrent updates of the same task.
+    """
+    task_ids = sorted(set(task_ids))
+    if not task_ids:
+        return
+
+    tasks = connection.execute(
+        select(
+            TaskResource.id,
+            TaskResource.user_id,
+            TaskResource.kind,
+            TaskResource.json,
+            TaskResource.is_active,
+            TaskResource.created_at,
+            TaskResource.updated_at,
+        ).where(TaskResource.id.in_(task_ids))
+    ).all()
+    members = connection.execute(
+        select(TaskMember.task_id, TaskMember.user_id).where(
+            TaskMember.task_id.in_(task_ids),
+            TaskMember.status == MemberStatus.ACTIVE,
+        )
+    ).all()
+
+    member_user_ids: Dict[int, List[int]] = defaultdict(list)
+    for task_id, member_id in members:
+        member_user_ids[task_id].append(member_id)
+
+    rows = {}
+    for task_row in tasks:
+        for row in build_task_list_entries(task_row, member_user_ids[task_row.id]):
+            rows[(row["task_id"], row["user_id"])] = row
+
+    columns = [c for c in TaskListEntry.__table__.columns if c.key != "id"]
+    existing = connection.execute(
+        select(TaskListEntry.id, *columns).where(TaskListEntry.task_id.in_(task_ids))
+    ).all()
+
+    stale_ids = []
+    for entry in existing:
+        row = rows.pop((entry.task_id, entry.user_id), None)
+        if row is None:
+            stale_ids.append(entry.id)
+            continue
+        changed = {
+            column.key: row[column.key]
+            for column in columns
+            if row[column.key] != getattr(entry, column.key)
+        }
+        if changed:
+            connection.execute(
+                update(TaskListEntry)
+                .where(TaskListEntry.id == entry.id)
+                .values(**changed)
+            )
+
+    if stale_ids:
+        connection.execute(delete(TaskListEntry).where(TaskListEntry.id.in_(stale_ids)))
+    if rows:
+        connection.execute(insert(TaskListEntry), list(rows.values()))
+
+
+def _list_fields(task_json: Any) -> Tuple:
+    """Values of a task's JSON that its list entries depend on"""
+    task_json = task_json if isinstance(task_json, dict) else {}
+    metadata = task_json.get("metadata") or {}
+    spec = task_json.get("spec") or {}
+    status = task_json.get("status") or {}
+    labels = metadata.get("labels") or {}
+    return (
+        spec.get("title"),
+        spec.get("teamRef"),
+        spec.get("workspaceRef"),
+        spec.get("is_group_chat"),
+        labels.get("taskType"),
+        labels.get("type"),
+        status.get("status"),
+    )
+
+
+def _task_list_changed(task: TaskResource) -> bool:
+    """Whether a flushed change of a task affects its list entries"""
+    state = inspect(task)
+    if any(
+        state.attrs[key].history.has_changes()
+        for key in ("user_id", "kind", "is_active")
+    ):
+        return True
+
+    history = state.attrs.json.history
+    if not history.has_changes():
+        return False
+    if not history.deleted:
+        # Modified in place, the previous value is unknown
+        return True
+    return _list_fields(history.deleted[0]) != _list_fields(task.json)
+
+
+def _changed_task_ids(session: Session) -> Set[int]:
+    """Collect IDs of tasks whose list entries are affected by the flush"""
+    task_ids = set()
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, TaskResource):
+            if obj.kind == "Task" and obj.id is not None:
+                task_ids.add(obj.id)
+        elif isinstance(obj, TaskMember) and obj.task_id:
+            task_ids.add(obj.task_id)
+
+    for obj in session.dirty:
+        # dirty also holds objects with only no-op attribute sets
+        if not session.is_modified(obj, include_collections=False):
+            continue
+        if isinstance(obj, TaskResource):
+            if obj.kind == "Task" and obj.id is not None and _task_list_changed(obj):
+                task_ids.add(obj.id)
+        elif isinstance(obj, TaskMember) and obj.task_id:
+            task_ids.add(obj.task_id)
+    return task_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_after_flush(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe the flushed objects at this point, and
+    # the entries are written on the same connection and transaction
+    task_ids = _changed_task_ids(session)
+    if not task_ids:
+        return
+    sync_task_list_entries(session.connection(), task_ids)
+    # Entries loaded earlier in this session were replaced underneath it
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, TaskListEntry) and obj.task_id in task_ids:
+            session.expunge(obj)
+
+
+def encode_cursor(sort_value: datetime, task_id: int) -> str:
+    """Encode the position after an entry as an opaque cursor"""
+    raw = f"{sort_value.isoformat()}|{task_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        sort_value, task_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(sort_value), int(task_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate_entries(
+    query: Query,
+    sort_column,
+    *,
+    skip: int = 0,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[TaskListEntry], int, Optional[str]]:
+    """
+    Fetch one page of entries ordered by sort_column and task_id descending.
+
+    The cursor is a position in the sort order, not a snapshot. Lists sorted
+    by the immutable created_at page consistently. Lists sorted by updated_at
+    are not stable: a task whose entry is refreshed while a client pages
+    through the list moves to the front. Such a task may then be skipped or
+    returned twice.
+
+    Args:
+        query: Entry query already filtered to one user's list
+        sort_column: TaskListEntry column the list is ordered by
+        skip: Offset, only used when no cursor is given
+        limit: Page size
+        cursor: Cursor returned with the previous page
+
+    Returns:
+        Tuple of (entries, exact total, cursor for the next page or None)
+    """
+    total = query.order_by(None).with_entities(func.count(TaskListEntry.id)).scalar()
+
+    if cursor:
+        sort_value, task_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, TaskListEntry.task_id < task_id),
+            )
+        )
+    query = query.order_by(sort_column.desc(), TaskListEntry.task_id.desc())
+    if skip and not cursor:
+        query = query.offset(skip)
+    entries = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(entries) > limit:
+        entries = entries[:limit]
+        last = entries[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), last.task_id)
+    return entries, total or 0, next_cursor
+
+
+def _title_filter(db: Session, title: str):
+    """
+    Build the title match expression for the session's database.
+
+    MySQL uses the ngram FULLTEXT index on title with a phrase query, which
+    matches substrings of at least NGRAM_TOKEN_SIZE characters like the
+    previous application-side filter did. The index is built without
+    stopwords, which the ngram parser would otherwise drop from both the index
+    and the query. Shorter queries and other databases fall back to a LIKE
+    scan.
+
+    Returns:
+        Tuple of (filter expression, relevance expression or None)
+    """
+    if db.get_bind().dialect.name == "mysql" and len(title) >= NGRAM_TOKEN_SIZE:
+        phrase = '"{}"'.format(title.replace('"', " "))
+        relevance = match(TaskListEntry.title, against=phrase).in_boolean_mode()
+        return relevance, relevance
+
+    escaped = title.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return TaskListEntry.title.ilike(f"%{escaped}%", escape="\\"), None
+
+
+def search_entries(
+    db: Session, *, user_id: int, title: str, skip: int = 0, limit: int = 10
+) -> Tuple[List[TaskListEntry], int]:
+    """
+    Search the titles of the tasks a user owns.
+
+    Results are ranked by relevance where the database provides it, then by
+    created_at descending.
+
+    Returns:
+        Tuple of (entries for the page, exact number of matches)
+    """
+    title_filter, relevance = _title_filter(db, title.strip())
+    query = db.query(TaskListEntry).filter(
+        TaskListEntry.user_id == user_id,
+        TaskListEntry.is_owner == True,
+        title_filter,
+    )
+    total = query.with_entities(func.count(TaskListEntry.id)).scalar()
+
+    order_by = [TaskListEntry.created_at.desc(), TaskListEntry.task_id.desc()]
+    if relevance is not None:
+        order_by.insert(0, relevance.desc())
+    entries = query.order_by(*order_by).offset(skip).limit(limit).all()
+    return entries, total or 0
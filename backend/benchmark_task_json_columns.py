@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark JSON_EXTRACT filters against the generated columns on tasks
+
+Seeds a scratch copy of the tasks table (CREATE TABLE ... LIKE keeps the
+generated columns and indexes), then prints EXPLAIN output and median
+latency of each hot query written against JSON paths (before) and against
+the generated columns (after). Requires a MySQL 8 database migrated to at
+least revision r8s9t0u1v2w3.
+
+Usage:
+    python benchmark_task_json_columns.py --rows 1000000
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TABLE = "tasks_json_benchmark"
+SEED_CHUNK_ROWS = 100_000
+TEAM_COUNT = 1000
+
+# (name, before, after) query pairs; {table} is replaced with the scratch table
+QUERIES: List[Tuple[str, str, str]] = [
+    (
+        "running tasks of a team",
+        """
+        SELECT id FROM {table}
+        WHERE kind = 'Task' AND is_active = true
+        AND JSON_UNQUOTE(JSON_EXTRACT(json, '$.spec.teamRef.name')) = 'team-7'
+        AND JSON_UNQUOTE(JSON_EXTRACT(json, '$.spec.teamRef.namespace')) = 'default'
+        AND JSON_UNQUOTE(JSON_EXTRACT(json, '$.status.status')) IN ('PENDING', 'RUNNING')
+        """,
+        """
+        SELECT id FROM {table}
+        WHERE kind = 'Task'
+        AND task_team_name = 'team-7' AND task_team_namespace = 'default'
+        AND task_status IN ('PENDING', 'RUNNING') AND is_active = true
+        """,
+    ),
+    (
+        "dispatch candidates",
+        """
+        SELECT id FROM {table}
+        WHERE kind = 'Task' AND is_active = true
+        AND JSON_UNQUOTE(JSON_EXTRACT(json, '$.status.status')) = 'PENDING'
+        AND coalesce(JSON_UNQUOTE(JSON_EXTRACT(json, '$.metadata.labels.type')), 'online') = 'offline'
+        AND coalesce(JSON_UNQUOTE(JSON_EXTRACT(json, '$.metadata.labels.source')), '') != 'chat_shell'
+        ORDER BY created_at DESC LIMIT 10
+        """,
+        """
+        SELECT id FROM {table}
+        WHERE kind = 'Task' AND is_active = true
+        AND task_status = 'PENDING' AND task_type = 'offline'
+        AND task_source != 'chat_shell'
+        ORDER BY created_at DESC LIMIT 10
+        """,
+    ),
+]
+
+
+def seed(conn: Connection, rows: int) -> None:
+    """Create the scratch table and fill it with synthetic tasks"""
+    conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    conn.execute(text(f"CREATE TABLE {TABLE} LIKE tasks"))
+
+    # 10^5 sequence numbers per chunk from a cross join of digits
+    digits = "SELECT 0 d UNION ALL " + " UNION ALL ".join(
+        f"SELECT {i}" for i in range(1, 10)
+    )
+    for start in range(0, rows, SEED_CHUNK_ROWS):
+        count = min(SEED_CHUNK_ROWS, rows - start)
+        conn.execute(
+            text(f"""
+                INSERT INTO {TABLE} (user_id, kind, name, namespace, json, is_active, created_at, updated_at)
+                SELECT
+                    1 + n % 5000,
+                    'Task',
+                    CONCAT('task-', n),
+                    'default',
+                    JSON_OBJECT(
+                        'kind', 'Task',
+                        'metadata', JSON_OBJECT(
+                            'name', CONCAT('task-', n),
+                            'namespace', 'default',
+                            'labels', JSON_OBJECT(
+                                'type', IF(n % 10 = 0, 'offline', 'online'),
+                                'source', IF(n % 3 = 0, 'chat_shell', 'web')
+                            )
+                        ),
+                        'spec', JSON_OBJECT(
+                            'title', CONCAT('Task number ', n),
+                            'prompt', REPEAT('lorem ipsum ', 50),
+                            'teamRef', JSON_OBJECT('name', CONCAT('team-', n % {TEAM_COUNT}), 'namespace', 'default'),
+                            'workspaceRef', JSON_OBJECT('name', CONCAT('ws-', n), 'namespace', 'default')
+                        ),
+                        'status', JSON_OBJECT(
+                            'status', ELT(1 + n % 5, 'PENDING', 'RUNNING', 'COMPLETED', 'FAILED', 'DELETE')
+                        )
+                    ),
+                    true,
+                    NOW() - INTERVAL n SECOND,
+                    NOW() - INTERVAL n SECOND
+                FROM (
+                    SELECT :start + a.d + b.d * 10 + c.d * 100 + e.d * 1000 + f.d * 10000 AS n
+                    FROM ({digits}) a, ({digits}) b, ({digits}) c, ({digits}) e, ({digits}) f
+                ) seq
+                WHERE n < :end
+                """),
+            {"start": start, "end": start + count},
+        )
+        logger.info(f"Seeded {start + count}/{rows} rows")
+    conn.execute(text(f"ANALYZE TABLE {TABLE}"))
+
+
+def explain(conn: Connection, sql: str) -> List[str]:
+    """Return the EXPLAIN rows of a query as readable lines"""
+    result = conn.execute(text(f"EXPLAIN {sql}"))
+    columns = ["type", "key", "rows", "filtered", "Extra"]
+    return [
+        ", ".join(f"{c}={row._mapping.get(c)}" for c in columns)
+        for row in result.fetchall()
+    ]
+
+
+def time_query(conn: Connection, sql: str, runs: int) -> float:
+    """Median wall time of a query in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        conn.execute(text(sql)).fetchall()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the scratch table afterwards"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    with engine.connect() as conn:
+        seed(conn, args.rows)
+        conn.commit()
+        try:
+            for name, before, after in QUERIES:
+                print(f"\n== {name} ==")
+                for label, sql in (("before", before), ("after", after)):
+                    sql = sql.format(table=TABLE)
+                    print(f"{label}: {time_query(conn, sql, args.runs):.1f} ms")
+                    for line in explain(conn, sql):
+                        print(f"  {line}")
+        finally:
+            if not args.keep:
+                conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+                conn.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import Settings
+from app.core.principal_cache import principal_cache
 from app.core.security import create_access_token, get_password_hash
 from app.db.base import Base
 
@@ -25,6 +26,8 @@ from app.models.shared_team import SharedTeam
 from app.models.skill_binary import SkillBinary
 from app.models.subtask import Subtask
 from app.models.user import User
+from app.services.crd_cache import crd_cache
+from app.services.group_permission import group_permission_cache
 
 # Test database URL (SQLite in-memory with shared cache for thread safety)
 TEST_DATABASE_URL = "sqlite:///file:testdb?mode=memory&cache=shared&uri=true"
@@ -49,6 +52,10 @@ def test_db() -> Generator[Session, None, None]:
 
     # Create session
     db = TestingSessionLocal()
+    # Cached users, memberships and CRDs of earlier tests' databases must not leak in
+    principal_cache.clear()
+    group_permission_cache.clear()
+    crd_cache.clear()
 
     try:
         yield db
@@ -150,7 +157,7 @@ def test_client(test_db: Session) -> TestClient:
     """
     Create a test client with database dependency override.
     """
-    from app.api.dependencies import get_db
+    from app.api.dependencies import get_db, get_read_db
     from app.main import create_app
 
     app = create_app()
@@ -166,6 +173,7 @@ def test_client(test_db: Session) -> TestClient:
             raise
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     return TestClient(app)
 
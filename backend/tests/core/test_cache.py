@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the pooled Redis cache client
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.core.cache import RedisCache
+
+
+@pytest.fixture
+def cache():
+    return RedisCache("redis://127.0.0.1:6379/0")
+
+
+@pytest.mark.unit
+class TestRedisCachePools:
+    """Test per-event-loop client pooling"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_loop(self, cache):
+        first = await cache._get_client()
+        second = await cache._get_client()
+
+        assert first is second
+        assert cache.get_stats()["event_loop_pools"] == 1
+
+    def test_each_loop_gets_its_own_client(self, cache):
+        """Clients are not shared across loops and closed loops are dropped"""
+        first = asyncio.run(cache._get_client())
+        second = asyncio.run(cache._get_client())
+
+        assert first is not second
+        # The first loop is closed, so only the second client is kept
+        assert cache.get_stats()["event_loop_pools"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_releases_clients(self, cache):
+        client = await cache._get_client()
+        sync_client = cache._get_sync_client()
+
+        with (
+            patch.object(client, "aclose", new=AsyncMock()) as aclose,
+            patch.object(sync_client, "close") as close,
+        ):
+            await cache.close()
+
+        aclose.assert_awaited_once()
+        close.assert_called_once()
+        assert cache.get_stats()["event_loop_pools"] == 0
+        assert await cache._get_client() is not client
+
+
+@pytest.mark.unit
+class TestRedisCacheOperations:
+    """Test operations against a mocked client"""
+
+    @pytest.fixture
+    def client(self, cache):
+        client = MagicMock()
+        client.get = AsyncMock(return_value=orjson.dumps({"a": 1}))
+        client.mget = AsyncMock(return_value=[orjson.dumps(1), None, b"raw"])
+        client.delete = AsyncMock(return_value=2)
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        client.pipeline.return_value = pipe
+        with patch.object(cache, "_get_client", new=AsyncMock(return_value=client)):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_get_records_latency(self, cache, client):
+        assert await cache.get("key") == {"a": 1}
+        assert await cache.get("key") == {"a": 1}
+
+        stats = cache.get_stats()["operations"]["get"]
+        assert stats["count"] == 2
+        assert stats["errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self, cache, client):
+        client.get.side_effect = ConnectionError("down")
+
+        assert await cache.get("key") is None
+        assert cache.get_stats()["operations"]["get"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_multi_key_helpers(self, cache, client):
+        assert await cache.get_many(["a", "b", "c"]) == [1, None, b"raw"]
+        assert await cache.set_many({"a": 1, "b": 2}, expire=10) is True
+        assert await cache.delete_many(["a", "b"]) == 2
+
+        pipe = client.pipeline.return_value
+        assert pipe.set.call_count == 2
+        pipe.execute.assert_awaited_once()
+        client.delete.assert_awaited_once_with("a", "b")
+
+    @pytest.mark.asyncio
+    async def test_empty_multi_key_calls_skip_redis(self, cache, client):
+        assert await cache.get_many([]) == []
+        assert await cache.set_many({}) is True
+        assert await cache.delete_many([]) == 0
+
+        client.mget.assert_not_called()
+        client.delete.assert_not_called()
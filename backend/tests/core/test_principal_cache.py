@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the authenticated principal cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core import security
+from app.core.principal_cache import principal_cache
+from app.core.security import get_auth_context, get_current_user, verify_token
+from app.models.user import User
+
+
+@pytest.mark.integration
+class TestPrincipalCache:
+    """Test cached token and API key authentication"""
+
+    @pytest.fixture(autouse=True)
+    def publish(self):
+        with patch.object(principal_cache, "publish_invalidation") as publish:
+            yield publish
+
+    def _capture_queries(self, db: Session):
+        statements = []
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        return statements
+
+    def test_token_is_decoded_once(self, test_token):
+        with patch.object(security.jwt, "decode", wraps=security.jwt.decode) as decode:
+            assert verify_token(test_token) == {"username": "testuser"}
+            assert verify_token(test_token) == {"username": "testuser"}
+        assert decode.call_count == 1
+
+    def test_cached_user_is_attached_without_query(
+        self, test_db, test_user, test_token
+    ):
+        get_current_user(token=test_token, db=test_db)
+        test_db.expunge_all()
+
+        statements = self._capture_queries(test_db)
+        user = get_current_user(token=test_token, db=test_db)
+        assert statements == []
+        assert user in test_db
+        assert (user.id, user.user_name) == (test_user.id, "testuser")
+
+        # The attached user is a regular persistent object
+        user.email = "new@example.com"
+        test_db.commit()
+        assert test_db.query(User).get(test_user.id).email == "new@example.com"
+
+    def test_deactivated_user_is_revoked(self, publish, test_db, test_user, test_token):
+        get_current_user(token=test_token, db=test_db)
+
+        test_user.is_active = False
+        test_db.commit()
+        publish.assert_called_once_with({test_user.id}, set())
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(token=test_token, db=test_db)
+        assert exc_info.value.status_code == 401
+
+    def test_api_key_principal_is_cached_until_revoked(
+        self, publish, test_db, test_user, test_api_key
+    ):
+        raw_key, api_key = test_api_key
+        context = get_auth_context(db=test_db, api_key=raw_key, wegent_username=None)
+        assert context.user.id == test_user.id
+        test_db.refresh(api_key)
+        assert api_key.last_used_at is not None
+        publish.assert_not_called()
+
+        statements = self._capture_queries(test_db)
+        context = get_auth_context(db=test_db, api_key=raw_key, wegent_username=None)
+        assert statements == []
+        assert context.api_key_name == "Test API Key"
+
+        api_key.is_active = False
+        test_db.commit()
+        with pytest.raises(HTTPException) as exc_info:
+            get_auth_context(db=test_db, api_key=raw_key, wegent_username=None)
+        assert exc_info.value.status_code == 401
+
+    def test_published_revocation_drops_entries(self, test_db, test_user, test_token):
+        get_current_user(token=test_token, db=test_db)
+        # Simulate a deactivation committed by another worker
+        test_db.execute(
+            User.__table__.update()
+            .where(User.id == test_user.id)
+            .values(is_active=False)
+        )
+        test_db.commit()
+        get_current_user(token=test_token, db=test_db)
+
+        principal_cache.channel.handle(b'{"user_ids": [%d]}' % test_user.id)
+        test_db.expire_all()
+        with pytest.raises(HTTPException):
+            get_current_user(token=test_token, db=test_db)
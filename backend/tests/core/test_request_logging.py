@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the request logging middleware and the access log queue
+"""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import request_logging
+from app.core.logging import (
+    ACCESS_LOGGER_NAME,
+    start_access_log_queue,
+    stop_access_log_queue,
+)
+from app.core.request_logging import RequestLoggingMiddleware
+from shared.telemetry.config import OtelConfig
+
+
+def _otel_config(**overrides) -> OtelConfig:
+    values = dict(
+        enabled=True,
+        service_name="test",
+        otlp_endpoint="",
+        sampler_ratio=1.0,
+        metrics_enabled=False,
+        capture_request_headers=False,
+        capture_request_body=True,
+        capture_response_headers=True,
+        capture_response_body=True,
+        max_body_size=8,
+    )
+    values.update(overrides)
+    return OtelConfig(**values)
+
+
+def _client(config: OtelConfig) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return PlainTextResponse(
+            body.decode() * 2, headers={"X-Seen-Id": request.state.request_id}
+        )
+
+    @app.get("/api/stream")
+    async def stream():
+        return StreamingResponse(
+            iter([b"data: 1\n\n", b"data: 2\n\n"]), media_type="text/event-stream"
+        )
+
+    app.add_middleware(RequestLoggingMiddleware, otel_config=config)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestRequestLoggingMiddleware:
+    """Test access logging and body capture"""
+
+    @pytest.fixture
+    def span(self):
+        span = MagicMock()
+        with (
+            patch.object(
+                RequestLoggingMiddleware, "_tracing_enabled", return_value=True
+            ),
+            patch.object(request_logging, "_current_span", return_value=span),
+        ):
+            yield span
+
+    def _attributes(self, span) -> dict:
+        return {
+            call.args[0]: call.args[1] for call in span.set_attribute.call_args_list
+        }
+
+    def test_access_lines_and_request_id(self, caplog):
+        client = _client(_otel_config(enabled=False))
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER_NAME):
+            response = client.post("/api/echo?x=1", content=b"hi")
+
+        assert response.text == "hihi"
+        request_id = response.headers["X-Request-ID"]
+        assert response.headers["X-Seen-Id"] == request_id
+        lines = [r.getMessage() for r in caplog.records if r.name == ACCESS_LOGGER_NAME]
+        assert lines[0].startswith(f"request : POST /api/echo x=1 {request_id}")
+        assert lines[1].startswith(f"response: POST /api/echo x=1 {request_id}")
+        assert " 200 " in lines[1]
+
+    def test_bodies_are_teed_up_to_max_size(self, span):
+        client = _client(_otel_config())
+
+        with patch("shared.telemetry.context.set_task_context") as set_task_context:
+            response = client.post("/api/echo", content=b'{"task_id":7}')
+
+        # The response passes through unchanged
+        assert response.text == '{"task_id":7}' * 2
+        attributes = self._attributes(span)
+        assert attributes["http.request.body"] == (
+            '{"task_i... [truncated, total size: 13 bytes]'
+        )
+        assert attributes["http.response.body"] == (
+            '{"task_i... [truncated, total size: 26 bytes]'
+        )
+        assert attributes["http.response.header.x-seen-id"] == (
+            response.headers["X-Request-ID"]
+        )
+        # Truncated bodies are not parsed for task context
+        set_task_context.assert_not_called()
+
+    def test_task_context_from_complete_request_body(self, span):
+        client = _client(_otel_config(max_body_size=64))
+
+        with patch("shared.telemetry.context.set_task_context") as set_task_context:
+            client.post("/api/echo", content=b'{"task_id":7}')
+
+        set_task_context.assert_called_once_with(task_id=7, subtask_id=None)
+
+    def test_event_streams_and_unsampled_routes_are_not_captured(self, span):
+        client = _client(_otel_config(body_capture_urls=["/api/stream"]))
+
+        assert client.get("/api/stream").text == "data: 1\n\ndata: 2\n\n"
+        client.post("/api/echo", content=b"hi")
+
+        attributes = self._attributes(span)
+        assert "http.request.body" not in attributes
+        assert "http.response.body" not in attributes
+
+
+@pytest.mark.unit
+class TestAccessLogQueue:
+    """Test writing access log lines from a background thread"""
+
+    def test_records_keep_request_id_of_caller(self):
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            start_access_log_queue()
+            with patch(
+                "shared.telemetry.context.get_request_id", return_value="abcd1234"
+            ):
+                logging.getLogger(ACCESS_LOGGER_NAME).warning("line %s", 1)
+            stop_access_log_queue()
+        finally:
+            root.removeHandler(handler)
+
+        [record] = records
+        assert record.getMessage() == "line 1"
+        assert record.request_id == "abcd1234"
+        assert logging.getLogger(ACCESS_LOGGER_NAME).propagate is True
@@ -12,6 +12,8 @@ from app.core.security import (
     verify_password,
     get_password_hash,
     create_access_token,
+    create_executor_status_token,
+    verify_executor_status_token,
     verify_token,
     authenticate_user,
     get_current_user,
@@ -181,6 +183,32 @@ class TestTokenOperations:
         assert exc_info.value.status_code == 401
 
 
+@pytest.mark.unit
+class TestExecutorStatusToken:
+    """Test per-subtask tokens for direct executor status updates"""
+
+    def test_status_token_round_trip(self):
+        """Test that a status token carries its task and subtask"""
+        claims = verify_executor_status_token(create_executor_status_token(3, 7))
+
+        assert claims["task_id"] == 3
+        assert claims["subtask_id"] == 7
+
+    def test_user_token_is_not_a_status_token(self):
+        """Test that user access tokens are rejected as status tokens"""
+        user_token = create_access_token(data={"sub": "testuser"})
+
+        assert verify_executor_status_token(user_token) is None
+        assert verify_executor_status_token("invalid.token") is None
+
+    def test_status_token_is_not_a_user_token(self):
+        """Test that status tokens cannot authenticate a user"""
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(create_executor_status_token(3, 7))
+
+        assert exc_info.value.status_code == 401
+
+
 @pytest.mark.unit
 class TestAuthenticateUser:
     """Test user authentication function"""
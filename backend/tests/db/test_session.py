@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for pool wait timing and the async session path
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db import session as db_session
+from app.db.session import TimedQueuePool
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.services.chat.storage import db as storage_db
+from app.services.chat.storage.db import DatabaseHandler
+
+ASYNC_TEST_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+)
+
+
+@pytest.mark.unit
+class TestTimedQueuePool:
+    """Test recording checkout wait times"""
+
+    def test_checkouts_and_timeouts_are_recorded(self):
+        pool = TimedQueuePool(
+            lambda: sqlite3.connect(":memory:"),
+            pool_size=1,
+            max_overflow=0,
+            timeout=0.05,
+            logging_name="test",
+        )
+
+        with patch("shared.telemetry.metrics.record_db_pool_wait") as record_wait:
+            connection = pool.connect()
+            with pytest.raises(TimeoutError):
+                pool.connect()
+            connection.close()
+
+        [acquired, timed_out] = record_wait.call_args_list
+        assert acquired.args[0] == "test" and acquired.args[2] is True
+        assert timed_out.args[0] == "test" and timed_out.args[2] is False
+        assert timed_out.args[1] >= 50
+
+
+@pytest.mark.integration
+class TestAsyncSessions:
+    """Test running chat database operations on the async engine"""
+
+    @pytest.fixture
+    async def async_sessions(self, test_db):
+        engine = create_async_engine(ASYNC_TEST_DATABASE_URL)
+        factory = async_sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False
+        )
+        with (
+            patch.object(db_session, "AsyncSessionLocal", factory),
+            patch.object(db_session, "AsyncReadSessionLocal", factory),
+            patch.object(storage_db, "_db_executor", None),
+        ):
+            yield factory
+        await engine.dispose()
+
+    async def test_bound_session_is_used_and_committed(
+        self, async_sessions, test_db, test_user
+    ):
+        subtask = Subtask(
+            user_id=test_user.id,
+            task_id=1,
+            team_id=1,
+            title="t",
+            bot_ids=[],
+            role=SubtaskRole.ASSISTANT,
+            message_id=1,
+            status=SubtaskStatus.RUNNING,
+        )
+        test_db.add(subtask)
+        test_db.commit()
+
+        assert db_session.async_sessions_enabled()
+        await DatabaseHandler().save_partial_response(subtask.id, "partial")
+        assert await DatabaseHandler().get_subtask_message_id(subtask.id) == 1
+
+        test_db.expire_all()
+        assert test_db.get(Subtask, subtask.id).result == {
+            "value": "partial",
+            "streaming": True,
+        }
+        assert db_session.get_bound_session() is None
@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for list-based chat history in SessionManager
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.services.chat.storage.session import SessionManager
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute, like a redis pipeline"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        self._commands = []
+        return results
+
+
+class FakeRedis:
+    """Minimal in-memory Redis with string and list values"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    async def getdel(self, key):
+        return self.data.pop(key, None)
+
+    async def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def expire(self, key, seconds):
+        self.ttl[key] = seconds
+        return key in self.data
+
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    async def lpush(self, key, *values):
+        items = self.data.setdefault(key, [])
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    async def ltrim(self, key, start, end):
+        items = self.data.get(key, [])
+        end = len(items) if end == -1 else end + 1
+        self.data[key] = items[start:end] if start >= 0 else items[start:][:end]
+        return True
+
+    async def lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def llen(self, key):
+        return len(self.data.get(key, []))
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def manager(redis):
+    manager = SessionManager()
+    with patch.object(manager._cache, "_get_client", new=AsyncMock(return_value=redis)):
+        yield manager
+
+
+@pytest.mark.unit
+class TestChatHistory:
+    """Test chat history stored as a Redis list"""
+
+    @pytest.mark.asyncio
+    async def test_append_and_read(self, manager, redis):
+        await manager.append_message(1, "user", "hi")
+        await manager.append_user_and_assistant_messages(1, "question", "answer")
+
+        assert await manager.get_chat_history(1) == [
+            {"role": "user", "content": "hi"},
+            {"role": "user", "content": "question"},
+            {"role": "assistant", "content": "answer"},
+        ]
+        assert await manager.get_chat_history(1, limit=1) == [
+            {"role": "assistant", "content": "answer"}
+        ]
+        assert await manager.get_history_length(1) == 3
+        assert redis.ttl["chat:history_list:1"] == settings.CHAT_HISTORY_EXPIRE_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_history_is_trimmed(self, manager):
+        with patch.object(settings, "CHAT_HISTORY_MAX_MESSAGES", 4):
+            for i in range(5):
+                await manager.append_user_and_assistant_messages(1, f"q{i}", f"a{i}")
+
+            history = await manager.get_chat_history(1)
+
+        assert [m["content"] for m in history] == ["q3", "a3", "q4", "a4"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_are_not_lost(self, manager):
+        await asyncio.gather(
+            *[manager.append_message(1, "user", str(i)) for i in range(20)]
+        )
+
+        assert await manager.get_history_length(1) == 20
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob_is_migrated_on_read(self, manager, redis):
+        legacy = [{"role": "user", "content": "old"}]
+        redis.data["chat:history:1"] = orjson.dumps(legacy)
+
+        assert await manager.get_chat_history(1) == legacy
+        assert "chat:history:1" not in redis.data
+        assert await manager.get_chat_history(1) == legacy
+
+    @pytest.mark.asyncio
+    async def test_legacy_blob_is_kept_in_front_on_append(self, manager, redis):
+        redis.data["chat:history:1"] = orjson.dumps(
+            [
+                {"role": "user", "content": "old question"},
+                {"role": "assistant", "content": "old answer"},
+            ]
+        )
+
+        await manager.append_user_and_assistant_messages(
+            1, "new question", "new answer"
+        )
+
+        assert [m["content"] for m in await manager.get_chat_history(1)] == [
+            "old question",
+            "old answer",
+            "new question",
+            "new answer",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_history(self, manager, redis):
+        redis.data["chat:history:1"] = orjson.dumps([{"role": "user", "content": "x"}])
+        await manager.append_message(1, "user", "y")
+
+        await manager.save_chat_history(1, [{"role": "user", "content": "z"}])
+
+        assert await manager.get_chat_history(1) == [{"role": "user", "content": "z"}]
+        assert await manager.clear_history(1) is True
+        assert await manager.get_chat_history(1) == []
@@ -0,0 +1,229 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the incremental chat history loader
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+from app.chat_shell.history import loader
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.subtask_attachment import AttachmentStatus, SubtaskAttachment
+from app.services.chat.storage import db as storage_db
+
+TASK_ID = 42
+
+
+@pytest.fixture
+def db(test_db, monkeypatch):
+    @contextmanager
+    def _db_session():
+        yield test_db
+
+    monkeypatch.setattr(storage_db, "_db_session", _db_session)
+    loader.clear_history_cache()
+    yield test_db
+    loader.clear_history_cache()
+
+
+@pytest.fixture
+def statements(db):
+    """Collect SQL statements issued on the test connection"""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _add_turn(
+    db, user, message_id, prompt, answer, attachment_text=None, image_base64=None
+):
+    timestamp = datetime(2025, 1, 1) + timedelta(minutes=message_id)
+    user_subtask = Subtask(
+        user_id=user.id,
+        task_id=TASK_ID,
+        team_id=1,
+        title="t",
+        bot_ids=[],
+        role=SubtaskRole.USER,
+        prompt=prompt,
+        message_id=message_id,
+        status=SubtaskStatus.COMPLETED,
+        sender_user_id=user.id,
+        updated_at=timestamp,
+    )
+    assistant_subtask = Subtask(
+        user_id=user.id,
+        task_id=TASK_ID,
+        team_id=1,
+        title="t",
+        bot_ids=[],
+        role=SubtaskRole.ASSISTANT,
+        result={"value": answer},
+        message_id=message_id + 1,
+        status=SubtaskStatus.COMPLETED,
+        updated_at=timestamp,
+    )
+    db.add_all([user_subtask, assistant_subtask])
+    db.flush()
+    if attachment_text:
+        db.add(
+            SubtaskAttachment(
+                subtask_id=user_subtask.id,
+                user_id=user.id,
+                original_filename="doc.pdf",
+                file_extension=".pdf",
+                file_size=10,
+                mime_type="application/pdf",
+                binary_data=b"%PDF" * 1000,
+                extracted_text=attachment_text,
+                text_length=len(attachment_text),
+                status=AttachmentStatus.READY,
+            )
+        )
+    if image_base64:
+        db.add(
+            SubtaskAttachment(
+                subtask_id=user_subtask.id,
+                user_id=user.id,
+                original_filename="image.png",
+                file_extension=".png",
+                file_size=10,
+                mime_type="image/png",
+                binary_data=b"",
+                image_base64=image_base64,
+                status=AttachmentStatus.READY,
+            )
+        )
+    db.commit()
+    return user_subtask, assistant_subtask
+
+
+def _contents(history):
+    return [m["content"] for m in history]
+
+
+@pytest.mark.unit
+class TestHistoryLoader:
+    """Test batched attachment loading and incremental caching"""
+
+    def test_builds_history_with_attachments(self, db, test_user, statements):
+        _add_turn(db, test_user, 1, "q1", "a1", attachment_text="pdf one")
+        _add_turn(db, test_user, 3, "q2", "a2", attachment_text="pdf two")
+
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=True)
+
+        assert _contents(history) == [
+            "[File Content - doc.pdf]:\npdf one\n\nUser[testuser]: q1",
+            "a1",
+            "[File Content - doc.pdf]:\npdf two\n\nUser[testuser]: q2",
+            "a2",
+        ]
+        attachment_queries = [
+            s
+            for s in statements
+            if s.startswith("SELECT") and "subtask_attachments" in s
+        ]
+        assert len(attachment_queries) == 1
+        assert "binary_data" not in attachment_queries[0]
+
+    def test_only_new_turns_are_loaded(self, db, test_user, statements):
+        _add_turn(db, test_user, 1, "q1", "a1", attachment_text="pdf one")
+        loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        _add_turn(db, test_user, 3, "q2", "a2")
+        statements.clear()
+        with patch.object(
+            loader, "_build_history_message", wraps=loader._build_history_message
+        ) as build:
+            history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        assert _contents(history)[1:] == ["a1", "q2", "a2"]
+        assert history[0]["content"].endswith("q1")
+        # Only the new turn was loaded and built
+        assert [call.args[0].prompt for call in build.call_args_list] == ["q2", None]
+        assert not any(
+            s.startswith("SELECT") and "binary_data" in s for s in statements
+        )
+
+        # Nothing new: no subtask rows are built at all
+        with patch.object(loader, "_build_history_message") as build:
+            assert loader._load_history_from_db_sync(TASK_ID, False) == history
+        build.assert_not_called()
+
+    def test_exclude_after_message_id_uses_cache(self, db, test_user):
+        _add_turn(db, test_user, 1, "q1", "a1")
+        _add_turn(db, test_user, 3, "q2", "a2")
+        loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        history = loader._load_history_from_db_sync(
+            TASK_ID, is_group_chat=False, exclude_after_message_id=3
+        )
+
+        assert _contents(history) == ["q1", "a1"]
+
+    def test_changes_behind_watermark_rebuild_history(self, db, test_user):
+        _, answer = _add_turn(db, test_user, 1, "q1", "a1")
+        _add_turn(db, test_user, 3, "q2", "a2")
+        loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        answer.result = {"value": "edited"}
+        answer.updated_at = datetime(2025, 2, 1)
+        db.commit()
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+        assert _contents(history) == ["q1", "edited", "q2", "a2"]
+
+        answer.status = SubtaskStatus.DELETE
+        db.commit()
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+        assert _contents(history) == ["q1", "q2", "a2"]
+
+    def test_returned_messages_do_not_alias_cache(self, db, test_user):
+        _add_turn(db, test_user, 1, "q1", "a1")
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        history[0]["content"] = "changed"
+
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+        assert history[0]["content"] == "q1"
+
+    def test_nested_content_does_not_alias_cache(self, db, test_user):
+        _add_turn(db, test_user, 1, "q1", "a1", image_base64="aGVsbG8=")
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+
+        history[0]["content"][0]["text"] = "changed"
+        history[0]["content"].pop()
+
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+        assert history[0]["content"][0]["text"] == "q1"
+        assert history[0]["content"][1]["image_url"]["url"].endswith("aGVsbG8=")
+
+    def test_cache_is_bounded_by_size(self, db, test_user, monkeypatch):
+        monkeypatch.setattr(loader.settings, "CHAT_HISTORY_CACHE_MAX_BYTES", 1000)
+        _add_turn(db, test_user, 1, "q1", "a1", image_base64="x" * 600)
+        loader._load_history_from_db_sync(TASK_ID, is_group_chat=False)
+        loader._load_history_from_db_sync(TASK_ID, is_group_chat=True)
+
+        # Only the most recently used history fits
+        assert list(loader._history_cache) == [(TASK_ID, True)]
+        assert loader._history_cache_bytes < 1000
+
+        _add_turn(db, test_user, 3, "q2", "a2", image_base64="x" * 600)
+        history = loader._load_history_from_db_sync(TASK_ID, is_group_chat=True)
+
+        # A history larger than the cache is not kept
+        assert len(history) == 4
+        assert not loader._history_cache
+        assert loader._history_cache_bytes == 0
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the resolved CRD reference cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.models.user import User
+from app.schemas.kind import Ghost
+from app.services.chat.config.model_resolver import get_bot_system_prompt
+from app.services.crd_cache import crd_cache
+
+
+def _ghost_json(name: str, prompt: str) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": "Ghost",
+        "metadata": {"name": name, "namespace": "default"},
+        "spec": {"systemPrompt": prompt},
+    }
+
+
+def _bot_json(name: str, ghost_name: str) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": "Bot",
+        "metadata": {"name": name, "namespace": "default"},
+        "spec": {
+            "ghostRef": {"name": ghost_name, "namespace": "default"},
+            "shellRef": {"name": "ClaudeCode", "namespace": "default"},
+        },
+    }
+
+
+@pytest.mark.integration
+class TestCrdCache:
+    """Test cached validation and resolution of CRD references"""
+
+    @pytest.fixture(autouse=True)
+    def publish(self):
+        with patch.object(crd_cache, "publish_invalidation") as publish:
+            yield publish
+
+    def _add_kind(self, db: Session, user: User, kind: str, name: str, json: dict):
+        row = Kind(
+            user_id=user.id, kind=kind, name=name, namespace="default", json=json
+        )
+        db.add(row)
+        db.commit()
+        return row
+
+    def _count_queries(self, db: Session):
+        statements = []
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        return statements
+
+    def test_validated_object_is_reused_until_row_changes(self, test_db, test_user):
+        ghost = self._add_kind(
+            test_db, test_user, "Ghost", "g", _ghost_json("g", "first")
+        )
+
+        with patch.object(
+            Ghost, "model_validate", wraps=Ghost.model_validate
+        ) as validate:
+            crd = crd_cache.validate(ghost)
+            assert crd_cache.validate(ghost) is crd
+            assert validate.call_count == 1
+
+            # Unflushed changes are never served from the cache
+            ghost.json = _ghost_json("g", "second")
+            assert crd_cache.validate(ghost).spec.systemPrompt == "second"
+            test_db.commit()
+            assert crd_cache.validate(ghost).spec.systemPrompt == "second"
+            assert validate.call_count == 3
+
+    def test_find_caches_hits_and_misses(self, test_db, test_user):
+        self._add_kind(test_db, test_user, "Ghost", "g", _ghost_json("g", "hello"))
+        crd_cache.find(test_db, "Ghost", "g", namespace="default", user_id=test_user.id)
+        crd_cache.find(test_db, "Ghost", "missing", user_id=test_user.id)
+
+        statements = self._count_queries(test_db)
+        resolved = crd_cache.find(
+            test_db, "Ghost", "g", namespace="default", user_id=test_user.id
+        )
+        assert crd_cache.find(test_db, "Ghost", "missing", user_id=test_user.id) is None
+        assert statements == []
+        assert resolved.crd.spec.systemPrompt == "hello"
+        assert resolved.json["spec"] == {"systemPrompt": "hello"}
+
+    def test_committed_update_evicts_and_publishes(self, publish, test_db, test_user):
+        ghost = self._add_kind(
+            test_db, test_user, "Ghost", "g", _ghost_json("g", "old")
+        )
+        bot = self._add_kind(test_db, test_user, "Bot", "b", _bot_json("b", "g"))
+        publish.reset_mock()
+        assert get_bot_system_prompt(test_db, bot, test_user.id, "member") == (
+            "old\n\nmember"
+        )
+
+        ghost.json = _ghost_json("g", "new")
+        test_db.commit()
+        publish.assert_called_once_with({("Ghost", "g")})
+
+        assert get_bot_system_prompt(test_db, bot, test_user.id) == "new"
+
+    def test_rolled_back_changes_are_not_cached(self, test_db, test_user):
+        ghost = self._add_kind(
+            test_db, test_user, "Ghost", "g", _ghost_json("g", "committed")
+        )
+
+        ghost.json = _ghost_json("g", "uncommitted")
+        test_db.flush()
+        resolved = crd_cache.find(test_db, "Ghost", "g", user_id=test_user.id)
+        assert resolved.crd.spec.systemPrompt == "uncommitted"
+        test_db.rollback()
+
+        resolved = crd_cache.find(test_db, "Ghost", "g", user_id=test_user.id)
+        assert resolved.crd.spec.systemPrompt == "committed"
+
+    def test_published_invalidation_drops_entries(self, test_db, test_user):
+        ghost = self._add_kind(
+            test_db, test_user, "Ghost", "g", _ghost_json("g", "old")
+        )
+        crd_cache.find(test_db, "Ghost", "g", user_id=test_user.id)
+        # Simulate an update committed by another worker
+        test_db.execute(
+            Kind.__table__.update()
+            .where(Kind.id == ghost.id)
+            .values(json=_ghost_json("g", "new"))
+        )
+        test_db.commit()
+        test_db.expire_all()
+        resolved = crd_cache.find(test_db, "Ghost", "g", user_id=test_user.id)
+        assert resolved.crd.spec.systemPrompt == "old"
+
+        crd_cache.channel.handle(b'{"refs": [["Ghost", "g"]]}')
+        resolved = crd_cache.find(test_db, "Ghost", "g", user_id=test_user.id)
+        assert resolved.crd.spec.systemPrompt == "new"
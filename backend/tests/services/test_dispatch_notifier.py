@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for executor dispatch wake-up notifications
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+from app.models.user import User
+from app.services.dispatch_notifier import (
+    DispatchListener,
+    DispatchNotifier,
+    dispatch_notifier,
+)
+
+
+@pytest.mark.unit
+class TestDispatchListener:
+    """Test waiting for dispatch notifications"""
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_on_matching_task_type(self):
+        """Notifications for other task types are ignored"""
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(
+            side_effect=[
+                {"type": "message", "data": b"offline"},
+                None,
+                {"type": "message", "data": b"online"},
+            ]
+        )
+
+        assert await DispatchListener(pubsub, "online").wait(5) is True
+        assert pubsub.get_message.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out(self):
+        """Wait returns False once the timeout elapses without a notification"""
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(return_value=None)
+
+        assert await DispatchListener(pubsub, "online").wait(0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_wait_sleeps_when_subscription_fails(self):
+        """A broken subscription degrades to a plain wait instead of spinning"""
+        pubsub = MagicMock()
+        pubsub.get_message = AsyncMock(side_effect=ConnectionError("gone"))
+
+        started = time.monotonic()
+        assert await DispatchListener(pubsub, "online").wait(0.1) is False
+        assert time.monotonic() - started >= 0.1
+        assert pubsub.get_message.await_count == 1
+
+
+@pytest.mark.unit
+class TestDispatchNotifier:
+    """Test publishing dispatch notifications"""
+
+    def test_notify_publishes_task_type(self):
+        """The task type is published on the configured channel"""
+        notifier = DispatchNotifier("redis://localhost:6379/0", "dispatch")
+        notifier.publisher._client = MagicMock()
+
+        notifier.notify("offline")
+
+        assert notifier.publisher.flush(timeout=1)
+        notifier.publisher._client.publish.assert_called_once_with(
+            "dispatch", "offline"
+        )
+
+    def test_notify_swallows_redis_errors(self):
+        """Publishing failures never break task creation"""
+        notifier = DispatchNotifier("redis://localhost:6379/0", "dispatch")
+        notifier.publisher._client = MagicMock()
+        notifier.publisher._client.publish.side_effect = ConnectionError("down")
+
+        notifier.notify()
+        notifier.notify()
+
+        assert notifier.publisher.flush(timeout=1)
+        # Messages are dropped for a while after a failure
+        notifier.publisher._client.publish.assert_called_once()
+
+    def test_notify_does_not_wait_for_redis(self):
+        """A slow Redis does not block the committing thread"""
+        notifier = DispatchNotifier("redis://localhost:6379/0", "dispatch")
+        notifier.publisher._client = MagicMock()
+        notifier.publisher._client.publish.side_effect = lambda *args: time.sleep(0.5)
+
+        started = time.monotonic()
+        notifier.notify()
+        assert time.monotonic() - started < 0.1
+
+        assert notifier.publisher.flush(timeout=2)
+        notifier.publisher._client.publish.assert_called_once()
+
+
+@pytest.mark.integration
+class TestDispatchNotifyOnCommit:
+    """Test publishing when PENDING subtasks are committed"""
+
+    @pytest.fixture
+    def notify(self):
+        with patch.object(dispatch_notifier, "notify") as notify:
+            yield notify
+
+    def _create_task(
+        self, db: Session, user: User, name: str = "task", labels: dict = None
+    ):
+        task = TaskResource(
+            user_id=user.id,
+            kind="Task",
+            name=name,
+            namespace="default",
+            json={
+                "kind": "Task",
+                "metadata": {"name": name, "namespace": "default", "labels": labels},
+                "spec": {
+                    "title": name,
+                    "prompt": "hello",
+                    "teamRef": {"name": "team", "namespace": "default"},
+                    "workspaceRef": {"name": "ws", "namespace": "default"},
+                },
+                "status": {"status": "PENDING"},
+            },
+            is_active=True,
+        )
+        db.add(task)
+        db.flush()
+        return task
+
+    def _add_subtask(
+        self,
+        db: Session,
+        task: TaskResource,
+        role: SubtaskRole = SubtaskRole.ASSISTANT,
+        status: SubtaskStatus = SubtaskStatus.PENDING,
+    ) -> Subtask:
+        subtask = Subtask(
+            user_id=task.user_id,
+            task_id=task.id,
+            team_id=1,
+            title="subtask",
+            bot_ids=[1],
+            role=role,
+            status=status,
+            message_id=2,
+        )
+        db.add(subtask)
+        return subtask
+
+    def test_new_pending_subtask_notifies_after_commit(
+        self, notify, test_db: Session, test_user: User
+    ):
+        """The task type is published once the subtask is committed"""
+        task = self._create_task(test_db, test_user, labels={"type": "offline"})
+        self._add_subtask(test_db, task)
+        test_db.flush()
+        notify.assert_not_called()
+
+        test_db.commit()
+
+        notify.assert_called_once_with("offline")
+
+    def test_retried_subtask_notifies(self, notify, test_db: Session, test_user: User):
+        """Subtasks set back to PENDING wake the executor managers as well"""
+        task = self._create_task(test_db, test_user)
+        subtask = self._add_subtask(test_db, task, status=SubtaskStatus.FAILED)
+        test_db.commit()
+        notify.assert_not_called()
+
+        subtask.status = SubtaskStatus.PENDING
+        test_db.commit()
+
+        notify.assert_called_once_with("online")
+
+    def test_undispatchable_changes_do_not_notify(
+        self, notify, test_db: Session, test_user: User
+    ):
+        """User messages, chat_shell tasks and rolled back subtasks are skipped"""
+        task = self._create_task(test_db, test_user)
+        chat = self._create_task(
+            test_db, test_user, "chat", labels={"source": "chat_shell"}
+        )
+        self._add_subtask(test_db, task, role=SubtaskRole.USER)
+        self._add_subtask(test_db, chat)
+        test_db.commit()
+
+        self._add_subtask(test_db, task)
+        test_db.flush()
+        test_db.rollback()
+        test_db.commit()
+
+        notify.assert_not_called()
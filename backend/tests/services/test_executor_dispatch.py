@@ -0,0 +1,335 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Integration tests for set-based subtask dispatch in ExecutorKindsService
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+from app.models.user import User
+from app.services.adapters.executor_kinds import ExecutorKindsService
+from app.services.dispatch_notifier import dispatch_notifier
+
+
+def _task_json(name: str, status: str = "PENDING", labels: dict = None) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": "Task",
+        "metadata": {"name": name, "namespace": "default", "labels": labels},
+        "spec": {
+            "title": name,
+            "prompt": "hello",
+            "teamRef": {"name": "team", "namespace": "default"},
+            "workspaceRef": {"name": "ws", "namespace": "default"},
+        },
+        "status": {"status": status, "progress": 0},
+    }
+
+
+@pytest.mark.integration
+class TestExecutorDispatch:
+    """Test claiming subtasks for executor dispatch"""
+
+    @pytest.fixture
+    def service(self):
+        with patch.object(
+            ExecutorKindsService, "_emit_chat_start_ws_event"
+        ), patch.object(ExecutorKindsService, "_emit_task_status_ws_event"):
+            yield ExecutorKindsService(TaskResource)
+
+    def _create_task(
+        self,
+        db: Session,
+        user: User,
+        name: str,
+        status: str = "PENDING",
+        labels: dict = None,
+        age_minutes: int = 0,
+    ) -> TaskResource:
+        task = TaskResource(
+            user_id=user.id,
+            kind="Task",
+            name=name,
+            namespace="default",
+            json=_task_json(name, status, labels),
+            is_active=True,
+            created_at=datetime.now() - timedelta(minutes=age_minutes),
+        )
+        db.add(task)
+        db.flush()
+        return task
+
+    def _create_subtask(
+        self,
+        db: Session,
+        task: TaskResource,
+        message_id: int,
+        role: SubtaskRole = SubtaskRole.ASSISTANT,
+        status: SubtaskStatus = SubtaskStatus.PENDING,
+    ) -> Subtask:
+        subtask = Subtask(
+            user_id=task.user_id,
+            task_id=task.id,
+            team_id=1,
+            title=f"{task.name}-{message_id}",
+            bot_ids=[1],
+            role=role,
+            status=status,
+            message_id=message_id,
+        )
+        db.add(subtask)
+        db.flush()
+        return subtask
+
+    def test_claims_first_assistant_subtask_per_task(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Only the earliest pending assistant subtask of each task is claimed"""
+        older = self._create_task(test_db, test_user, "older", age_minutes=10)
+        newer = self._create_task(test_db, test_user, "newer")
+        self._create_subtask(test_db, older, 1, role=SubtaskRole.USER)
+        older_first = self._create_subtask(test_db, older, 2)
+        self._create_subtask(test_db, older, 4)
+        newer_first = self._create_subtask(test_db, newer, 2)
+        test_db.commit()
+
+        claimed = service._get_first_subtasks_for_tasks(
+            test_db, "PENDING", 10, "online"
+        )
+
+        # Newest task first, one subtask per task
+        assert [s.id for s in claimed] == [newer_first.id, older_first.id]
+
+    def test_filters_by_type_source_and_limit(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Offline, chat_shell and non-pending tasks are not dispatched as online"""
+        online = self._create_task(test_db, test_user, "online", age_minutes=5)
+        offline = self._create_task(
+            test_db, test_user, "offline", labels={"type": "offline"}
+        )
+        chat = self._create_task(
+            test_db, test_user, "chat", labels={"source": "chat_shell"}
+        )
+        running = self._create_task(test_db, test_user, "running", status="RUNNING")
+        online_subtask = self._create_subtask(test_db, online, 2)
+        offline_subtask = self._create_subtask(test_db, offline, 2)
+        self._create_subtask(test_db, chat, 2)
+        self._create_subtask(test_db, running, 2)
+        test_db.commit()
+
+        claimed_online = service._get_first_subtasks_for_tasks(
+            test_db, "PENDING", 10, "online"
+        )
+        claimed_offline = service._get_first_subtasks_for_tasks(
+            test_db, "PENDING", 1, "offline"
+        )
+
+        assert [s.id for s in claimed_online] == [online_subtask.id]
+        assert [s.id for s in claimed_offline] == [offline_subtask.id]
+
+    def test_claim_for_task_ids_skips_tasks_with_running_subtask(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Tasks with a running subtask are skipped and task_ids order is kept"""
+        first = self._create_task(test_db, test_user, "first", status="RUNNING")
+        second = self._create_task(test_db, test_user, "second")
+        busy = self._create_task(test_db, test_user, "busy", status="RUNNING")
+        first_subtask = self._create_subtask(test_db, first, 2)
+        second_subtask = self._create_subtask(test_db, second, 2)
+        self._create_subtask(test_db, busy, 2, status=SubtaskStatus.RUNNING)
+        self._create_subtask(test_db, busy, 4)
+        test_db.commit()
+
+        claimed = service._claim_subtasks_for_task_ids(
+            test_db, [second.id, busy.id, first.id], "PENDING"
+        )
+
+        assert [s.id for s in claimed] == [second_subtask.id, first_subtask.id]
+
+    def test_claim_for_task_ids_treats_missing_task_status_as_pending(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Tasks whose JSON has no status are claimed like PENDING ones"""
+        task = self._create_task(test_db, test_user, "unset")
+        task.json = {k: v for k, v in task.json.items() if k != "status"}
+        subtask = self._create_subtask(test_db, task, 2)
+        test_db.commit()
+        assert task.task_status is None
+
+        claimed = service._claim_subtasks_for_task_ids(test_db, [task.id], "PENDING")
+        updated = service._update_subtasks_to_running(test_db, claimed)
+
+        assert [s.id for s in claimed] == [subtask.id]
+        assert [s.id for s in updated] == [subtask.id]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("notified", [True, False])
+    async def test_long_poll_claims_again_after_wait(
+        self, service, test_db: Session, notified
+    ):
+        """Subtasks committed while waiting are claimed even without a notification"""
+        listener = MagicMock()
+        listener.wait = AsyncMock(return_value=notified)
+
+        @asynccontextmanager
+        async def listen(task_type):
+            yield listener
+
+        claimed = {"tasks": [{"subtask_id": 1}]}
+        with patch.object(dispatch_notifier, "listen", listen), patch.object(
+            service, "_dispatch_once", side_effect=[{"tasks": []}, claimed]
+        ) as dispatch_once:
+            result = await service.dispatch_tasks(test_db, wait=5)
+
+        assert result == claimed
+        assert dispatch_once.call_count == 2
+        listener.wait.assert_awaited_once_with(5)
+
+    def test_update_subtasks_to_running_marks_tasks_running(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Claimed subtasks and their pending tasks move to RUNNING"""
+        task = self._create_task(test_db, test_user, "task")
+        subtask = self._create_subtask(test_db, task, 2)
+        test_db.commit()
+
+        updated = service._update_subtasks_to_running(test_db, [subtask])
+        test_db.commit()
+
+        assert [s.id for s in updated] == [subtask.id]
+        test_db.refresh(subtask)
+        test_db.refresh(task)
+        assert subtask.status == SubtaskStatus.RUNNING
+        assert task.json["status"]["status"] == "RUNNING"
+        assert task.task_status == "RUNNING"
+
+    def test_update_subtasks_to_running_skips_rows_started_elsewhere(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Only subtasks the UPDATE actually changed are returned for dispatch"""
+        task = self._create_task(test_db, test_user, "task")
+        other_task = self._create_task(test_db, test_user, "other")
+        subtask = self._create_subtask(test_db, task, 2)
+        taken = self._create_subtask(test_db, other_task, 2)
+        test_db.commit()
+
+        # Another worker started this subtask after it was loaded here
+        test_db.execute(
+            update(Subtask)
+            .where(Subtask.id == taken.id)
+            .values(status=SubtaskStatus.RUNNING)
+            .execution_options(synchronize_session=False)
+        )
+
+        updated = service._update_subtasks_to_running(test_db, [subtask, taken])
+
+        assert [s.id for s in updated] == [subtask.id]
+
+    def _create_kind(
+        self, db: Session, kind: str, name: str, spec: dict, user_id: int
+    ) -> Kind:
+        row = Kind(
+            user_id=user_id,
+            kind=kind,
+            name=name,
+            namespace="default",
+            json={
+                "apiVersion": "agent.wecode.io/v1",
+                "kind": kind,
+                "metadata": {"name": name, "namespace": "default"},
+                "spec": spec,
+            },
+            is_active=True,
+        )
+        db.add(row)
+        db.flush()
+        return row
+
+    def test_format_batch_uses_constant_queries(
+        self, service, test_db: Session, test_user: User
+    ):
+        """Formatting a dispatch batch preloads everything in a fixed number of queries"""
+        self._create_kind(
+            test_db, "Ghost", "ghost", {"systemPrompt": "be helpful"}, test_user.id
+        )
+        # Public shell is used when the user has no shell of that name
+        self._create_kind(
+            test_db,
+            "Shell",
+            "ClaudeCode",
+            {"shellType": "ClaudeCode", "baseImage": "public/image"},
+            0,
+        )
+        self._create_kind(
+            test_db,
+            "Model",
+            "model",
+            {"modelConfig": {"env": {"model": "m"}}},
+            test_user.id,
+        )
+        bot = self._create_kind(
+            test_db,
+            "Bot",
+            "bot",
+            {
+                "ghostRef": {"name": "ghost"},
+                "shellRef": {"name": "ClaudeCode"},
+                "modelRef": {"name": "model"},
+            },
+            test_user.id,
+        )
+        team = self._create_kind(
+            test_db,
+            "Team",
+            "team",
+            {
+                "members": [{"botRef": {"name": "bot"}, "prompt": "member prompt"}],
+                "collaborationModel": "route",
+            },
+            test_user.id,
+        )
+
+        subtasks = []
+        for i in range(5):
+            task = self._create_task(test_db, test_user, f"task-{i}")
+            user_subtask = self._create_subtask(
+                test_db, task, 1, role=SubtaskRole.USER
+            )
+            user_subtask.prompt = f"prompt-{i}"
+            subtask = self._create_subtask(test_db, task, 2)
+            subtask.team_id = team.id
+            subtask.bot_ids = [bot.id]
+            subtasks.append(subtask)
+        test_db.commit()
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = test_db.get_bind()
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            result = service._format_subtasks_response(test_db, subtasks)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        assert len(result["tasks"]) == 5
+        assert len(statements) <= 9
+        first = result["tasks"][0]
+        assert first["prompt"] == "prompt-0"
+        assert first["bot"][0]["system_prompt"] == "be helpful\nmember prompt"
+        assert first["bot"][0]["shell_type"] == "ClaudeCode"
+        assert first["bot"][0]["base_image"] == "public/image"
+        assert first["bot"][0]["agent_config"] == {"env": {"model": "m"}}
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Integration tests for applying executor result deltas in update_subtask
+"""
+
+from unittest.mock import patch
+
+import pytest
+from shared.utils.result_delta import ResultDeltaEncoder
+from sqlalchemy.orm import Session
+
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+from app.models.user import User
+from app.schemas.subtask import SubtaskExecutorUpdate
+from app.services.adapters.executor_kinds import ExecutorKindsService
+
+
+@pytest.mark.integration
+class TestExecutorResultDelta:
+    """Test updating subtask results from deltas"""
+
+    @pytest.fixture
+    def service(self):
+        with (
+            patch.object(ExecutorKindsService, "_emit_chat_chunk_ws_event") as emit,
+            patch.object(ExecutorKindsService, "_update_task_status_based_on_subtasks"),
+        ):
+            service = ExecutorKindsService(TaskResource)
+            service.emit_chunk = emit
+            yield service
+
+    @pytest.fixture
+    def subtask(self, test_db: Session, test_user: User) -> Subtask:
+        subtask = Subtask(
+            user_id=test_user.id,
+            task_id=1,
+            team_id=1,
+            title="subtask",
+            bot_ids=[1],
+            role=SubtaskRole.ASSISTANT,
+            status=SubtaskStatus.RUNNING,
+            message_id=2,
+        )
+        test_db.add(subtask)
+        test_db.commit()
+        return subtask
+
+    async def _send(self, service, db, subtask, encoder, result) -> dict:
+        seq, delta = encoder.encode(subtask.id, result)
+        update = {"subtask_id": subtask.id, "status": "RUNNING", "progress": 50}
+        if delta is None:
+            update.update(result=result, result_seq=seq)
+        else:
+            update.update(result_delta=delta)
+        return await service.update_subtask(
+            db, subtask_update=SubtaskExecutorUpdate(**update)
+        )
+
+    async def test_deltas_rebuild_the_result(self, service, test_db, subtask):
+        encoder = ResultDeltaEncoder()
+        first = {"value": "Hello", "thinking": [{"title": "plan"}]}
+        second = {
+            "value": "Hello world",
+            "thinking": [{"title": "plan"}, {"title": "edit"}],
+            "workbench": {"file_changes": [{"new_path": "a.py"}]},
+        }
+
+        await self._send(service, test_db, subtask, encoder, first)
+        response = await self._send(service, test_db, subtask, encoder, second)
+
+        assert "resync" not in response
+        test_db.expire_all()
+        stored = test_db.get(Subtask, subtask.id)
+        assert stored.result == second
+        assert stored.result_seq == 2
+        # The frontend still gets the text appended and the full result
+        chunk = service.emit_chunk.call_args.kwargs
+        assert chunk["content"] == " world"
+        assert chunk["offset"] == len("Hello")
+        assert chunk["result"] == second
+
+    async def test_gap_asks_for_full_result(self, service, test_db, subtask):
+        encoder = ResultDeltaEncoder()
+        await self._send(service, test_db, subtask, encoder, {"value": "a"})
+        # Lost on the way
+        encoder.encode(subtask.id, {"value": "ab"})
+
+        response = await self._send(
+            service, test_db, subtask, encoder, {"value": "abc"}
+        )
+
+        assert response["resync"] is True
+        test_db.expire_all()
+        stored = test_db.get(Subtask, subtask.id)
+        assert stored.result == {"value": "a"}
+        assert stored.result_seq == 1
+        assert stored.progress == 50
+
+        encoder.reset(subtask.id)
+        response = await self._send(
+            service, test_db, subtask, encoder, {"value": "abc"}
+        )
+        assert "resync" not in response
+        test_db.expire_all()
+        assert test_db.get(Subtask, subtask.id).result == {"value": "abc"}
+
+    async def test_out_of_order_full_result_is_ignored(self, service, test_db, subtask):
+        encoder = ResultDeltaEncoder()
+        await self._send(service, test_db, subtask, encoder, {"value": "a"})
+        await self._send(service, test_db, subtask, encoder, {"value": "ab"})
+        service.emit_chunk.reset_mock()
+
+        # The first full result arrives again late over the other path
+        response = await service.update_subtask(
+            test_db,
+            subtask_update=SubtaskExecutorUpdate(
+                subtask_id=subtask.id,
+                status="RUNNING",
+                progress=60,
+                result={"value": "a"},
+                result_seq=1,
+            ),
+        )
+
+        assert "resync" not in response
+        test_db.expire_all()
+        stored = test_db.get(Subtask, subtask.id)
+        assert stored.result == {"value": "ab"}
+        assert stored.result_seq == 2
+        assert stored.progress == 60
+        service.emit_chunk.assert_not_called()
+
+    async def test_unsequenced_full_result_resyncs_next_delta(
+        self, service, test_db, subtask
+    ):
+        encoder = ResultDeltaEncoder()
+        await self._send(service, test_db, subtask, encoder, {"value": "a"})
+
+        await service.update_subtask(
+            test_db,
+            subtask_update=SubtaskExecutorUpdate(
+                subtask_id=subtask.id,
+                status="RUNNING",
+                progress=50,
+                result={"value": "from elsewhere"},
+            ),
+        )
+        test_db.expire_all()
+        stored = test_db.get(Subtask, subtask.id)
+        assert stored.result == {"value": "from elsewhere"}
+        assert stored.result_seq == 0
+
+        response = await self._send(service, test_db, subtask, encoder, {"value": "ab"})
+        assert response["resync"] is True
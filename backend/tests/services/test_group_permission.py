@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for cached group permission resolution
+"""
+
+from unittest.mock import patch
+
+import orjson
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.namespace import Namespace
+from app.models.namespace_member import NamespaceMember
+from app.models.user import User
+from app.schemas.namespace import GroupRole
+from app.services.group_permission import (
+    check_group_permission,
+    get_effective_role_in_group,
+    get_user_groups,
+    group_permission_cache,
+)
+
+
+@pytest.mark.integration
+class TestGroupPermissionCache:
+    """Test the group hierarchy trie and membership cache"""
+
+    @pytest.fixture(autouse=True)
+    def publish(self):
+        with patch.object(group_permission_cache, "publish_invalidation") as publish:
+            yield publish
+
+    def _create_groups(self, db: Session, user: User, *names: str) -> None:
+        db.add_all(
+            Namespace(name=name, owner_user_id=user.id, is_active=name != "a/off")
+            for name in names
+        )
+        db.commit()
+
+    def _add_member(
+        self, db: Session, user: User, group_name: str, role: GroupRole
+    ) -> NamespaceMember:
+        member = NamespaceMember(group_name=group_name, user_id=user.id, role=role)
+        db.add(member)
+        db.commit()
+        return member
+
+    def _count_queries(self, db: Session):
+        statements = []
+        event.listen(
+            db.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        return statements
+
+    def test_subgroups_and_inherited_roles(self, test_db, test_user):
+        self._create_groups(test_db, test_user, "a", "a/b", "a/b/c", "a/off", "ab")
+        self._add_member(test_db, test_user, "a", GroupRole.Developer)
+        self._add_member(test_db, test_user, "a/b", GroupRole.Maintainer)
+
+        assert get_user_groups(test_db, test_user.id) == ["a", "a/b", "a/b/c"]
+        assert (
+            get_effective_role_in_group(test_db, test_user.id, "a/b/c")
+            == GroupRole.Maintainer
+        )
+        assert (
+            get_effective_role_in_group(test_db, test_user.id, "a/x")
+            == GroupRole.Developer
+        )
+        assert get_effective_role_in_group(test_db, test_user.id, "ab") is None
+        # Group permission checks only consider direct membership
+        assert check_group_permission(test_db, test_user.id, "a/b", GroupRole.Developer)
+        assert not check_group_permission(
+            test_db, test_user.id, "a/b/c", GroupRole.Reporter
+        )
+
+    def test_repeated_checks_are_served_from_cache(self, test_db, test_user):
+        self._create_groups(test_db, test_user, "a", "a/b")
+        self._add_member(test_db, test_user, "a", GroupRole.Owner)
+        get_user_groups(test_db, test_user.id)
+
+        statements = self._count_queries(test_db)
+        for _ in range(3):
+            assert get_user_groups(test_db, test_user.id) == ["a", "a/b"]
+            assert check_group_permission(
+                test_db, test_user.id, "a", GroupRole.Maintainer
+            )
+        assert statements == []
+
+    def test_committed_changes_invalidate_and_publish(
+        self, publish, test_db, test_user
+    ):
+        self._create_groups(test_db, test_user, "a")
+        publish.assert_called_once_with(set(), True)
+        assert get_user_groups(test_db, test_user.id) == []
+
+        member = self._add_member(test_db, test_user, "a", GroupRole.Reporter)
+        publish.assert_called_with({test_user.id}, False)
+        assert get_user_groups(test_db, test_user.id) == ["a"]
+
+        member.role = GroupRole.Owner
+        test_db.commit()
+        assert check_group_permission(test_db, test_user.id, "a", GroupRole.Owner)
+
+        self._create_groups(test_db, test_user, "a/new")
+        assert get_user_groups(test_db, test_user.id) == ["a", "a/new"]
+
+    def test_rolled_back_changes_are_not_cached(self, publish, test_db, test_user):
+        self._create_groups(test_db, test_user, "a")
+        publish.reset_mock()
+
+        test_db.add(NamespaceMember(group_name="a", user_id=test_user.id, role="Owner"))
+        test_db.flush()
+        assert get_user_groups(test_db, test_user.id) == ["a"]
+        test_db.rollback()
+
+        assert get_user_groups(test_db, test_user.id) == []
+        publish.assert_not_called()
+
+    def test_published_invalidation_drops_entries(self, test_db, test_user):
+        self._create_groups(test_db, test_user, "a")
+        assert get_user_groups(test_db, test_user.id) == []
+        # Simulate a change committed by another worker
+        test_db.execute(
+            NamespaceMember.__table__.insert().values(
+                group_name="a", user_id=test_user.id, role="Owner", is_active=True
+            )
+        )
+        assert get_user_groups(test_db, test_user.id) == []
+
+        group_permission_cache.channel.handle(
+            orjson.dumps({"user_ids": [test_user.id], "groups": False})
+        )
+        assert get_user_groups(test_db, test_user.id) == ["a"]
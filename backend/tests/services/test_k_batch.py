@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for transactional batch apply
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models.kind import Kind
+from app.services.crd_cache import crd_cache
+from app.services.k_batch import BatchService
+
+
+def _resource(kind: str, name: str, spec: dict) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": kind,
+        "metadata": {"name": name, "namespace": "default"},
+        "spec": spec,
+    }
+
+
+def _ghost(name: str, prompt: str = "prompt") -> dict:
+    return _resource("Ghost", name, {"systemPrompt": prompt})
+
+
+def _shell(name: str) -> dict:
+    return _resource("Shell", name, {"shellType": "ClaudeCode"})
+
+
+def _bot(name: str, ghost: str, shell: str) -> dict:
+    return _resource(
+        "Bot",
+        name,
+        {
+            "ghostRef": {"name": ghost, "namespace": "default"},
+            "shellRef": {"name": shell, "namespace": "default"},
+        },
+    )
+
+
+def _team(name: str, *bots: str) -> dict:
+    return _resource(
+        "Team",
+        name,
+        {
+            "members": [
+                {"botRef": {"name": bot, "namespace": "default"}, "role": "leader"}
+                for bot in bots
+            ],
+            "collaborationModel": "pipeline",
+        },
+    )
+
+
+@pytest.mark.integration
+class TestBatchApply:
+    """Test validating and upserting a batch in one transaction"""
+
+    @pytest.fixture
+    def service(self, test_db):
+        with (
+            patch.object(
+                BatchService,
+                "get_db",
+                lambda self: Session(bind=test_db.get_bind()),
+            ),
+            patch.object(crd_cache, "publish_invalidation"),
+        ):
+            yield BatchService()
+
+    def _rows(self, db: Session):
+        db.expire_all()
+        return {
+            (row.kind, row.name): row.json
+            for row in db.query(Kind).filter(Kind.is_active == True)
+        }
+
+    def test_references_resolve_within_batch(self, service, test_db, test_user):
+        resources = [
+            _team("team", "bot"),
+            _bot("bot", "ghost", "shell"),
+            _ghost("ghost"),
+            _shell("shell"),
+        ]
+        statements = []
+        event.listen(
+            test_db.get_bind(),
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        results = service.apply_resources(test_user.id, resources)
+
+        assert [(r["kind"], r["operation"]) for r in results] == [
+            ("Team", "created"),
+            ("Bot", "created"),
+            ("Ghost", "created"),
+            ("Shell", "created"),
+        ]
+        assert set(self._rows(test_db)) == {
+            ("Team", "team"),
+            ("Bot", "bot"),
+            ("Ghost", "ghost"),
+            ("Shell", "shell"),
+        }
+        # One prefetch query per kind and a single INSERT
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 1
+        assert len(statements) <= 6
+
+    def test_existing_rows_are_updated_and_evicted(self, service, test_db, test_user):
+        service.apply_resources(test_user.id, [_ghost("ghost", "old")])
+        assert (
+            crd_cache.find(
+                test_db, "Ghost", "ghost", user_id=test_user.id
+            ).crd.spec.systemPrompt
+            == "old"
+        )
+
+        [result] = service.apply_resources(test_user.id, [_ghost("ghost", "new")])
+
+        assert result["operation"] == "updated"
+        assert test_db.query(Kind).filter(Kind.kind == "Ghost").count() == 1
+        test_db.expire_all()
+        assert (
+            crd_cache.find(
+                test_db, "Ghost", "ghost", user_id=test_user.id
+            ).crd.spec.systemPrompt
+            == "new"
+        )
+
+    def test_failed_references_only_fail_dependent_items(
+        self, service, test_db, test_user
+    ):
+        results = service.apply_resources(
+            test_user.id,
+            [_ghost("ghost"), _bot("bot", "ghost", "missing"), _team("team", "bot")],
+        )
+
+        assert [r["success"] for r in results] == [True, False, False]
+        assert "Shell 'missing' not found" in results[1]["error"]
+        assert "Bot 'bot' not found" in results[2]["error"]
+        assert set(self._rows(test_db)) == {("Ghost", "ghost")}
+
+    def test_atomic_apply_writes_nothing_on_failure(self, service, test_db, test_user):
+        results = service.apply_resources(
+            test_user.id,
+            [_ghost("ghost"), _shell("shell"), _bot("bot", "missing", "shell")],
+            atomic=True,
+        )
+
+        assert not any(r["success"] for r in results)
+        assert "Ghost 'missing' not found" in results[2]["error"]
+        assert "Not applied" in results[0]["error"]
+        assert self._rows(test_db) == {}
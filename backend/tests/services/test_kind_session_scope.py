@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for sharing a session across Kind service operations
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.db.session import count_pool_checkouts
+from app.models.subtask import Subtask, SubtaskRole, SubtaskStatus
+from app.models.task import TaskResource
+from app.services.crd_cache import crd_cache
+from app.services.kind import kind_service
+from app.services.kind_base import KindBaseService
+
+
+def _ghost(name: str, prompt: str) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": "Ghost",
+        "metadata": {"name": name, "namespace": "default"},
+        "spec": {"systemPrompt": prompt},
+    }
+
+
+@pytest.mark.integration
+class TestKindSessionScope:
+    """Test Kind service operations running in the caller's session"""
+
+    @pytest.fixture(autouse=True)
+    def no_own_sessions(self):
+        with (
+            patch.object(
+                KindBaseService, "get_db", side_effect=AssertionError("new session")
+            ),
+            patch.object(crd_cache, "publish_invalidation"),
+        ):
+            yield
+
+    def test_operations_use_the_given_session(self, test_db, test_user):
+        kind_service.create_resource(
+            test_user.id, "Ghost", _ghost("g", "a"), db=test_db
+        )
+        kind_service.update_resource(
+            test_user.id, "Ghost", "default", "g", _ghost("g", "b"), db=test_db
+        )
+
+        resource = kind_service.get_resource(
+            test_user.id, "Ghost", "default", "g", db=test_db
+        )
+        assert resource.json["spec"]["systemPrompt"] == "b"
+        assert [
+            r.name
+            for r in kind_service.list_resources(
+                test_user.id, "Ghost", "default", db=test_db
+            )
+        ] == ["g"]
+        assert kind_service.delete_resource(
+            test_user.id, "Ghost", "default", "g", db=test_db
+        )
+
+    def test_task_is_formatted_with_the_given_session(self, test_db, test_user):
+        task = TaskResource(
+            user_id=test_user.id,
+            kind="Task",
+            name="t",
+            namespace="default",
+            json={
+                "kind": "Task",
+                "metadata": {"name": "t", "namespace": "default"},
+                "spec": {},
+                "status": {"status": "RUNNING"},
+            },
+            is_active=True,
+        )
+        test_db.add(task)
+        test_db.flush()
+        test_db.add(
+            Subtask(
+                user_id=test_user.id,
+                task_id=task.id,
+                team_id=1,
+                title="s",
+                bot_ids=[],
+                role=SubtaskRole.ASSISTANT,
+                message_id=1,
+                status=SubtaskStatus.RUNNING,
+            )
+        )
+        test_db.commit()
+
+        formatted = kind_service._format_resource("Task", task, db=test_db)
+
+        assert [s["title"] for s in formatted["status"]["subTasks"]] == ["s"]
+
+    def test_nested_operations_record_one_metric(self, test_db):
+        with patch(
+            "shared.telemetry.metrics.record_db_pool_checkouts"
+        ) as record_checkouts:
+            with count_pool_checkouts("outer") as counter:
+                test_db.get_bind().connect().close()
+                with count_pool_checkouts("inner") as inner:
+                    test_db.get_bind().connect().close()
+                assert inner is counter
+
+        assert counter == [2]
+        record_checkouts.assert_called_once_with("outer", 2)
@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for StreamingCore content buffering and incremental persistence
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.streaming import core as core_module
+from app.services.streaming.core import StreamingConfig, StreamingCore, StreamingState
+from app.services.streaming.emitters import StreamEmitter
+
+
+class NullEmitter(StreamEmitter):
+    """Emitter that drops all events"""
+
+    async def emit_start(self, *args, **kwargs) -> None:
+        pass
+
+    async def emit_chunk(self, *args, **kwargs) -> None:
+        pass
+
+    async def emit_done(self, *args, **kwargs) -> None:
+        pass
+
+    async def emit_error(self, *args, **kwargs) -> None:
+        pass
+
+    async def emit_cancelled(self, *args, **kwargs) -> None:
+        pass
+
+
+class RecordingEmitter(NullEmitter):
+    """Emitter recording chunk and done events"""
+
+    def __init__(self):
+        self.events: list[tuple] = []
+
+    async def emit_chunk(self, content, offset, subtask_id, result=None) -> None:
+        self.events.append(("chunk", content, offset))
+
+    async def emit_done(self, task_id, subtask_id, offset, result, **kwargs) -> None:
+        self.events.append(("done", result["value"], offset))
+
+
+class FakeStorage:
+    """Storage handler keeping the streaming cache like Redis SET/APPEND"""
+
+    def __init__(self, supports_append: bool = True):
+        self.cache: dict[int, bytes] = {}
+        self.redis_bytes_written = 0
+        self.full_saves = 0
+        self.db_checkpoints: list[dict] = []
+        self.db_bytes_written = 0
+        if not supports_append:
+            self.append_streaming_content = None
+
+    async def save_streaming_content(self, subtask_id: int, content: str) -> bool:
+        data = content.encode("utf-8")
+        self.cache[subtask_id] = data
+        self.redis_bytes_written += len(data)
+        self.full_saves += 1
+        return True
+
+    async def append_streaming_content(self, subtask_id: int, delta: str) -> int:
+        data = delta.encode("utf-8")
+        self.cache[subtask_id] = self.cache.get(subtask_id, b"") + data
+        self.redis_bytes_written += len(data)
+        return len(self.cache[subtask_id])
+
+    async def update_subtask_status(self, subtask_id, status, result=None, error=None):
+        if status == "RUNNING" and result is not None:
+            self.db_checkpoints.append(result)
+            self.db_bytes_written += len(result["value"])
+
+    async def publish_streaming_done(self, subtask_id, result) -> None:
+        pass
+
+    async def get_subtask_message_id(self, subtask_id) -> int:
+        return 1
+
+
+class FakeClock:
+    """Stands in for the asyncio module to control the loop clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    def get_event_loop(self):
+        return self
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(core_module, "asyncio", fake):
+        yield fake
+
+
+def _make_core(storage, **config) -> StreamingCore:
+    state = StreamingState(task_id=1, subtask_id=2, user_id=3)
+    defaults = {
+        "redis_save_interval": 1.0,
+        "db_save_interval": 5.0,
+        "db_checkpoint_scale_chars": 20000,
+        "db_save_max_interval": 30.0,
+    }
+    defaults.update(config)
+    return StreamingCore(
+        NullEmitter(), state, StreamingConfig(**defaults), storage_handler=storage
+    )
+
+
+async def _stream(core, clock, tokens, seconds_per_token=0.02):
+    for token in tokens:
+        clock.now += seconds_per_token
+        assert await core.process_token(token)
+
+
+@pytest.mark.unit
+class TestStreamingState:
+    """Test the chunked content buffer"""
+
+    def test_full_response_joins_chunks(self):
+        state = StreamingState(task_id=1, subtask_id=2, user_id=3)
+        for token in ["Hello", ", ", "world"]:
+            state.append_content(token)
+
+        assert state.full_response == "Hello, world"
+        assert state.offset == len("Hello, world")
+
+        state.append_content("!")
+        assert state.full_response == "Hello, world!"
+
+    def test_take_unsaved_content_returns_delta(self):
+        state = StreamingState(task_id=1, subtask_id=2, user_id=3)
+        state.append_content("a")
+        state.append_content("b")
+
+        assert state.take_unsaved_content() == "ab"
+        assert state.take_unsaved_content() == ""
+
+        state.append_content("c")
+        assert state.take_unsaved_content() == "c"
+        assert state.full_response == "abc"
+
+
+@pytest.mark.unit
+class TestStreamingCorePersistence:
+    """Test Redis delta saves and DB checkpoints"""
+
+    @pytest.mark.asyncio
+    async def test_redis_receives_only_new_content(self, clock):
+        """After the first full save only deltas are appended"""
+        storage = FakeStorage()
+        core = _make_core(storage)
+        tokens = [f"tok{i} " for i in range(500)]
+
+        await _stream(core, clock, tokens)
+        await core.finalize()
+
+        expected = "".join(tokens)
+        assert storage.cache[2].decode() == expected
+        assert storage.full_saves == 1
+        assert storage.redis_bytes_written == len(expected)
+
+    @pytest.mark.asyncio
+    async def test_multibyte_content_is_appended(self, clock):
+        """Byte lengths are tracked so non-ASCII content stays in sync"""
+        storage = FakeStorage()
+        core = _make_core(storage)
+
+        await _stream(core, clock, ["你好", "，", "世界"] * 100, seconds_per_token=1.0)
+        await core.finalize()
+
+        assert storage.cache[2].decode() == "你好，世界" * 100
+        assert storage.full_saves == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_is_rewritten(self, clock):
+        """A length mismatch after APPEND triggers a full rewrite"""
+        storage = FakeStorage()
+        core = _make_core(storage)
+
+        await _stream(core, clock, ["a" * 10] * 5, seconds_per_token=1.0)
+        del storage.cache[2]  # Key expired
+        await _stream(core, clock, ["b" * 10] * 5, seconds_per_token=1.0)
+
+        assert storage.cache[2].decode() == "a" * 50 + "b" * 50
+        assert storage.full_saves == 2
+
+    @pytest.mark.asyncio
+    async def test_handler_without_append_saves_full_content(self, clock):
+        """Storage handlers without append_streaming_content get full saves"""
+        storage = FakeStorage(supports_append=False)
+        core = _make_core(storage)
+
+        await _stream(core, clock, ["x"] * 5, seconds_per_token=1.0)
+
+        assert storage.cache[2] == b"xxxxx"
+        assert storage.full_saves == 5
+
+    @pytest.mark.asyncio
+    async def test_db_checkpoint_skipped_without_progress(self, clock):
+        """No checkpoint is written when nothing changed since the last one"""
+        storage = FakeStorage()
+        core = _make_core(storage)
+
+        await _stream(core, clock, ["a"])
+        clock.now += 10
+        await core._periodic_save()
+        assert len(storage.db_checkpoints) == 1
+
+        core.state.add_thinking_step({"title": "tool"})
+        await core._periodic_save()
+        assert len(storage.db_checkpoints) == 2
+        assert storage.db_checkpoints[-1]["streaming"] is True
+
+    def test_db_save_interval_grows_with_response(self):
+        core = _make_core(FakeStorage())
+
+        assert core._db_save_interval() == 5.0
+        core.state.offset = 20000
+        assert core._db_save_interval() == 10.0
+        core.state.offset = 10_000_000
+        assert core._db_save_interval() == 30.0
+
+
+@pytest.mark.unit
+class TestChunkCoalescing:
+    """Test coalescing tokens into chunk events"""
+
+    def _make_core(self, **config) -> tuple[StreamingCore, RecordingEmitter]:
+        config = {"chunk_flush_interval": 0.04, **config}
+        core = _make_core(FakeStorage(), **config)
+        core.emitter = emitter = RecordingEmitter()
+        return core, emitter
+
+    @pytest.mark.asyncio
+    async def test_fast_tokens_are_coalesced_with_offsets(self, clock):
+        core, emitter = self._make_core(chunk_flush_chars=1000)
+
+        await _stream(core, clock, ["a", "bc", "d", "ef", "g"], seconds_per_token=0.015)
+        await core.finalize()
+
+        chunks = [event for event in emitter.events if event[0] == "chunk"]
+        # The first token is emitted right away, the others once per window
+        assert chunks == [("chunk", "a", 0), ("chunk", "bcdef", 1), ("chunk", "g", 6)]
+        assert emitter.events[-1] == ("done", "abcdefg", 7)
+        assert (core._token_count, core._chunk_count) == (5, 3)
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_flushed_at_size_limit(self, clock):
+        core, emitter = self._make_core(chunk_flush_chars=4)
+
+        await _stream(core, clock, ["a", "bb", "cc", "d"], seconds_per_token=0.0)
+
+        assert emitter.events == [("chunk", "a", 0), ("chunk", "bbcc", 1)]
+
+    @pytest.mark.asyncio
+    async def test_buffered_tokens_are_flushed_after_window(self):
+        core, emitter = self._make_core(chunk_flush_interval=0.01)
+
+        assert await core.process_token("a")
+        assert await core.process_token("b")
+        assert emitter.events == [("chunk", "a", 0)]
+
+        await asyncio.sleep(0.05)
+        assert emitter.events == [("chunk", "a", 0), ("chunk", "b", 1)]
+        assert core._chunk_flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_emits_every_token(self, clock):
+        core, emitter = self._make_core()
+        core.config.chunk_flush_interval = 0
+
+        await _stream(core, clock, ["a", "b"], seconds_per_token=0.0)
+
+        assert emitter.events == [("chunk", "a", 0), ("chunk", "b", 1)]
+
+
+@pytest.mark.slow
+class TestStreamingPersistenceBenchmark:
+    """Microbenchmark: persistence volume and time for long streams"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("token_count", [10_000, 100_000])
+    async def test_long_stream(self, clock, token_count):
+        tokens = [f"w{i % 97:02d} " for i in range(token_count)]
+        expected_bytes = len("".join(tokens))
+
+        results = {}
+        for name, storage, config in [
+            # Previous behaviour: full Redis rewrite and fixed DB interval
+            ("full", FakeStorage(supports_append=False), {"db_save_max_interval": 5.0}),
+            ("delta", FakeStorage(), {}),
+        ]:
+            core = _make_core(storage, **config)
+            started = time.perf_counter()
+            await _stream(core, clock, tokens)
+            result = await core.finalize()
+            elapsed = time.perf_counter() - started
+
+            assert len(result["value"]) == expected_bytes
+            assert storage.cache[2].decode() == result["value"]
+            results[name] = (storage, elapsed)
+            print(
+                f"\n{name:>5} tokens={token_count} time={elapsed:.3f}s "
+                f"redis_bytes={storage.redis_bytes_written} "
+                f"db_bytes={storage.db_bytes_written} "
+                f"checkpoints={len(storage.db_checkpoints)}"
+            )
+
+        full, delta = results["full"][0], results["delta"][0]
+        # Redis volume is linear in the response size
+        assert delta.redis_bytes_written == expected_bytes
+        assert full.redis_bytes_written > 10 * expected_bytes
+        assert delta.db_bytes_written <= full.db_bytes_written
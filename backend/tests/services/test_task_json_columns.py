@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for queries served by generated columns over task JSON paths
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.models.kind import Kind
+from app.models.task import TaskResource
+from app.models.user import User
+from app.services.adapters.bot_kinds import BotKindsService
+from app.services.adapters.task_kinds import TaskKindsService
+from app.services.adapters.team_kinds import TeamKindsService
+
+
+def _create_task(
+    db: Session,
+    user: User,
+    name: str,
+    status: str,
+    team: str = "team",
+    namespace: str = "default",
+    minutes: int = 0,
+) -> TaskResource:
+    task = TaskResource(
+        user_id=user.id,
+        kind="Task",
+        name=name,
+        namespace="default",
+        json={
+            "apiVersion": "agent.wecode.io/v1",
+            "kind": "Task",
+            "metadata": {"name": name, "namespace": "default"},
+            "spec": {
+                "title": name,
+                "prompt": "hello",
+                "teamRef": {"name": team, "namespace": namespace},
+                "workspaceRef": {"name": "ws", "namespace": "default"},
+            },
+            "status": {"status": status, "progress": 0},
+        },
+        is_active=True,
+        created_at=datetime(2025, 1, 1) + timedelta(minutes=minutes),
+    )
+    db.add(task)
+    db.commit()
+    return task
+
+
+@pytest.mark.integration
+class TestTaskJsonColumns:
+    """Test filters on the generated status and team reference columns"""
+
+    def test_generated_columns_follow_json(self, test_db, test_user):
+        task = _create_task(test_db, test_user, "a", "PENDING", team="t1")
+        test_db.refresh(task)
+        assert (task.task_status, task.task_team_name, task.task_team_namespace) == (
+            "PENDING",
+            "t1",
+            "default",
+        )
+
+        task.json["status"]["status"] = "RUNNING"
+        flag_modified(task, "json")
+        test_db.commit()
+        test_db.refresh(task)
+        assert task.task_status == "RUNNING"
+
+    def test_running_tasks_for_team(self, test_db, test_user):
+        running = _create_task(test_db, test_user, "running", "RUNNING")
+        pending = _create_task(test_db, test_user, "pending", "PENDING")
+        _create_task(test_db, test_user, "done", "COMPLETED")
+        _create_task(test_db, test_user, "other-ns", "RUNNING", namespace="group")
+        _create_task(test_db, test_user, "other-team", "RUNNING", team="other")
+
+        tasks = TeamKindsService(Kind)._get_running_tasks_for_team(
+            test_db, "team", "default"
+        )
+
+        assert sorted(t["task_id"] for t in tasks) == [running.id, pending.id]
+
+    def test_running_tasks_for_bot_teams(self, test_db, test_user):
+        first = _create_task(test_db, test_user, "first", "RUNNING", team="t1")
+        second = _create_task(
+            test_db, test_user, "second", "PENDING", team="t2", namespace="group"
+        )
+        _create_task(
+            test_db, test_user, "mixed", "RUNNING", team="t1", namespace="group"
+        )
+        _create_task(test_db, test_user, "failed", "FAILED", team="t1")
+        teams = [
+            Kind(user_id=test_user.id, kind="Team", name="t1", namespace="default"),
+            Kind(user_id=test_user.id, kind="Team", name="t2", namespace="group"),
+        ]
+
+        tasks = BotKindsService(Kind)._get_running_tasks_for_teams(test_db, teams)
+
+        assert [(t["task_id"], t["team_name"]) for t in tasks] == [
+            (first.id, "t1"),
+            (second.id, "t2"),
+        ]
+
+    def test_task_pagination_total_excludes_deleted(self, test_db, test_user):
+        kept = [
+            _create_task(test_db, test_user, f"kept{i}", "COMPLETED", minutes=i)
+            for i in range(3)
+        ]
+        _create_task(test_db, test_user, "deleted", "DELETE", minutes=10)
+
+        service = TaskKindsService(TaskResource)
+        with (
+            patch.object(service, "_get_tasks_related_data_batch", return_value={}),
+            patch.object(
+                service,
+                "_convert_to_task_dict_optimized",
+                side_effect=lambda task, related, crd: {"id": task.id},
+            ),
+        ):
+            items, total = service.get_user_tasks_with_pagination(
+                test_db, user_id=test_user.id, skip=0, limit=2
+            )
+
+        assert total == 3
+        assert items == [{"id": kept[2].id}, {"id": kept[1].id}]
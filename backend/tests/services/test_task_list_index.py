@@ -0,0 +1,382 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the denormalized, keyset-paginated task list
+"""
+
+import importlib.util
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.models.kind import Kind
+from app.models.shared_team import SharedTeam
+from app.models.task import TaskResource
+from app.models.task_list_entry import TaskListEntry
+from app.models.task_member import MemberStatus, TaskMember
+from app.models.user import User
+from app.services.adapters.task_kinds import TaskKindsService
+from app.services.task_list_index import _title_filter, search_entries
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _task_json(name: str, status: str = "PENDING", **spec) -> dict:
+    return {
+        "apiVersion": "agent.wecode.io/v1",
+        "kind": "Task",
+        "metadata": {
+            "name": name,
+            "namespace": "default",
+            "labels": {"taskType": "code", "type": "online"},
+        },
+        "spec": {
+            "title": f"title {name}",
+            "prompt": "hello",
+            "teamRef": {"name": "team", "namespace": "default"},
+            "workspaceRef": {"name": f"ws-{name}", "namespace": "default"},
+            **spec,
+        },
+        "status": {
+            "status": status,
+            "progress": 0,
+            "completedAt": "2025-01-02T08:00:00",
+        },
+    }
+
+
+@pytest.mark.integration
+class TestTaskListIndex:
+    """Test task_list_entries maintenance and the lite list queries"""
+
+    @pytest.fixture
+    def service(self):
+        return TaskKindsService(TaskResource)
+
+    @pytest.fixture
+    def other_user(self, test_db: Session) -> User:
+        user = User(user_name="other", password_hash="x", email="o@example.com")
+        test_db.add(user)
+        test_db.commit()
+        return user
+
+    def _create_task(
+        self, db: Session, user: User, name: str, minutes: int = 0, **spec
+    ) -> TaskResource:
+        timestamp = BASE_TIME + timedelta(minutes=minutes)
+        task = TaskResource(
+            user_id=user.id,
+            kind="Task",
+            name=name,
+            namespace="default",
+            json=_task_json(name, **spec),
+            is_active=True,
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+        db.add(task)
+        db.commit()
+        return task
+
+    def _add_member(self, db: Session, task: TaskResource, user: User) -> TaskMember:
+        member = TaskMember(
+            task_id=task.id,
+            user_id=user.id,
+            invited_by=task.user_id,
+            status=MemberStatus.ACTIVE.value,
+        )
+        db.add(member)
+        db.commit()
+        return member
+
+    def _entries(self, db: Session, task: TaskResource):
+        return (
+            db.query(TaskListEntry)
+            .filter(TaskListEntry.task_id == task.id)
+            .order_by(TaskListEntry.user_id)
+            .all()
+        )
+
+    def test_entries_follow_task_and_member_changes(
+        self, test_db, test_user, other_user
+    ):
+        task = self._create_task(test_db, test_user, "a")
+        [entry] = self._entries(test_db, task)
+        assert (entry.user_id, entry.is_owner, entry.is_group_chat) == (
+            test_user.id,
+            True,
+            False,
+        )
+        assert entry.title == "title a"
+        assert entry.task_type == "code"
+        assert entry.completed_at == datetime(2025, 1, 2, 8, 0, 0)
+
+        member = self._add_member(test_db, task, other_user)
+        entries = self._entries(test_db, task)
+        assert [(e.user_id, e.is_owner) for e in entries] == [
+            (test_user.id, True),
+            (other_user.id, False),
+        ]
+        assert all(e.is_group_chat and e.member_count == 1 for e in entries)
+
+        member.status = MemberStatus.REMOVED.value
+        test_db.commit()
+        [entry] = self._entries(test_db, task)
+        assert entry.is_group_chat is False
+
+        task.json["status"]["status"] = "DELETE"
+        flag_modified(task, "json")
+        test_db.commit()
+        assert self._entries(test_db, task) == []
+
+    def test_only_list_relevant_changes_resync(self, test_db, test_user, other_user):
+        task = self._create_task(test_db, test_user, "a")
+        self._add_member(test_db, task, other_user)
+        entry_ids = [e.id for e in self._entries(test_db, task)]
+
+        with patch(
+            "app.services.task_list_index.sync_task_list_entries"
+        ) as sync_entries:
+            task_json = dict(task.json)
+            task_json["status"] = {**task_json["status"], "progress": 50}
+            task.json = task_json
+            task.updated_at = BASE_TIME + timedelta(minutes=5)
+            test_db.commit()
+        sync_entries.assert_not_called()
+
+        task_json = dict(task.json)
+        task_json["spec"] = {**task_json["spec"], "title": "renamed"}
+        task.json = task_json
+        test_db.commit()
+
+        entries = self._entries(test_db, task)
+        # Rows are updated in place
+        assert [e.id for e in entries] == entry_ids
+        assert all(e.title == "renamed" for e in entries)
+        assert all(e.updated_at == task.updated_at for e in entries)
+
+    def test_keyset_pages_are_exact(self, service, test_db, test_user):
+        # Pairs of tasks share created_at so the task_id tie-breaker is exercised
+        tasks = [
+            self._create_task(test_db, test_user, f"t{i}", minutes=i // 2)
+            for i in range(7)
+        ]
+        deleted = self._create_task(test_db, test_user, "gone", minutes=10)
+        deleted.json["status"]["status"] = "DELETE"
+        flag_modified(deleted, "json")
+        test_db.commit()
+
+        seen, cursor = [], None
+        while True:
+            items, total, cursor = service.get_user_tasks_lite(
+                test_db, user_id=test_user.id, limit=3, cursor=cursor
+            )
+            assert total == 7
+            seen.extend(item["id"] for item in items)
+            if cursor is None:
+                break
+
+        expected = sorted(tasks, key=lambda t: (t.created_at, t.id), reverse=True)
+        assert seen == [t.id for t in expected]
+
+        # Offset pagination is still supported and agrees with the cursor
+        items, _, _ = service.get_user_tasks_lite(
+            test_db, user_id=test_user.id, skip=3, limit=3
+        )
+        assert [item["id"] for item in items] == seen[3:6]
+
+    def test_group_and_personal_lists(self, service, test_db, test_user, other_user):
+        personal = self._create_task(test_db, test_user, "personal")
+        flagged = self._create_task(test_db, test_user, "flagged", is_group_chat=True)
+        shared = self._create_task(test_db, other_user, "shared", minutes=5)
+        self._add_member(test_db, shared, test_user)
+
+        items, total, _ = service.get_user_personal_tasks_lite(
+            test_db, user_id=test_user.id
+        )
+        assert [item["id"] for item in items] == [personal.id]
+        assert total == 1
+
+        # Activity on a group chat (a new message runs the task) moves it to the front
+        task_json = dict(flagged.json)
+        task_json["status"] = {**task_json["status"], "status": "RUNNING"}
+        flagged.json = task_json
+        flagged.updated_at = BASE_TIME + timedelta(hours=1)
+        test_db.commit()
+        items, total, _ = service.get_user_group_tasks_lite(
+            test_db, user_id=test_user.id
+        )
+        assert [item["id"] for item in items] == [flagged.id, shared.id]
+        assert all(item["is_group_chat"] for item in items)
+        assert total == 2
+
+        new_items = service.get_new_tasks_since_id(
+            test_db, user_id=test_user.id, since_id=personal.id
+        )
+        assert [item["id"] for item in new_items] == [shared.id, flagged.id]
+
+    def test_team_and_repo_resolved_per_page(
+        self, service, test_db, test_user, other_user
+    ):
+        own = self._create_task(test_db, test_user, "own")
+        shared = self._create_task(
+            test_db,
+            test_user,
+            "shared",
+            teamRef={"name": "shared-team", "namespace": "default"},
+        )
+        team = Kind(
+            user_id=test_user.id, kind="Team", name="team", namespace="default", json={}
+        )
+        shared_team = Kind(
+            user_id=other_user.id,
+            kind="Team",
+            name="shared-team",
+            namespace="default",
+            json={},
+        )
+        workspace = TaskResource(
+            user_id=test_user.id,
+            kind="Workspace",
+            name="ws-own",
+            namespace="default",
+            json={"spec": {"repository": {"gitRepo": "org/repo"}}},
+        )
+        test_db.add_all([team, shared_team, workspace])
+        test_db.flush()
+        test_db.add(
+            SharedTeam(
+                user_id=test_user.id,
+                original_user_id=other_user.id,
+                team_id=shared_team.id,
+                is_active=True,
+            )
+        )
+        test_db.commit()
+
+        items, _, _ = service.get_user_tasks_lite(test_db, user_id=test_user.id)
+        by_id = {item["id"]: item for item in items}
+
+        assert by_id[own.id]["team_id"] == team.id
+        assert by_id[own.id]["git_repo"] == "org/repo"
+        assert by_id[shared.id]["team_id"] == shared_team.id
+        assert by_id[shared.id]["git_repo"] is None
+        assert by_id[own.id]["completed_at"] == datetime(2025, 1, 2, 8, 0, 0)
+
+    def test_invalid_cursor_is_rejected(self, service, test_db, test_user):
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_user_tasks_lite(
+                test_db, user_id=test_user.id, cursor="not-a-cursor"
+            )
+        assert exc_info.value.status_code == 400
+
+
+@pytest.mark.integration
+class TestTaskTitleSearch:
+    """Test database-side task title search"""
+
+    def _create_task(self, db: Session, user: User, title: str, minutes: int):
+        timestamp = BASE_TIME + timedelta(minutes=minutes)
+        task_json = _task_json(f"task-{minutes}")
+        task_json["spec"]["title"] = title
+        task = TaskResource(
+            user_id=user.id,
+            kind="Task",
+            name=f"task-{minutes}",
+            namespace="default",
+            json=task_json,
+            is_active=True,
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+        db.add(task)
+        return task
+
+    def test_matches_outside_recent_window_are_found(self, test_db, test_user):
+        old = self._create_task(test_db, test_user, "Fix Login bug", minutes=0)
+        for i in range(1, 150):
+            self._create_task(test_db, test_user, f"other {i}", minutes=i)
+        recent = self._create_task(test_db, test_user, "login page", minutes=200)
+        test_db.commit()
+
+        service = TaskKindsService(TaskResource)
+        with (
+            patch.object(service, "_get_tasks_related_data_batch", return_value={}),
+            patch.object(
+                service,
+                "_convert_to_task_dict_optimized",
+                side_effect=lambda task, related, crd: {"id": task.id},
+            ),
+        ):
+            items, total = service.get_user_tasks_by_title_with_pagination(
+                test_db, user_id=test_user.id, title="LOGIN", limit=1
+            )
+            assert total == 2
+            assert items == [{"id": recent.id}]
+
+            items, _ = service.get_user_tasks_by_title_with_pagination(
+                test_db, user_id=test_user.id, title="login", skip=1, limit=1
+            )
+            assert items == [{"id": old.id}]
+
+    def test_titles_with_stopword_substrings_are_found(self, test_db, test_user):
+        # "data" and "chat" contain ngram tokens with the stopwords "a" and "at"
+        self._create_task(test_db, test_user, "Fix data chat export", minutes=0)
+        self._create_task(test_db, test_user, "Other", minutes=1)
+        test_db.commit()
+
+        for query in ("data", "chat", "at"):
+            entries, total = search_entries(test_db, user_id=test_user.id, title=query)
+            assert total == 1
+            assert entries[0].title == "Fix data chat export"
+
+    def test_fulltext_index_is_built_without_stopwords(self):
+        path = (
+            Path(__file__).parents[2]
+            / "alembic"
+            / "versions"
+            / "q7r8s9t0u1v2_add_task_title_fulltext_index.py"
+        )
+        spec = importlib.util.spec_from_file_location("fulltext_migration", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+
+        with patch.object(migration, "op") as op:
+            migration.upgrade()
+
+        statements = [" ".join(c.args[0].split()) for c in op.execute.call_args_list]
+        assert statements[0] == "SET SESSION innodb_ft_enable_stopword = OFF"
+        assert "ADD FULLTEXT INDEX ftx_task_list_title" in statements[1]
+        assert statements[2] == "SET SESSION innodb_ft_enable_stopword = DEFAULT"
+
+    def test_like_wildcards_are_literal(self, test_db, test_user):
+        self._create_task(test_db, test_user, "100% done", minutes=0)
+        self._create_task(test_db, test_user, "1000 done", minutes=1)
+        test_db.commit()
+
+        entries, total = search_entries(test_db, user_id=test_user.id, title="0%")
+        assert total == 1
+        assert entries[0].title == "100% done"
+
+    def test_mysql_uses_fulltext_phrase_query(self):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "mysql"
+
+        title_filter, relevance = _title_filter(db, 'say "hi"')
+
+        assert relevance is not None
+        compiled = str(title_filter.compile(dialect=mysql.dialect()))
+        assert "MATCH (task_list_entries.title) AGAINST" in compiled
+        assert "IN BOOLEAN MODE" in compiled
+
+        # Queries shorter than the ngram token size cannot use the index
+        _, relevance = _title_filter(db, "a")
+        assert relevance is None
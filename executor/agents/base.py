@@ -16,7 +16,7 @@ from shared.utils import git_util
 from executor.config import config
 from shared.status import TaskStatus
 from shared.logger import setup_logger
-from executor.callback.callback_client import CallbackClient
+from executor.callback.callback_client import CallbackClient, register_status_token
 from shared.utils.crypto import is_token_encrypted, decrypt_git_token
 
 logger = setup_logger("agent_base")
@@ -46,6 +46,9 @@ class Agent:
         """
         self.task_data = task_data
         self.callback_client = CallbackClient()
+        register_status_token(
+            task_data.get("subtask_id", -1), task_data.get("status_token")
+        )
         self.task_id = task_data.get("task_id", -1)
         self.subtask_id = task_data.get("subtask_id", -1)
         self.task_title = task_data.get("task_title", "")
@@ -125,6 +128,7 @@ class Agent:
             message=message,
             result=result,
             task_type=self.task_type,
+            direct=True,
         )
 
     def pre_execute(self) -> TaskStatus:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Git Change Tracker - Incremental detection of the file changes of a task
+
+The file changes of a task merge three diffs, later ones taking priority for
+the same path: commits since the task started, staged changes and unstaged
+changes. Each diff is cached and only recomputed when its inputs change:
+
+- committed changes when HEAD moves
+- staged changes when HEAD moves or the index file is written
+- unstaged changes only for the paths git reports as modified whose mtime or
+  size differ from the previous check
+
+Line counts come from --numstat, so no patches are generated.
+"""
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from git import Repo
+
+# Above this many changed paths, diff the whole working tree instead of
+# passing every path on the command line
+MAX_PATHSPEC_PATHS = 200
+
+
+def _parse_diff_output(output: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the output of `git diff --raw --numstat -z`
+
+    Returns:
+        Dictionary of file change dictionaries keyed by new path
+    """
+    tokens = output.split("\0")
+    changes: Dict[str, Dict[str, Any]] = {}
+    counts: Dict[str, Tuple[int, int]] = {}
+
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith(":"):
+            # ":<mode> <mode> <sha> <sha> <status>" followed by the path(s)
+            status = token.split()[-1][0]
+            if status in ("R", "C"):
+                old_path, new_path = tokens[i + 1], tokens[i + 2]
+                i += 3
+            else:
+                old_path = new_path = tokens[i + 1]
+                i += 2
+            changes[new_path] = {
+                "old_path": old_path,
+                "new_path": new_path,
+                "new_file": status in ("A", "C"),
+                "renamed_file": status == "R",
+                "deleted_file": status == "D",
+                "added_lines": 0,
+                "removed_lines": 0,
+                "diff_title": os.path.basename(new_path),
+            }
+        elif token:
+            # "<added>\t<removed>\t<path>", renames have an empty path
+            # followed by the old and new paths; binary files count as "-"
+            added, removed, path = token.split("\t", 2)
+            if path:
+                i += 1
+            else:
+                path = tokens[i + 2]
+                i += 3
+            counts[path] = (
+                int(added) if added.isdigit() else 0,
+                int(removed) if removed.isdigit() else 0,
+            )
+        else:
+            i += 1
+
+    for path, (added, removed) in counts.items():
+        if path in changes:
+            changes[path]["added_lines"] = added
+            changes[path]["removed_lines"] = removed
+    return changes
+
+
+class GitChangeTracker:
+    """
+    Tracks the file changes of a repository since a base commit, reusing the
+    results of previous checks for everything that did not change
+    """
+
+    def __init__(self, repo: "Repo", base_commit: Optional[str] = None):
+        """
+        Initialize the tracker
+
+        Args:
+            repo: Repository to track
+            base_commit: Commit the task started at, only unstaged changes
+                are tracked without it
+        """
+        self.repo = repo
+        self.base_commit = base_commit
+        self._head: Optional[str] = None
+        self._index_stat: Optional[Tuple[int, int]] = None
+        # path -> (mtime_ns, size) of modified working tree files, None if deleted
+        self._modified: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._committed: Dict[str, Dict[str, Any]] = {}
+        self._staged: Dict[str, Dict[str, Any]] = {}
+        self._unstaged: Dict[str, Dict[str, Any]] = {}
+        self._file_changes: List[Dict[str, Any]] = []
+
+    def get_file_changes(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Get the current file changes
+
+        Returns:
+            (file_changes, changed): file change dictionaries in the format of
+            ProgressStateManager._get_git_file_changes(), and whether anything
+            was recomputed since the previous call
+        """
+        head = self.repo.head.commit.hexsha
+        index_stat = self._get_index_stat()
+        modified = self._get_modified_paths()
+
+        head_moved = head != self._head
+        index_written = index_stat != self._index_stat
+        changed = False
+
+        if self.base_commit and head_moved:
+            self._committed = self._diff(self.base_commit, head)
+            changed = True
+        if self.base_commit and (head_moved or index_written):
+            self._staged = self._diff("--cached", head)
+            changed = True
+
+        # Staging changes what unstaged diffs are based on
+        if index_written:
+            stale = list(modified)
+        else:
+            stale = [
+                path
+                for path, stat in modified.items()
+                if path not in self._modified or self._modified[path] != stat
+            ]
+        gone = [path for path in self._modified if path not in modified]
+        if stale or gone or index_written:
+            self._update_unstaged(stale, gone, len(stale) == len(modified))
+            changed = True
+
+        self._head = head
+        self._index_stat = index_stat
+        self._modified = modified
+
+        if changed:
+            merged: Dict[str, Dict[str, Any]] = {}
+            for layer in (self._committed, self._staged, self._unstaged):
+                merged.update(layer)
+            self._file_changes = list(merged.values())
+        return list(self._file_changes), changed
+
+    def _update_unstaged(
+        self, stale: List[str], gone: List[str], everything: bool
+    ) -> None:
+        """Re-diff the stale paths of the working tree against the index"""
+        if everything or len(stale) > MAX_PATHSPEC_PATHS:
+            self._unstaged = self._diff()
+            return
+
+        for path in stale + gone:
+            self._unstaged.pop(path, None)
+        if stale:
+            self._unstaged.update(self._diff("--", *stale))
+
+    def _diff(self, *args: str) -> Dict[str, Dict[str, Any]]:
+        output = self.repo.git.diff("--raw", "--numstat", "-z", "-M", *args)
+        return _parse_diff_output(output)
+
+    def _get_index_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(os.path.join(self.repo.git_dir, "index"))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_modified_paths(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """
+        Get the tracked paths whose stat info differs from the index, which
+        git checks without reading file contents
+        """
+        output = self.repo.git.diff_files("--name-only", "-z")
+        modified: Dict[str, Optional[Tuple[int, int]]] = {}
+        for path in filter(None, output.split("\0")):
+            try:
+                stat = os.lstat(os.path.join(self.repo.working_tree_dir, path))
+                modified[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                modified[path] = None
+        return modified
@@ -9,8 +9,10 @@
 """
 Progress State Manager - Unified management of thinking and workbench states
 """
+
 import os
 import threading
+import time
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
@@ -18,6 +20,8 @@ from urllib.parse import urlparse
 try:
     from git import GitCommandError, InvalidGitRepositoryError, Repo
 
+    from executor.agents.claude_code.git_change_tracker import GitChangeTracker
+
     GIT_AVAILABLE = True
 except ImportError:
     GIT_AVAILABLE = False
@@ -28,6 +32,14 @@ from shared.status import TaskStatus
 
 logger = setup_logger("progress_state_manager")
 
+# Git changes are checked every MIN interval while files change, backing off
+# up to the MAX interval while the repository is idle
+GIT_CHECK_MIN_INTERVAL = 2.0
+GIT_CHECK_MAX_INTERVAL = 10.0
+GIT_CHECK_BACKOFF = 1.5
+# Checks of large repositories are spaced so that they take at most 1/N of the time
+GIT_CHECK_COST_FACTOR = 5
+
 
 class ProgressStateManager:
     """
@@ -64,6 +76,14 @@ class ProgressStateManager:
             None  # Periodic monitoring task
         )
         self._is_monitoring: bool = False  # Monitoring status flag
+        self._check_interval: float = GIT_CHECK_MIN_INTERVAL
+        self._repo: Optional["Repo"] = None  # Reused across checks
+        self._change_tracker: Optional["GitChangeTracker"] = None
+        # Initial commit the tracker was created for, kept when it falls back
+        # to unstaged changes only
+        self._change_tracker_base: Optional[str] = None
+        self._commits_state: Optional[tuple] = None  # (HEAD, branch) last seen
+        self._commit_info_cache: Dict[str, Dict[str, Any]] = {}
 
     def initialize_workbench(self, status: str = "running") -> None:
         """
@@ -221,6 +241,24 @@ class ProgressStateManager:
 
         return workbench
 
+    def _get_repo(self) -> Optional["Repo"]:
+        """
+        Get the repository of the project, opened once and reused by all checks
+
+        Returns:
+            Repo instance, or None if the project is not a git repository
+        """
+        if self._repo is None:
+            repo_path = self.project_path
+            if not GIT_AVAILABLE or not repo_path or not os.path.exists(repo_path):
+                return None
+            try:
+                self._repo = Repo(repo_path)
+            except InvalidGitRepositoryError:
+                logger.warning(f"Not a valid git repository: {repo_path}")
+                return None
+        return self._repo
+
     def _save_initial_commit(self) -> None:
         """
         Save commit ID, message, and source branch information at task start to workbench
@@ -229,11 +267,10 @@ class ProgressStateManager:
             return
 
         try:
-            repo_path = self.project_path
-            if not repo_path or not os.path.exists(repo_path):
+            repo = self._get_repo()
+            if repo is None:
                 return
 
-            repo = Repo(repo_path)
             initial_commit = repo.head.commit
             self.initial_commit_id = initial_commit.hexsha
 
@@ -267,11 +304,10 @@ class ProgressStateManager:
             return
 
         try:
-            repo_path = self.project_path
-            if not repo_path or not os.path.exists(repo_path):
+            repo = self._get_repo()
+            if repo is None:
                 return
 
-            repo = Repo(repo_path)
             current_commit = repo.head.commit
 
             # Update target_branch (current branch)
@@ -282,6 +318,12 @@ class ProgressStateManager:
                 # detached HEAD state, don't set target_branch
                 pass
 
+            # Nothing to update until HEAD moves or another branch is checked out
+            commits_state = (current_commit.hexsha, target_branch)
+            if commits_state == self._commits_state:
+                return
+            self._commits_state = commits_state
+
             # Only set target_branch if it's different from source_branch
             source_branch = self.workbench_data["git_info"].get("source_branch", "")
             if target_branch and target_branch != source_branch:
@@ -301,22 +343,26 @@ class ProgressStateManager:
             try:
                 # Iterate through all commits from next of initial commit to HEAD
                 for commit in repo.iter_commits(f"{self.initial_commit_id}..HEAD"):
-                    commit_info = {
-                        "commit_id": commit.hexsha,
-                        "short_id": commit.hexsha[:8],
-                        "message": commit.message.strip(),
-                        "author": commit.author.name,
-                        "author_email": commit.author.email,
-                        "committed_date": datetime.fromtimestamp(
-                            commit.committed_date
-                        ).isoformat(),
-                        "stats": {
-                            "files_changed": len(commit.stats.files),
-                            "insertions": commit.stats.total["insertions"],
-                            "deletions": commit.stats.total["deletions"],
-                        },
-                    }
-                    task_commits.append(commit_info)
+                    # Commit stats need a diff each, compute them once per commit
+                    commit_info = self._commit_info_cache.get(commit.hexsha)
+                    if commit_info is None:
+                        commit_info = {
+                            "commit_id": commit.hexsha,
+                            "short_id": commit.hexsha[:8],
+                            "message": commit.message.strip(),
+                            "author": commit.author.name,
+                            "author_email": commit.author.email,
+                            "committed_date": datetime.fromtimestamp(
+                                commit.committed_date
+                            ).isoformat(),
+                            "stats": {
+                                "files_changed": len(commit.stats.files),
+                                "insertions": commit.stats.total["insertions"],
+                                "deletions": commit.stats.total["deletions"],
+                            },
+                        }
+                        self._commit_info_cache[commit.hexsha] = commit_info
+                    task_commits.append(dict(commit_info))
 
                 # Reverse list to arrange in chronological order (earliest first)
                 task_commits.reverse()
@@ -346,13 +392,15 @@ class ProgressStateManager:
             except Exception as e:
                 logger.warning(f"Failed to iterate commits: {str(e)}")
                 self.workbench_data["git_info"]["task_commits"] = []
+                self._commits_state = None
 
         except Exception as e:
             logger.warning(f"Failed to update task commits: {str(e)}")
 
     def _get_git_file_changes(self) -> List[Dict[str, Any]]:
         """
-        Get file changes from git diff (using GitPython SDK)
+        Get file changes from git diff, recomputing only what changed since the
+        previous check (see GitChangeTracker)
 
         Returns:
             List of file change dictionaries with structure:
@@ -376,132 +424,58 @@ class ProgressStateManager:
             return file_changes
 
         try:
-            # Get working directory from project_path
-            repo_path = self.project_path
-
-            if not repo_path or not os.path.exists(repo_path):
+            repo = self._get_repo()
+            if repo is None:
                 return file_changes
 
-            # Initialize Git repository object
-            try:
-                repo = Repo(repo_path)
-            except InvalidGitRepositoryError:
-                logger.warning(f"Not a valid git repository: {repo_path}")
-                return file_changes
+            # Changes are tracked against the initial commit (committed, staged
+            # and unstaged changes), otherwise only unstaged changes are used
+            tracker = self._change_tracker
+            if tracker is None or self._change_tracker_base != self.initial_commit_id:
+                if not self.initial_commit_id:
+                    logger.info("No initial commit ID, using unstaged changes only")
+                tracker = GitChangeTracker(repo, self.initial_commit_id)
+                self._change_tracker = tracker
+                self._change_tracker_base = self.initial_commit_id
 
-            # Get current branch name (for logging)
             try:
-                current_branch = repo.active_branch.name
-            except Exception:
-                current_branch = "HEAD"
-
-            # Get file changes: prioritize initial commit comparison, otherwise use unstaged changes
-            if self.initial_commit_id:
-                try:
-                    # Compare initial commit with current state (including all committed and uncommitted changes)
-                    initial_commit = repo.commit(self.initial_commit_id)
-                    current_commit = repo.head.commit
-
-                    # Get committed changes (initial_commit..HEAD)
-                    committed_diffs = initial_commit.diff(
-                        current_commit, create_patch=True
-                    )
-
-                    # Get unstaged changes (working tree vs index)
-                    unstaged_diffs = repo.index.diff(None, create_patch=True)
-
-                    # Get staged but uncommitted changes (HEAD vs index)
-                    # Use diff(None) to get differences between index and working tree, then reverse
-                    staged_diffs = repo.index.diff(current_commit, create_patch=True)
-
-                    # Merge all changes (use dictionary for deduplication with file path as key)
-                    all_diffs_dict = {}
-
-                    # First add committed changes
-                    for diff in committed_diffs:
-                        path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
-
-                    # Then add staged changes (will override committed files with same name)
-                    for diff in staged_diffs:
-                        path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
-
-                    # Finally add unstaged changes (highest priority)
-                    for diff in unstaged_diffs:
-                        path = diff.b_path if diff.b_path else diff.a_path
-                        all_diffs_dict[path] = diff
-
-                    diffs = list(all_diffs_dict.values())
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to compare with initial commit: {str(e)}, falling back to unstaged changes"
-                    )
-                    diffs = repo.index.diff(None, create_patch=True)
-            else:
-                # No initial commit ID, only get unstaged changes
-                diffs = repo.index.diff(None, create_patch=True)
-                logger.info(
-                    f"No initial commit ID, using unstaged changes only: {len(diffs)} files"
+                file_changes, _ = tracker.get_file_changes()
+            except GitCommandError as e:
+                if not tracker.base_commit:
+                    raise
+                # The initial commit cannot be diffed (e.g. it is gone after a
+                # rewrite), keep tracking unstaged changes only from now on
+                logger.warning(
+                    f"Failed to compare with initial commit: {str(e)}, falling back to unstaged changes"
                 )
-
-            for diff in diffs:
-                # Get file paths
-                old_path = diff.a_path if diff.a_path else diff.b_path
-                new_path = diff.b_path if diff.b_path else diff.a_path
-
-                # Determine file status
-                new_file = diff.new_file
-                deleted_file = diff.deleted_file
-                renamed_file = diff.renamed_file
-
-                # Calculate added/removed lines
-                added_lines = 0
-                removed_lines = 0
-
-                if diff.diff:
-                    # Parse diff content to count lines
-                    diff_text = diff.diff.decode("utf-8", errors="ignore")
-                    for line in diff_text.split("\n"):
-                        if line.startswith("+") and not line.startswith("+++"):
-                            added_lines += 1
-                        elif line.startswith("-") and not line.startswith("---"):
-                            removed_lines += 1
-
-                # Generate diff title (filename without path)
-                diff_title = os.path.basename(new_path)
-
-                file_change = {
-                    "old_path": old_path,
-                    "new_path": new_path,
-                    "new_file": new_file,
-                    "renamed_file": renamed_file,
-                    "deleted_file": deleted_file,
-                    "added_lines": added_lines,
-                    "removed_lines": removed_lines,
-                    "diff_title": diff_title,
-                }
-
-                file_changes.append(file_change)
+                tracker = GitChangeTracker(repo)
+                self._change_tracker = tracker
+                file_changes, _ = tracker.get_file_changes()
 
         except GitCommandError as e:
             logger.warning(f"Git command failed: {str(e)}")
+            self._change_tracker = None
         except Exception as e:
             logger.warning(f"Failed to get git file changes: {str(e)}", exc_info=True)
+            self._change_tracker = None
 
         return file_changes
 
     def _start_monitoring(self) -> None:
         """
-        Start periodic monitoring task, check git changes every 2 seconds
+        Start periodic monitoring task, check git changes every 2 seconds while
+        files change and less often while the repository is idle
         """
         if self._is_monitoring:
             logger.warning("Monitoring is already running")
             return
 
         self._is_monitoring = True
+        self._check_interval = GIT_CHECK_MIN_INTERVAL
         self._schedule_next_check()
-        logger.info("Started git changes monitoring (interval: 2s)")
+        logger.info(
+            f"Started git changes monitoring (interval: {GIT_CHECK_MIN_INTERVAL:g}-{GIT_CHECK_MAX_INTERVAL:g}s)"
+        )
 
     def _stop_monitoring(self) -> None:
         """
@@ -520,25 +494,48 @@ class ProgressStateManager:
         if not self._is_monitoring:
             return
 
-        self._monitor_timer = threading.Timer(2.0, self._check_git_changes)
+        self._monitor_timer = threading.Timer(
+            self._check_interval, self._check_git_changes
+        )
         self._monitor_timer.daemon = True
         self._monitor_timer.start()
 
+    def _update_check_interval(self, changed: bool, elapsed: float) -> None:
+        """
+        Adapt the interval of the next check to the repository activity and size
+
+        Args:
+            changed: Whether the last check found new changes
+            elapsed: Duration of the last check in seconds
+        """
+        if changed:
+            interval = GIT_CHECK_MIN_INTERVAL
+        else:
+            interval = min(
+                self._check_interval * GIT_CHECK_BACKOFF, GIT_CHECK_MAX_INTERVAL
+            )
+        self._check_interval = max(interval, elapsed * GIT_CHECK_COST_FACTOR)
+
     def _check_git_changes(self) -> None:
         """
         Periodically check git changes and update workbench data
         """
+        changed = False
+        start_time = time.monotonic()
         try:
             if not self._is_monitoring or self.workbench_data is None:
                 return
 
             # Detect file changes
             file_changes = self._get_git_file_changes()
-            if file_changes:
+            if file_changes and file_changes != self.workbench_data["file_changes"]:
                 self.workbench_data["file_changes"] = file_changes
+                changed = True
 
             # Detect new commits and branch changes
+            commits_state = self._commits_state
             self._update_task_commits()
+            changed = changed or self._commits_state != commits_state
 
             # Update last check time
             self.workbench_data["lastUpdated"] = datetime.now().isoformat()
@@ -547,6 +544,7 @@ class ProgressStateManager:
             logger.warning(f"Error during git changes check: {str(e)}")
         finally:
             # Schedule next check
+            self._update_check_interval(changed, time.monotonic() - start_time)
             self._schedule_next_check()
 
     def __del__(self):
@@ -12,20 +12,47 @@ Callback client module, handles communication with the executor_manager callback
 
 import os
 import requests
+import threading
 import time
 import json
 from typing import Dict, Any, Optional
 
+from executor.callback.status_channel import DirectStatusChannel
 from executor.config import config
 
 from shared.logger import setup_logger
 from shared.status import TaskStatus
 from shared.telemetry.config import get_otel_config
 from shared.utils.http_util import build_payload
+from shared.utils.result_delta import ResultDeltaEncoder
 from shared.utils.sensitive_data_masker import mask_sensitive_data
 
 logger = setup_logger("callback_client")
 
+# Results of these statuses are always sent in full and end the delta sequence
+FINAL_STATUSES = {
+    TaskStatus.COMPLETED.value,
+    TaskStatus.SUCCESS.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+    TaskStatus.TIMEOUT.value,
+}
+
+# Shared by all clients of the process so each subtask has one sequence. The
+# lock only guards the encoder state, requests are sent without holding it
+_result_encoder = ResultDeltaEncoder()
+_result_lock = threading.Lock()
+
+# Direct channel to the backend for progress updates, see register_status_token()
+status_channel = DirectStatusChannel(
+    config.TASK_API_DOMAIN if config.DIRECT_STATUS_ENABLED else ""
+)
+
+
+def register_status_token(subtask_id: int, token: Optional[str]) -> None:
+    """Send progress updates of a subtask directly with its dispatched status token"""
+    status_channel.register(subtask_id, token)
+
 
 class CallbackClient:
     """Callback client class, responsible for sending callbacks to executor_manager"""
@@ -100,6 +127,7 @@ class CallbackClient:
         executor_namespace: Optional[str] = None,
         result: Optional[Dict[str, Any]] = None,
         task_type: Optional[str] = None,
+        direct: bool = False,
     ) -> Dict[str, Any]:
         """
         Send a callback to the executor_manager
@@ -114,6 +142,9 @@ class CallbackClient:
             executor_namespace: Optional executor namespace
             result: Optional result data dictionary
             task_type: Optional task type (e.g., "validation" for validation tasks)
+            direct: Send a progress update directly to the backend if the
+                subtask has a status token. Final statuses always go through
+                the executor_manager.
 
         Returns:
             Dict[str, Any]: Result returned by the callback interface
@@ -140,13 +171,18 @@ class CallbackClient:
             data["status"] = status
         if message:
             data["error_message"] = message
-        if result:
-            data["result"] = result
         if task_type:
             data["task_type"] = task_type
 
+        final = (status or "").upper() in FINAL_STATUSES
+        direct = direct and not final and task_type != "validation"
+        if final:
+            status_channel.unregister(subtask_id)
+
         try:
-            return self._request_with_retry(lambda: self._do_send_callback(data))
+            if not result:
+                return self._send(data, subtask_id, direct)
+            return self._send_result_callback(data, subtask_id, final, result, direct)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse response data: {e}")
             return {"status": TaskStatus.FAILED.value, "error_msg": str(e)}
@@ -154,21 +190,80 @@ class CallbackClient:
             logger.error(f"Unexpected error during send_callback: {e}")
             return {"status": TaskStatus.FAILED.value, "error_msg": str(e)}
 
-    def _do_send_callback(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _send_result_callback(
+        self,
+        data: Dict[str, Any],
+        subtask_id: int,
+        final: bool,
+        result: Dict[str, Any],
+        direct: bool,
+    ) -> Dict[str, Any]:
         """
-        Execute the callback request
+        Send a callback with a result, as a delta of the previous result of
+        the subtask if possible
+
+        Args:
+            data: The callback data without the result
+            subtask_id: The ID of the subtask
+            final: Whether the status ends the subtask
+            result: The cumulative result data dictionary
+            direct: Send directly to the backend if possible
+
+        Returns:
+            Dict[str, Any]: Result returned by the callback interface
+        """
+        if not config.CALLBACK_RESULT_DELTA_ENABLED:
+            return self._send({**data, "result": result}, subtask_id, direct)
+
+        with _result_lock:
+            seq, delta = _result_encoder.encode(subtask_id, result, full=final)
+        if delta is not None:
+            response = self._send({**data, "result_delta": delta}, subtask_id, direct)
+            if response.get("status") != TaskStatus.SUCCESS.value:
+                # The next update is sent in full
+                with _result_lock:
+                    _result_encoder.reset(subtask_id)
+                return response
+            if not (response.get("data") or {}).get("resync"):
+                return response
+            # The receiver missed an earlier update
+            logger.info(f"Resending full result of subtask {subtask_id}")
+            with _result_lock:
+                seq, _ = _result_encoder.encode(subtask_id, result, full=True)
+
+        response = self._send(
+            {**data, "result": result, "result_seq": seq}, subtask_id, direct
+        )
+        with _result_lock:
+            if final:
+                _result_encoder.forget(subtask_id)
+            elif response.get("status") != TaskStatus.SUCCESS.value:
+                _result_encoder.reset(subtask_id)
+        return response
+
+    def _send(
+        self, data: Dict[str, Any], subtask_id: int, direct: bool
+    ) -> Dict[str, Any]:
+        """
+        Send an update directly to the backend if requested and possible,
+        otherwise as a callback to the executor_manager
 
         Args:
             data: The data to send in the request
+            subtask_id: The ID of the subtask
+            direct: Try the direct status channel first
 
         Returns:
-            Tuple of (success, result)
+            Dict[str, Any]: Result returned by the backend or callback interface
         """
-        # Mask sensitive data in callback payload for logging
-        masked_data = mask_sensitive_data(data)
-        logger.info("Sending callback to %s, body: %s", self.callback_url, masked_data)
+        if direct and status_channel.available(subtask_id):
+            response = status_channel.send(subtask_id, data, self._build_headers())
+            if response is not None:
+                return response
+        return self._request_with_retry(lambda: self._do_send_callback(data))
 
-        # Prepare headers with trace context for distributed tracing
+    def _build_headers(self) -> Dict[str, str]:
+        """Prepare headers with trace context for distributed tracing"""
         headers = {"Content-Type": "application/json"}
         otel_config = get_otel_config()
         if otel_config.enabled:
@@ -177,10 +272,28 @@ class CallbackClient:
 
             if is_telemetry_enabled():
                 headers = inject_trace_context_to_headers(headers)
+        return headers
+
+    def _do_send_callback(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the callback request
+
+        Args:
+            data: The data to send in the request
+
+        Returns:
+            Tuple of (success, result)
+        """
+        # Mask sensitive data in callback payload for logging
+        masked_data = mask_sensitive_data(data)
+        logger.info("Sending callback to %s, body: %s", self.callback_url, masked_data)
 
         # Send original unmasked data
         response = requests.post(
-            self.callback_url, json=data, headers=headers, timeout=self.timeout
+            self.callback_url,
+            json=data,
+            headers=self._build_headers(),
+            timeout=self.timeout,
         )
         return self._handle_response(response)
 
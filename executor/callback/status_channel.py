@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Direct status channel module, sends progress updates straight to the backend
+instead of relaying them through executor_manager
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+
+from shared.logger import setup_logger
+from shared.status import TaskStatus
+
+logger = setup_logger("status_channel")
+
+
+class DirectStatusChannel:
+    """
+    Sends progress updates to the backend task status API over a keep-alive
+    session, authenticated with the status token dispatched with each
+    subtask. Failed sends disable the channel for a while so callers fall
+    back to the executor_manager callback, rejected updates are sent as a
+    callback as well.
+    """
+
+    def __init__(
+        self,
+        api_domain: str,
+        timeout: int = 3,
+        retry_interval: int = 30,
+    ):
+        """
+        Initialize the direct status channel
+
+        Args:
+            api_domain: Backend base URL, the channel is disabled if empty
+            timeout: Request timeout in seconds
+            retry_interval: Seconds the channel stays disabled after a failure
+        """
+        self.url = (
+            f"{api_domain.rstrip('/')}/api/executors/tasks/status"
+            if api_domain
+            else ""
+        )
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self._tokens: Dict[int, str] = {}
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._disabled_until = 0.0
+
+    def register(self, subtask_id: int, token: Optional[str]) -> None:
+        """Enable the channel for a subtask"""
+        if self.url and token:
+            self._tokens[subtask_id] = token
+
+    def unregister(self, subtask_id: int) -> None:
+        """Disable the channel for a subtask"""
+        self._tokens.pop(subtask_id, None)
+
+    def available(self, subtask_id: int) -> bool:
+        """Whether updates of a subtask can be sent through the channel"""
+        return subtask_id in self._tokens and time.monotonic() >= self._disabled_until
+
+    def send(
+        self, subtask_id: int, data: Dict[str, Any], headers: Dict[str, str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a status update to the backend
+
+        Args:
+            subtask_id: The ID of the subtask
+            data: The update, as sent to the executor_manager callback
+            headers: Request headers
+
+        Returns:
+            Result in the format of the callback client, or None if the update
+            was not sent and must go through the callback instead
+        """
+        token = self._tokens.get(subtask_id)
+        if token is None or not self.available(subtask_id):
+            return None
+
+        # Titles are not forwarded by executor_manager either
+        data = {
+            k: v for k, v in data.items() if k not in ("task_title", "subtask_title")
+        }
+        headers = {**headers, "Authorization": f"Bearer {token}"}
+        try:
+            with self._lock:
+                response = self._session.put(
+                    self.url, json=data, headers=headers, timeout=self.timeout
+                )
+        except requests.RequestException as e:
+            self._disable(f"request failed: {e}")
+            return None
+
+        if response.status_code in [200, 201, 204]:
+            if response.content:
+                return {"status": TaskStatus.SUCCESS.value, "data": response.json()}
+            return {"status": TaskStatus.SUCCESS.value}
+
+        if response.status_code in [401, 403]:
+            logger.warning(
+                f"Status token of subtask {subtask_id} was rejected, using callbacks"
+            )
+            self.unregister(subtask_id)
+        elif response.status_code >= 500:
+            self._disable(f"status {response.status_code}: {response.text}")
+        else:
+            logger.warning(
+                f"Direct status update rejected ({response.status_code}: {response.text}), using callback"
+            )
+        return None
+
+    def _disable(self, reason: str) -> None:
+        logger.warning(
+            f"Direct status update failed ({reason}), using callbacks for {self.retry_interval}s"
+        )
+        self._disabled_until = time.monotonic() + self.retry_interval
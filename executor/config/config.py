@@ -13,6 +13,17 @@ Global configuration for workspace paths and other shared settings.
 
 WORKSPACE_ROOT = os.environ.get("WORKSPACE_ROOT", "/workspace/")
 CALLBACK_URL = os.environ.get("CALLBACK_URL", "")
+# Send progress results as deltas of the previous update instead of in full
+CALLBACK_RESULT_DELTA_ENABLED = (
+    os.environ.get("CALLBACK_RESULT_DELTA_ENABLED", "true").lower() == "true"
+)
+# Send progress updates straight to the backend at TASK_API_DOMAIN when the
+# subtask was dispatched with a status token; task start and completion
+# still go through CALLBACK_URL
+TASK_API_DOMAIN = os.environ.get("TASK_API_DOMAIN", "")
+DIRECT_STATUS_ENABLED = (
+    os.environ.get("DIRECT_STATUS_ENABLED", "true").lower() == "true"
+)
 
 # Agno Agent default headers configuration
 EXECUTOR_ENV = os.environ.get("EXECUTOR_ENV", "{}")
@@ -58,6 +58,23 @@ def execute_task(agent: Agent) -> Tuple[TaskStatus, Optional[str]]:
     return agent_service.execute_agent_task(agent)
 
 
+def _adopt_executor_name(task_data: Dict[str, Any]) -> None:
+    """
+    Use the executor name dispatched with the task for all callbacks
+
+    Warm pool containers are started under a pool name and renamed by
+    executor_manager when a task is assigned, so the EXECUTOR_NAME they were
+    started with no longer exists once they receive a task.
+
+    Args:
+        task_data (dict): Task data
+    """
+    executor_name = task_data.get("executor_name")
+    if executor_name and executor_name != os.getenv("EXECUTOR_NAME"):
+        logger.info(f"Executor renamed to {executor_name}")
+        os.environ["EXECUTOR_NAME"] = executor_name
+
+
 def _get_callback_params(task_data: Dict[str, Any]) -> Dict[str, str]:
     """
     Extract common callback parameters from task data
@@ -116,6 +133,7 @@ def process(task_data: Dict[str, Any]) -> TaskStatus:
     Returns:
         TaskStatus: Processing status
     """
+    _adopt_executor_name(task_data)
     callback_params = _get_callback_params(task_data)
 
     # Extract validation_id for validation tasks
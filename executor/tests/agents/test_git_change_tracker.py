@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from executor.agents.claude_code.git_change_tracker import (
+    GitChangeTracker,
+    _parse_diff_output,
+)
+
+
+class TestParseDiffOutput:
+    """Test cases for parsing `git diff --raw --numstat -z` output"""
+
+    def test_modified_added_and_deleted_files(self):
+        output = "\0".join(
+            [
+                ":100644 100644 1111111 2222222 M",
+                "src/a.py",
+                ":000000 100644 0000000 3333333 A",
+                "new.txt",
+                ":100644 000000 4444444 0000000 D",
+                "old.txt",
+                "3\t1\tsrc/a.py",
+                "2\t0\tnew.txt",
+                "0\t5\told.txt",
+                "",
+            ]
+        )
+
+        changes = _parse_diff_output(output)
+
+        assert changes["src/a.py"] == {
+            "old_path": "src/a.py",
+            "new_path": "src/a.py",
+            "new_file": False,
+            "renamed_file": False,
+            "deleted_file": False,
+            "added_lines": 3,
+            "removed_lines": 1,
+            "diff_title": "a.py",
+        }
+        assert changes["new.txt"]["new_file"] is True
+        assert changes["new.txt"]["added_lines"] == 2
+        assert changes["old.txt"]["deleted_file"] is True
+        assert changes["old.txt"]["removed_lines"] == 5
+
+    def test_rename_with_score_and_binary_file(self):
+        output = "\0".join(
+            [
+                ":100644 100644 1111111 1111111 R095",
+                "old name.txt",
+                "dir/new name.txt",
+                ":100644 100644 5555555 6666666 M",
+                "image.png",
+                "1\t1\t",
+                "old name.txt",
+                "dir/new name.txt",
+                "-\t-\timage.png",
+                "",
+            ]
+        )
+
+        changes = _parse_diff_output(output)
+
+        renamed = changes["dir/new name.txt"]
+        assert renamed["renamed_file"] is True
+        assert renamed["old_path"] == "old name.txt"
+        assert renamed["diff_title"] == "new name.txt"
+        assert (renamed["added_lines"], renamed["removed_lines"]) == (1, 1)
+        assert (changes["image.png"]["added_lines"], changes["image.png"]["removed_lines"]) == (0, 0)
+
+    def test_empty_output(self):
+        assert _parse_diff_output("") == {}
+
+
+class TestGitChangeTracker:
+    """Test cases for incremental git change tracking"""
+
+    @pytest.fixture
+    def repo_path(self, tmp_path):
+        """Repository with one commit of three files"""
+
+        def run(*args):
+            subprocess.run(["git", "-C", str(tmp_path), *args], check=True)
+
+        run("init", "-q")
+        run("config", "user.email", "test@example.com")
+        run("config", "user.name", "test")
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text("1\n2\n3\n")
+        run("add", ".")
+        run("commit", "-qm", "init")
+        return tmp_path
+
+    @pytest.fixture
+    def repo(self, repo_path):
+        git = pytest.importorskip("git")
+        return git.Repo(repo_path)
+
+    def _by_path(self, changes):
+        return {change["new_path"]: change for change in changes}
+
+    def test_unchanged_repository_is_not_diffed_again(self, repo, repo_path):
+        tracker = GitChangeTracker(repo, repo.head.commit.hexsha)
+        (repo_path / "a.txt").write_text("1\n2\n3\n4\n")
+
+        changes, changed = tracker.get_file_changes()
+        assert changed is True
+        assert self._by_path(changes)["a.txt"]["added_lines"] == 1
+
+        changes_again, changed = tracker.get_file_changes()
+        assert changed is False
+        assert changes_again == changes
+
+    def test_changes_of_all_layers_are_merged(self, repo, repo_path):
+        tracker = GitChangeTracker(repo, repo.head.commit.hexsha)
+        (repo_path / "a.txt").write_text("1\n")
+        repo.git.commit("-qam", "shrink a")
+        (repo_path / "d.txt").write_text("x\ny\n")
+        repo.git.add("d.txt")
+        repo.git.mv("c.txt", "e.txt")
+        (repo_path / "b.txt").unlink()
+
+        changes = self._by_path(tracker.get_file_changes()[0])
+
+        assert changes["a.txt"]["removed_lines"] == 2
+        assert changes["d.txt"]["new_file"] is True
+        assert changes["d.txt"]["added_lines"] == 2
+        assert changes["e.txt"]["renamed_file"] is True
+        assert changes["e.txt"]["old_path"] == "c.txt"
+        assert changes["b.txt"]["deleted_file"] is True
+        assert changes["b.txt"]["removed_lines"] == 3
+
+    def test_reverted_file_is_dropped(self, repo, repo_path):
+        tracker = GitChangeTracker(repo, repo.head.commit.hexsha)
+        (repo_path / "a.txt").write_text("changed\n")
+        (repo_path / "b.txt").write_text("changed\n")
+        assert len(tracker.get_file_changes()[0]) == 2
+
+        repo.git.checkout("--", "a.txt")
+        changes, changed = tracker.get_file_changes()
+
+        assert changed is True
+        assert list(self._by_path(changes)) == ["b.txt"]
+
+    def test_unknown_base_commit_falls_back_to_unstaged_changes(
+        self, repo, repo_path
+    ):
+        from executor.agents.claude_code.progress_state_manager import (
+            ProgressStateManager,
+        )
+
+        manager = ProgressStateManager(
+            MagicMock(), {}, MagicMock(), project_path=str(repo_path)
+        )
+        manager.initial_commit_id = "0" * 40
+        (repo_path / "a.txt").write_text("1\n2\n3\n4\n")
+
+        changes = self._by_path(manager._get_git_file_changes())
+        assert changes["a.txt"]["added_lines"] == 1
+
+        # The fallback tracker is kept instead of being rebuilt every check
+        tracker = manager._change_tracker
+        assert tracker.base_commit is None
+        manager._get_git_file_changes()
+        assert manager._change_tracker is tracker
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for the direct status path of executor/callback/callback_client.py
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from executor.callback import callback_client
+from executor.callback.callback_client import CallbackClient
+from executor.callback.status_channel import DirectStatusChannel
+
+
+def _response(status_code, body=None):
+    response = MagicMock(status_code=status_code, text="")
+    response.content = b"{}" if body is not None else b""
+    response.json.return_value = body
+    return response
+
+
+class TestCallbackClientDirectStatus:
+    """Tests for choosing between the direct channel and the callback"""
+
+    SUBTASK_ID = 7
+
+    @pytest.fixture
+    def channel(self):
+        channel = DirectStatusChannel("http://backend")
+        channel._session = MagicMock()
+        channel._session.put.return_value = _response(200, {})
+        channel.register(self.SUBTASK_ID, "token")
+        with patch.object(callback_client, "status_channel", channel):
+            yield channel
+        callback_client._result_encoder.forget(self.SUBTASK_ID)
+
+    @pytest.fixture
+    def post(self):
+        with patch("executor.callback.callback_client.requests.post") as post:
+            post.return_value = _response(200, {})
+            yield post
+
+    @pytest.fixture
+    def client(self):
+        return CallbackClient(callback_url="http://manager/callback", retry_delay=0)
+
+    def _send(self, client, **kwargs):
+        kwargs.setdefault("progress", 50)
+        kwargs.setdefault("status", "RUNNING")
+        return client.send_callback(
+            task_id=1,
+            subtask_id=self.SUBTASK_ID,
+            task_title="task",
+            subtask_title="subtask",
+            direct=True,
+            **kwargs,
+        )
+
+    def test_progress_goes_through_direct_channel(self, client, channel, post):
+        result = self._send(client)
+
+        assert result["status"] == "SUCCESS"
+        channel._session.put.assert_called_once()
+        post.assert_not_called()
+
+    @pytest.mark.parametrize("status_code", [400, 401, 403, 422, 503])
+    def test_rejected_update_falls_back_to_callback(
+        self, client, channel, post, status_code
+    ):
+        channel._session.put.return_value = _response(status_code)
+
+        result = self._send(client)
+
+        assert result["status"] == "SUCCESS"
+        post.assert_called_once()
+        assert post.call_args[1]["json"]["progress"] == 50
+
+    def test_disabled_channel_is_skipped(self, client, channel, post):
+        channel._session.put.return_value = _response(503)
+        self._send(client)
+        self._send(client)
+
+        assert channel._session.put.call_count == 1
+        assert post.call_count == 2
+
+    @pytest.mark.parametrize("status", ["COMPLETED", "FAILED", "CANCELLED"])
+    def test_final_status_goes_through_executor_manager(
+        self, client, channel, post, status
+    ):
+        self._send(client, progress=100, status=status)
+
+        channel._session.put.assert_not_called()
+        post.assert_called_once()
+        assert channel.available(self.SUBTASK_ID) is False
+
+    def test_validation_goes_through_executor_manager(self, client, channel, post):
+        self._send(client, task_type="validation")
+
+        channel._session.put.assert_not_called()
+        post.assert_called_once()
+
+    def test_resync_over_direct_channel_resends_full_result(
+        self, client, channel, post
+    ):
+        with patch.object(
+            callback_client.config, "CALLBACK_RESULT_DELTA_ENABLED", True
+        ):
+            self._send(client, result={"value": "a"})
+            channel._session.put.return_value = _response(200, {"resync": True})
+            self._send(client, result={"value": "ab"})
+
+        sent = [call[1]["json"] for call in channel._session.put.call_args_list]
+        assert len(sent) == 3
+        assert sent[0]["result"] == {"value": "a"}
+        assert sent[1]["result_delta"]["value_append"] == "b"
+        assert sent[2]["result"] == {"value": "ab"}
+        assert sent[2]["result_seq"] == 3
+        post.assert_not_called()
+
+    def test_slow_send_does_not_block_other_subtasks(self, client, channel, post):
+        """Requests are sent without holding the result encoder lock"""
+        other_subtask_id = self.SUBTASK_ID + 1
+        in_flight = threading.Event()
+        release = threading.Event()
+
+        def put(url, json, headers, timeout):
+            if json["subtask_id"] == self.SUBTASK_ID:
+                in_flight.set()
+                release.wait(5)
+            return _response(200, {})
+
+        channel._session.put.side_effect = put
+        slow = threading.Thread(
+            target=self._send, args=(client,), kwargs={"result": {"value": "a"}}
+        )
+        other = threading.Thread(
+            target=client.send_callback,
+            kwargs={
+                "task_id": 1,
+                "subtask_id": other_subtask_id,
+                "task_title": "task",
+                "subtask_title": "subtask",
+                "progress": 50,
+                "status": "RUNNING",
+                "result": {"value": "b"},
+            },
+        )
+        slow.start()
+        try:
+            assert in_flight.wait(2)
+            other.start()
+            other.join(timeout=2)
+            assert not other.is_alive()
+            post.assert_called_once()
+        finally:
+            release.set()
+            slow.join(timeout=5)
+            other.join(timeout=5)
+            callback_client._result_encoder.forget(other_subtask_id)
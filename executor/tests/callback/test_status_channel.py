@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for executor/callback/status_channel.py
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from executor.callback.status_channel import DirectStatusChannel
+
+
+def _response(status_code, body=None):
+    response = MagicMock(status_code=status_code, text="")
+    response.content = b"{}" if body is not None else b""
+    response.json.return_value = body
+    return response
+
+
+class TestDirectStatusChannel:
+    """Tests for sending status updates directly to the backend"""
+
+    @pytest.fixture
+    def channel(self):
+        channel = DirectStatusChannel("http://backend/", retry_interval=30)
+        channel._session = MagicMock()
+        channel.register(1, "token-1")
+        channel.register(2, "token-2")
+        return channel
+
+    def test_disabled_without_api_domain(self):
+        channel = DirectStatusChannel("")
+        channel.register(1, "token")
+        assert channel.available(1) is False
+
+    def test_success_sends_with_token(self, channel):
+        channel._session.put.return_value = _response(200, {"resync": False})
+
+        result = channel.send(
+            1, {"progress": 50, "task_title": "t"}, {"X-Trace": "abc"}
+        )
+
+        assert result == {"status": "SUCCESS", "data": {"resync": False}}
+        _, kwargs = channel._session.put.call_args
+        assert channel._session.put.call_args[0][0] == (
+            "http://backend/api/executors/tasks/status"
+        )
+        assert kwargs["json"] == {"progress": 50}
+        assert kwargs["headers"] == {
+            "X-Trace": "abc",
+            "Authorization": "Bearer token-1",
+        }
+
+    @pytest.mark.parametrize(
+        "outcome",
+        [_response(502), requests.ConnectionError("refused")],
+        ids=["server_error", "connection_error"],
+    )
+    def test_failure_disables_channel_for_retry_interval(self, channel, outcome):
+        if isinstance(outcome, Exception):
+            channel._session.put.side_effect = outcome
+        else:
+            channel._session.put.return_value = outcome
+
+        with patch("executor.callback.status_channel.time.monotonic") as monotonic:
+            monotonic.return_value = 100.0
+            assert channel.send(1, {"progress": 50}, {}) is None
+            assert channel.available(1) is False
+            assert channel.available(2) is False
+
+            monotonic.return_value = 129.0
+            assert channel.send(1, {"progress": 60}, {}) is None
+            assert channel._session.put.call_count == 1
+
+            monotonic.return_value = 130.0
+            assert channel.available(1) is True
+
+    @pytest.mark.parametrize("status_code", [401, 403])
+    def test_rejected_token_unregisters_subtask(self, channel, status_code):
+        channel._session.put.return_value = _response(status_code)
+
+        assert channel.send(1, {"progress": 50}, {}) is None
+
+        assert channel.available(1) is False
+        assert channel.available(2) is True
+
+    def test_other_client_error_keeps_channel(self, channel):
+        channel._session.put.return_value = _response(422)
+
+        assert channel.send(1, {"progress": 50}, {}) is None
+
+        assert channel.available(1) is True
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Unit tests for executor/tasks/task_processor.py
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from executor.callback.callback_client import CallbackClient
+from executor.tasks import task_processor
+from shared.status import TaskStatus
+
+
+class TestProcessExecutorName:
+    """Tests for the executor name reported by callbacks"""
+
+    @pytest.fixture
+    def task_data(self):
+        return {
+            "task_id": 123,
+            "subtask_id": 456,
+            "executor_name": "wegent-pool-abc123-t123-s456-n789",
+        }
+
+    def test_assigned_warm_container_reports_its_new_name(self, monkeypatch, task_data):
+        """Callbacks of a renamed warm container carry the name it was assigned"""
+        monkeypatch.setenv("EXECUTOR_NAME", "wegent-pool-abc123")
+        agent_service = MagicMock()
+        agent_service.return_value.execute_task.return_value = (
+            TaskStatus.RUNNING,
+            None,
+        )
+
+        with patch.object(
+            task_processor,
+            "send_task_started_callback",
+            return_value={"status": TaskStatus.SUCCESS.value},
+        ) as started, patch.object(task_processor, "AgentService", agent_service):
+            task_processor.process(task_data)
+
+        assert started.call_args.kwargs["executor_name"] == task_data["executor_name"]
+
+        # Progress callbacks of the agents read the name from the environment
+        with patch("executor.callback.callback_client.requests.post") as post:
+            post.return_value = MagicMock(status_code=200, content=b"")
+            CallbackClient(callback_url="http://manager/callback").send_callback(
+                task_id=123,
+                subtask_id=456,
+                task_title="task",
+                subtask_title="subtask",
+                progress=50,
+            )
+        assert post.call_args.kwargs["json"]["executor_name"] == (
+            task_data["executor_name"]
+        )
+
+    def test_missing_executor_name_keeps_environment(self, monkeypatch, task_data):
+        """Tasks started from TASK_INFO keep the name the container was started with"""
+        monkeypatch.setenv("EXECUTOR_NAME", "wegent-task-user-abc")
+        del task_data["executor_name"]
+
+        task_processor._adopt_executor_name(task_data)
+        params = task_processor._get_callback_params(task_data)
+
+        assert params["executor_name"] == "wegent-task-user-abc"
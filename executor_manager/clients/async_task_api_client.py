@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Async API client module, forwards task status updates to the API over pooled
+keep-alive connections
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+from shared.logger import setup_logger
+
+from executor_manager.config.config import (API_MAX_RETRIES, API_RETRY_BACKOFF,
+                                            API_RETRY_DELAY, API_TIMEOUT,
+                                            CALLBACK_FORWARD_WORKERS,
+                                            CALLBACK_TASK_API_URL)
+
+logger = setup_logger(__name__)
+
+
+class AsyncTaskApiClient:
+    """Async API client class, responsible for updating task status in the task API"""
+
+    def __init__(
+        self,
+        timeout=API_TIMEOUT,
+        max_retries=API_MAX_RETRIES,
+        retry_delay=API_RETRY_DELAY,
+        retry_backoff=API_RETRY_BACKOFF,
+        max_connections=CALLBACK_FORWARD_WORKERS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.callback_task_api_url = CALLBACK_TASK_API_URL
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_backoff = retry_backoff
+        self.max_connections = max_connections
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self.transport,
+            )
+        return self._client
+
+    async def _request_with_retry(self, request_func, max_retries=None):
+        """Generic request retry logic, waiting without blocking the event loop"""
+        retries = 0
+        delay = self.retry_delay
+        retry_limit = max_retries if max_retries is not None else self.max_retries
+
+        while retries <= retry_limit:
+            try:
+                return await request_func()
+            except httpx.HTTPError as e:
+                if retries == retry_limit:
+                    logger.error(f"Request failed after {retries} retries: {e}")
+                    return False, str(e)
+
+                logger.warning(
+                    f"Request failed (attempt {retries + 1}/{retry_limit}): {e}. Retrying in {delay} seconds..."
+                )
+                await asyncio.sleep(delay)
+                retries += 1
+                delay *= self.retry_backoff
+        return None
+
+    async def update_task_status(self, data: Dict[str, Any]):
+        """Update task status in API with a dict parameter"""
+        try:
+            return await self._request_with_retry(
+                lambda: self._do_update_task_status(data)
+            )
+        except ValueError as e:
+            logger.error(f"Failed to parse response data: {e}")
+            return False, str(e)
+        except Exception as e:
+            logger.error(f"Unexpected error during update_task_status: {e}")
+            return False, str(e)
+
+    async def _do_update_task_status(self, data):
+        task_id = data["task_id"]
+        response = await self._get_client().put(
+            self.callback_task_api_url, params={"task_id": task_id}, json=data
+        )
+        return self._handle_response(
+            response, context=f"updating status for task {task_id}"
+        )
+
+    def _handle_response(self, response: httpx.Response, context="API request"):
+        """Common response handler"""
+        logger.info(f"Received response: {response.status_code}, {response.text}")
+        if response.status_code in [200, 201, 204]:
+            logger.info(f"Success: {context}")
+            if response.content:
+                return True, response.json()
+            return False, {"error_msg": "No content in response"}
+
+        elif 400 <= response.status_code < 500:
+            error_msg = f"Client error ({response.status_code}) during {context}"
+            logger.error(error_msg)
+            return False, {"error_msg": error_msg}
+
+        else:
+            raise httpx.HTTPStatusError(
+                f"Server error ({response.status_code}) during {context}",
+                request=response.request,
+                response=response,
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -23,7 +23,8 @@ from executor_manager.config.config import (API_MAX_RETRIES, API_RETRY_BACKOFF,
                                             FETCH_TASK_API_BASE_URL,
                                             OFFLINE_TASK_FETCH_LIMIT,
                                             TASK_FETCH_LIMIT,
-                                            TASK_FETCH_STATUS)
+                                            TASK_FETCH_STATUS,
+                                            TASK_LONG_POLL_TIMEOUT)
 # Import the shared logger
 from executor_manager.executors.dispatcher import ExecutorDispatcher
 
@@ -96,6 +97,28 @@ class TaskApiClient:
             response, expect_json=True, context="fetching tasks"
         )
         
+    def wait_for_tasks(self, limit, wait=TASK_LONG_POLL_TIMEOUT):
+        """Long-poll online tasks from API, returning as soon as tasks become dispatchable"""
+        logger.info(f"Waiting up to {wait}s for tasks...")
+        try:
+            return self._request_with_retry(
+                lambda: self._do_wait_for_tasks(limit, wait), max_retries=0
+            )
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse response data: {e}")
+            return False, str(e)
+        except Exception as e:
+            logger.error(f"Unexpected error during wait_for_tasks: {e}")
+            return False, str(e)
+
+    def _do_wait_for_tasks(self, limit, wait):
+        url = f"{self.fetch_task_api_base_url}?limit={limit}&task_status={self.task_status}&wait={wait}"
+        # The backend holds the request for up to `wait` seconds
+        response = requests.post(url, timeout=wait + self.timeout)
+        return self._handle_response(
+            response, expect_json=True, context="waiting for tasks"
+        )
+
     def update_fetch_params(self, limit=None, task_status=None):
         """Update task fetch parameters"""
         if limit is not None:
@@ -111,6 +134,8 @@ class TaskApiClient:
         status = kwargs.get("status")
         error_message = kwargs.get("error_message")
         result = kwargs.get("result")
+        result_seq = kwargs.get("result_seq")
+        result_delta = kwargs.get("result_delta")
         title = kwargs.get("title")
 
         logger.info(
@@ -126,6 +151,8 @@ class TaskApiClient:
             status=status,
             error_message=error_message,
             result=result,
+            result_seq=result_seq,
+            result_delta=result_delta,
             title=title,
         )
 
@@ -29,11 +29,30 @@ API_MAX_RETRIES = 3  # Maximum number of retry attempts
 API_RETRY_DELAY = 1  # Initial delay between retries (seconds)
 API_RETRY_BACKOFF = 2  # Backoff multiplier for retry delay
 
+# Executor callback forwarding
+# Workers forwarding queued callbacks to the backend, also the size of the connection pool
+CALLBACK_FORWARD_WORKERS = int(os.getenv("CALLBACK_FORWARD_WORKERS", "8"))
+# Maximum number of queued callbacks; further non-terminal callbacks are rejected with 503
+CALLBACK_QUEUE_MAX_SIZE = int(os.getenv("CALLBACK_QUEUE_MAX_SIZE", "1000"))
+# Seconds to wait for queued callbacks to be forwarded on shutdown
+CALLBACK_DRAIN_TIMEOUT = int(os.getenv("CALLBACK_DRAIN_TIMEOUT", "10"))
+
 # Scheduler Configuration
 TASK_FETCH_INTERVAL = 5  # Task fetch interval (seconds)
 TIME_LOG_INTERVAL = 5  # Time log interval (seconds)
 SCHEDULER_SLEEP_TIME = 1  # Scheduler sleep time (seconds)
 
+# Maximum number of tasks from one fetched batch that are launched concurrently
+TASK_LAUNCH_CONCURRENCY = int(os.getenv("TASK_LAUNCH_CONCURRENCY", "5"))
+
+# Long-poll dispatch configuration
+# Seconds the backend may hold an online dispatch request open waiting for new tasks.
+# New tasks then start immediately; interval polling stays active as a fallback, every
+# TASK_LONG_POLL_FALLBACK_INTERVAL seconds while the watcher runs.
+# Set to 0 to disable long-poll and rely on interval polling only.
+TASK_LONG_POLL_TIMEOUT = int(os.getenv("TASK_LONG_POLL_TIMEOUT", "25"))
+TASK_LONG_POLL_FALLBACK_INTERVAL = int(os.getenv("TASK_LONG_POLL_FALLBACK_INTERVAL", "30"))
+
 # Offline task scheduling time configuration
 # Evening time range for offline tasks (default: 21-23)
 OFFLINE_TASK_EVENING_HOURS = os.getenv("OFFLINE_TASK_EVENING_HOURS", "21-23")
@@ -45,6 +64,8 @@ OFFLINE_TASK_MORNING_HOURS = os.getenv("OFFLINE_TASK_MORNING_HOURS", "0-8")
 # Define port range for Docker containers
 PORT_RANGE_MIN = int(os.getenv("EXECUTOR_PORT_RANGE_MIN", 10000))
 PORT_RANGE_MAX = int(os.getenv("EXECUTOR_PORT_RANGE_MAX", 10100))
+# Seconds an allocated port stays reserved, covering the gap until the new container shows up in docker ps
+PORT_RESERVATION_TTL = int(os.getenv("EXECUTOR_PORT_RESERVATION_TTL", 60))
 
 # GitHub App Configuration
 GITHUB_APP_ID = os.getenv("GITHUB_APP_ID")
@@ -55,6 +76,20 @@ EXECUTOR_DISPATCHER_MODE = os.getenv("EXECUTOR_DISPATCHER_MODE", "docker")
 EXECUTOR_CONFIG = os.getenv("EXECUTOR_CONFIG", "{\"docker\":\"executor_manager.executors.docker.DockerExecutor\"}")
 EXECUTOR_ENV = os.environ.get("EXECUTOR_ENV", "{}")
 
+# Warm container pool configuration
+# Idle executor containers kept pre-started for the default EXECUTOR_IMAGE (0 disables the pool)
+WARM_POOL_SIZE = int(os.getenv("WARM_POOL_SIZE", "0"))
+# Idle containers older than this are replaced (seconds)
+WARM_POOL_MAX_IDLE_SECONDS = int(os.getenv("WARM_POOL_MAX_IDLE_SECONDS", "1800"))
+# Per-image pool sizes as JSON, e.g. {"my/base-image:1.0": 2}; overrides WARM_POOL_SIZE for that image
+WARM_POOL_IMAGE_CAPS = os.getenv("WARM_POOL_IMAGE_CAPS", "{}")
+# Interval between pool maintenance runs (seconds)
+WARM_POOL_REFILL_INTERVAL = int(os.getenv("WARM_POOL_REFILL_INTERVAL", "10"))
+
+# Use the Docker Engine API over the docker socket for container lookups.
+# Container state is then served from memory, falling back to the docker CLI when unavailable.
+DOCKER_ENGINE_API_ENABLED = os.getenv("DOCKER_ENGINE_API_ENABLED", "true").lower() == "true"
+
 # OpenTelemetry configuration is centralized in shared/telemetry/config.py
 # Use: from shared.telemetry.config import get_otel_config
 # All OTEL_* environment variables are read from there
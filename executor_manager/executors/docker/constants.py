@@ -34,4 +34,10 @@ DEFAULT_PROGRESS_RUNNING = 30
 DEFAULT_PROGRESS_COMPLETE = 100
 
 # Default values
-DEFAULT_TASK_ID = -1
\ No newline at end of file
+DEFAULT_TASK_ID = -1
+
+# Label marking warm pool containers, value is the pool image
+WARM_POOL_LABEL = "aigc.weibo.com/warm-pool"
+
+# Seconds to wait after start before checking whether a container exited immediately
+CONTAINER_HEALTH_CHECK_DELAY = 2
\ No newline at end of file
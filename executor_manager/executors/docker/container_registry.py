@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+In-memory registry of executor_manager containers kept in sync with the
+Docker daemon through the Engine API events stream.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from shared.logger import setup_logger
+
+from executor_manager.config.config import (DOCKER_ENGINE_API_ENABLED,
+                                            PORT_RANGE_MAX, PORT_RANGE_MIN)
+from executor_manager.executors.docker.constants import (CONTAINER_OWNER,
+                                                         DOCKER_SOCKET_PATH)
+from executor_manager.executors.docker.engine_client import DockerEngineClient
+
+logger = setup_logger(__name__)
+
+# Events that change whether a container is running, which ports it holds or its name
+STATE_EVENTS = {"create", "start", "restart", "unpause", "pause", "die", "stop", "kill", "oom", "rename"}
+
+# Delay before reconnecting after the events stream fails (seconds)
+RECONNECT_DELAY = 2
+
+
+@dataclass
+class ContainerInfo:
+    """Registry entry for a single container"""
+
+    id: str
+    name: str
+    labels: Dict[str, str] = field(default_factory=dict)
+    running: bool = False
+    ports: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def _match_label_selector(labels: Dict[str, str], label_selector: Optional[str]) -> bool:
+    """Match labels against a docker style label filter ("key" or "key=value")"""
+    if not label_selector:
+        return True
+    key, sep, value = label_selector.partition("=")
+    if key not in labels:
+        return False
+    return not sep or labels[key] == value
+
+
+def _container_from_summary(summary: Dict[str, Any]) -> ContainerInfo:
+    """Build a registry entry from a /containers/json item"""
+    names = summary.get("Names") or []
+    ports = [
+        {"host_port": int(p["PublicPort"]), "container_port": int(p["PrivatePort"]), "protocol": p.get("Type", "tcp")}
+        for p in summary.get("Ports") or []
+        if p.get("PublicPort") and p.get("IP", "0.0.0.0") == "0.0.0.0"
+    ]
+    return ContainerInfo(
+        id=summary["Id"],
+        name=names[0].lstrip("/") if names else summary["Id"][:12],
+        labels=summary.get("Labels") or {},
+        running=summary.get("State") == "running",
+        ports=ports,
+    )
+
+
+def _container_from_inspect(details: Dict[str, Any]) -> ContainerInfo:
+    """Build a registry entry from a /containers/{id}/json response"""
+    ports = []
+    network_ports = (details.get("NetworkSettings") or {}).get("Ports") or {}
+    for container_port, bindings in network_ports.items():
+        port, _, protocol = container_port.partition("/")
+        for binding in bindings or []:
+            if binding.get("HostPort") and binding.get("HostIp", "0.0.0.0") == "0.0.0.0":
+                ports.append({"host_port": int(binding["HostPort"]), "container_port": int(port), "protocol": protocol or "tcp"})
+    return ContainerInfo(
+        id=details["Id"],
+        name=(details.get("Name") or details["Id"][:12]).lstrip("/"),
+        labels=(details.get("Config") or {}).get("Labels") or {},
+        running=bool((details.get("State") or {}).get("Running")),
+        ports=ports,
+    )
+
+
+class ContainerRegistry:
+    """
+    Keeps the executor_manager containers in memory so that count, port and
+    task lookups do not need to query the Docker daemon.
+
+    A background thread lists the containers once and then applies the
+    daemon's container events. Lookups are only served while the registry is
+    in sync; callers fall back to the docker CLI otherwise.
+    """
+
+    def __init__(self, client: DockerEngineClient):
+        self.client = client
+        self._lock = threading.Lock()
+        self._containers: Dict[str, ContainerInfo] = {}
+        # One byte per port in the executor port range, set while a running container holds it
+        self._port_bitmap = bytearray(PORT_RANGE_MAX - PORT_RANGE_MIN + 1)
+        self._ready = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        """True while the registry reflects the daemon state"""
+        return self._ready.is_set()
+
+    def start(self) -> None:
+        """Start syncing in a background thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="docker-container-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop syncing and close the client"""
+        self._running = False
+        self._ready.clear()
+        self.client.close()
+
+    def wait_until_ready(self, timeout: float) -> bool:
+        """Block until the initial sync finished or the timeout elapsed"""
+        return self._ready.wait(timeout)
+
+    def _run(self) -> None:
+        owner_filter = {"label": [f"owner={CONTAINER_OWNER}"]}
+        while self._running:
+            try:
+                # Replay events from just before the listing so none are lost in between
+                since = int(time.time()) - 1
+                self.sync()
+                self._ready.set()
+                for event in self.client.events(filters={"type": ["container"], **owner_filter}, since=since):
+                    if not self._running:
+                        break
+                    self.apply_event(event)
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"Docker events stream interrupted, falling back to docker CLI: {e}")
+            self._ready.clear()
+            if self._running:
+                time.sleep(RECONNECT_DELAY)
+
+    def sync(self) -> None:
+        """Reload all executor_manager containers from the daemon"""
+        summaries = self.client.list_containers(filters={"label": [f"owner={CONTAINER_OWNER}"]}, all=True)
+        containers = {}
+        for summary in summaries:
+            info = _container_from_summary(summary)
+            containers[info.id] = info
+        with self._lock:
+            self._containers = containers
+            self._rebuild_port_bitmap()
+        logger.info(f"Container registry synced: {len(containers)} containers")
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply a single container event from the daemon"""
+        if event.get("Type", "container") != "container":
+            return
+        action = (event.get("Action") or event.get("status") or "").split(":")[0]
+        container_id = event.get("id") or (event.get("Actor") or {}).get("ID")
+        if not container_id:
+            return
+
+        if action == "destroy":
+            with self._lock:
+                removed = self._containers.pop(container_id, None)
+                if removed:
+                    self._set_ports(removed, False)
+            return
+
+        if action not in STATE_EVENTS:
+            return
+
+        details = self.client.inspect_container(container_id)
+        with self._lock:
+            previous = self._containers.pop(container_id, None)
+            if previous:
+                self._set_ports(previous, False)
+            if details is not None:
+                info = _container_from_inspect(details)
+                self._containers[container_id] = info
+                self._set_ports(info, True)
+
+    def _rebuild_port_bitmap(self) -> None:
+        self._port_bitmap = bytearray(len(self._port_bitmap))
+        for info in self._containers.values():
+            self._set_ports(info, True)
+
+    def _set_ports(self, info: ContainerInfo, in_use: bool) -> None:
+        if not info.running and in_use:
+            return
+        for port in info.ports:
+            host_port = port["host_port"]
+            if PORT_RANGE_MIN <= host_port <= PORT_RANGE_MAX:
+                self._port_bitmap[host_port - PORT_RANGE_MIN] = 1 if in_use else 0
+
+    def get_used_ports(self) -> Set[int]:
+        """Ports in the executor range held by running containers"""
+        with self._lock:
+            return {PORT_RANGE_MIN + i for i, used in enumerate(self._port_bitmap) if used}
+
+    def is_port_used(self, port: int) -> bool:
+        """Whether a running container holds the given port"""
+        if not PORT_RANGE_MIN <= port <= PORT_RANGE_MAX:
+            return False
+        return bool(self._port_bitmap[port - PORT_RANGE_MIN])
+
+    def list_running(self, label_selector: Optional[str] = None) -> List[ContainerInfo]:
+        """Running containers matching the label selector"""
+        with self._lock:
+            return [
+                info
+                for info in self._containers.values()
+                if info.running and _match_label_selector(info.labels, label_selector)
+            ]
+
+    def list_names(self, label_selector: Optional[str] = None) -> List[str]:
+        """Names of containers matching the label selector, running or not"""
+        with self._lock:
+            return [info.name for info in self._containers.values() if _match_label_selector(info.labels, label_selector)]
+
+    def get_container(self, name: str) -> Optional[ContainerInfo]:
+        """Container by name, running or not"""
+        with self._lock:
+            for info in self._containers.values():
+                if info.name == name:
+                    return info
+        return None
+
+
+_registry: Optional[ContainerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def start_container_registry(socket_path: str = DOCKER_SOCKET_PATH, wait_timeout: float = 5.0) -> Optional[ContainerRegistry]:
+    """
+    Start the shared container registry if the Docker socket is reachable.
+
+    Returns:
+        Optional[ContainerRegistry]: The registry, or None if it is disabled or unavailable
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            return _registry
+        if not DOCKER_ENGINE_API_ENABLED:
+            logger.info("Docker Engine API disabled, using docker CLI")
+            return None
+        if not os.path.exists(socket_path):
+            logger.info(f"Docker socket {socket_path} not found, using docker CLI")
+            return None
+
+        client = DockerEngineClient(socket_path)
+        if not client.ping():
+            client.close()
+            logger.warning(f"Docker daemon not reachable on {socket_path}, using docker CLI")
+            return None
+
+        registry = ContainerRegistry(client)
+        registry.start()
+        if not registry.wait_until_ready(wait_timeout):
+            logger.warning("Container registry initial sync is slow, using docker CLI until ready")
+        _registry = registry
+        return registry
+
+
+def stop_container_registry() -> None:
+    """Stop the shared container registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.stop()
+            _registry = None
+
+
+def get_container_registry() -> Optional[ContainerRegistry]:
+    """Return the shared registry if it is started and in sync, otherwise None"""
+    registry = _registry
+    if registry is not None and registry.ready:
+        return registry
+    return None
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Minimal Docker Engine API client over the Docker unix socket
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+from shared.logger import setup_logger
+
+from executor_manager.executors.docker.constants import DOCKER_SOCKET_PATH
+
+logger = setup_logger(__name__)
+
+
+class DockerEngineClient:
+    """
+    Docker Engine API client that keeps a persistent connection pool to the
+    daemon socket instead of spawning a docker CLI process per call.
+    """
+
+    def __init__(self, socket_path: str = DOCKER_SOCKET_PATH, timeout: float = 10.0):
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: Path of the Docker daemon unix socket
+            timeout: Timeout in seconds for regular (non-streaming) requests
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(uds=socket_path),
+            base_url="http://docker",
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self._client.close()
+
+    def ping(self) -> bool:
+        """Return True if the daemon answers on the socket"""
+        try:
+            return self._client.get("/_ping").status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    def list_containers(
+        self, filters: Optional[Dict[str, List[str]]] = None, all: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        List containers, equivalent to docker ps.
+
+        Args:
+            filters: Docker filters, e.g. {"label": ["owner=executor_manager"]}
+            all: Include stopped containers
+
+        Returns:
+            List[Dict[str, Any]]: Container summaries
+        """
+        params = {"all": "true" if all else "false"}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        response = self._client.get("/containers/json", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def inspect_container(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Inspect a container, equivalent to docker inspect.
+
+        Returns:
+            Optional[Dict[str, Any]]: Container details, None if it does not exist
+        """
+        response = self._client.get(f"/containers/{container_id}/json")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def events(
+        self,
+        filters: Optional[Dict[str, List[str]]] = None,
+        since: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream daemon events until the connection is closed.
+
+        Args:
+            filters: Docker event filters
+            since: Unix timestamp to replay events from
+
+        Yields:
+            Dict[str, Any]: Decoded events
+        """
+        params = {}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        if since is not None:
+            params["since"] = str(since)
+
+        # No read timeout: the stream stays idle until something happens
+        timeout = httpx.Timeout(self.timeout, read=None)
+        with self._client.stream(
+            "GET", "/events", params=params, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring malformed Docker event: {line[:200]}")
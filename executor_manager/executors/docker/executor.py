@@ -13,6 +13,7 @@ Docker executor for running tasks in Docker containers
 import json
 import os
 import subprocess
+import threading
 import time
 from email import utils
 from typing import Any, Dict, List, Optional, Tuple
@@ -22,6 +23,7 @@ import requests
 from executor_manager.config.config import EXECUTOR_ENV
 from executor_manager.executors.base import Executor
 from executor_manager.executors.docker.constants import (
+    CONTAINER_HEALTH_CHECK_DELAY,
     CONTAINER_OWNER,
     DEFAULT_API_ENDPOINT,
     DEFAULT_DOCKER_HOST,
@@ -31,6 +33,7 @@ from executor_manager.executors.docker.constants import (
     DEFAULT_TASK_ID,
     DEFAULT_TIMEZONE,
     DOCKER_SOCKET_PATH,
+    WARM_POOL_LABEL,
     WORKSPACE_MOUNT_PATH,
 )
 from executor_manager.executors.docker.utils import (
@@ -40,8 +43,13 @@ from executor_manager.executors.docker.utils import (
     find_available_port,
     get_container_ports,
     get_running_task_details,
+    release_port,
+)
+from executor_manager.executors.docker.warm_pool import WarmContainerPool
+from executor_manager.utils.executor_name import (
+    generate_assigned_warm_executor_name,
+    generate_executor_name,
 )
-from executor_manager.utils.executor_name import generate_executor_name
 from shared.logger import setup_logger
 from shared.status import TaskStatus
 from shared.telemetry.config import get_otel_config
@@ -66,6 +74,10 @@ class DockerExecutor(Executor):
         # Check if Docker is available
         self._check_docker_availability()
 
+        # Pre-started idle containers for online tasks (disabled unless configured),
+        # started and stopped with the application
+        self.warm_pool = WarmContainerPool(self)
+
     def _check_docker_availability(self) -> None:
         """Check if Docker is available on the system"""
         try:
@@ -113,13 +125,15 @@ class DockerExecutor(Executor):
             # Determine execution path based on whether container name exists
             if executor_name:
                 self._execute_in_existing_container(task, execution_status)
-            else:
+            elif not self._execute_in_warm_container(
+                task, task_info, execution_status, callback
+            ):
                 # Generate new container name
                 execution_status["executor_name"] = generate_executor_name(
                     task_id, subtask_id, user_name
                 )
 
-                self._create_new_container(task, task_info, execution_status)
+                self._create_new_container(task, task_info, execution_status, callback)
         except Exception as e:
             # Unified exception handling
             self._handle_execution_exception(e, task_id, execution_status)
@@ -127,7 +141,7 @@ class DockerExecutor(Executor):
         # Call callback function only for regular tasks (not validation tasks)
         # Validation tasks don't exist in the database, so we skip the callback
         # to avoid 404 errors when trying to update non-existent task status
-        if not is_validation_task:
+        if not is_validation_task and not execution_status.get("callback_sent"):
             self._call_callback(
                 callback,
                 task_id,
@@ -170,6 +184,94 @@ class DockerExecutor(Executor):
             status["progress"] = DEFAULT_PROGRESS_COMPLETE
             status["error_msg"] = response.json().get("error_msg", "")
 
+    def _execute_in_warm_container(
+        self,
+        task: Dict[str, Any],
+        task_info: Dict[str, Any],
+        status: Dict[str, Any],
+        callback: Optional[callable] = None,
+    ) -> bool:
+        """
+        Send the task to an idle warm pool container.
+
+        Returns:
+            bool: True if a pool container took the task, False to start a new container
+        """
+        if (
+            not self.warm_pool.enabled
+            or task.get("type", "online") != "online"
+            or task.get("callback_url")
+        ):
+            return False
+
+        image = self._get_base_image_from_task(task) or task.get(
+            "executor_image", os.getenv("EXECUTOR_IMAGE", "")
+        )
+        container = self.warm_pool.acquire(image)
+        if container is None:
+            return False
+
+        # Record the task on the container itself, so running task lookups and
+        # cancellation still find it after an executor_manager restart
+        assigned_name = generate_assigned_warm_executor_name(
+            container.name,
+            task_info["task_id"],
+            task_info["subtask_id"],
+            task.get("subtask_next_id"),
+        )
+        try:
+            self.subprocess.run(
+                ["docker", "rename", container.name, assigned_name],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to assign warm container {container.name} to task {task_info['task_id']}: {e}, starting a new container"
+            )
+            self.warm_pool.discard(container)
+            return False
+        container.name = assigned_name
+
+        # Report the executor before handing over the task, so the executor's own
+        # status callbacks always arrive after this one
+        self._call_callback(
+            callback,
+            task_info["task_id"],
+            task_info["subtask_id"],
+            container.name,
+            DEFAULT_PROGRESS_RUNNING,
+            TaskStatus.RUNNING.value,
+        )
+
+        try:
+            # The executor reports the assigned name in its callbacks instead of
+            # the pool name it was started with
+            response = self._send_task_to_container(
+                {**task, "executor_name": container.name},
+                DEFAULT_DOCKER_HOST,
+                container.port,
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(
+                f"Warm container {container.name} failed to take task {task_info['task_id']}: {e}, starting a new container"
+            )
+            self.warm_pool.discard(container)
+            return False
+
+        logger.info(
+            f"Task {task_info['task_id']} assigned to warm container {container.name}"
+        )
+        status["executor_name"] = container.name
+        status["callback_sent"] = True
+        return True
+
+    def get_warm_pool_stats(self) -> Dict[str, Any]:
+        """Warm container pool configuration and state"""
+        return self.warm_pool.get_stats()
+
     def _get_container_port(self, executor_name: str) -> int:
         """Get container port information"""
         port_result = get_container_ports(executor_name)
@@ -209,7 +311,11 @@ class DockerExecutor(Executor):
         return self.requests.post(endpoint, json=task, headers=headers)
 
     def _create_new_container(
-        self, task: Dict[str, Any], task_info: Dict[str, Any], status: Dict[str, Any]
+        self,
+        task: Dict[str, Any],
+        task_info: Dict[str, Any],
+        status: Dict[str, Any],
+        callback: Optional[callable] = None,
     ) -> None:
         """Create new Docker container"""
         executor_name = status["executor_name"]
@@ -260,9 +366,22 @@ class DockerExecutor(Executor):
             # Check if container is still running after a short delay
             # This catches cases where the container exits immediately (e.g., binary incompatibility)
             if base_image:
-                self._check_container_health(task, executor_name, is_validation_task)
+                if is_validation_task:
+                    self._check_container_health(
+                        task, executor_name, is_validation_task
+                    )
+                else:
+                    # Regular tasks report failures through the callback, so the
+                    # check does not need to hold up the launch
+                    self._schedule_container_health_check(
+                        task, task_info, executor_name, callback
+                    )
 
         except subprocess.CalledProcessError as e:
+            # The container never started, free its port for the next launch
+            if task_info.get("port"):
+                release_port(task_info["port"])
+
             # For validation tasks, report image pull or container start failure
             if is_validation_task:
                 error_msg = e.stderr or str(e)
@@ -282,9 +401,60 @@ class DockerExecutor(Executor):
                 )
             raise
 
-    def _check_container_health(
-        self, task: Dict[str, Any], executor_name: str, is_validation_task: bool
+    def _schedule_container_health_check(
+        self,
+        task: Dict[str, Any],
+        task_info: Dict[str, Any],
+        executor_name: str,
+        callback: Optional[callable],
     ) -> None:
+        """Run the container health check in the background after the startup delay"""
+        timer = threading.Timer(
+            CONTAINER_HEALTH_CHECK_DELAY,
+            self._check_container_health_in_background,
+            args=(task, task_info, executor_name, callback),
+        )
+        timer.daemon = True
+        timer.start()
+
+    def _check_container_health_in_background(
+        self,
+        task: Dict[str, Any],
+        task_info: Dict[str, Any],
+        executor_name: str,
+        callback: Optional[callable],
+    ) -> None:
+        """Check container health and report an immediate exit as a task failure"""
+        try:
+            error_msg = self._check_container_health(
+                task, executor_name, False, delay=0
+            )
+        except Exception as e:
+            logger.warning(f"Error checking container health: {e}")
+            return
+
+        if not error_msg or not callback:
+            return
+
+        try:
+            callback(
+                task_id=task_info["task_id"],
+                subtask_id=task_info["subtask_id"],
+                executor_name=executor_name,
+                progress=DEFAULT_PROGRESS_COMPLETE,
+                status=TaskStatus.FAILED.value,
+                error_message=f"Container exited immediately: {error_msg}",
+            )
+        except Exception as e:
+            logger.error(f"Error in callback for task {task_info['task_id']}: {e}")
+
+    def _check_container_health(
+        self,
+        task: Dict[str, Any],
+        executor_name: str,
+        is_validation_task: bool,
+        delay: float = CONTAINER_HEALTH_CHECK_DELAY,
+    ) -> Optional[str]:
         """
         Check if container is still running after startup.
 
@@ -297,9 +467,14 @@ class DockerExecutor(Executor):
             task: Task data
             executor_name: Name of the container to check
             is_validation_task: Whether this is a validation task
+            delay: Seconds to wait before checking
+
+        Returns:
+            Optional[str]: Failure reason if the container exited, None otherwise
         """
         # Wait a short time for container to potentially fail
-        time.sleep(2)
+        if delay > 0:
+            time.sleep(delay)
 
         try:
             # Check container status
@@ -381,6 +556,8 @@ class DockerExecutor(Executor):
                     # Raise exception to mark task as failed
                     raise RuntimeError(f"Container exited immediately: {error_msg}")
 
+                return error_msg
+
         except subprocess.TimeoutExpired:
             logger.warning(f"Timeout checking container health for {executor_name}")
         except RuntimeError:
@@ -389,6 +566,8 @@ class DockerExecutor(Executor):
         except Exception as e:
             logger.warning(f"Error checking container health: {e}")
 
+        return None
+
     def _analyze_container_failure(self, logs: str, exit_code: str) -> str:
         """
         Analyze container logs to determine the cause of failure.
@@ -489,8 +668,6 @@ class DockerExecutor(Executor):
             executor_image: Default executor image
             base_image: Optional custom base image
         """
-        from executors.docker.binary_extractor import EXECUTOR_BINARY_VOLUME
-
         task_id = task_info["task_id"]
         subtask_id = task_info["subtask_id"]
         user_name = task_info["user_name"]
@@ -523,19 +700,90 @@ class DockerExecutor(Executor):
             # Environment variables
             "-e",
             f"TASK_INFO={task_str}",
-            "-e",
-            f"EXECUTOR_NAME={executor_name}",
-            "-e",
-            f"TZ={DEFAULT_TIMEZONE}",
-            "-e",
-            f"LANG={DEFAULT_LOCALE}",
-            "-e",
-            f"EXECUTOR_ENV={EXECUTOR_ENV}",
-            # Mount
-            "-v",
-            f"{DOCKER_SOCKET_PATH}:{DOCKER_SOCKET_PATH}",
         ]
 
+        self._add_executor_options(cmd, executor_name, task_info, base_image)
+
+        # Add callback URL
+        self._add_callback_url(cmd, task)
+
+        # Add OpenTelemetry trace context for distributed tracing
+        self._add_trace_context(cmd)
+
+        # Add executor image (use base_image if provided, otherwise use default executor_image)
+        final_image = base_image if base_image else executor_image
+        cmd.append(final_image)
+
+        return cmd
+
+    def _prepare_warm_container_command(
+        self,
+        executor_name: str,
+        executor_image: str,
+        base_image: Optional[str] = None,
+        container_info: Optional[Dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Prepare Docker run command for an idle warm pool container.
+
+        The container starts without TASK_INFO, so the executor only serves its
+        API and waits for a task sent through _send_task_to_container.
+
+        Args:
+            executor_name: Container name
+            executor_image: Default executor image
+            base_image: Optional custom base image
+            container_info: Dict that receives the assigned port
+        """
+        container_info = container_info if container_info is not None else {}
+
+        cmd = [
+            "docker",
+            "run",
+            "-d",
+            "--name",
+            executor_name,
+            "--label",
+            f"owner={CONTAINER_OWNER}",
+            "--label",
+            f"{WARM_POOL_LABEL}={base_image or executor_image}",
+            # Pool containers only serve online tasks
+            "--label",
+            "aigc.weibo.com/task-type=online",
+        ]
+
+        self._add_executor_options(cmd, executor_name, container_info, base_image)
+        self._add_callback_url(cmd, {})
+        cmd.append(base_image if base_image else executor_image)
+
+        return cmd
+
+    def _add_executor_options(
+        self,
+        cmd: List[str],
+        executor_name: str,
+        task_info: Dict[str, Any],
+        base_image: Optional[str] = None,
+    ) -> None:
+        """Add environment, mounts, network and port shared by all executor containers"""
+        from executors.docker.binary_extractor import EXECUTOR_BINARY_VOLUME
+
+        cmd.extend(
+            [
+                "-e",
+                f"EXECUTOR_NAME={executor_name}",
+                "-e",
+                f"TZ={DEFAULT_TIMEZONE}",
+                "-e",
+                f"LANG={DEFAULT_LOCALE}",
+                "-e",
+                f"EXECUTOR_ENV={EXECUTOR_ENV}",
+                # Mount
+                "-v",
+                f"{DOCKER_SOCKET_PATH}:{DOCKER_SOCKET_PATH}",
+            ]
+        )
+
         # If using custom base_image, mount executor binary from Named Volume
         if base_image:
             cmd.extend(
@@ -561,21 +809,10 @@ class DockerExecutor(Executor):
 
         # Add port mapping
         port = find_available_port()
+        task_info["port"] = port
         logger.info(f"Assigned port {port} for container {executor_name}")
         cmd.extend(["-p", f"{port}:{port}", "-e", f"PORT={port}"])
 
-        # Add callback URL
-        self._add_callback_url(cmd, task)
-
-        # Add OpenTelemetry trace context for distributed tracing
-        self._add_trace_context(cmd)
-
-        # Add executor image (use base_image if provided, otherwise use default executor_image)
-        final_image = base_image if base_image else executor_image
-        cmd.append(final_image)
-
-        return cmd
-
     def _add_task_api_domain(self, cmd: List[str]) -> None:
         """Add TASK_API_DOMAIN environment variable for executor to access backend API"""
         task_api_domain = os.getenv("TASK_API_DOMAIN", "")
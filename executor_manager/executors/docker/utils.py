@@ -14,16 +14,29 @@ import os
 import re
 import socket
 import subprocess
-from typing import Set
+import threading
+import time
+from typing import Dict, Set
 from urllib.parse import urlparse
 
 from shared.logger import setup_logger
 from shared.utils.ip_util import get_host_ip, is_ip_address
 
-from executor_manager.config.config import PORT_RANGE_MAX, PORT_RANGE_MIN
+from executor_manager.config.config import (PORT_RANGE_MAX, PORT_RANGE_MIN,
+                                            PORT_RESERVATION_TTL)
+from executor_manager.executors.docker.constants import WARM_POOL_LABEL
+from executor_manager.executors.docker.container_registry import \
+    get_container_registry
+from executor_manager.utils.executor_name import parse_warm_executor_task
 
 logger = setup_logger(__name__)
 
+# Ports handed out to containers that may not be visible in docker ps yet,
+# mapped to their reservation expiry time. Guarded by _port_lock so concurrent
+# launches never pick the same port.
+_port_lock = threading.Lock()
+_reserved_ports: Dict[int, float] = {}
+
 
 def build_callback_url(task: dict) -> str:
     """
@@ -65,9 +78,9 @@ def build_callback_url(task: dict) -> str:
 
 def find_available_port() -> int:
     """
-    Find an available port in the defined range.
+    Find and reserve an available port in the defined range.
     Only considers ports used by containers with label=owner=executor_manager
-    and ports in use by the host system.
+    and ports reserved by launches that are still in progress.
 
     Returns:
         int: An available port number
@@ -83,7 +96,7 @@ def find_available_port() -> int:
         )
         
         # Find first available port in range
-        return _get_first_available_port(docker_used_ports)
+        return _reserve_first_available_port(docker_used_ports)
         
     except subprocess.CalledProcessError as e:
         logger.error("Error checking Docker ports: %s", e.stderr or e)
@@ -116,6 +129,38 @@ def _get_first_available_port(used_ports: Set[int]) -> int:
     )
 
 
+def _reserve_first_available_port(used_ports: Set[int]) -> int:
+    """
+    Reserve the first port that is neither in use nor reserved.
+
+    Args:
+        used_ports: Set of ports already in use
+
+    Returns:
+        int: Reserved port
+    """
+    with _port_lock:
+        now = time.monotonic()
+        for port, expires_at in list(_reserved_ports.items()):
+            if expires_at <= now:
+                del _reserved_ports[port]
+
+        port = _get_first_available_port(used_ports | set(_reserved_ports))
+        _reserved_ports[port] = now + PORT_RESERVATION_TTL
+        return port
+
+
+def release_port(port: int) -> None:
+    """
+    Release a port reservation, e.g. when the container failed to start.
+
+    Args:
+        port: Port returned by find_available_port
+    """
+    with _port_lock:
+        _reserved_ports.pop(port, None)
+
+
 def get_docker_used_ports() -> Set[int]:
     """
     Get ports used by Docker containers with owner=executor_manager label.
@@ -123,6 +168,10 @@ def get_docker_used_ports() -> Set[int]:
     Returns:
         Set[int]: Set of port numbers in use
     """
+    registry = get_container_registry()
+    if registry is not None:
+        return registry.get_used_ports()
+
     docker_used_ports = set()
     cmd = [
         "docker",
@@ -145,6 +194,50 @@ def get_docker_used_ports() -> Set[int]:
     return docker_used_ports
 
 
+def _apply_container_tasks(containers: list) -> None:
+    """
+    Fill in task labels of assigned warm pool containers. Pool containers are
+    started before their task is known, so their Docker labels carry no task
+    ids; the assignment is kept in the container name instead.
+    """
+    for container_info in containers:
+        if container_info.get("task_id"):
+            continue
+        task_labels = parse_warm_executor_task(container_info["container_name"])
+        if task_labels:
+            container_info.update(task_labels)
+
+
+def list_warm_pool_containers() -> list:
+    """
+    List the names of warm pool containers, running or not.
+
+    Returns:
+        list: Container names, empty if Docker cannot be queried
+    """
+    registry = get_container_registry()
+    if registry is not None:
+        return registry.list_names(WARM_POOL_LABEL)
+
+    try:
+        cmd = [
+            "docker",
+            "ps",
+            "-a",
+            "--filter",
+            "label=owner=executor_manager",
+            "--filter",
+            f"label={WARM_POOL_LABEL}",
+            "--format",
+            "{{.Names}}",
+        ]
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        return [name for name in result.stdout.splitlines() if name.strip()]
+    except Exception as e:
+        logger.warning(f"Failed to list warm pool containers: {getattr(e, 'stderr', None) or e}")
+        return []
+
+
 def check_container_ownership(container_name: str) -> bool:
     """
     Check if container exists and is owned by executor_manager.
@@ -155,6 +248,10 @@ def check_container_ownership(container_name: str) -> bool:
     Returns:
         bool: True if container exists and is owned by executor_manager, False otherwise
     """
+    registry = get_container_registry()
+    if registry is not None:
+        return registry.get_container(container_name) is not None
+
     try:
         check_cmd = [
             "docker",
@@ -233,11 +330,15 @@ def count_running_containers(label_selector: str = None) -> dict:
         dict: Result with status, count and optional error message
     """
     try:
-        cmd = _build_docker_ps_command(label_selector)
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        
-        # Count non-empty lines in output
-        container_count = sum(1 for line in result.stdout.split("\n") if line.strip())
+        registry = get_container_registry()
+        if registry is not None:
+            container_count = len(registry.list_running(label_selector))
+        else:
+            cmd = _build_docker_ps_command(label_selector)
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+
+            # Count non-empty lines in output
+            container_count = sum(1 for line in result.stdout.split("\n") if line.strip())
         
         logger.info(f"Found {container_count} running containers with owner=executor_manager")
         return {"status": "success", "count": container_count}
@@ -262,67 +363,23 @@ def get_running_task_details(label_selector: str = None) -> dict:
         dict: Result with status, task_details and optional error message
     """
     try:
-        # Base command with owner filter
-        cmd = ["docker", "ps", "--filter", "label=owner=executor_manager"]
-        
-        # Add additional label selector if provided
-        if label_selector:
-            cmd.extend(["--filter", f"label={label_selector}"])
-            
-        # Format to get task_id, subtask_id, subtask_next_id and container name
-        # Using go template formatting to get multiple fields
-        cmd.extend([
-            "--format",
-            "{{.Label \"task_id\"}}|{{.Label \"subtask_id\"}}|{{.Label \"subtask_next_id\"}}|{{.Label \"aigc.weibo.com/task-type\"}}|{{.Names}}"
-        ])
-        
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        
-        # Process container information
-        containers = []
-        task_map = {}
-        
-        for line in result.stdout.split("\n"):
-            if not line.strip():
-                continue
-                
-            parts = line.strip().split("|")
-            
-            if len(parts) >= 5:
-                task_id = parts[0]
-                subtask_id = parts[1]
-                subtask_next_id = parts[2]
-                task_type = parts[3] if parts[3] else "online"
-                container_name = parts[4]
-                                
-                container_info = {
-                    "task_id": task_id,
-                    "subtask_id": subtask_id,
-                    "container_name": container_name,
-                    "subtask_next_id": subtask_next_id,
-                    "task_type": task_type
+        registry = get_container_registry()
+        if registry is not None:
+            containers = [
+                {
+                    "task_id": info.labels.get("task_id", ""),
+                    "subtask_id": info.labels.get("subtask_id", ""),
+                    "container_name": info.name,
+                    "subtask_next_id": info.labels.get("subtask_next_id", ""),
+                    "task_type": info.labels.get("aigc.weibo.com/task-type") or "online"
                 }
-                
-                containers.append(container_info)
-                
-                # Group by task_id
-                if task_id not in task_map:
-                    task_map[task_id] = []
-                task_map[task_id].append(container_info)
-        
-        # Determine which tasks are still running
-        running_task_ids = []
-        for task_id, task_containers in task_map.items():
-            # Check if any container for this task has an empty subtask_next_id
-
-            has_completed = False
-            has_completed = any(
-                container.get("subtask_next_id") == ""
-                for container in task_containers
-            )
-            
-            if not has_completed:
-                running_task_ids.append(task_id)
+                for info in registry.list_running(label_selector)
+            ]
+        else:
+            containers = _list_task_containers(label_selector)
+
+        _apply_container_tasks(containers)
+        running_task_ids = _get_running_task_ids(containers)
         
         logger.info(f"Found {len(running_task_ids)} running tasks with owner=executor_manager")
         return {
@@ -341,6 +398,84 @@ def get_running_task_details(label_selector: str = None) -> dict:
             "containers": []
         }
 
+
+def _list_task_containers(label_selector: str = None) -> list:
+    """
+    List task containers with the docker CLI.
+
+    Args:
+        label_selector (str, optional): Additional label selector for filtering
+
+    Returns:
+        list: Container info dicts with task labels and container name
+    """
+    # Base command with owner filter
+    cmd = ["docker", "ps", "--filter", "label=owner=executor_manager"]
+    
+    # Add additional label selector if provided
+    if label_selector:
+        cmd.extend(["--filter", f"label={label_selector}"])
+        
+    # Format to get task_id, subtask_id, subtask_next_id and container name
+    # Using go template formatting to get multiple fields
+    cmd.extend([
+        "--format",
+        "{{.Label \"task_id\"}}|{{.Label \"subtask_id\"}}|{{.Label \"subtask_next_id\"}}|{{.Label \"aigc.weibo.com/task-type\"}}|{{.Names}}"
+    ])
+    
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    
+    # Process container information
+    containers = []
+    
+    for line in result.stdout.split("\n"):
+        if not line.strip():
+            continue
+            
+        parts = line.strip().split("|")
+        
+        if len(parts) >= 5:
+            containers.append({
+                "task_id": parts[0],
+                "subtask_id": parts[1],
+                "container_name": parts[4],
+                "subtask_next_id": parts[2],
+                "task_type": parts[3] if parts[3] else "online"
+            })
+
+    return containers
+
+
+def _get_running_task_ids(containers: list) -> list:
+    """
+    Determine which tasks are still running.
+
+    A task is finished once any of its containers has an empty subtask_next_id.
+
+    Args:
+        containers (list): Container info dicts
+
+    Returns:
+        list: Task IDs that are still running
+    """
+    # Group by task_id
+    task_map = {}
+    for container_info in containers:
+        task_map.setdefault(container_info["task_id"], []).append(container_info)
+
+    running_task_ids = []
+    for task_id, task_containers in task_map.items():
+        # Check if any container for this task has an empty subtask_next_id
+        has_completed = any(
+            container.get("subtask_next_id") == ""
+            for container in task_containers
+        )
+        
+        if not has_completed:
+            running_task_ids.append(task_id)
+
+    return running_task_ids
+
 def get_container_ports(container_name: str) -> dict:
     """
     Get port mappings for a specific container by name.
@@ -359,6 +494,15 @@ def get_container_ports(container_name: str) -> dict:
                 "error_msg": f"Container '{container_name}' not found or not owned by executor_manager",
                 "ports": []
             }
+
+        registry = get_container_registry()
+        if registry is not None:
+            info = registry.get_container(container_name)
+            ports = list(info.ports) if info and info.running else []
+            return {
+                "status": "success",
+                "ports": ports
+            }
             
         # Get ports information for the specific container
         cmd = [
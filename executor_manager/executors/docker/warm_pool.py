@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Warm container pool for the Docker executor.
+
+Keeps pre-started idle executor containers per image so that online tasks are
+sent to a running executor instead of paying for docker run and executor
+startup on the critical path.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from shared.logger import setup_logger
+
+from executor_manager.config.config import (WARM_POOL_IMAGE_CAPS,
+                                            WARM_POOL_MAX_IDLE_SECONDS,
+                                            WARM_POOL_REFILL_INTERVAL,
+                                            WARM_POOL_SIZE)
+from executor_manager.executors.docker.constants import DEFAULT_DOCKER_HOST
+from executor_manager.executors.docker.utils import (delete_container,
+                                                     list_warm_pool_containers,
+                                                     release_port)
+from executor_manager.utils.executor_name import (generate_warm_executor_name,
+                                                  parse_warm_executor_task)
+
+logger = setup_logger(__name__)
+
+# Maximum time to wait for a new pool container to serve its API (seconds)
+READY_TIMEOUT = 60
+READY_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class WarmContainer:
+    """An idle pool container"""
+
+    name: str
+    image: str
+    port: int
+    created_at: float
+
+
+def _parse_image_caps(raw: str) -> Dict[str, int]:
+    try:
+        caps = json.loads(raw or "{}")
+        return {str(image): max(0, int(size)) for image, size in caps.items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.error(f"Invalid WARM_POOL_IMAGE_CAPS, ignoring: {e}")
+        return {}
+
+
+class WarmContainerPool:
+    """Pool of idle executor containers, refilled in the background"""
+
+    def __init__(
+        self,
+        executor,
+        pool_size: int = WARM_POOL_SIZE,
+        max_idle_seconds: int = WARM_POOL_MAX_IDLE_SECONDS,
+        image_caps: Optional[Dict[str, int]] = None,
+        refill_interval: int = WARM_POOL_REFILL_INTERVAL,
+        default_image: Optional[str] = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            executor: DockerExecutor used to build and run pool containers
+            pool_size: Idle containers kept for the default executor image
+            max_idle_seconds: Idle containers older than this are replaced
+            image_caps: Pool size per image, overrides pool_size for that image
+            refill_interval: Seconds between maintenance runs
+            default_image: Default executor image (EXECUTOR_IMAGE)
+        """
+        self.executor = executor
+        self.pool_size = max(0, pool_size)
+        self.max_idle_seconds = max_idle_seconds
+        self.image_caps = image_caps if image_caps is not None else _parse_image_caps(WARM_POOL_IMAGE_CAPS)
+        self.refill_interval = refill_interval
+        self.default_image = default_image if default_image is not None else os.getenv("EXECUTOR_IMAGE", "")
+
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[WarmContainer]] = {}
+        self._starting: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return any(self.get_target(image) > 0 for image in self.images())
+
+    def images(self) -> List[str]:
+        """Images that have a pool"""
+        images = list(self.image_caps.keys())
+        if self.default_image and self.default_image not in self.image_caps:
+            images.insert(0, self.default_image)
+        return images
+
+    def get_target(self, image: str) -> int:
+        """Number of idle containers to keep for an image"""
+        if image in self.image_caps:
+            return self.image_caps[image]
+        return self.pool_size if image == self.default_image else 0
+
+    def start(self) -> None:
+        """Remove idle containers left by a previous run and start background maintenance"""
+        if self._running:
+            return
+        self.remove_orphans()
+        if not self.enabled:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="warm-container-pool", daemon=True)
+        self._thread.start()
+        logger.info(f"Warm container pool started: {self.get_stats()}")
+
+    def stop(self) -> None:
+        """Stop maintenance and remove idle containers"""
+        self._running = False
+        self._wakeup.set()
+        with self._lock:
+            idle = [c for containers in self._idle.values() for c in containers]
+            self._idle = {}
+        for container in idle:
+            self._remove(container)
+
+    def remove_orphans(self) -> None:
+        """
+        Remove idle pool containers this pool does not track, e.g. the ones of a
+        previous executor_manager run. Containers assigned to a task are kept.
+        """
+        with self._lock:
+            tracked = {c.name for containers in self._idle.values() for c in containers}
+        for name in list_warm_pool_containers():
+            if name in tracked or parse_warm_executor_task(name):
+                continue
+            logger.info(f"Removing orphaned warm container {name}")
+            result = delete_container(name)
+            if result.get("status") != "success":
+                logger.warning(f"Failed to remove warm container {name}: {result.get('error_msg')}")
+
+    def acquire(self, image: str) -> Optional[WarmContainer]:
+        """
+        Take an idle container for an image.
+
+        Returns:
+            Optional[WarmContainer]: The container, or None if the pool is empty
+        """
+        if self.get_target(image) <= 0:
+            return None
+
+        expired = []
+        container = None
+        now = time.time()
+        with self._lock:
+            idle = self._idle.get(image, [])
+            while idle:
+                candidate = idle.pop()
+                if now - candidate.created_at < self.max_idle_seconds:
+                    container = candidate
+                    break
+                expired.append(candidate)
+            if container:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        for stale in expired:
+            self._remove(stale)
+        # Replace the taken container right away
+        self._wakeup.set()
+        return container
+
+    def discard(self, container: WarmContainer) -> None:
+        """Remove a container that could not take its task"""
+        self._remove(container)
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while self._running:
+            try:
+                self.refill()
+            except Exception as e:
+                logger.error(f"Warm container pool maintenance failed: {e}")
+            self._wakeup.wait(self.refill_interval)
+            self._wakeup.clear()
+
+    def refill(self) -> None:
+        """Replace expired idle containers and start missing ones"""
+        now = time.time()
+        expired = []
+        missing = {}
+        with self._lock:
+            for image in self.images():
+                idle = self._idle.setdefault(image, [])
+                fresh = [c for c in idle if now - c.created_at < self.max_idle_seconds]
+                expired.extend(c for c in idle if c not in fresh)
+                self._idle[image] = fresh
+                needed = self.get_target(image) - len(fresh) - self._starting.get(image, 0)
+                if needed > 0:
+                    missing[image] = needed
+                    self._starting[image] = self._starting.get(image, 0) + needed
+
+        for container in expired:
+            logger.info(f"Removing expired warm container {container.name}")
+            self._remove(container)
+
+        for image, count in missing.items():
+            for _ in range(count):
+                container = None
+                try:
+                    container = self._start_container(image)
+                except Exception as e:
+                    logger.error(f"Failed to start warm container for {image}: {e}")
+                with self._lock:
+                    self._starting[image] -= 1
+                    if container:
+                        self._idle.setdefault(image, []).append(container)
+
+    def _start_container(self, image: str) -> Optional[WarmContainer]:
+        """Start a pool container and wait until its executor API answers"""
+        name = generate_warm_executor_name()
+        base_image = None if image == self.default_image else image
+        if base_image:
+            self.executor._ensure_executor_binary_updated(self.default_image)
+
+        container_info: Dict[str, Any] = {}
+        cmd = self.executor._prepare_warm_container_command(name, self.default_image, base_image, container_info)
+        try:
+            self.executor.subprocess.run(cmd, check=True, capture_output=True, text=True)
+        except Exception:
+            if container_info.get("port"):
+                release_port(container_info["port"])
+            raise
+
+        container = WarmContainer(name=name, image=image, port=container_info["port"], created_at=time.time())
+        if self._wait_until_ready(container):
+            logger.info(f"Warm container {name} ready on port {container.port} for {image}")
+            return container
+
+        logger.warning(f"Warm container {name} did not become ready, removing it")
+        self._remove(container)
+        return None
+
+    def _wait_until_ready(self, container: WarmContainer) -> bool:
+        deadline = time.time() + READY_TIMEOUT
+        url = f"http://{DEFAULT_DOCKER_HOST}:{container.port}/"
+        while self._running and time.time() < deadline:
+            try:
+                # Any HTTP answer means the executor API is up
+                self.executor.requests.get(url, timeout=2)
+                return True
+            except Exception:
+                time.sleep(READY_POLL_INTERVAL)
+        return False
+
+    def _remove(self, container: WarmContainer) -> None:
+        result = delete_container(container.name)
+        if result.get("status") != "success":
+            logger.warning(f"Failed to remove warm container {container.name}: {result.get('error_msg')}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool configuration and state for the load endpoint"""
+        with self._lock:
+            images = {
+                image: {
+                    "target": self.get_target(image),
+                    "idle": len(self._idle.get(image, [])),
+                    "starting": self._starting.get(image, 0),
+                }
+                for image in self.images()
+            }
+            hits, misses = self._hits, self._misses
+        return {
+            "enabled": self.enabled,
+            "pool_size": self.pool_size,
+            "max_idle_seconds": self.max_idle_seconds,
+            "image_caps": dict(self.image_caps),
+            "images": images,
+            "hits": hits,
+            "misses": misses,
+        }
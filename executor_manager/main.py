@@ -71,6 +71,25 @@ async def lifespan(app):
     except Exception as e:
         logger.warning(f"Executor binary extraction error: {e}, custom base images may not work")
 
+    # Track executor containers in memory through the Docker Engine API
+    try:
+        from executor_manager.executors.docker.container_registry import \
+            start_container_registry
+        if start_container_registry():
+            logger.info("Docker container registry started")
+    except Exception as e:
+        logger.warning(f"Docker container registry unavailable, using docker CLI: {e}")
+
+    # Start the warm container pool after removing idle pool containers of a previous run
+    warm_pool = None
+    try:
+        from executor_manager.executors.dispatcher import ExecutorDispatcher
+        warm_pool = getattr(ExecutorDispatcher.get_executor("docker"), "warm_pool", None)
+        if warm_pool is not None:
+            warm_pool.start()
+    except Exception as e:
+        logger.warning(f"Failed to start warm container pool: {e}")
+
     # Start the task scheduler
     logger.info("Initializing task scheduler...")
     scheduler_instance = TaskScheduler()
@@ -90,6 +109,19 @@ async def lifespan(app):
     if scheduler_instance:
         scheduler_instance.stop()
 
+    # Remove idle pool containers, containers running tasks are kept
+    if warm_pool is not None:
+        warm_pool.stop()
+
+    from executor_manager.executors.docker.container_registry import \
+        stop_container_registry
+    stop_container_registry()
+
+    # Forward callbacks still queued
+    from executor_manager.config.config import CALLBACK_DRAIN_TIMEOUT
+    from executor_manager.tasks.callback_forwarder import callback_forwarder
+    await callback_forwarder.stop(CALLBACK_DRAIN_TIMEOUT)
+
     # Shutdown OpenTelemetry
     if otel_config.enabled:
         from shared.telemetry.core import shutdown_telemetry
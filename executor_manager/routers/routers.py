@@ -10,14 +10,18 @@
 API routes module, defines FastAPI routes and models
 """
 
+import asyncio
 import os
 import time
 import uuid
 from typing import Any, Dict, Optional
 
-from executor_manager.clients.task_api_client import TaskApiClient
 from executor_manager.config.config import EXECUTOR_DISPATCHER_MODE
 from executor_manager.executors.dispatcher import ExecutorDispatcher
+from executor_manager.tasks.callback_forwarder import (
+    CallbackQueueFull,
+    callback_forwarder,
+)
 from executor_manager.tasks.task_processor import TaskProcessor
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse
@@ -30,6 +34,7 @@ from shared.telemetry.context import (
     set_task_context,
     set_user_context,
 )
+from shared.utils.http_util import build_payload
 
 # Setup logger
 logger = setup_logger(__name__)
@@ -42,8 +47,6 @@ app = FastAPI(
 
 # Create task processor for handling callbacks
 task_processor = TaskProcessor()
-# Create API client for direct API calls
-api_client = TaskApiClient()
 
 # Health check paths that should skip logging to reduce overhead
 HEALTH_CHECK_PATHS = {"/", "/health"}
@@ -202,6 +205,8 @@ class CallbackRequest(BaseModel):
     status: Optional[str] = None
     error_message: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
+    result_seq: Optional[int] = None  # Sequence number of a full result
+    result_delta: Optional[Dict[str, Any]] = None  # Result as a delta of the last one
     task_type: Optional[str] = (
         None  # Task type: "validation" for validation tasks, None for regular tasks
     )
@@ -243,27 +248,37 @@ async def callback_handler(request: CallbackRequest, http_request: Request):
                 "message": f"Successfully processed validation callback for task {request.task_id}",
             }
 
-        # For regular tasks, update task status in database
-        success, result = api_client.update_task_status_by_fields(
+        # For regular tasks, queue the status update for the database
+        payload = build_payload(
             task_id=request.task_id,
             subtask_id=request.subtask_id,
-            progress=request.progress,
             executor_name=request.executor_name,
             executor_namespace=request.executor_namespace,
+            progress=request.progress,
             status=request.status,
             error_message=request.error_message,
-            title=request.task_title,
             result=request.result,
+            result_seq=request.result_seq,
+            result_delta=request.result_delta,
+            title=request.task_title,
         )
-        if not success:
-            logger.warning(
-                f"Failed to update status for task {request.task_id}: {result}"
-            )
-        logger.info(f"Successfully processed callback for task {request.task_id}")
-        return {
+        try:
+            resync = callback_forwarder.submit(payload)
+        except CallbackQueueFull as e:
+            logger.warning(f"Rejecting callback for task {request.task_id}: {e}")
+            raise HTTPException(status_code=503, detail=str(e))
+
+        logger.info(f"Successfully queued callback for task {request.task_id}")
+        response = {
             "status": "success",
             "message": f"Successfully processed callback for task {request.task_id}",
         }
+        # The backend missed an earlier delta, ask the executor for the full result
+        if resync:
+            response["resync"] = True
+        return response
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing callback: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -359,8 +374,10 @@ async def receive_tasks(request: TasksRequest, http_request: Request):
                 user_id=str(first_task.user.id), user_name=first_task.user.name
             )
 
-        # Call the task processor to handle the tasks
-        task_processor.process_tasks([task.dict() for task in request.tasks])
+        # Call the task processor to handle the tasks, off the event loop
+        await asyncio.to_thread(
+            task_processor.process_tasks, [task.dict() for task in request.tasks]
+        )
         return {"code": 0}
     except Exception as e:
         logger.error(f"Error processing tasks: {e}")
@@ -406,6 +423,8 @@ async def get_executor_load(http_request: Request):
         executor = ExecutorDispatcher.get_executor(EXECUTOR_DISPATCHER_MODE)
         result = executor.get_executor_count()
         result["total"] = int(os.getenv("MAX_CONCURRENT_TASKS", "30"))
+        if hasattr(executor, "get_warm_pool_stats"):
+            result["warm_pool"] = executor.get_warm_pool_stats()
         return result
     except Exception as e:
         logger.error(f"Error getting executor load: {e}")
@@ -523,7 +542,7 @@ async def validate_image(request: ValidateImageRequest, http_request: Request):
 
     try:
         # Submit validation task using the task processor
-        task_processor.process_tasks([validation_task])
+        await asyncio.to_thread(task_processor.process_tasks, [validation_task])
 
         logger.info(
             f"Validation task submitted: task_id={validation_task_id}, validation_id={validation_id}, image={image}"
@@ -11,7 +11,9 @@ Scheduler module, responsible for periodic task execution
 """
 
 import os
+import threading
 import time
+from contextlib import contextmanager
 
 import pytz
 from apscheduler.executors.pool import ThreadPoolExecutor
@@ -27,7 +29,9 @@ from executor_manager.config.config import (EXECUTOR_DISPATCHER_MODE,
                                             OFFLINE_TASK_EVENING_HOURS,
                                             OFFLINE_TASK_MORNING_HOURS,
                                             SCHEDULER_SLEEP_TIME,
-                                            TASK_FETCH_INTERVAL)
+                                            TASK_FETCH_INTERVAL,
+                                            TASK_LONG_POLL_FALLBACK_INTERVAL,
+                                            TASK_LONG_POLL_TIMEOUT)
 from executor_manager.executors.dispatcher import ExecutorDispatcher
 from executor_manager.tasks.task_processor import TaskProcessor
 
@@ -42,8 +46,13 @@ class TaskScheduler:
         self.api_client = TaskApiClient()
         self.task_processor = TaskProcessor()
         self.running = False
+        self.watcher_thread = None
         self.max_concurrent_tasks = int(os.getenv("MAX_CONCURRENT_TASKS", "30"))
         self.max_offline_concurrent_tasks = int(os.getenv("MAX_OFFLINE_CONCURRENT_TASKS", "10"))
+        # Online slots held by fetches in flight, shared by the long-poll watcher
+        # and the interval job so both never hand out the same free slots
+        self._online_slots_lock = threading.Lock()
+        self._reserved_online_slots = 0
 
         # Configure APScheduler
         jobstores = {"default": MemoryJobStore()}
@@ -92,30 +101,115 @@ class TaskScheduler:
         set_span_attribute("executor.running_count", running_executor_num)
         set_span_attribute("executor.max_concurrent", self.max_concurrent_tasks)
 
-        available_slots = min(10, self.max_concurrent_tasks - running_executor_num)
+        with self._reserve_online_slots(running_executor_num) as available_slots:
+            if available_slots <= 0:
+                logger.info("No available slots for new tasks, skipping fetch")
+                set_span_attribute("task.skipped", True)
+                set_span_attribute("task.skip_reason", "no_available_slots")
+                return True
 
-        if available_slots <= 0:
-            logger.info("No available slots for new tasks, skipping fetch")
-            set_span_attribute("task.skipped", True)
-            set_span_attribute("task.skip_reason", "no_available_slots")
-            return True
+            self.api_client.update_fetch_params(limit=available_slots)
+            logger.info(f"Fetching up to {available_slots} online tasks")
+            set_span_attribute("task.fetch_limit", available_slots)
 
-        self.api_client.update_fetch_params(limit=available_slots)
-        logger.info(f"Fetching up to {available_slots} online tasks")
-        set_span_attribute("task.fetch_limit", available_slots)
+            success, result = self.api_client.fetch_tasks()
+            logger.info(f"Online tasks fetch result: success={success}, data={result}")
 
-        success, result = self.api_client.fetch_tasks()
-        logger.info(f"Online tasks fetch result: success={success}, data={result}")
+            if success:
+                tasks = result.get("tasks", [])
+                set_span_attribute("task.fetched_count", len(tasks))
+                self.task_processor.process_tasks(tasks)
+            else:
+                set_span_attribute("error", True)
+                set_span_attribute("task.fetch_success", False)
 
-        if success:
-            tasks = result.get("tasks", [])
-            set_span_attribute("task.fetched_count", len(tasks))
-            self.task_processor.process_tasks(tasks)
-        else:
+        return success
+
+    @contextmanager
+    def _reserve_online_slots(self, running_executor_num):
+        """
+        Reserve free online slots for one fetch until its tasks are processed.
+
+        Slots held by the other fetch in flight are not free, so the watcher and
+        the interval job together never start more than max_concurrent_tasks.
+        """
+        with self._online_slots_lock:
+            free_slots = self.max_concurrent_tasks - running_executor_num - self._reserved_online_slots
+            slots = max(0, min(10, free_slots))
+            self._reserved_online_slots += slots
+        try:
+            yield slots
+        finally:
+            with self._online_slots_lock:
+                self._reserved_online_slots -= slots
+
+    def _get_running_online_executors(self):
+        """Return the number of running online executors, or None if unknown"""
+        executor_count_result = ExecutorDispatcher.get_executor(EXECUTOR_DISPATCHER_MODE).get_executor_count(
+            "aigc.weibo.com/task-type=online"
+        )
+
+        if executor_count_result["status"] != "success":
+            error_msg = executor_count_result.get("error_msg", "Unknown error")
+            logger.error(f"Failed to get pod count: {error_msg}")
+            return None
+
+        return executor_count_result.get("running", 0)
+
+    @trace_sync(
+        span_name="watch_online_tasks",
+        tracer_name="executor_manager.scheduler",
+        attributes={"task.type": "online", "scheduler.job": "watch_online_tasks"},
+    )
+    def _long_poll_online_tasks(self, available_slots):
+        """Long-poll one batch of online tasks and process it, returns the number of tasks"""
+        set_span_attribute("task.fetch_limit", available_slots)
+        success, result = self.api_client.wait_for_tasks(
+            limit=available_slots, wait=TASK_LONG_POLL_TIMEOUT
+        )
+        tasks = result.get("tasks", []) if success and isinstance(result, dict) else []
+        set_span_attribute("task.fetched_count", len(tasks))
+        if not success:
             set_span_attribute("error", True)
             set_span_attribute("task.fetch_success", False)
-
-        return success
+        if tasks:
+            logger.info(f"Online task watcher received {len(tasks)} tasks")
+            self.task_processor.process_tasks(tasks)
+        return len(tasks)
+
+    def watch_online_tasks(self):
+        """
+        Long-poll the backend for online tasks.
+
+        The backend holds each dispatch request until new PENDING tasks are
+        announced, so tasks start immediately instead of waiting for the next
+        fetch interval. The interval job keeps running less often as a
+        fallback; both reserve their slots so they never hand out the same ones.
+        """
+        logger.info(f"Online task watcher started, long-poll timeout {TASK_LONG_POLL_TIMEOUT} seconds")
+        while self.running:
+            try:
+                running_executor_num = self._get_running_online_executors()
+                if running_executor_num is None:
+                    time.sleep(SCHEDULER_SLEEP_TIME)
+                    continue
+
+                with self._reserve_online_slots(running_executor_num) as available_slots:
+                    if available_slots <= 0:
+                        time.sleep(SCHEDULER_SLEEP_TIME)
+                        continue
+
+                    started = time.time()
+                    received = self._long_poll_online_tasks(available_slots)
+
+                if not received and time.time() - started < SCHEDULER_SLEEP_TIME:
+                    # The backend answered at once without tasks (long-poll unsupported
+                    # or request failed), back off to the polling interval instead of spinning
+                    time.sleep(TASK_FETCH_INTERVAL)
+            except Exception as e:
+                logger.error(f"Online task watcher error: {e}")
+                time.sleep(TASK_FETCH_INTERVAL)
+        logger.info("Online task watcher stopped")
 
     @trace_sync(
         span_name="fetch_offline_tasks",
@@ -216,10 +310,15 @@ class TaskScheduler:
         """Setup schedule plan"""
         logger.info(f"Set task fetch interval to {TASK_FETCH_INTERVAL} seconds")
         
+        # Online tasks are picked up by the long-poll watcher when it is enabled,
+        # interval polling then only runs as a less frequent fallback
+        online_fetch_interval = TASK_FETCH_INTERVAL
+        if TASK_LONG_POLL_TIMEOUT > 0:
+            online_fetch_interval = max(TASK_FETCH_INTERVAL, TASK_LONG_POLL_FALLBACK_INTERVAL)
         self.scheduler.add_job(
             self.fetch_online_and_process_tasks,
             'interval',
-            seconds=TASK_FETCH_INTERVAL,
+            seconds=online_fetch_interval,
             id='fetch_online_tasks',
             name='fetch_online_tasks'
         )
@@ -256,6 +355,12 @@ class TaskScheduler:
         
         try:
             self.scheduler.start()
+
+            if TASK_LONG_POLL_TIMEOUT > 0:
+                self.watcher_thread = threading.Thread(
+                    target=self.watch_online_tasks, name="online-task-watcher", daemon=True
+                )
+                self.watcher_thread.start()
             
             while self.running:
                 time.sleep(SCHEDULER_SLEEP_TIME)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""
+Callback forwarder module, queues executor callbacks and forwards them to the
+API with a pool of workers so callback handlers never wait for the backend.
+
+- Updates of a subtask are forwarded one at a time and in the order received.
+- A queued update that no worker has picked up yet is replaced by a newer
+  update of the same subtask, unless it is terminal or its result would be
+  lost. Fields only the replaced update carried are kept.
+- A queued result delta is merged with the next delta of the subtask that
+  follows it, so a slow backend receives one delta instead of many.
+- Terminal updates are never replaced and are accepted even when the queue
+  is full.
+- When the API answers a result delta with "resync", the next result delta
+  of the subtask is not queued and its callback is answered with "resync"
+  instead, so the executor sends its full result.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from shared.logger import setup_logger
+from shared.telemetry.context import set_task_context
+from shared.telemetry.metrics import (record_callback_forwarded,
+                                      record_callback_queue_change)
+from shared.utils.result_delta import merge_result_deltas
+
+from executor_manager.clients.async_task_api_client import AsyncTaskApiClient
+from executor_manager.config.config import (CALLBACK_FORWARD_WORKERS,
+                                            CALLBACK_QUEUE_MAX_SIZE)
+
+logger = setup_logger(__name__)
+
+# Statuses after which no further updates of a subtask are expected
+TERMINAL_STATUSES = {"COMPLETED", "FAILED", "CANCELLED"}
+
+# Payload fields carrying the result
+RESULT_FIELDS = ("result", "result_seq", "result_delta")
+
+
+class CallbackQueueFull(Exception):
+    """Raised when a non-terminal callback arrives while the queue is full"""
+
+
+@dataclass
+class QueuedUpdate:
+    """A task status update waiting to be forwarded"""
+
+    payload: Dict[str, Any]
+    received_at: float
+
+    @property
+    def terminal(self) -> bool:
+        return str(self.payload.get("status") or "").upper() in TERMINAL_STATUSES
+
+
+def _supersedes(update: QueuedUpdate, queued: QueuedUpdate) -> bool:
+    """Whether a queued update can be replaced by a newer one"""
+    if queued.terminal:
+        return False
+    if "result" in update.payload:
+        return True
+    return not any(field in queued.payload for field in RESULT_FIELDS)
+
+
+class CallbackForwarder:
+    """Per-subtask coalescing queue of task status updates drained by workers"""
+
+    def __init__(
+        self,
+        client: Optional[AsyncTaskApiClient] = None,
+        workers: int = CALLBACK_FORWARD_WORKERS,
+        max_size: int = CALLBACK_QUEUE_MAX_SIZE,
+    ):
+        self.client = client or AsyncTaskApiClient()
+        self.workers = workers
+        self.max_size = max_size
+        # subtask_id -> updates not picked up by a worker yet, oldest first
+        self._pending: Dict[int, List[QueuedUpdate]] = {}
+        # Subtasks waiting for a worker or being forwarded
+        self._scheduled: Set[int] = set()
+        # Subtasks whose next result delta is answered with "resync"
+        self._resync: Set[int] = set()
+        self._size = 0
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of queued updates"""
+        return self._size
+
+    def submit(self, payload: Dict[str, Any]) -> bool:
+        """
+        Queue a task status update for forwarding.
+
+        Args:
+            payload: Update as sent to the task API
+
+        Returns:
+            bool: True if the executor must send the full result of the subtask
+
+        Raises:
+            CallbackQueueFull: The queue is full and the update is not terminal
+        """
+        self._ensure_started()
+        subtask_id = payload["subtask_id"]
+
+        resync = False
+        if "result_delta" in payload and subtask_id in self._resync:
+            # The API would reject the delta, only forward the status
+            self._resync.discard(subtask_id)
+            payload = {k: v for k, v in payload.items() if k not in RESULT_FIELDS}
+            resync = True
+        elif "result" in payload:
+            self._resync.discard(subtask_id)
+
+        update = QueuedUpdate(payload=payload, received_at=time.monotonic())
+        queued = self._pending.get(subtask_id, [])
+        if self._merge_delta(update, queued):
+            return resync
+
+        kept = [q for q in queued if not _supersedes(update, q)]
+        replaced = [q for q in queued if _supersedes(update, q)]
+
+        if not replaced and not update.terminal and self._size >= self.max_size:
+            raise CallbackQueueFull(
+                f"Callback queue is full ({self._size} updates queued)"
+            )
+
+        for q in replaced:
+            update.payload = {
+                **{k: v for k, v in q.payload.items() if k not in RESULT_FIELDS},
+                **update.payload,
+            }
+            update.received_at = min(update.received_at, q.received_at)
+        self._pending[subtask_id] = kept + [update]
+        self._size += 1 - len(replaced)
+        record_callback_queue_change(1 - len(replaced))
+
+        if subtask_id not in self._scheduled:
+            self._scheduled.add(subtask_id)
+            self._ready.put_nowait(subtask_id)
+        return resync
+
+    def _merge_delta(self, update: QueuedUpdate, queued: List[QueuedUpdate]) -> bool:
+        """Merge a result delta into the last queued update if that is a delta too"""
+        if not queued or "result_delta" not in update.payload:
+            return False
+        last = queued[-1]
+        if last.terminal or "result_delta" not in last.payload:
+            return False
+        delta = merge_result_deltas(
+            last.payload["result_delta"], update.payload["result_delta"]
+        )
+        if delta is None:
+            return False
+
+        last.payload = {**last.payload, **update.payload, "result_delta": delta}
+        return True
+
+    def _ensure_started(self) -> None:
+        """Start the workers on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._ready = asyncio.Queue()
+        self._scheduled = set(self._pending)
+        for subtask_id in self._pending:
+            self._ready.put_nowait(subtask_id)
+        self._tasks = [loop.create_task(self._work()) for _ in range(self.workers)]
+        logger.info(f"Started {self.workers} callback forward workers")
+
+    async def _work(self) -> None:
+        while True:
+            subtask_id = await self._ready.get()
+            try:
+                updates = self._pending[subtask_id]
+                update = updates.pop(0)
+                if not updates:
+                    del self._pending[subtask_id]
+                self._size -= 1
+                record_callback_queue_change(-1)
+
+                await self._forward(subtask_id, update)
+            finally:
+                if subtask_id in self._pending:
+                    self._ready.put_nowait(subtask_id)
+                else:
+                    self._scheduled.discard(subtask_id)
+                self._ready.task_done()
+
+    async def _forward(self, subtask_id: int, update: QueuedUpdate) -> None:
+        payload = update.payload
+        set_task_context(task_id=payload.get("task_id"), subtask_id=subtask_id)
+        try:
+            success, result = await self.client.update_task_status(payload)
+        except Exception as e:
+            success, result = False, str(e)
+        record_callback_forwarded(
+            (time.monotonic() - update.received_at) * 1000, bool(success)
+        )
+
+        if not success:
+            logger.warning(
+                f"Failed to update status for task {payload.get('task_id')}: {result}"
+            )
+            return
+        if (
+            "result_delta" in payload
+            and isinstance(result, dict)
+            and result.get("resync")
+            and not any(
+                "result" in q.payload for q in self._pending.get(subtask_id, [])
+            )
+        ):
+            logger.info(f"Backend asked for the full result of subtask {subtask_id}")
+            self._resync.add(subtask_id)
+
+    async def stop(self, timeout: float) -> None:
+        """Forward the queued updates for up to timeout seconds and stop the workers"""
+        if self._ready is not None and self._loop is asyncio.get_running_loop():
+            try:
+                await asyncio.wait_for(self._ready.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Dropping {self._size} callbacks not forwarded within {timeout}s"
+                )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+        await self.client.aclose()
+
+
+callback_forwarder = CallbackForwarder()
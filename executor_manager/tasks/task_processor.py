@@ -10,6 +10,9 @@
 Task processing module, handles tasks fetched from API
 """
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
 from executor_manager.clients.task_api_client import TaskApiClient
 from executor_manager.config import config
 from executor_manager.executors.dispatcher import ExecutorDispatcher
@@ -47,6 +50,11 @@ class TaskProcessor:
         self.github_app = None
         if config.GITHUB_APP_ID and config.GITHUB_PRIVATE_KEY_PATH:
             self.github_app = get_github_app()
+        # Bounded pool so a fetched batch starts its containers concurrently
+        self.launch_pool = ThreadPoolExecutor(
+            max_workers=max(1, config.TASK_LAUNCH_CONCURRENCY),
+            thread_name_prefix="task-launcher",
+        )
 
     def update_task_status_callback(self, task_id, subtask_id, progress=0, **kwargs):
         """
@@ -68,6 +76,9 @@ class TaskProcessor:
         """
         Process fetched tasks with distributed tracing support.
 
+        Tasks are launched concurrently on a bounded worker pool. Each executor
+        reports the outcome through update_task_status_callback.
+
         Args:
             tasks: List of tasks fetched from API
 
@@ -82,9 +93,20 @@ class TaskProcessor:
         total_count = len(tasks)
         success_count = 0
 
-        for task in tasks:
-            task_id = task.get("task_id", -1)
-            result, success = self._process_single_task(task)
+        # Run each launch in a copy of the caller's context so trace spans
+        # keep their parent
+        futures = [
+            (
+                task.get("task_id", -1),
+                self.launch_pool.submit(
+                    contextvars.copy_context().run, self._process_single_task, task
+                ),
+            )
+            for task in tasks
+        ]
+
+        for task_id, future in futures:
+            result, success = future.result()
             task_result[task_id] = result
             if success:
                 success_count += 1
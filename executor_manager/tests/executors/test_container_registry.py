@@ -0,0 +1,226 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import queue
+import socketserver
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from executor_manager.executors.docker import utils as docker_utils
+from executor_manager.executors.docker.container_registry import \
+    ContainerRegistry
+from executor_manager.executors.docker.engine_client import DockerEngineClient
+
+
+def _container(container_id, name, task_id, port, running=True, subtask_next_id="", task_type="online"):
+    return {
+        "Id": container_id,
+        "Name": f"/{name}",
+        "Config": {
+            "Labels": {
+                "owner": "executor_manager",
+                "task_id": str(task_id),
+                "subtask_id": str(task_id * 10),
+                "subtask_next_id": subtask_next_id,
+                "aigc.weibo.com/task-type": task_type,
+            }
+        },
+        "State": {"Running": running, "Status": "running" if running else "exited"},
+        "NetworkSettings": {
+            "Ports": {f"{port}/tcp": [{"HostIp": "0.0.0.0", "HostPort": str(port)}]} if running else {}
+        },
+    }
+
+
+def _summary(details):
+    return {
+        "Id": details["Id"],
+        "Names": [details["Name"]],
+        "Labels": details["Config"]["Labels"],
+        "State": details["State"]["Status"],
+        "Ports": [
+            {"IP": b["HostIp"], "PrivatePort": int(p.split("/")[0]), "PublicPort": int(b["HostPort"]), "Type": "tcp"}
+            for p, bindings in details["NetworkSettings"]["Ports"].items()
+            for b in bindings
+        ],
+    }
+
+
+class FakeDockerDaemon:
+    """Serves a subset of the Docker Engine API on a unix socket"""
+
+    def __init__(self):
+        self.containers = {}
+        self.events = queue.Queue()
+        self.connections = 0
+        self.requests = []
+        self.socket_path = os.path.join(tempfile.mkdtemp(), "docker.sock")
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                daemon.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                daemon.requests.append(url.path)
+                if url.path == "/_ping":
+                    self._send_json(200, "OK")
+                elif url.path == "/containers/json":
+                    show_all = parse_qs(url.query).get("all") == ["true"]
+                    self._send_json(200, [
+                        _summary(c) for c in daemon.containers.values() if show_all or c["State"]["Running"]
+                    ])
+                elif url.path.startswith("/containers/"):
+                    container = daemon.containers.get(url.path.split("/")[2])
+                    if container is None:
+                        self._send_json(404, {"message": "No such container"})
+                    else:
+                        self._send_json(200, container)
+                elif url.path == "/events":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    while True:
+                        event = daemon.events.get()
+                        if event is None:
+                            self.wfile.write(b"0\r\n\r\n")
+                            self.close_connection = True
+                            return
+                        data = json.dumps(event).encode() + b"\n"
+                        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        self.wfile.flush()
+                else:
+                    self._send_json(404, {"message": "not found"})
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def add(self, details):
+        self.containers[details["Id"]] = details
+
+    def emit(self, action, container_id):
+        self.events.put({"Type": "container", "Action": action, "Actor": {"ID": container_id}})
+
+    def close(self):
+        self.events.put(None)
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def daemon():
+    fake = FakeDockerDaemon()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def registry(daemon):
+    daemon.add(_container("c1", "executor-1", 1, 10001))
+    daemon.add(_container("c2", "executor-2", 2, 10002, task_type="offline", subtask_next_id="21"))
+    daemon.add(_container("c3", "executor-3", 3, 10003, running=False))
+    registry = ContainerRegistry(DockerEngineClient(daemon.socket_path))
+    registry.start()
+    assert registry.wait_until_ready(5)
+    assert _wait_for(lambda: "/events" in daemon.requests)
+    yield registry
+    registry.stop()
+
+
+def _wait_for(predicate, timeout=5):
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return True
+        event.wait(0.01)
+    return predicate()
+
+
+class TestDockerEngineClient:
+    """Test cases for the Docker Engine API client"""
+
+    def test_requests_reuse_connection(self, daemon):
+        """Test that consecutive requests share one socket connection"""
+        daemon.add(_container("c1", "executor-1", 1, 10001))
+        client = DockerEngineClient(daemon.socket_path)
+        try:
+            assert client.ping()
+            assert [c["Id"] for c in client.list_containers()] == ["c1"]
+            assert client.inspect_container("c1")["Name"] == "/executor-1"
+            assert client.inspect_container("missing") is None
+        finally:
+            client.close()
+
+        assert daemon.connections == 1
+
+
+class TestContainerRegistry:
+    """Test cases for the in-memory container registry"""
+
+    def test_initial_sync(self, registry):
+        """Test that running containers, ports and labels are loaded"""
+        assert {c.name for c in registry.list_running()} == {"executor-1", "executor-2"}
+        assert [c.name for c in registry.list_running("aigc.weibo.com/task-type=online")] == ["executor-1"]
+        assert registry.get_used_ports() == {10001, 10002}
+        assert registry.get_container("executor-3").running is False
+
+    def test_events_update_state(self, daemon, registry):
+        """Test that start, die and destroy events keep the registry in sync"""
+        daemon.add(_container("c4", "executor-4", 4, 10004))
+        daemon.emit("start", "c4")
+        assert _wait_for(lambda: registry.is_port_used(10004))
+
+        daemon.add(_container("c1", "executor-1", 1, 10001, running=False))
+        daemon.emit("die", "c1")
+        assert _wait_for(lambda: not registry.is_port_used(10001))
+        assert registry.get_container("executor-1").running is False
+
+        del daemon.containers["c1"]
+        daemon.emit("destroy", "c1")
+        assert _wait_for(lambda: registry.get_container("executor-1") is None)
+        assert registry.get_used_ports() == {10002, 10004}
+
+    def test_utils_read_from_registry(self, daemon, registry):
+        """Test that lookups are answered from memory without the docker CLI"""
+        requests_before = len(daemon.requests)
+        with patch.object(docker_utils, "get_container_registry", return_value=registry), \
+                patch.object(docker_utils.subprocess, "run") as mock_run:
+            details = docker_utils.get_running_task_details()
+            count = docker_utils.count_running_containers("aigc.weibo.com/task-type=offline")
+            ports = docker_utils.get_container_ports("executor-2")
+            used_ports = docker_utils.get_docker_used_ports()
+
+        mock_run.assert_not_called()
+        assert len(daemon.requests) == requests_before
+        assert details["status"] == "success"
+        # Task 1 has an empty subtask_next_id, so only task 2 is still running
+        assert details["task_ids"] == ["2"]
+        assert len(details["containers"]) == 2
+        assert count["count"] == 1
+        assert ports["ports"] == [{"host_port": 10002, "container_port": 10002, "protocol": "tcp"}]
+        assert used_ports == {10001, 10002}
@@ -255,6 +255,39 @@ class TestDockerExecutor:
         assert "456" in result["task_ids"]
         assert len(result["containers"]) == 2
 
+    def test_background_health_check_reports_exited_container(self, executor, sample_task, mock_subprocess):
+        """Test that an immediately exited container is reported as failed through the callback"""
+        mock_callback = MagicMock()
+        mock_subprocess.run.side_effect = [
+            MagicMock(returncode=0, stdout="exited"),
+            MagicMock(returncode=0, stdout="", stderr="GLIBC not found"),
+            MagicMock(returncode=0, stdout="1"),
+        ]
+        task_info = executor._extract_task_info(sample_task)
+
+        executor._check_container_health_in_background(
+            sample_task, task_info, "new-executor", mock_callback
+        )
+
+        mock_callback.assert_called_once()
+        kwargs = mock_callback.call_args.kwargs
+        assert kwargs["task_id"] == 123
+        assert kwargs["subtask_id"] == 456
+        assert kwargs["status"] == TaskStatus.FAILED.value
+        assert "Container exited immediately" in kwargs["error_message"]
+
+    def test_background_health_check_running_container(self, executor, sample_task, mock_subprocess):
+        """Test that a running container does not trigger a callback"""
+        mock_callback = MagicMock()
+        mock_subprocess.run.return_value = MagicMock(returncode=0, stdout="running")
+        task_info = executor._extract_task_info(sample_task)
+
+        executor._check_container_health_in_background(
+            sample_task, task_info, "new-executor", mock_callback
+        )
+
+        mock_callback.assert_not_called()
+
     def test_call_callback_success(self, executor):
         """Test calling callback successfully"""
         mock_callback = MagicMock()
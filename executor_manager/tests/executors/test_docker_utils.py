@@ -5,6 +5,7 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import subprocess
+from executor_manager.executors.docker import utils as docker_utils
 from executor_manager.executors.docker.utils import (
     build_callback_url,
     find_available_port,
@@ -14,6 +15,7 @@ from executor_manager.executors.docker.utils import (
     get_container_ports,
     get_running_task_details,
     count_running_containers,
+    release_port,
 )
 
 
@@ -62,6 +64,33 @@ class TestDockerUtils:
         ports = get_docker_used_ports()
         assert len(ports) == 0
 
+    @patch.object(docker_utils, 'get_docker_used_ports')
+    def test_find_available_port_reserves_ports_for_concurrent_launches(self, mock_used):
+        """Test that ports are not handed out twice before containers show up in docker ps"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_used.return_value = set()
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            ports = list(pool.map(lambda _: find_available_port(), range(5)))
+
+        try:
+            assert len(set(ports)) == 5
+        finally:
+            for port in ports:
+                release_port(port)
+
+    @patch.object(docker_utils, 'get_docker_used_ports')
+    def test_release_port_makes_port_available_again(self, mock_used):
+        """Test that a released port can be allocated again"""
+        mock_used.return_value = set()
+
+        port = find_available_port()
+        release_port(port)
+
+        assert find_available_port() == port
+        release_port(port)
+
     @patch('subprocess.run')
     def test_check_container_ownership_true(self, mock_run):
         """Test checking container ownership when owned"""
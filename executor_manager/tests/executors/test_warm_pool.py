@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from executor_manager.executors.docker import executor as executor_module
+from executor_manager.executors.docker import utils as docker_utils
+from executor_manager.executors.docker import warm_pool as warm_pool_module
+from executor_manager.executors.docker.executor import DockerExecutor
+from executor_manager.executors.docker.warm_pool import (WarmContainer,
+                                                         WarmContainerPool)
+from shared.status import TaskStatus
+
+EXECUTOR_IMAGE = "test/executor:latest"
+
+
+class TestWarmContainerPool:
+    """Test cases for the warm container pool"""
+
+    @pytest.fixture
+    def mock_subprocess(self):
+        mock = MagicMock()
+        mock.run.return_value = MagicMock(returncode=0, stdout="container-id")
+        mock.CalledProcessError = subprocess.CalledProcessError
+        return mock
+
+    @pytest.fixture
+    def executor(self, mock_subprocess):
+        ports = iter(range(10010, 10100))
+        with patch.object(executor_module, "find_available_port", side_effect=lambda: next(ports)), \
+                patch.object(executor_module, "build_callback_url", return_value="http://callback"), \
+                patch.object(warm_pool_module, "delete_container", return_value={"status": "success"}) as mock_delete:
+            executor = DockerExecutor(subprocess_module=mock_subprocess, requests_module=MagicMock())
+            executor.warm_pool = WarmContainerPool(executor, pool_size=2, max_idle_seconds=60, image_caps={}, default_image=EXECUTOR_IMAGE)
+            executor.warm_pool._running = True
+            executor.mock_delete = mock_delete
+            yield executor
+            executor.warm_pool._running = False
+
+    @pytest.fixture
+    def task(self):
+        return {
+            "task_id": 123,
+            "subtask_id": 456,
+            "subtask_next_id": 789,
+            "user": {"name": "test_user"},
+            "executor_image": EXECUTOR_IMAGE,
+            "type": "online",
+        }
+
+    def test_refill_starts_idle_containers(self, executor, mock_subprocess):
+        """Test that refill starts containers up to the pool size without task info"""
+        executor.warm_pool.refill()
+
+        stats = executor.get_warm_pool_stats()
+        assert stats["images"][EXECUTOR_IMAGE] == {"target": 2, "idle": 2, "starting": 0}
+        run_cmd = mock_subprocess.run.call_args.args[0]
+        assert run_cmd[:3] == ["docker", "run", "-d"]
+        assert not any(str(arg).startswith("TASK_INFO=") for arg in run_cmd)
+        assert "aigc.weibo.com/task-type=online" in run_cmd
+        assert run_cmd[-1] == EXECUTOR_IMAGE
+
+    def test_submit_uses_warm_container(self, executor, mock_subprocess, task):
+        """Test that an online task is sent to an idle container instead of docker run"""
+        executor.warm_pool.refill()
+        mock_subprocess.run.reset_mock()
+        callback = MagicMock()
+
+        result = executor.submit_executor(task, callback=callback)
+
+        assert result["status"] == "success"
+        assert result["executor_name"].startswith("wegent-pool-")
+        assert result["executor_name"].endswith("-t123-s456-n789")
+        # The container is renamed to carry its task instead of being started
+        rename_cmd = mock_subprocess.run.call_args.args[0]
+        assert rename_cmd[:2] == ["docker", "rename"]
+        assert rename_cmd[3] == result["executor_name"]
+        mock_subprocess.run.assert_called_once()
+        endpoint = executor.requests.post.call_args.args[0]
+        assert endpoint.endswith(":10011/api/tasks/execute")
+        # The executor is told its new name to report in its own callbacks
+        assert executor.requests.post.call_args.kwargs["json"]["executor_name"] == result["executor_name"]
+        callback.assert_called_once_with(
+            task_id=123,
+            subtask_id=456,
+            executor_name=result["executor_name"],
+            progress=30,
+            status=TaskStatus.RUNNING.value,
+        )
+        assert executor.get_warm_pool_stats()["hits"] == 1
+
+        # The assigned container counts as the task's executor, also after a restart
+        listing = MagicMock(stdout=f"||||{result['executor_name']}\n", returncode=0)
+        with patch.object(docker_utils, "get_container_registry", return_value=None), \
+                patch.object(docker_utils.subprocess, "run", return_value=listing):
+            details = docker_utils.get_running_task_details()
+        assert details["task_ids"] == ["123"]
+        assert details["containers"][0]["subtask_next_id"] == "789"
+
+    def test_follow_up_subtask_reaches_renamed_warm_container(self, executor, task):
+        """Test that a follow-up dispatched with the reported name is sent to the same container"""
+        executor.warm_pool.refill()
+        assigned_name = executor.submit_executor(task, callback=MagicMock())["executor_name"]
+        # The executor's callbacks report the name it received with the task,
+        # which the backend dispatches the next subtask with
+        reported_name = executor.requests.post.call_args.kwargs["json"]["executor_name"]
+        executor.requests.post.reset_mock()
+        executor.requests.post.return_value.json.return_value = {"status": "success"}
+        follow_up = {**task, "subtask_id": 789, "subtask_next_id": None, "executor_name": reported_name}
+
+        with patch.object(executor_module, "get_container_ports",
+                          return_value={"status": "success", "ports": [{"host_port": 10011}]}) as ports:
+            result = executor.submit_executor(follow_up, callback=MagicMock())
+
+        assert result["executor_name"] == assigned_name
+        ports.assert_called_once_with(assigned_name)
+        assert executor.requests.post.call_args.args[0].endswith(":10011/api/tasks/execute")
+
+    def test_submit_falls_back_when_warm_container_fails(self, executor, mock_subprocess, task):
+        """Test that a failing pool container is discarded and a new container is started"""
+        executor.warm_pool.refill()
+        executor.requests.post.side_effect = Exception("connection refused")
+        mock_subprocess.run.reset_mock()
+
+        result = executor.submit_executor(task, callback=MagicMock())
+
+        assert result["status"] == "success"
+        assert result["executor_name"].startswith("wegent-task-")
+        # Rename of the pool container, then docker run of the new container
+        assert mock_subprocess.run.call_count == 2
+        assert mock_subprocess.run.call_args.args[0][:2] == ["docker", "run"]
+        assert executor.mock_delete.call_count == 1
+
+    def test_failed_rename_discards_container(self, executor, mock_subprocess, task):
+        """Test that a container that cannot be assigned is discarded"""
+        executor.warm_pool.refill()
+        mock_subprocess.run.side_effect = [subprocess.CalledProcessError(1, "docker rename"), MagicMock(returncode=0)]
+
+        result = executor.submit_executor(task, callback=MagicMock())
+
+        assert result["executor_name"].startswith("wegent-task-")
+        assert executor.mock_delete.call_count == 1
+        executor.requests.post.assert_not_called()
+
+    def test_start_removes_orphaned_idle_containers(self, executor):
+        """Test that idle pool containers of a previous run are removed and assigned ones kept"""
+        pool = executor.warm_pool
+        pool._running = False
+        pool.pool_size = 0
+        names = ["wegent-pool-abc123", "wegent-pool-def456-t12-s34-n"]
+        with patch.object(warm_pool_module, "list_warm_pool_containers", return_value=names):
+            pool.start()
+
+        executor.mock_delete.assert_called_once_with("wegent-pool-abc123")
+        assert pool._thread is None
+
+    def test_stop_removes_idle_containers(self, executor):
+        """Test that stopping the pool removes its idle containers"""
+        executor.warm_pool.refill()
+
+        executor.warm_pool.stop()
+
+        assert executor.mock_delete.call_count == 2
+        assert executor.get_warm_pool_stats()["images"][EXECUTOR_IMAGE]["idle"] == 0
+
+    def test_offline_tasks_bypass_pool(self, executor, task):
+        """Test that only online tasks use the pool"""
+        executor.warm_pool.refill()
+        task["type"] = "offline"
+
+        assert executor._execute_in_warm_container(task, executor._extract_task_info(task), {}) is False
+        assert executor.get_warm_pool_stats()["images"][EXECUTOR_IMAGE]["idle"] == 2
+
+    def test_expired_containers_are_not_used(self, executor):
+        """Test that idle containers past the max idle age are removed instead of assigned"""
+        pool = executor.warm_pool
+        pool._idle[EXECUTOR_IMAGE] = [WarmContainer("wegent-pool-old", EXECUTOR_IMAGE, 10050, time.time() - 120)]
+
+        assert pool.acquire(EXECUTOR_IMAGE) is None
+        executor.mock_delete.assert_called_once_with("wegent-pool-old")
+        assert pool.get_stats()["misses"] == 1
+
+    def test_image_caps_override_pool_size(self, executor):
+        """Test per-image pool sizes"""
+        pool = WarmContainerPool(executor, pool_size=2, image_caps={"custom/base:1": 1, EXECUTOR_IMAGE: 0}, default_image=EXECUTOR_IMAGE)
+
+        assert pool.get_target(EXECUTOR_IMAGE) == 0
+        assert pool.get_target("custom/base:1") == 1
+        assert pool.get_target("unknown/image") == 0
+        assert pool.enabled
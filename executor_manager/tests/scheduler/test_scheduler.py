@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import threading
+import time
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def scheduler_module():
+    """Import the scheduler with a fake executor dispatcher so no Docker daemon is needed"""
+    dispatcher = MagicMock()
+    dispatcher.get_executor.return_value.get_executor_count.return_value = {"status": "success", "running": 0}
+    fake_module = types.ModuleType("executor_manager.executors.dispatcher")
+    fake_module.ExecutorDispatcher = dispatcher
+
+    with patch.dict(sys.modules, {"executor_manager.executors.dispatcher": fake_module}):
+        for mod in list(sys.modules.keys()):
+            if mod.startswith(("executor_manager.scheduler", "executor_manager.tasks", "executor_manager.clients")):
+                del sys.modules[mod]
+        from executor_manager.scheduler import scheduler
+        yield scheduler
+
+
+class BlockingApiClient:
+    """Fake backend long-poll: holds the request until a task is published"""
+
+    def __init__(self):
+        self.published = threading.Event()
+        self.published_at = None
+        self.task = {"subtask_id": 1, "task_id": 1}
+
+    def publish(self):
+        self.published_at = time.time()
+        self.published.set()
+
+    def wait_for_tasks(self, limit, wait):
+        if self.published.wait(wait):
+            self.published.clear()
+            return True, {"tasks": [self.task]}
+        return True, {"tasks": []}
+
+
+class TestTaskSchedulerWatcher:
+    """Test cases for the online task long-poll watcher"""
+
+    def test_watcher_starts_task_without_waiting_for_fetch_interval(self, scheduler_module):
+        """Time to first process_tasks call is bounded by the push, not the polling interval"""
+        scheduler = scheduler_module.TaskScheduler()
+        api_client = BlockingApiClient()
+        scheduler.api_client = api_client
+        processed = threading.Event()
+        latencies = []
+
+        def process_tasks(tasks):
+            latencies.append(time.time() - api_client.published_at)
+            processed.set()
+
+        scheduler.task_processor = MagicMock()
+        scheduler.task_processor.process_tasks.side_effect = process_tasks
+        scheduler.running = True
+
+        with patch.object(scheduler_module, "TASK_LONG_POLL_TIMEOUT", 5):
+            watcher = threading.Thread(target=scheduler.watch_online_tasks, daemon=True)
+            watcher.start()
+            try:
+                for _ in range(5):
+                    time.sleep(0.05)
+                    api_client.publish()
+                    assert processed.wait(2)
+                    processed.clear()
+            finally:
+                scheduler.running = False
+                api_client.publish()
+                watcher.join(timeout=5)
+
+        assert len(latencies) >= 5
+        # Interval polling waits half a fetch interval on average, the watcher picks
+        # the task up as soon as the backend releases the request
+        assert max(latencies[:5]) < min(0.5, scheduler_module.TASK_FETCH_INTERVAL / 2)
+
+    def test_watcher_backs_off_when_backend_does_not_hold_request(self, scheduler_module):
+        """An immediate empty response falls back to the fetch interval instead of spinning"""
+        scheduler = scheduler_module.TaskScheduler()
+        scheduler.task_processor = MagicMock()
+        scheduler.api_client = MagicMock()
+        scheduler.api_client.wait_for_tasks.return_value = (True, {"tasks": []})
+        scheduler.running = True
+
+        def stop(seconds):
+            scheduler.running = False
+
+        with patch.object(scheduler_module.time, "sleep", side_effect=stop) as sleep:
+            scheduler.watch_online_tasks()
+
+        sleep.assert_called_once_with(scheduler_module.TASK_FETCH_INTERVAL)
+        scheduler.task_processor.process_tasks.assert_not_called()
+
+    @pytest.mark.parametrize("long_poll_timeout, interval", [(25, 30), (0, 5)])
+    def test_online_interval_job_stays_as_fallback(self, scheduler_module, long_poll_timeout, interval):
+        """Interval polling runs less often while the watcher is enabled"""
+        scheduler = scheduler_module.TaskScheduler()
+
+        with patch.object(scheduler_module, "TASK_LONG_POLL_TIMEOUT", long_poll_timeout), \
+                patch.object(scheduler_module, "TASK_FETCH_INTERVAL", 5), \
+                patch.object(scheduler_module, "TASK_LONG_POLL_FALLBACK_INTERVAL", 30):
+            scheduler.setup_schedule()
+
+        job = scheduler.scheduler.get_job("fetch_online_tasks")
+        assert job.trigger.interval.total_seconds() == interval
+
+    def test_watcher_and_interval_job_do_not_share_slots(self, scheduler_module):
+        """Slots held by a long-poll in flight are not handed out by the interval job"""
+        scheduler = scheduler_module.TaskScheduler()
+        scheduler.max_concurrent_tasks = 12
+        scheduler.task_processor = MagicMock()
+        api_client = BlockingApiClient()
+        scheduler.api_client = MagicMock()
+        scheduler.api_client.fetch_tasks.return_value = (True, {"tasks": []})
+        polling = threading.Event()
+
+        def wait_for_tasks(limit, wait):
+            polling.set()
+            return api_client.wait_for_tasks(limit, wait)
+
+        scheduler.api_client.wait_for_tasks.side_effect = wait_for_tasks
+        scheduler.running = True
+
+        with patch.object(scheduler_module, "TASK_LONG_POLL_TIMEOUT", 5):
+            watcher = threading.Thread(target=scheduler.watch_online_tasks, daemon=True)
+            watcher.start()
+            try:
+                assert polling.wait(2)
+                scheduler.fetch_online_and_process_tasks()
+            finally:
+                scheduler.running = False
+                api_client.publish()
+                watcher.join(timeout=5)
+
+        assert scheduler.api_client.wait_for_tasks.call_args_list[0].kwargs["limit"] == 10
+        scheduler.api_client.update_fetch_params.assert_called_once_with(limit=2)
+        assert scheduler._reserved_online_slots == 0
@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from shared.utils.result_delta import ResultDeltaEncoder, apply_result_delta
+
+from executor_manager.clients.async_task_api_client import AsyncTaskApiClient
+from executor_manager.tasks.callback_forwarder import (
+    CallbackForwarder,
+    CallbackQueueFull,
+)
+
+
+class FakeBackend:
+    """Task API that records updates and holds them until released"""
+
+    def __init__(self):
+        self.updates = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.resync = False
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        await self.release.wait()
+        self.updates.append(json.loads(request.content))
+        body = {"message": "ok"}
+        if self.resync:
+            body["resync"] = True
+        return httpx.Response(200, json=body)
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+async def forwarder(backend):
+    client = AsyncTaskApiClient(
+        retry_delay=0, transport=httpx.MockTransport(backend.handle)
+    )
+    forwarder = CallbackForwarder(client=client, workers=2, max_size=3)
+    yield forwarder
+    await forwarder.stop(timeout=1)
+
+
+def _update(subtask_id, progress, status="RUNNING", **fields):
+    return {
+        "task_id": 1,
+        "subtask_id": subtask_id,
+        "progress": progress,
+        "status": status,
+        **fields,
+    }
+
+
+@pytest.mark.unit
+class TestCallbackForwarder:
+    """Test queueing, coalescing and forwarding executor callbacks"""
+
+    async def test_queued_updates_are_coalesced(self, forwarder, backend):
+        backend.release.clear()
+        forwarder.submit(_update(7, 10))
+        await asyncio.sleep(0.01)  # picked up and in flight
+        forwarder.submit(_update(7, 20, title="Task"))
+        forwarder.submit(_update(7, 30, result={"value": "abc"}))
+        forwarder.submit(_update(7, 40))
+        forwarder.submit(_update(7, 100, status="COMPLETED"))
+        assert forwarder.depth == 2
+
+        backend.release.set()
+        await forwarder.stop(timeout=1)
+
+        # An update with a result is only replaced by one with a result
+        assert [u["progress"] for u in backend.updates] == [10, 30, 100]
+        # Fields of replaced updates are kept
+        assert backend.updates[1]["title"] == "Task"
+        assert backend.updates[1]["result"] == {"value": "abc"}
+
+    async def test_consecutive_deltas_are_merged(self, forwarder, backend):
+        results = [{"value": "a"}, {"value": "ab"}, {"value": "abc", "done": True}]
+        encoder = ResultDeltaEncoder()
+        encoder.encode(7, results[0])
+        backend.release.clear()
+        forwarder.submit(_update(7, 10, result=results[0], result_seq=1))
+        await asyncio.sleep(0.01)
+        for progress, result in ((20, results[1]), (30, results[2])):
+            seq, delta = encoder.encode(7, result)
+            forwarder.submit(
+                _update(7, progress, title=f"T{progress}", result_delta=delta)
+            )
+        assert forwarder.depth == 1
+
+        backend.release.set()
+        await forwarder.stop(timeout=1)
+
+        assert [u["progress"] for u in backend.updates] == [10, 30]
+        delta = backend.updates[1]["result_delta"]
+        assert (delta["base_seq"], delta["seq"]) == (1, 3)
+        assert apply_result_delta(results[0], delta) == results[2]
+        assert backend.updates[1]["title"] == "T30"
+
+    async def test_deltas_are_kept_until_a_full_result(self, forwarder, backend):
+        backend.release.clear()
+        forwarder.submit(_update(7, 10))
+        await asyncio.sleep(0.01)
+        # Deltas that do not follow each other cannot be merged
+        forwarder.submit(
+            _update(7, 20, result_delta={"version": 1, "seq": 2, "base_seq": 1})
+        )
+        forwarder.submit(
+            _update(7, 30, result_delta={"version": 1, "seq": 4, "base_seq": 3})
+        )
+        assert forwarder.depth == 2
+        forwarder.submit(_update(7, 40, result={"value": "x"}, result_seq=4))
+        assert forwarder.depth == 1
+
+        backend.release.set()
+        await forwarder.stop(timeout=1)
+
+        assert [u["progress"] for u in backend.updates] == [10, 40]
+
+    async def test_full_queue_only_accepts_terminal_updates(self, forwarder, backend):
+        backend.release.clear()
+        forwarder.submit(_update(1, 10))
+        forwarder.submit(_update(2, 10))
+        await asyncio.sleep(0.01)  # both workers busy
+        for subtask_id in range(3, 6):
+            forwarder.submit(_update(subtask_id, 20))
+
+        with pytest.raises(CallbackQueueFull):
+            forwarder.submit(_update(9, 20))
+        # Replacing a queued update does not grow the queue
+        forwarder.submit(_update(3, 30))
+        forwarder.submit(_update(9, 100, status="FAILED"))
+        assert forwarder.depth == 4
+
+        backend.release.set()
+        await forwarder.stop(timeout=1)
+        assert sorted((u["subtask_id"], u["progress"]) for u in backend.updates) == [
+            (1, 10),
+            (2, 10),
+            (3, 30),
+            (4, 20),
+            (5, 20),
+            (9, 100),
+        ]
+
+    async def test_resync_is_answered_on_next_delta(self, forwarder, backend):
+        backend.resync = True
+        forwarder.submit(_update(7, 10, result_delta={"seq": 2}))
+        await asyncio.sleep(0.01)
+        backend.resync = False
+
+        assert forwarder.submit(_update(7, 20, result_delta={"seq": 3})) is True
+        assert forwarder.submit(_update(7, 30, result={"value": "x"})) is False
+        await forwarder.stop(timeout=1)
+
+        # The rejected delta was replaced by the full result
+        assert [u["progress"] for u in backend.updates] == [10, 30]
+        assert "result_delta" not in backend.updates[1]
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import threading
+import time
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def processor_module():
+    """Import the task processor with a fake executor dispatcher so no Docker daemon is needed"""
+    dispatcher = MagicMock()
+    fake_module = types.ModuleType("executor_manager.executors.dispatcher")
+    fake_module.ExecutorDispatcher = dispatcher
+
+    with patch.dict(sys.modules, {"executor_manager.executors.dispatcher": fake_module}):
+        for mod in list(sys.modules.keys()):
+            if mod.startswith(("executor_manager.tasks", "executor_manager.clients")):
+                del sys.modules[mod]
+        from executor_manager.tasks import task_processor
+        yield task_processor, dispatcher
+
+
+class SlowExecutor:
+    """Fake executor whose launch takes a fixed time and reports through the callback"""
+
+    def __init__(self, launch_time):
+        self.launch_time = launch_time
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def submit_executor(self, task, callback=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.launch_time)
+        with self.lock:
+            self.active -= 1
+        if task.get("fail"):
+            return {"status": "failed", "executor_name": None, "error_msg": "boom"}
+        callback(task_id=task["task_id"], subtask_id=task["subtask_id"], executor_name=f"executor-{task['task_id']}", progress=30, status="RUNNING")
+        return {"status": "success", "executor_name": f"executor-{task['task_id']}"}
+
+
+class TestTaskProcessor:
+    """Test cases for concurrent task launching"""
+
+    def test_process_tasks_launches_batch_concurrently(self, processor_module):
+        """A batch takes about one launch time instead of the sum of all launches"""
+        task_processor, dispatcher = processor_module
+        executor = SlowExecutor(launch_time=0.2)
+        dispatcher.get_executor.return_value = executor
+
+        with patch.object(task_processor.config, "TASK_LAUNCH_CONCURRENCY", 5):
+            processor = task_processor.TaskProcessor()
+        processor.api_client = MagicMock()
+        processor.api_client.update_task_status_by_fields.return_value = (True, {})
+
+        tasks = [{"task_id": i, "subtask_id": i * 10} for i in range(5)]
+        started = time.time()
+        result = processor.process_tasks(tasks)
+        elapsed = time.time() - started
+
+        assert elapsed < 0.6
+        assert executor.max_active == 5
+        assert sorted(result.keys()) == [0, 1, 2, 3, 4]
+        assert result[3]["executor_name"] == "executor-3"
+        assert processor.api_client.update_task_status_by_fields.call_count == 5
+
+    def test_process_tasks_respects_concurrency_limit(self, processor_module):
+        """No more than TASK_LAUNCH_CONCURRENCY launches run at the same time"""
+        task_processor, dispatcher = processor_module
+        executor = SlowExecutor(launch_time=0.05)
+        dispatcher.get_executor.return_value = executor
+
+        with patch.object(task_processor.config, "TASK_LAUNCH_CONCURRENCY", 2):
+            processor = task_processor.TaskProcessor()
+        processor.api_client = MagicMock()
+        processor.api_client.update_task_status_by_fields.return_value = (True, {})
+
+        tasks = [{"task_id": i, "subtask_id": i, "fail": i == 0} for i in range(6)]
+        result = processor.process_tasks(tasks)
+
+        assert executor.max_active == 2
+        assert result[0]["status"] == "failed"
+        assert processor.api_client.update_task_status_by_fields.call_count == 5
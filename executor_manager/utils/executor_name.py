@@ -5,6 +5,7 @@
 
 import hashlib
 import re
+import uuid
 
 
 def generate_executor_name(task_id, subtask_id, user_name):
@@ -13,6 +14,28 @@ def generate_executor_name(task_id, subtask_id, user_name):
     return f"wegent-task-{user_name}-{digest}"
 
 
+def generate_warm_executor_name():
+    return f"wegent-pool-{uuid.uuid4().hex[:15]}"
+
+
+# Warm pool container renamed to carry the task it was assigned to, since the
+# labels of a running container cannot be changed
+_ASSIGNED_WARM_NAME = re.compile(r"^wegent-pool-[0-9a-f]+-t(\d+)-s(\d+)-n(\d*)$")
+
+
+def generate_assigned_warm_executor_name(name, task_id, subtask_id, subtask_next_id=None):
+    return f"{name}-t{task_id}-s{subtask_id}-n{subtask_next_id or ''}"
+
+
+def parse_warm_executor_task(name):
+    """Task labels of an assigned warm pool container, None for other containers"""
+    match = _ASSIGNED_WARM_NAME.match(name or "")
+    if not match:
+        return None
+    task_id, subtask_id, subtask_next_id = match.groups()
+    return {"task_id": task_id, "subtask_id": subtask_id, "subtask_next_id": subtask_next_id}
+
+
 def _sanitize_k8s_name(user_name):
     sanitized_name = user_name.replace(" ", "-").replace("_", "--")
     sanitized_name = re.sub(r"[^a-z0-9-.]", "", sanitized_name.lower())
@@ -21,4 +44,4 @@ def _sanitize_k8s_name(user_name):
     if not sanitized_name[-1].isalnum():
         sanitized_name = sanitized_name + "z"
     sanitized_name = sanitized_name[:10]
-    return sanitized_name
\ No newline at end of file
+    return sanitized_name
@@ -25,9 +25,12 @@ Environment Variables:
     OTEL_DISABLE_SEND_RECEIVE_SPANS: Disable internal http.send/http.receive spans for SSE/streaming (default: true)
         This is the industry standard approach to reduce noise from streaming endpoints like /api/chat/stream
         where each chunk would otherwise create a separate span. See OpenTelemetry ASGI instrumentation docs.
+    OTEL_BODY_CAPTURE_URLS: Comma-separated list of URL patterns whose bodies are captured (empty means all)
+    OTEL_BODY_CAPTURE_SAMPLE_RATE: Fraction 0.0-1.0 of requests whose bodies are captured (default: 1.0)
 """
 
 import os
+import random
 import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -69,6 +72,8 @@ class OtelConfig:
     excluded_urls: List[str] = field(default_factory=list)  # URL patterns to exclude (blacklist)
     included_urls: List[str] = field(default_factory=list)  # URL patterns to include (whitelist, empty means all)
     disable_send_receive_spans: bool = True  # Disable internal http.send/http.receive spans for SSE/streaming
+    body_capture_urls: List[str] = field(default_factory=list)  # URL patterns whose bodies are captured (empty means all)
+    body_capture_sample_rate: float = 1.0  # Fraction of matching requests whose bodies are captured
 
 
 # Cached configuration instance
@@ -144,6 +149,15 @@ def get_otel_config(service_name_override: Optional[str] = None) -> OtelConfig:
             disable_send_receive_spans=os.getenv(
                 "OTEL_DISABLE_SEND_RECEIVE_SPANS", "true"
             ).lower() == "true",
+            body_capture_urls=[
+                url.strip()
+                for url in os.getenv("OTEL_BODY_CAPTURE_URLS", "").split(",")
+                if url.strip()
+            ],
+            body_capture_sample_rate=min(
+                max(float(os.getenv("OTEL_BODY_CAPTURE_SAMPLE_RATE", "1.0")), 0.0),
+                1.0,
+            ),
         )
     
     return _otel_config
@@ -271,6 +285,34 @@ def should_trace_url(url: str, config: Optional[OtelConfig] = None) -> bool:
     return True
 
 
+def should_capture_body(url: str, config: Optional[OtelConfig] = None) -> bool:
+    """
+    Decide whether the bodies of a request should be captured.
+    
+    Only URLs matching body_capture_urls (all URLs if empty) are candidates,
+    and of those a body_capture_sample_rate fraction is sampled. Whether
+    request or response bodies are captured at all is still controlled by
+    capture_request_body and capture_response_body.
+    
+    Args:
+        url: The URL path of the request
+        config: Optional OtelConfig instance. If not provided, uses get_otel_config()
+    
+    Returns:
+        bool: True if the request's bodies should be captured
+    """
+    if config is None:
+        config = get_otel_config()
+    
+    if config.body_capture_urls and not _url_matches_patterns(
+        url, config.body_capture_urls
+    ):
+        return False
+    
+    rate = config.body_capture_sample_rate
+    return rate >= 1.0 or random.random() < rate
+
+
 def _url_matches_patterns(url: str, patterns: List[str]) -> bool:
     """
     Check if a URL matches any of the given patterns.
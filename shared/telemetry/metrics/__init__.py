@@ -12,10 +12,16 @@ Provides pre-defined business metrics and decorators for automatic metric collec
 from shared.telemetry.metrics.business import (
     WegentMetrics,
     get_wegent_metrics,
+    record_callback_forwarded,
+    record_callback_queue_change,
+    record_db_pool_checkouts,
+    record_db_pool_wait,
     record_message_sent,
     record_model_call,
+    record_redis_operation,
     record_session_active_change,
     record_session_opened,
+    record_stream_chunks,
     record_task_completed,
     record_task_created,
     record_task_failed,
@@ -37,6 +43,12 @@ __all__ = [
     "record_task_failed",
     "record_user_activity",
     "record_model_call",
+    "record_redis_operation",
+    "record_db_pool_checkouts",
+    "record_db_pool_wait",
+    "record_stream_chunks",
+    "record_callback_queue_change",
+    "record_callback_forwarded",
     # Decorators
     "track_metric",
     "track_duration",
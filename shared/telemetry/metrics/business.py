@@ -174,6 +174,66 @@ class WegentMetrics:
             unit="tokens",
         )
 
+    # Infrastructure metrics
+    @property
+    def redis_operation_duration(self) -> Histogram:
+        """Histogram for Redis operation latency."""
+        return self._get_or_create_histogram(
+            "wegent.redis.operation.duration",
+            "Redis operation latency in milliseconds",
+        )
+
+    @property
+    def db_pool_checkouts(self) -> Histogram:
+        """Histogram for connection pool checkouts per service operation."""
+        return self._get_or_create_histogram(
+            "wegent.db.pool.checkouts",
+            "Database connection pool checkouts per service operation",
+            unit="1",
+        )
+
+    @property
+    def db_pool_wait_time(self) -> Histogram:
+        """Histogram for the time spent acquiring a pooled connection."""
+        return self._get_or_create_histogram(
+            "wegent.db.pool.wait_time",
+            "Time spent waiting for a database connection from the pool",
+            unit="ms",
+        )
+
+    @property
+    def stream_tokens(self) -> Counter:
+        """Counter for tokens streamed to clients."""
+        return self._get_or_create_counter(
+            "wegent.stream.tokens",
+            "Number of tokens streamed to clients",
+        )
+
+    @property
+    def stream_chunk_frames(self) -> Counter:
+        """Counter for chunk events emitted to clients."""
+        return self._get_or_create_counter(
+            "wegent.stream.chunk_frames",
+            "Number of chunk events emitted for streamed tokens",
+        )
+
+    @property
+    def callback_queue_depth(self) -> UpDownCounter:
+        """UpDownCounter for executor callbacks waiting to be forwarded."""
+        return self._get_or_create_up_down_counter(
+            "wegent.callback.queue.depth",
+            "Number of executor callbacks waiting to be forwarded",
+        )
+
+    @property
+    def callback_forward_latency(self) -> Histogram:
+        """Histogram for the time from receiving a callback to forwarding it."""
+        return self._get_or_create_histogram(
+            "wegent.callback.forward_latency",
+            "Time from receiving an executor callback until the backend accepted it",
+            unit="ms",
+        )
+
 
 def get_wegent_metrics() -> WegentMetrics:
     """
@@ -429,3 +489,122 @@ def record_model_call(
 
     except Exception as e:
         logger.debug(f"Failed to record model call metric: {e}")
+
+
+def record_redis_operation(
+    operation: str, duration_ms: float, success: bool = True
+) -> None:
+    """
+    Record the latency of a Redis operation.
+
+    Args:
+        operation: Operation name (e.g., "get", "set", "pipeline")
+        duration_ms: Operation duration in milliseconds
+        success: Whether the operation succeeded
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        get_wegent_metrics().redis_operation_duration.record(
+            duration_ms, {"operation": operation, "success": success}
+        )
+    except Exception as e:
+        logger.debug(f"Failed to record redis operation metric: {e}")
+
+
+def record_db_pool_checkouts(operation: str, checkouts: int) -> None:
+    """
+    Record the connection pool checkouts made by a service operation.
+
+    Args:
+        operation: Operation name (e.g., "Bot.create_resource")
+        checkouts: Number of connections checked out from the pool
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        get_wegent_metrics().db_pool_checkouts.record(
+            checkouts, {"operation": operation}
+        )
+    except Exception as e:
+        logger.debug(f"Failed to record db pool checkouts metric: {e}")
+
+
+def record_db_pool_wait(pool: str, duration_ms: float, success: bool = True) -> None:
+    """
+    Record the time spent acquiring a connection from a pool.
+
+    Args:
+        pool: Pool name (e.g., "primary", "replica", "async")
+        duration_ms: Time until a connection was handed out or the wait failed
+        success: Whether a connection was acquired
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        get_wegent_metrics().db_pool_wait_time.record(
+            duration_ms, {"pool": pool, "success": success}
+        )
+    except Exception as e:
+        logger.debug(f"Failed to record db pool wait metric: {e}")
+
+
+def record_stream_chunks(shell_type: str, tokens: int, frames: int) -> None:
+    """
+    Record the tokens of a stream and the chunk events they were emitted in.
+
+    Args:
+        shell_type: Shell type of the stream (e.g., "Chat")
+        tokens: Number of tokens streamed
+        frames: Number of chunk events emitted for them
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        metrics = get_wegent_metrics()
+        attributes = {"shell_type": shell_type}
+        metrics.stream_tokens.add(tokens, attributes)
+        metrics.stream_chunk_frames.add(frames, attributes)
+    except Exception as e:
+        logger.debug(f"Failed to record stream chunk metrics: {e}")
+
+
+def record_callback_queue_change(delta: int) -> None:
+    """
+    Record a change in the number of queued executor callbacks.
+
+    Args:
+        delta: Change in queued callbacks (+1 for queued, -1 for forwarded,
+            coalesced or dropped)
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        get_wegent_metrics().callback_queue_depth.add(delta)
+    except Exception as e:
+        logger.debug(f"Failed to record callback queue metric: {e}")
+
+
+def record_callback_forwarded(duration_ms: float, success: bool = True) -> None:
+    """
+    Record the forwarding of an executor callback to the backend.
+
+    Args:
+        duration_ms: Time from receiving the callback until it was forwarded,
+            including the time spent queued
+        success: Whether the backend accepted the update
+    """
+    if not is_telemetry_enabled():
+        return
+
+    try:
+        get_wegent_metrics().callback_forward_latency.record(
+            duration_ms, {"success": success}
+        )
+    except Exception as e:
+        logger.debug(f"Failed to record callback forward metric: {e}")
@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import sys
+
+import pytest
+
+# Add shared directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from utils.result_delta import (
+    ResultDeltaEncoder,
+    apply_result_delta,
+    encode_result_delta,
+    merge_result_deltas,
+)
+
+
+def _result(value="", thinking=(), file_changes=(), **workbench):
+    return {
+        "value": value,
+        "thinking": list(thinking),
+        "workbench": {"file_changes": list(file_changes), **workbench},
+    }
+
+
+@pytest.mark.unit
+class TestEncodeResultDelta:
+    """Test encoding the changes between two results"""
+
+    def test_appends_are_sent_as_suffixes(self):
+        previous = _result("Hello", [{"title": "plan"}])
+        current = _result("Hello world", [{"title": "plan"}, {"title": "edit"}])
+
+        delta = encode_result_delta(previous, current)
+
+        assert delta == {
+            "value_append": " world",
+            "thinking_append": [{"title": "edit"}],
+        }
+        assert apply_result_delta(previous, delta) == current
+
+    def test_only_changed_file_entries_are_sent(self):
+        previous = _result(
+            file_changes=[{"new_path": "a.py", "added_lines": 1}, {"new_path": "b.py"}],
+            status="running",
+        )
+        current = _result(
+            file_changes=[{"new_path": "a.py", "added_lines": 2}, {"new_path": "c.py"}],
+            status="running",
+        )
+
+        delta = encode_result_delta(previous, current)
+
+        assert delta == {
+            "file_changes": [
+                {"new_path": "a.py", "added_lines": 2},
+                {"new_path": "c.py"},
+            ],
+            "file_changes_removed": ["b.py"],
+        }
+        assert apply_result_delta(previous, delta) == current
+
+    def test_rewrites_and_removals_are_sent_in_full(self):
+        previous = {"value": "draft", "workbench": {"status": "running"}, "old": 1}
+        current = {"value": "final", "workbench": {}}
+
+        delta = encode_result_delta(previous, current)
+
+        assert delta == {
+            "set": {"value": "final", "workbench": {}},
+            "unset": ["old"],
+        }
+        assert apply_result_delta(previous, delta) == current
+
+    def test_apply_does_not_modify_the_result(self):
+        previous = _result("a", file_changes=[{"new_path": "a.py"}])
+        current = _result("ab", file_changes=[{"new_path": "b.py"}])
+
+        apply_result_delta(previous, encode_result_delta(previous, current))
+
+        assert previous == _result("a", file_changes=[{"new_path": "a.py"}])
+
+
+@pytest.mark.unit
+class TestResultDeltaEncoder:
+    """Test sequencing the updates of a subtask"""
+
+    def test_first_result_is_full_then_deltas(self):
+        encoder = ResultDeltaEncoder()
+        result = _result("a")
+
+        assert encoder.encode(1, result) == (1, None)
+        result["value"] += "b"
+        seq, delta = encoder.encode(1, result)
+
+        assert seq == 2
+        assert delta["seq"] == 2 and delta["base_seq"] == 1
+        assert delta["value_append"] == "b"
+
+    def test_reset_and_full_restart_snapshots(self):
+        encoder = ResultDeltaEncoder()
+        encoder.encode(1, _result("a"))
+
+        assert encoder.encode(1, _result("ab"), full=True) == (2, None)
+        encoder.reset(1)
+        # Sequence numbers keep increasing so older full results can be told apart
+        assert encoder.encode(1, _result("abc")) == (3, None)
+        encoder.forget(1)
+        assert encoder.encode(1, _result("abcd")) == (1, None)
+        # Subtasks are sequenced independently
+        assert encoder.encode(2, _result("x")) == (1, None)
+
+
+@pytest.mark.unit
+class TestMergeResultDeltas:
+    """Test merging consecutive deltas of a subtask"""
+
+    def _deltas(self, *results):
+        encoder = ResultDeltaEncoder()
+        encoder.encode(1, results[0])
+        return [encoder.encode(1, result)[1] for result in results[1:]]
+
+    @pytest.mark.parametrize(
+        "results",
+        [
+            # Appends
+            [
+                _result("a", [1]),
+                _result("ab", [1, 2]),
+                _result("abc", [1, 2, 3]),
+            ],
+            # A rewrite after an append
+            [_result("a"), _result("ab"), _result("x")],
+            # File entries changed, added and removed
+            [
+                _result(file_changes=[{"new_path": "a", "n": 1}]),
+                _result(
+                    file_changes=[{"new_path": "a", "n": 2}, {"new_path": "b"}],
+                    branch="main",
+                ),
+                _result(file_changes=[{"new_path": "b"}, {"new_path": "c"}]),
+            ],
+            # Keys added and removed
+            [
+                {"value": "a"},
+                {"value": "a", "extra": 1},
+                {"value": "ab"},
+            ],
+        ],
+    )
+    def test_merged_delta_has_the_effect_of_both(self, results):
+        first, second = self._deltas(*results)
+
+        merged = merge_result_deltas(first, second)
+
+        assert merged["base_seq"] == first["base_seq"]
+        assert merged["seq"] == second["seq"]
+        assert apply_result_delta(results[0], merged) == results[-1]
+
+    def test_non_consecutive_deltas_are_not_merged(self):
+        first, _, third = self._deltas(
+            _result("a"), _result("ab"), _result("abc"), _result("abcd")
+        )
+
+        assert merge_result_deltas(first, third) is None
+
+    def test_re_added_file_entry_is_not_merged(self):
+        first, second = self._deltas(
+            _result(file_changes=[{"new_path": "a"}, {"new_path": "b"}]),
+            _result(file_changes=[{"new_path": "b"}]),
+            _result(file_changes=[{"new_path": "b"}, {"new_path": "a"}]),
+        )
+
+        assert merge_result_deltas(first, second) is None
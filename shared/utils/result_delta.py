@@ -0,0 +1,324 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Delta encoding of executor task results.
+
+Executors report the cumulative result of a subtask with every progress
+update: the response text in "value", the "thinking" steps and the
+"workbench" with its git "file_changes". Instead of the full result, only
+the changes since the previous update are sent as a versioned delta:
+
+    {
+        "version": 1,
+        "seq": 7,                       # sequence number of this update
+        "base_seq": 6,                  # update the delta applies to
+        "value_append": "...",          # text appended to value
+        "thinking_append": [...],       # new thinking steps
+        "file_changes": [...],          # added or changed file entries
+        "file_changes_removed": [...],  # paths of entries that are gone
+        "workbench": {...},             # other changed workbench keys
+        "set": {...},                   # other changed top-level keys
+        "unset": [...],                 # removed top-level keys
+    }
+
+Changes that are not appends (e.g. rewritten text) are sent in full through
+"set". Full snapshots carry their sequence number as well, so a receiver
+whose stored sequence number differs from base_seq knows it missed an update
+and asks for a full snapshot instead of applying the delta.
+"""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+RESULT_DELTA_VERSION = 1
+
+
+def _file_change_path(entry: Dict[str, Any]) -> Any:
+    return entry.get("new_path") or entry.get("old_path")
+
+
+def _apply_file_changes(
+    file_changes: List[Dict[str, Any]],
+    changed: List[Dict[str, Any]],
+    removed: List[Any],
+) -> List[Dict[str, Any]]:
+    """Replace entries with the same path, append new ones and drop removed"""
+    removed = set(removed)
+    positions = {_file_change_path(entry): i for i, entry in enumerate(file_changes)}
+    entries = list(file_changes)
+    for entry in changed:
+        index = positions.get(_file_change_path(entry))
+        if index is None:
+            positions[_file_change_path(entry)] = len(entries)
+            entries.append(entry)
+        else:
+            entries[index] = entry
+    return [entry for entry in entries if _file_change_path(entry) not in removed]
+
+
+def _diff_workbench(
+    previous: Dict[str, Any], current: Dict[str, Any], delta: Dict[str, Any]
+) -> bool:
+    """Add the changes of a workbench to a delta, False if it must be sent in full"""
+    if set(previous) - set(current):
+        return False
+
+    changes: Dict[str, Any] = {}
+    workbench = {
+        key: value
+        for key, value in current.items()
+        if key != "file_changes" and (key not in previous or previous[key] != value)
+    }
+    if workbench:
+        changes["workbench"] = workbench
+
+    before = previous.get("file_changes")
+    after = current.get("file_changes")
+    if after != before:
+        if not isinstance(before, list) or not isinstance(after, list):
+            return False
+        before_by_path = {_file_change_path(entry): entry for entry in before}
+        after_paths = {_file_change_path(entry) for entry in after}
+        changed = [
+            entry
+            for entry in after
+            if before_by_path.get(_file_change_path(entry)) != entry
+        ]
+        removed = [path for path in before_by_path if path not in after_paths]
+        # Reordered entries cannot be expressed as a delta
+        if _apply_file_changes(before, changed, removed) != after:
+            return False
+        if changed:
+            changes["file_changes"] = changed
+        if removed:
+            changes["file_changes_removed"] = removed
+
+    delta.update(changes)
+    return True
+
+
+def encode_result_delta(
+    previous: Dict[str, Any], current: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Encode the changes from one result to the next.
+
+    Args:
+        previous: Result of the previous update
+        current: Result of this update
+
+    Returns:
+        Delta without version and sequence numbers, empty if nothing changed
+    """
+    delta: Dict[str, Any] = {}
+    changed: Dict[str, Any] = {}
+
+    for key, value in current.items():
+        before = previous.get(key)
+        if key in previous and before == value:
+            continue
+
+        if (
+            key == "value"
+            and isinstance(before, str)
+            and isinstance(value, str)
+            and value.startswith(before)
+        ):
+            delta["value_append"] = value[len(before) :]
+        elif (
+            key == "thinking"
+            and isinstance(before, list)
+            and isinstance(value, list)
+            and value[: len(before)] == before
+        ):
+            delta["thinking_append"] = value[len(before) :]
+        elif not (
+            key == "workbench"
+            and isinstance(before, dict)
+            and isinstance(value, dict)
+            and _diff_workbench(before, value, delta)
+        ):
+            changed[key] = value
+
+    if changed:
+        delta["set"] = changed
+    removed = [key for key in previous if key not in current]
+    if removed:
+        delta["unset"] = removed
+    return delta
+
+
+def apply_result_delta(
+    result: Optional[Dict[str, Any]], delta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Apply a delta to a result.
+
+    Args:
+        result: Result the delta is based on, not modified
+        delta: Delta from encode_result_delta()
+
+    Returns:
+        The updated result, sharing unchanged values with the given one
+    """
+    updated = dict(result or {})
+    for key in delta.get("unset", ()):
+        updated.pop(key, None)
+    updated.update(delta.get("set", {}))
+
+    if "value_append" in delta:
+        updated["value"] = (updated.get("value") or "") + delta["value_append"]
+    if "thinking_append" in delta:
+        updated["thinking"] = [
+            *(updated.get("thinking") or []),
+            *delta["thinking_append"],
+        ]
+
+    if any(
+        key in delta for key in ("workbench", "file_changes", "file_changes_removed")
+    ):
+        workbench = dict(updated.get("workbench") or {})
+        workbench.update(delta.get("workbench", {}))
+        if "file_changes" in delta or "file_changes_removed" in delta:
+            workbench["file_changes"] = _apply_file_changes(
+                workbench.get("file_changes") or [],
+                delta.get("file_changes", []),
+                delta.get("file_changes_removed", []),
+            )
+        updated["workbench"] = workbench
+    return updated
+
+
+# Delta fields that change a top-level key of the result in place
+_KEY_CHANGES = {
+    "value": ("value_append",),
+    "thinking": ("thinking_append",),
+    "workbench": ("workbench", "file_changes", "file_changes_removed"),
+}
+
+
+def merge_result_deltas(
+    first: Dict[str, Any], second: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge two consecutive deltas into one with the effect of applying both.
+
+    Args:
+        first: Earlier delta
+        second: Delta based on the update of the first
+
+    Returns:
+        The merged delta from first's base_seq to second's seq, or None if
+        second does not follow first or the changes cannot be merged
+    """
+    if (
+        first.get("version") != RESULT_DELTA_VERSION
+        or second.get("version") != RESULT_DELTA_VERSION
+        or second.get("base_seq") != first.get("seq")
+    ):
+        return None
+
+    merged = {k: v for k, v in first.items() if k not in ("set", "unset")}
+    # Keys the second delta replaces or removes lose the changes of the first
+    replaced = set(second.get("set", {})) | set(second.get("unset", ()))
+    for key in replaced:
+        for field in _KEY_CHANGES.get(key, ()):
+            merged.pop(field, None)
+
+    changed = {
+        key: value for key, value in first.get("set", {}).items() if key not in replaced
+    }
+    changed.update(second.get("set", {}))
+    if changed:
+        merged["set"] = changed
+    removed = list(dict.fromkeys([*first.get("unset", ()), *second.get("unset", ())]))
+    if removed:
+        merged["unset"] = removed
+
+    if "value_append" in second:
+        merged["value_append"] = merged.get("value_append", "") + second["value_append"]
+    if "thinking_append" in second:
+        merged["thinking_append"] = [
+            *merged.get("thinking_append", []),
+            *second["thinking_append"],
+        ]
+    if "workbench" in second:
+        merged["workbench"] = {**merged.get("workbench", {}), **second["workbench"]}
+
+    if "file_changes" in second or "file_changes_removed" in second:
+        removed_paths = set(merged.get("file_changes_removed", ()))
+        if any(
+            _file_change_path(entry) in removed_paths
+            for entry in second.get("file_changes", ())
+        ):
+            # A re-added entry moves to the end, which a delta cannot express
+            return None
+        file_changes = _apply_file_changes(
+            merged.get("file_changes", []), second.get("file_changes", []), []
+        )
+        if file_changes:
+            merged["file_changes"] = file_changes
+        file_changes_removed = list(
+            dict.fromkeys(
+                [
+                    *merged.get("file_changes_removed", ()),
+                    *second.get("file_changes_removed", ()),
+                ]
+            )
+        )
+        if file_changes_removed:
+            merged["file_changes_removed"] = file_changes_removed
+
+    merged["seq"] = second["seq"]
+    return merged
+
+
+class ResultDeltaEncoder:
+    """
+    Tracks the last result sent for each subtask and encodes the next one as
+    a full snapshot or a delta.
+    """
+
+    def __init__(self):
+        # subtask_id -> (seq, copy of the last result sent or None to send
+        # the next one in full)
+        self._sent: Dict[int, Tuple[int, Optional[Dict[str, Any]]]] = {}
+
+    def encode(
+        self, subtask_id: int, result: Dict[str, Any], full: bool = False
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Encode a result for sending.
+
+        Args:
+            subtask_id: Subtask the result belongs to
+            result: Current cumulative result
+            full: Send a full snapshot even if a delta is possible
+
+        Returns:
+            (seq, delta): the sequence number of the update and its delta, or
+            None if the full result must be sent
+        """
+        seq, previous = self._sent.get(subtask_id, (0, None))
+        seq += 1
+        self._sent[subtask_id] = (seq, copy.deepcopy(result))
+        if full or previous is None:
+            return seq, None
+
+        delta = encode_result_delta(previous, result)
+        delta.update(version=RESULT_DELTA_VERSION, seq=seq, base_seq=seq - 1)
+        return seq, delta
+
+    def reset(self, subtask_id: int) -> None:
+        """
+        Send the next result of a subtask in full. Its sequence numbers keep
+        increasing, so the receiver can still tell older full results apart.
+        """
+        if subtask_id in self._sent:
+            self._sent[subtask_id] = (self._sent[subtask_id][0], None)
+
+    def forget(self, subtask_id: int) -> None:
+        """Drop the state of a finished subtask"""
+        self._sent.pop(subtask_id, None)